@@ -27,17 +27,54 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # ============================================
 # 모듈 import
 # ============================================
-from routers.audit import get_audit_data
+from routers.audit import (
+    get_audit_activity,
+    get_audit_data,
+    query_audit,
+    search_audit,
+)
 from routers.auth import router as auth_router
-from routers.capacity import get_capacity_data
-from routers.endpoint import get_endpoint_data, search_endpoint
-from routers.health import get_health_data
-from routers.interface import get_interface_data
+from routers.capacity import (
+    get_capacity_data,
+    get_capacity_forecast,
+    get_capacity_history,
+    get_capacity_resources,
+)
+from routers.endpoint import (
+    export_endpoints,
+    get_endpoint_cube,
+    get_endpoint_data,
+    get_endpoint_index,
+    list_endpoints,
+    search_endpoint,
+)
+from routers.health import (
+    get_fault_analytics,
+    get_fault_changes,
+    get_health_data,
+    get_health_scores,
+    get_health_trend,
+)
+from routers.interface import (
+    get_interface_counters,
+    get_interface_data,
+    get_interface_flaps,
+    get_interface_heatmap,
+)
 from routers.linter import get_lint_data, lint_upload
 from routers.policy import get_policy_data
 from routers.setup import router as setup_router
 from routers.simulator import get_simulate_router
-from routers.topology import get_topology_data
+from routers.topology import (
+    get_topology_changes,
+    get_topology_data,
+    get_topology_graph,
+    get_topology_impact,
+    get_topology_layout,
+    get_topology_neighbors,
+    get_topology_path,
+    get_topology_redundancy,
+)
 from routers.users import router as users_router
 from services.aci_client import ACIClient
 from services.auth_service import decode_access_token, init_default_admin
@@ -209,11 +246,67 @@ async def setup_page():
 # ============================================
 
 
+def _dimension_filters(tenant, epg, node, interface, encap, peer) -> dict:
+    """Endpoint 차원 쿼리 파라미터 → 필터 dict (미지정 항목 제외)."""
+    candidates = {
+        "tenant": tenant,
+        "epg": epg,
+        "node": node,
+        "interface": interface,
+        "encap": encap,
+        "peer": peer,
+    }
+    return {k: v for k, v in candidates.items() if v is not None}
+
+
 @app.get("/api/health")
 async def api_health():
     return get_health_data(aci)
 
 
+@app.get("/api/health/trend")
+async def api_health_trend(
+    series: str = "", range: int = 3600, tier: str | None = None
+):
+    """Fault / 노드 수치 추세 (series는 콤마 구분, range는 초)."""
+    names = [name for name in series.split(",") if name]
+    return get_health_trend(names, range, tier)
+
+
+@app.get("/api/health/scores")
+async def api_health_scores():
+    return get_health_scores(aci)
+
+
+@app.get("/api/faults")
+async def api_faults(
+    group_by: str = "code",
+    code: str | None = None,
+    severity: str | None = None,
+    node: str | None = None,
+    tenant: str | None = None,
+    lifecycle: str | None = None,
+    subtree: str = "",
+    top: int = 10,
+):
+    """Fault group-by 분석 (지정된 차원 값은 필터로 고정, subtree는 DN 접두어)."""
+    candidates = {
+        "code": code,
+        "severity": severity,
+        "node": node,
+        "tenant": tenant,
+        "lifecycle": lifecycle,
+    }
+    filters = {k: v for k, v in candidates.items() if v is not None}
+    return get_fault_analytics(aci, group_by, filters, subtree, top)
+
+
+@app.get("/api/faults/changes")
+async def api_fault_changes(limit: int = 50):
+    """직전 스냅샷 대비 신규 / 해제 Fault."""
+    return get_fault_changes(aci, limit)
+
+
 @app.get("/api/policy")
 async def api_policy():
     return get_policy_data(aci)
@@ -224,14 +317,80 @@ async def api_interface():
     return get_interface_data(aci)
 
 
+@app.get("/api/interface/counters")
+async def api_interface_counters(top: int = 10):
+    return get_interface_counters(aci, top)
+
+
+@app.get("/api/interface/flaps")
+async def api_interface_flaps(threshold: int | None = None):
+    return get_interface_flaps(aci, threshold)
+
+
+@app.get("/api/interface/heatmap")
+async def api_interface_heatmap():
+    return get_interface_heatmap(aci)
+
+
 @app.get("/api/endpoint")
 async def api_endpoint():
     return get_endpoint_data(aci)
 
 
 @app.get("/api/endpoint/search")
-async def api_endpoint_search(q: str):
-    return search_endpoint(aci, q)
+async def api_endpoint_search(q: str, exact: bool = False):
+    return search_endpoint(aci, q, exact)
+
+
+@app.get("/api/endpoint/cube")
+async def api_endpoint_cube(
+    group_by: str = "tenant",
+    tenant: str | None = None,
+    epg: str | None = None,
+    node: str | None = None,
+    interface: str | None = None,
+    encap: str | None = None,
+    peer: str | None = None,
+    top: int = 10,
+):
+    """Endpoint 집계 큐브 drill-down (지정된 차원 값은 필터로 고정)."""
+    filters = _dimension_filters(tenant, epg, node, interface, encap, peer)
+    return get_endpoint_cube(aci, group_by, filters, top)
+
+
+@app.get("/api/endpoint/list")
+async def api_endpoint_list(
+    sort: str = "mac",
+    order: str = "asc",
+    cursor: str | None = None,
+    limit: int = 100,
+    q: str = "",
+    tenant: str | None = None,
+    epg: str | None = None,
+    node: str | None = None,
+    interface: str | None = None,
+    encap: str | None = None,
+    peer: str | None = None,
+):
+    """Endpoint 목록 (정렬 + 필터 + 커서 페이지네이션)."""
+    filters = _dimension_filters(tenant, epg, node, interface, encap, peer)
+    return list_endpoints(aci, sort, order, filters, q, cursor, limit)
+
+
+@app.get("/api/endpoint/export")
+async def api_endpoint_export(
+    format: str = "csv",
+    q: str = "",
+    tenant: str | None = None,
+    epg: str | None = None,
+    node: str | None = None,
+    interface: str | None = None,
+    encap: str | None = None,
+    peer: str | None = None,
+):
+    """Endpoint 스트리밍 내보내기 (csv / ndjson)."""
+    filters = _dimension_filters(tenant, epg, node, interface, encap, peer)
+    return export_endpoints(aci, format, filters, q)
 
 
 @app.get("/api/audit")
@@ -239,9 +398,67 @@ async def api_audit():
     return get_audit_data(aci)
 
 
+@app.get("/api/audit/query")
+async def api_audit_query(
+    user: str | None = None,
+    action: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+):
+    """로컬 Audit DB 조건 조회 (since / until은 ISO 8601)."""
+    return query_audit(aci, user, action, since, until, limit, offset)
+
+
+@app.get("/api/audit/search")
+async def api_audit_search(
+    q: str = "",
+    subtree: str | None = None,
+    user: str | None = None,
+    action: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 100,
+):
+    """Audit 역색인 검색 (DN 서브트리 / 토큰 / 사용자 / 유형 / 시간 범위)."""
+    return search_audit(aci, q, subtree, user, action, since, until, limit)
+
+
+@app.get("/api/audit/activity")
+async def api_audit_activity(
+    user: str | None = None, tenant: str | None = None, top: int = 10
+):
+    """요일 × 시간대 변경 히스토그램 (전체 / 사용자별 / Tenant별 7 × 24 버킷)."""
+    return get_audit_activity(aci, user, tenant, top)
+
+
 @app.get("/api/capacity")
-async def api_capacity():
-    return get_capacity_data(aci)
+async def api_capacity(interval: str = "5min"):
+    """TCAM 리포트 (interval: 5min / 15min / 1h / 1d, 주기 길이 동안 캐시)."""
+    return get_capacity_data(aci, interval)
+
+
+@app.get("/api/capacity/resources")
+async def api_capacity_resources(top: int = 10, interval: str = "5min"):
+    """노드 × 자원(Policy CAM / EP / VLAN / Mcast / LPM) 사용률 매트릭스."""
+    return get_capacity_resources(aci, top, interval)
+
+
+@app.get("/api/capacity/history")
+async def api_capacity_history(
+    node: str, resource: str, range: int = 7 * 86400, tier: str | None = None
+):
+    """노드 / 자원 사용률 이력 (range: 초 단위 구간)."""
+    return get_capacity_history(aci, node, resource, range, tier)
+
+
+@app.get("/api/capacity/forecast")
+async def api_capacity_forecast(
+    resource: str | None = None, tier: str = "1h", top: int = 20
+):
+    """자원 소진 예상일이 가까운 노드 순 (최소제곱 직선 추세)."""
+    return get_capacity_forecast(aci, resource, tier, top)
 
 
 @app.get("/api/topology")
@@ -249,9 +466,51 @@ async def api_topology():
     return get_topology_data(aci)
 
 
+@app.get("/api/topology/graph")
+async def api_topology_graph(since: int | None = None):
+    """Fabric 노드 / 링크 그래프 (since 지정 시 해당 버전 이후 변경분만)."""
+    return get_topology_graph(aci, since)
+
+
+@app.get("/api/topology/changes")
+async def api_topology_changes(limit: int = 20):
+    """최근 토폴로지 변경 이벤트 (버전별 노드 / 링크 diff)."""
+    return get_topology_changes(aci, limit)
+
+
+@app.get("/api/topology/layout")
+async def api_topology_layout():
+    """토폴로지 레이아웃 좌표 (구성 버전별 캐시)."""
+    return get_topology_layout(aci)
+
+
+@app.get("/api/topology/neighbors")
+async def api_topology_neighbors(node: str):
+    """노드 이웃 / 차수 (캐시된 인접 인덱스)."""
+    return get_topology_neighbors(aci, node)
+
+
+@app.get("/api/topology/path")
+async def api_topology_path(src: str, dst: str, avoid: str = ""):
+    """두 노드 간 최소 홉 경로 (avoid: 장애 가정 노드, 콤마 구분)."""
+    return get_topology_path(aci, src, dst, avoid)
+
+
+@app.get("/api/topology/redundancy")
+async def api_topology_redundancy():
+    """Leaf 이중화 수준 / 단일 장애점 (노드별 Endpoint 수 포함)."""
+    return get_topology_redundancy(aci, get_endpoint_index(aci))
+
+
+@app.get("/api/topology/impact")
+async def api_topology_impact(node: str):
+    """노드 장애 가정 시 영향 범위 (고립 / 이중화 저하 Leaf, 영향 Endpoint / EPG)."""
+    return get_topology_impact(aci, node, get_endpoint_index(aci))
+
+
 @app.get("/api/lint")
-async def api_lint():
-    return get_lint_data(aci)
+async def api_lint(incremental: bool = False):
+    return get_lint_data(aci, incremental)
 
 
 @app.post("/api/lint/upload")
@@ -1,12 +1,98 @@
 # ============================================
 # Audit Log Router
 # 목적: ACI 설정 변경 이력 데이터 제공
+# 버전: v1.11.0 - aaaModLR 전체 이력 로컬 SQLite 동기화 + 로컬 조건 조회
+#                + DN 서브트리 / 토큰 역색인 검색
+#                + 요일 × 시간대 변경 히스토그램 (전체 / 사용자별 / Tenant별)
+#                + DB 경로 AUDIT_DB_PATH 환경변수 지정 (기본 backend/data/audit.db),
+#                  APIC hosts 변경 시 이력 초기화
 # ============================================
 
-from fastapi import APIRouter
+import os
+import threading
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from services.audit_histogram import AuditHistogram
+from services.audit_search import AuditSearchIndex
+from services.audit_store import AuditStore, AuditSync
 
 router = APIRouter()
 
+# 로컬 Audit DB 경로 (기본 backend/data/audit.db — 컨테이너에서는 data/ 볼륨 마운트)
+AUDIT_DB_PATH = os.environ.get("AUDIT_DB_PATH") or os.path.join(
+    os.path.dirname(__file__), "..", "data", "audit.db"
+)
+
+# 조회 API 최대 페이지 크기
+MAX_QUERY_LIMIT = 1000
+
+# 히스토그램 사용자 / Tenant별 최대 반환 개수
+MAX_ACTIVITY_TOP = 50
+
+# 동기화 객체 / 검색 색인 (최초 사용 시 생성 — import만으로 DB 파일을 만들지 않음)
+_sync: Optional[AuditSync] = None
+_search_index: Optional[AuditSearchIndex] = None
+_histogram: Optional[AuditHistogram] = None
+_sync_lock = threading.Lock()
+
+# 동기화 → 색인 / 히스토그램 반영 구간 직렬화
+# (저장 직후 ~ add 전 사이에 히스토그램이 저장소로 구성되면 이중 집계되므로)
+_feed_lock = threading.Lock()
+
+
+def _get_sync() -> AuditSync:
+    """AuditSync 싱글톤 반환 (최초 호출 시 DB 열기)"""
+    global _sync
+    with _sync_lock:
+        if _sync is None:
+            os.makedirs(os.path.dirname(os.path.abspath(AUDIT_DB_PATH)), exist_ok=True)
+            _sync = AuditSync(AuditStore(AUDIT_DB_PATH))
+        return _sync
+
+
+def _get_search_index() -> AuditSearchIndex:
+    """검색 색인 싱글톤 반환 (최초 검색 시 저장소 전체로 구성)"""
+    global _search_index
+    sync = _get_sync()
+    with _sync_lock:
+        if _search_index is None:
+            _search_index = AuditSearchIndex(sync.store.iter_all)
+        return _search_index
+
+
+def _get_histogram() -> AuditHistogram:
+    """히스토그램 싱글톤 반환 (최초 조회 시 저장소 전체로 구성)"""
+    global _histogram
+    sync = _get_sync()
+    with _sync_lock:
+        if _histogram is None:
+            _histogram = AuditHistogram(sync.store.iter_all)
+        return _histogram
+
+
+def _sync_audit(aci) -> AuditSync:
+    """
+    APIC 신규 변경분 동기화 후 새 레코드를 검색 색인 / 히스토그램에 반영
+
+    APIC hosts가 바뀌어 저장소가 초기화되면 색인 / 히스토그램도 다음 조회 시 재구성.
+    """
+    sync = _get_sync()
+    with _feed_lock:
+        hosts = getattr(aci, "hosts", None)
+        if isinstance(hosts, list) and hosts and sync.bind_fabric(hosts):
+            for built in (_search_index, _histogram):
+                if built is not None:
+                    built.invalidate()
+        inserted = sync.sync(aci)
+        if _search_index is not None:
+            _search_index.add(inserted)
+        if _histogram is not None:
+            _histogram.add(inserted)
+    return sync
+
 
 def get_audit_data(aci):
     """
@@ -17,66 +103,177 @@ def get_audit_data(aci):
     - 변경 유형별 분류 (Creation/Modification/Deletion)
     - 사용자별 변경 횟수
 
+    APIC에서는 신규 변경분만 동기화하고 집계는 로컬 DB 전체 이력 기준.
+
     Args:
         aci: ACIClient 인스턴스
     Returns:
         dict: Audit Log 분석 결과 딕셔너리
     """
     # ============================================
-    # 1. Audit Log 조회
+    # 1. Audit Log 동기화 (백필 또는 워터마크 증분)
     # ============================================
-    # aaaModLR: 설정 변경 로그 클래스
-    # order-by: 최신순 정렬
-    # page-size: 최대 50개 조회
-    logs = aci.get("aaaModLR", "order-by=aaaModLR.created|desc&page-size=50")
+    sync = _sync_audit(aci)
+    store = sync.store
 
     # ============================================
-    # 2. 변경 유형별 및 사용자별 집계
+    # 2. 변경 유형별 및 사용자별 집계 (로컬 DB)
     # ============================================
     action_count = {"creation": 0, "modification": 0, "deletion": 0}
-    user_count = {}
-    recent_changes = []
-
-    for log in logs:
-        attr = log["aaaModLR"]["attributes"]
-
-        # 변경 유형 (ind 속성)
-        action = attr.get("ind", "")
-
-        # 사용자
-        user = attr.get("user", "unknown")
-
-        # 유형별 카운트
+    for action, count in store.count_by("action").items():
         if action in action_count:
-            action_count[action] += 1
-
-        # 사용자별 카운트
-        user_count[user] = user_count.get(user, 0) + 1
-
-        # 최근 변경 목록에 추가
-        recent_changes.append(
-            {
-                "timestamp": attr.get("created", "")[:19],  # 초 단위까지만
-                "user": user,
-                "action": action,
-                "affected": attr.get("affected", "")[:50],  # 50자로 제한
-            }
+            action_count[action] = count
+
+    by_user = [
+        {"user": k, "count": v}
+        for k, v in sorted(
+            store.count_by("user").items(), key=lambda x: x[1], reverse=True
         )
+    ]
 
     # ============================================
-    # 3. 사용자별 통계를 리스트로 변환
+    # 3. 최근 변경 목록 (최근 10개)
     # ============================================
-    by_user = [
-        {"user": k, "count": v}
-        for k, v in sorted(user_count.items(), key=lambda x: x[1], reverse=True)
+    recent_changes = [
+        {
+            "timestamp": row["created"][:19],  # 초 단위까지만
+            "user": row["user"],
+            "action": row["action"],
+            "affected": row["affected"][:50],  # 50자로 제한
+        }
+        for row in store.query(limit=10)
     ]
 
     # ============================================
     # 4. 결과 반환
     # ============================================
     return {
-        "total": len(logs),
+        "total": store.count(),
         "actions": action_count,
         "by_user": by_user,
-        "recent": recent_changes[:10],  # 최근 10개
+        "recent": recent_changes,
+        "backfill_done": sync.backfill_done,
     }
+
+
+def _parse_time(value: Optional[str], name: str) -> Optional[float]:
+    """ISO 8601 문자열 → epoch 초 (잘못된 형식이면 400)"""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value!r}")
+
+
+def query_audit(
+    aci,
+    user: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> dict:
+    """
+    Audit 이력 조건 조회 (로컬 DB, 최신순)
+
+    Args:
+        aci:    ACIClient 인스턴스 (신규 변경분 동기화용)
+        user:   사용자 (정확 일치)
+        action: creation / modification / deletion
+        since:  시작 시각 ISO 8601 (포함)
+        until:  종료 시각 ISO 8601 (미포함)
+        limit:  최대 건수 (최대 MAX_QUERY_LIMIT)
+        offset: 건너뛸 건수
+    Returns:
+        dict: {items, count}
+    Raises:
+        HTTPException 400: 잘못된 시각 형식
+    """
+    since_ts = _parse_time(since, "since")
+    until_ts = _parse_time(until, "until")
+
+    sync = _sync_audit(aci)
+    items = sync.store.query(
+        user=user,
+        action=action,
+        since=since_ts,
+        until=until_ts,
+        limit=max(1, min(limit, MAX_QUERY_LIMIT)),
+        offset=max(0, offset),
+    )
+    return {"items": items, "count": len(items)}
+
+
+def search_audit(
+    aci,
+    q: str = "",
+    subtree: Optional[str] = None,
+    user: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+) -> dict:
+    """
+    Audit 역색인 검색 (조건은 posting list 교집합으로 결합)
+
+    예: subtree=uni/tn-TenantY, since=2026-03-01T00:00:00+09:00
+        → TenantY 하위 오브젝트를 3월 이후 변경한 이력
+
+    Args:
+        aci:     ACIClient 인스턴스 (신규 변경분 동기화용)
+        q:       descr / changeSet 검색어 (공백 구분, 모두 포함)
+        subtree: affected DN 서브트리
+        user:    사용자
+        action:  creation / modification / deletion
+        since:   시작 시각 ISO 8601 (포함)
+        until:   종료 시각 ISO 8601 (미포함)
+        limit:   최대 건수 (최대 MAX_QUERY_LIMIT)
+    Returns:
+        dict: {items, total}
+    Raises:
+        HTTPException 400: 잘못된 시각 형식
+    """
+    since_ts = _parse_time(since, "since")
+    until_ts = _parse_time(until, "until")
+
+    index = _get_search_index()
+    _sync_audit(aci)
+    return index.search(
+        subtree=subtree,
+        user=user,
+        action=action,
+        text=q,
+        since=since_ts,
+        until=until_ts,
+        limit=max(1, min(limit, MAX_QUERY_LIMIT)),
+    )
+
+
+def get_audit_activity(
+    aci,
+    user: Optional[str] = None,
+    tenant: Optional[str] = None,
+    top: int = 10,
+) -> dict:
+    """
+    요일 × 시간대 변경 히스토그램 (변경 작업 시간대 준수 점검용)
+
+    집계는 동기화 시 신규 레코드만 누적하며, 응답은 7 × 24 버킷 배열.
+
+    Args:
+        aci:    ACIClient 인스턴스 (신규 변경분 동기화용)
+        user:   지정 시 해당 사용자만
+        tenant: 지정 시 해당 Tenant만 (Tenant 외 오브젝트는 "-")
+        top:    사용자 / Tenant별 반환 개수 (최대 MAX_ACTIVITY_TOP)
+    Returns:
+        dict: {weekdays, total, buckets, by_user, by_tenant}
+    """
+    histogram = _get_histogram()
+    _sync_audit(aci)
+    with _feed_lock:
+        return histogram.snapshot(
+            user=user, tenant=tenant, top=max(1, min(top, MAX_ACTIVITY_TOP))
+        )
@@ -1,15 +1,86 @@
 # ============================================
 # Capacity Report Router
 # 목적: ACI 용량 리포트 데이터 제공
+# 버전: v1.11.0 - 다중 자원(EP 테이블 / VLAN / Mcast / LPM) 동시 수집 추가,
+#                사용률 이력 보관 및 소진 예상일 예측,
+#                통계 주기 선택(5min / 15min / 1h / 1d) + 주기별 결과 캐시,
+#                TCAM 리포트를 다중 자원 수집 결과로 구성 (모든 조회 경로에서 이력 기록),
+#                조회 실패 / 빈 수집 결과는 캐시하지 않음
 # ============================================
 
-import re
-from fastapi import APIRouter
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from services.aci_client import APICRequestError
+from services.capacity_collector import (
+    DEFAULT_INTERVAL,
+    INTERVALS,
+    RESOURCES,
+    collect_capacity,
+    empty_capacity,
+)
+from services.capacity_forecast import CapacityHistory
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 자원별 상위 노드 최대 반환 개수
+MAX_RESOURCE_TOP = 50
+
+# 용량 재수집 최소 간격(초) — 기본(5분) 통계 클래스 갱신 주기
+CAPACITY_MAX_AGE = INTERVALS[DEFAULT_INTERVAL]
+
+# TCAM 리포트에 사용하는 자원 키
+TCAM_RESOURCE = "policy_cam"
+
+# 프로세스 공용 사용률 이력 (모든 주기의 신규 수집 시 기록, 같은 시각대 중복은 생략)
+_capacity_history = CapacityHistory()
+
+# 다중 자원 수집 결과 캐시 (키 = 통계 주기, TTL = 주기 길이) — TCAM 리포트도 공용
+_resource_cache = TTLCache(ttl=CAPACITY_MAX_AGE)
+
+
+def _check_interval(interval: str) -> None:
+    """통계 주기 검증 (알 수 없으면 400)"""
+    if interval not in INTERVALS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown interval: {interval} (choose from {', '.join(INTERVALS)})",
+        )
+
 
-def get_capacity_data(aci):
+def _collect_resources(aci, interval: str = DEFAULT_INTERVAL) -> dict:
+    """
+    다중 자원 수집 (주기 길이 동안 재사용), 신규 수집마다 주기와 무관하게 이력 기록
+
+    조회 실패 / 노드가 없는 결과는 캐시하지 않음 (1d 주기에서 빈 결과가 하루 동안
+    고정되지 않도록 다음 요청에서 재수집).
+    """
+
+    def load() -> dict:
+        collected = collect_capacity(
+            aci, interval=interval, top=MAX_RESOURCE_TOP, strict=True
+        )
+        _capacity_history.record(collected)
+        return collected
+
+    try:
+        return _resource_cache.get_or_load(
+            interval,
+            load,
+            ttl=INTERVALS[interval],
+            cache_if=lambda collected: bool(collected["nodes"]),
+        )
+    except APICRequestError as exc:
+        logger.warning("용량 수집 실패 [%s] (다음 요청에서 재시도): %s", interval, exc)
+        return empty_capacity(interval)
+
+
+def get_capacity_data(aci, interval: str = DEFAULT_INTERVAL):
     """
     용량 리포트 데이터 조회 및 분석
 
@@ -18,66 +89,121 @@ def get_capacity_data(aci):
     - 노드별 사용률
     - 고사용률 노드 (>=80%) 감지
 
+    다중 자원 수집 결과(주기 길이 동안 캐시)의 Policy CAM 자원으로 구성하므로
+    /api/capacity, /api/all 조회도 사용률 이력에 기록됨 (1d 통계는 하루 1회만 APIC 조회).
+
     Args:
-        aci: ACIClient 인스턴스
+        aci:      ACIClient 인스턴스
+        interval: 통계 주기 (5min / 15min / 1h / 1d)
     Returns:
         dict: 용량 리포트 딕셔너리
+    Raises:
+        HTTPException 400: 알 수 없는 주기
     """
-    # ============================================
-    # 1. 노드 ID -> 이름 매핑 테이블 생성
-    # ============================================
-    nodes = aci.get("fabricNode")
-    node_map = {}
-    for node in nodes:
-        attr = node["fabricNode"]["attributes"]
-        # ID와 이름 매핑 저장
-        node_map[attr.get("id", "")] = attr.get("name", "")
-
-    # ============================================
-    # 2. TCAM 사용량 조회
-    # ============================================
-    # eqptcapacityPolUsage5min: Policy CAM 사용량 클래스 (5분 평균)
-    tcam_data = aci.get("eqptcapacityPolUsage5min")
-
-    # ============================================
-    # 3. 노드별 사용량 분석
-    # ============================================
-    tcam_usage = []
-    high_usage_count = 0  # 고사용률 노드 카운터
-
-    for item in tcam_data:
-        attr = item["eqptcapacityPolUsage5min"]["attributes"]
-        dn = attr.get("dn", "")
-
-        # DN에서 노드 ID 추출 (정규식 사용)
-        match = re.search(r"node-(\d+)", dn)
-        node_id = match.group(1) if match else "unknown"
-
-        # 노드 이름 조회
-        node_name = node_map.get(node_id, node_id)
-
-        # 사용량 계산
-        used = int(attr.get("polUsageCum", 0))
-        cap = int(attr.get("polUsageCapCum", 1))  # 0으로 나누기 방지
-
-        # 사용률 계산 (퍼센트)
-        pct = round((used / cap) * 100, 1) if cap > 0 else 0
-
-        # 고사용률 체크 (80% 이상)
-        if pct >= 80:
-            high_usage_count += 1
-
-        # 결과 추가
-        tcam_usage.append(
-            {"node": node_name, "used": used, "capacity": cap, "percentage": pct}
-        )
+    _check_interval(interval)
+    collected = _collect_resources(aci, interval)
+
+    # 고사용률 노드 수 / 사용률 높은 순 상위 15개 (collect_capacity에서 정렬 완료)
+    high_usage_count = sum(
+        1 for row in collected["high_usage"] if row["resource"] == TCAM_RESOURCE
+    )
+    tcam_usage = [
+        {
+            "node": row["name"],
+            "used": row["used"],
+            "capacity": row["capacity"],
+            "percentage": row["percentage"],
+        }
+        for row in collected["top"][TCAM_RESOURCE][:15]
+    ]
+    return {
+        "interval": interval,
+        "high_usage_count": high_usage_count,
+        "tcam": tcam_usage,
+    }
+
+
+def get_capacity_resources(
+    aci, top: int = 10, interval: str = DEFAULT_INTERVAL
+) -> dict:
+    """
+    노드 × 자원 사용률 매트릭스
+
+    Policy CAM 외 L2 / L3 Endpoint, VLAN, Multicast, LPM 자원 클래스를
+    동시 조회하고 fabricNode 1회 조회 결과로 노드 이름을 조인.
+
+    Args:
+        aci:      ACIClient 인스턴스
+        top:      자원별 상위 노드 수 (최대 MAX_RESOURCE_TOP)
+        interval: 통계 주기 (5min / 15min / 1h / 1d), 주기 길이 동안 캐시
+    Returns:
+        dict: {interval, resources, nodes, top, high_usage}
+    Raises:
+        HTTPException 400: 알 수 없는 주기
+    """
+    _check_interval(interval)
+    collected = _collect_resources(aci, interval)
+    top = max(1, min(top, MAX_RESOURCE_TOP))
+    return {
+        **collected,
+        "top": {key: rows[:top] for key, rows in collected["top"].items()},
+    }
 
-    # ============================================
-    # 4. 사용률 높은 순으로 정렬
-    # ============================================
-    tcam_usage.sort(key=lambda x: x["percentage"], reverse=True)
 
-    # ============================================
-    # 5. 결과 반환
-    # ============================================
-    return {"high_usage_count": high_usage_count, "tcam": tcam_usage[:15]}  # 상위 15개
+def _check_resource(resource: Optional[str]) -> None:
+    """자원 키 검증 (알 수 없으면 400)"""
+    if resource is not None and resource not in {r.key for r in RESOURCES}:
+        raise HTTPException(status_code=400, detail=f"Unknown resource: {resource}")
+
+
+def get_capacity_history(
+    aci, node: str, resource: str, seconds: int = 7 * 86400, tier: Optional[str] = None
+) -> dict:
+    """
+    노드 / 자원 사용률 이력 (메모리 시계열)
+
+    Args:
+        aci:      ACIClient 인스턴스 (이력 갱신용 수집)
+        node:     노드 ID
+        resource: 자원 키 (policy_cam 등)
+        seconds:  조회 구간(초)
+        tier:     1h / 1d (미지정 시 구간에 맞춰 자동 선택)
+    Returns:
+        dict: {series, tier, step, points: [{t, avg, max}]}
+    Raises:
+        HTTPException 400: 알 수 없는 자원 / 계층
+    """
+    _check_resource(resource)
+    _collect_resources(aci)
+    try:
+        return _capacity_history.history(node, resource, seconds, tier)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def get_capacity_forecast(
+    aci, resource: Optional[str] = None, tier: str = "1h", top: int = 20
+) -> dict:
+    """
+    노드 × 자원 소진 예상일 (가까운 순)
+
+    이력 시리즈 전체를 한 번에 최소제곱 직선 적합하여
+    100% 도달까지 남은 일수를 계산 (증가 추세가 없으면 None).
+
+    Args:
+        aci:      ACIClient 인스턴스 (이력 갱신용 수집)
+        resource: 지정 시 해당 자원만
+        tier:     적합 계층 (1h: 최근 7일 / 1d: 최근 1년)
+        top:      반환 개수 (최대 MAX_RESOURCE_TOP)
+    Returns:
+        dict: {tier, items: [{id, name, resource, current, slope_per_day, days_to_exhaustion}]}
+    Raises:
+        HTTPException 400: 알 수 없는 자원 / 계층
+    """
+    _check_resource(resource)
+    _collect_resources(aci)
+    try:
+        rows = _capacity_history.forecast(resource, tier)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"tier": tier, "items": rows[: max(1, min(top, MAX_RESOURCE_TOP))]}
@@ -1,129 +1,313 @@
 # ============================================
 # Endpoint Tracker Router
 # 목적: ACI Endpoint 추적 데이터 제공
-# 버전: v1.1.0 - 검색 기능 추가
+# 버전: v1.11.0 - 보조 IP(fvIp) / VM / Host 정보 일괄 조인 추가,
+#                다른 분석(토폴로지 영향 범위)용 인덱스 공개 접근자
 # ============================================
 
-import re
-from fastapi import APIRouter
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from services.endpoint_index import (
+    CUBE_DIMENSIONS,
+    SORT_FIELDS,
+    EndpointIndex,
+    build_enrichment,
+)
 
 router = APIRouter()
 
+# ============================================
+# 상수 / 모듈 상태
+# ============================================
+
+# 스냅샷 최대 유지 시간(초) — 프론트엔드 자동 새로고침 주기(30초)와 동일
+SNAPSHOT_MAX_AGE = 30
+
+# 목록 API 최대 페이지 크기
+MAX_PAGE_SIZE = 1000
+
+# 스트리밍 내보내기 시 한 번에 전송할 행 수
+EXPORT_CHUNK_ROWS = 1000
+
+# 내보내기 컬럼 순서
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "mac",
+    "ip",
+    "tenant",
+    "app_profile",
+    "epg",
+    "encap",
+    "node",
+    "interface",
+    "ips",
+    "vm",
+    "host",
+    "peer",
+)
+
+# CSV 셀 내 다중 값 구분자 (보조 IP 목록)
+CSV_MULTI_VALUE_SEP = ";"
+
+# 프로세스 공용 Endpoint 인덱스 (get_endpoint_data 호출 시 갱신)
+_index = EndpointIndex()
+
+
+def _refresh_index(aci) -> EndpointIndex:
+    """
+    fvCEp / fvRsCEpToPathEp 및 보조 정보 클래스 조회 후 인덱스 갱신
+
+    보조 정보(fvIp, fvRsToVm, fvRsHyper, compVm, compHv)는 클래스별 1회씩만
+    일괄 조회하고 부모 DN 해시 조인으로 결합 (Endpoint별 추가 조회 없음).
+    """
+    endpoints = aci.get("fvCEp")
+    paths = aci.get("fvRsCEpToPathEp")
+    enrichment = build_enrichment(
+        ips=aci.get("fvIp"),
+        to_vm=aci.get("fvRsToVm"),
+        hypers=aci.get("fvRsHyper"),
+        vms=aci.get("compVm"),
+        hosts=aci.get("compHv"),
+    )
+    _index.refresh(endpoints, paths, enrichment)
+    return _index
+
+
+def _ensure_index(aci) -> EndpointIndex:
+    """스냅샷이 SNAPSHOT_MAX_AGE보다 오래된 경우에만 갱신"""
+    if _index.age() > SNAPSHOT_MAX_AGE:
+        return _refresh_index(aci)
+    return _index
+
+
+def get_endpoint_index(aci) -> EndpointIndex:
+    """
+    Endpoint 인덱스 (SNAPSHOT_MAX_AGE 이내면 APIC 재조회 없음)
+
+    토폴로지 영향 범위 등 다른 분석에서 노드별 Endpoint 수 조인에 사용.
+    """
+    return _ensure_index(aci)
+
 
 def get_endpoint_data(aci):
     """
     Endpoint 추적 데이터 조회 및 분석
 
+    호출 시마다 인덱스를 갱신하며 변경된 Endpoint만 큐브에 반영.
+
     Args:
         aci: ACIClient 인스턴스
     Returns:
         dict: Endpoint 통계 딕셔너리
     """
-    # fvCEp: Client Endpoint 클래스
-    endpoints = aci.get("fvCEp")
+    index = _refresh_index(aci)
+
+    return {
+        "total": index.cube.total,
+        "by_tenant": [
+            {"tenant": item["value"], "count": item["count"]}
+            for item in index.slice("tenant", top=10)["items"]
+        ],
+        "by_node": [
+            {"node": item["value"], "count": item["count"]}
+            for item in index.slice("node", top=10)["items"]
+        ],
+    }
+
 
-    # Tenant별 집계
-    tenant_count = {}
-    for ep in endpoints:
-        dn = ep["fvCEp"]["attributes"].get("dn", "")
-        parts = dn.split("/")
-        tenant = parts[1].replace("tn-", "") if len(parts) > 1 else "unknown"
-        tenant_count[tenant] = tenant_count.get(tenant, 0) + 1
+def _validate_dimensions(dims) -> None:
+    """차원 이름 검증 (알 수 없는 차원이면 400)"""
+    for dim in dims:
+        if dim not in CUBE_DIMENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown dimension '{dim}' — allowed: {', '.join(CUBE_DIMENSIONS)}",
+            )
 
-    # 정렬 후 상위 10개
-    by_tenant = [
-        {"tenant": k, "count": v}
-        for k, v in sorted(tenant_count.items(), key=lambda x: x[1], reverse=True)
-    ]
 
-    return {"total": len(endpoints), "by_tenant": by_tenant[:10]}
+def get_endpoint_cube(
+    aci, group_by: str, filters: Optional[dict] = None, top: int = 10
+) -> dict:
+    """
+    Endpoint 집계 큐브 slice / drill-down
 
+    예: group_by=node                      → 노드별 Endpoint 수 상위 N
+        group_by=interface, filters={node} → 특정 노드의 인터페이스별 상위 N
 
-def search_endpoint(aci, query):
+    Args:
+        aci:      ACIClient 인스턴스
+        group_by: 집계 차원 (tenant, epg, node, interface, encap, peer)
+        filters:  {차원: 값} 고정 조건
+        top:      반환할 상위 항목 수
+    Returns:
+        dict: {group_by, filters, total, distinct, items, version}
+    Raises:
+        HTTPException 400: 알 수 없는 차원 지정 시
+    """
+    filters = filters or {}
+    _validate_dimensions([group_by, *filters])
+
+    index = _ensure_index(aci)
+    result = index.slice(group_by, filters, top)
+    result["version"] = index.version
+    return result
+
+
+def list_endpoints(
+    aci,
+    sort: str = "mac",
+    order: str = "asc",
+    filters: Optional[dict] = None,
+    query: str = "",
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> dict:
+    """
+    Endpoint 목록 (서버 측 정렬 / 필터 / 커서 페이지네이션)
+
+    Args:
+        aci:     ACIClient 인스턴스
+        sort:    정렬 필드 (mac, ip, tenant, app_profile, epg, encap, node, interface)
+        order:   asc / desc
+        filters: {차원: 값} 정확 일치 필터
+        query:   MAC/IP 부분 문자열 검색어
+        cursor:  이전 응답의 next_cursor
+        limit:   페이지 크기 (최대 MAX_PAGE_SIZE)
+    Returns:
+        dict: {items, next_cursor, total, version}
+    Raises:
+        HTTPException 400: 잘못된 정렬 필드 / 정렬 방향 / 차원 / 커서
+    """
+    filters = filters or {}
+    if sort not in SORT_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sort field '{sort}' — allowed: {', '.join(SORT_FIELDS)}",
+        )
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    _validate_dimensions(filters)
+
+    index = _ensure_index(aci)
+    try:
+        return index.page(
+            sort=sort,
+            descending=(order == "desc"),
+            filters=filters,
+            query=query,
+            cursor=cursor,
+            limit=max(1, min(limit, MAX_PAGE_SIZE)),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _iter_csv(records) -> Iterator[str]:
+    """EndpointRecord 이터레이터 → CSV 텍스트 청크 (EXPORT_CHUNK_ROWS 행 단위)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    rows = 0
+    for record in records:
+        writer.writerow(
+            [
+                (
+                    CSV_MULTI_VALUE_SEP.join(record.ips)
+                    if col == "ips"
+                    else getattr(record, col)
+                )
+                for col in EXPORT_COLUMNS
+            ]
+        )
+        rows += 1
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def _iter_ndjson(records) -> Iterator[str]:
+    """EndpointRecord 이터레이터 → NDJSON 텍스트 청크 (EXPORT_CHUNK_ROWS 행 단위)"""
+    lines: list[str] = []
+    for record in records:
+        lines.append(json.dumps(record.to_dict(), ensure_ascii=False))
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_endpoints(
+    aci, fmt: str = "csv", filters: Optional[dict] = None, query: str = ""
+) -> StreamingResponse:
+    """
+    Endpoint 스트리밍 내보내기 (CSV / NDJSON)
+
+    스냅샷을 generator로 순회하며 EXPORT_CHUNK_ROWS 행씩 바로 전송.
+    전체 결과 리스트를 메모리에 만들지 않으므로 10만 건 이상도 메모리 일정.
+
+    Args:
+        aci:     ACIClient 인스턴스
+        fmt:     csv / ndjson
+        filters: {차원: 값} 정확 일치 필터
+        query:   MAC/IP 부분 문자열 검색어
+    Returns:
+        StreamingResponse
+    Raises:
+        HTTPException 400: 지원하지 않는 형식 / 알 수 없는 차원
+    """
+    filters = filters or {}
+    if fmt not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'ndjson'")
+    _validate_dimensions(filters)
+
+    records = _ensure_index(aci).iter_records(filters, query)
+    if fmt == "csv":
+        body, media_type = _iter_csv(records), "text/csv; charset=utf-8"
+    else:
+        body, media_type = _iter_ndjson(records), "application/x-ndjson"
+
+    filename = f"aci-endpoints-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{fmt}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def search_endpoint(aci, query, exact: bool = False):
     """
     Endpoint 검색 (MAC 또는 IP)
 
-    - MAC 주소 또는 IP 주소로 Endpoint 검색
-    - 연결된 Node, Interface 정보 포함
+    - MAC 주소 또는 IP 주소(보조 IP 포함)로 Endpoint 검색
+    - 연결된 Node, Interface, VM, Host 정보 포함
+    - 정확 일치(해시 인덱스)를 먼저, 이어서 나머지 부분 문자열 일치 반환
+      (예: 10.0.0.1 → 10.0.0.1, 10.0.0.12, 10.0.0.100 ...)
+    - exact=True면 정확 일치만 반환 (해시 인덱스 조회만, 전체 순회 없음)
+    - 인덱스 스냅샷 기준 (SNAPSHOT_MAX_AGE 초과 시 갱신)
 
     Args:
         aci: ACIClient 인스턴스
         query: 검색어 (MAC 또는 IP)
+        exact: 정확 일치만 검색
     Returns:
         list: 검색된 Endpoint 목록
     """
-    # 전체 Endpoint 조회
-    endpoints = aci.get("fvCEp")
-
-    # Endpoint 경로 정보 조회
-    paths = aci.get("fvRsCEpToPathEp")
-
-    # 검색어 정규화 (소문자, 하이픈→콜론)
-    query_normalized = query.lower().replace("-", ":")
-
-    results = []
-
-    for ep in endpoints:
-        attr = ep["fvCEp"]["attributes"]
-        mac = attr.get("mac", "").lower()
-        ip = attr.get("ip", "")
-        dn = attr.get("dn", "")
-
-        # ============================================
-        # MAC 또는 IP 매칭 확인
-        # ============================================
-        if query_normalized in mac or query in ip:
-
-            # DN에서 Tenant, AP, EPG 추출
-            tenant = "unknown"
-            app = "unknown"
-            epg = "unknown"
-
-            parts = dn.split("/")
-            for part in parts:
-                if part.startswith("tn-"):
-                    tenant = part.replace("tn-", "")
-                elif part.startswith("ap-"):
-                    app = part.replace("ap-", "")
-                elif part.startswith("epg-"):
-                    epg = part.replace("epg-", "")
-
-            # ============================================
-            # 경로 정보 찾기 (Node, Interface)
-            # ============================================
-            node = "-"
-            interface = "-"
-
-            for path in paths:
-                path_dn = path["fvRsCEpToPathEp"]["attributes"].get("dn", "")
-
-                # 현재 Endpoint의 경로인지 확인
-                if dn in path_dn:
-                    tdn = path["fvRsCEpToPathEp"]["attributes"].get("tDn", "")
-
-                    # 노드 ID 추출 (정규식)
-                    node_match = re.search(r"paths-(\d+)", tdn)
-                    if node_match:
-                        node = node_match.group(1)
-
-                    # 인터페이스 추출 (정규식)
-                    iface_match = re.search(r"\[(.+)\]", tdn)
-                    if iface_match:
-                        interface = iface_match.group(1)
-                    break
-
-            # 결과 추가
-            results.append(
-                {
-                    "mac": attr.get("mac", ""),
-                    "ip": ip if ip else "-",
-                    "tenant": tenant,
-                    "app_profile": app,
-                    "epg": epg,
-                    "encap": attr.get("encap", ""),
-                    "node": node,
-                    "interface": interface,
-                }
-            )
-
-    return results
+    index = _ensure_index(aci)
+    records = index.lookup(query)
+    if not exact:
+        seen = {record.dn for record in records}
+        records.extend(
+            record
+            for record in index.iter_records(query=query)
+            if record.dn not in seen
+        )
+    return [record.to_dict() for record in records]
@@ -1,13 +1,80 @@
 # ============================================
 # Health Check Router
 # 목적: ACI Fabric 헬스 체크 데이터 제공
+# 버전: v1.11.0 - Fault 인덱스 기반 분석 (group-by / top-N / 신규·해제 변경분)
+#                + 수집 시점별 Fault / 노드 수치 시계열 기록 (추세 API)
+#                + Fabric / Pod / Node / Tenant Health Score 일괄 수집 (TTL 캐시)
+#                + faultInst 조회 실패 시 Fault 인덱스 유지 (strict 조회),
+#                  조회 실패한 항목은 시계열 기록 생략
 # ============================================
 
-from fastapi import APIRouter
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from services.aci_client import APICRequestError
+from services.fault_index import FAULT_DIMENSIONS, FaultIndex
+from services.health_score import collect_health_scores
+from services.timeseries import TIERS, TimeSeriesStore
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 # FastAPI 라우터 인스턴스 생성
 router = APIRouter()
 
+# 스냅샷 최대 유지 시간(초) — 프론트엔드 자동 새로고침 주기(30초)와 동일
+SNAPSHOT_MAX_AGE = 30
+
+# 수집 시점마다 시계열로 기록할 Fault 코드 수 (상위 N개 + 기존 시리즈)
+TREND_TOP_CODES = 50
+
+# 추세 조회 최대 구간(초) — 최상위 계층 보존 기간
+TREND_MAX_RANGE = TIERS[-1][1] * TIERS[-1][2]
+
+# 프로세스 공용 Fault 인덱스 (get_health_data 호출 시 갱신)
+_fault_index = FaultIndex()
+
+# 프로세스 공용 시계열 저장소 (get_health_data 호출 시 기록)
+_trend_store = TimeSeriesStore()
+
+# Health Score 수집 결과 캐시 (SNAPSHOT_MAX_AGE 동안 재사용)
+_score_cache = TTLCache(ttl=SNAPSHOT_MAX_AGE)
+
+
+def _fetch(aci, class_name: str) -> Optional[list]:
+    """strict 조회 — 실패 시 로그 후 None (빈 결과와 구분)"""
+    try:
+        return aci.get(class_name, strict=True)
+    except APICRequestError as exc:
+        logger.warning("%s 조회 실패: %s", class_name, exc)
+        return None
+
+
+def _refresh_fault_index(aci) -> bool:
+    """
+    faultInst 조회 후 Fault 인덱스 갱신
+
+    조회 실패 시 빈 배열로 갱신하면 모든 Fault가 해제 → 다음 조회에서 전부 신규로
+    보고되므로, strict 조회로 실패를 구분해 기존 스냅샷을 그대로 유지.
+
+    Returns:
+        bool: 갱신 여부 (조회 실패 시 False)
+    """
+    faults = _fetch(aci, "faultInst")
+    if faults is None:
+        return False
+    _fault_index.refresh(faults)
+    return True
+
+
+def _ensure_fault_index(aci) -> FaultIndex:
+    """스냅샷이 SNAPSHOT_MAX_AGE보다 오래된 경우에만 faultInst 재조회"""
+    if _fault_index.age() > SNAPSHOT_MAX_AGE:
+        _refresh_fault_index(aci)
+    return _fault_index
+
 
 def get_health_data(aci):
     """
@@ -24,43 +91,45 @@ def get_health_data(aci):
         dict: 헬스 체크 결과 딕셔너리
     """
     # ============================================
-    # 1. Fault 조회 및 심각도별 분류
+    # 1. Fault 인덱스 갱신 및 심각도별 분류
     # ============================================
     # faultInst: ACI Fault 클래스 (고정값)
-    faults = aci.get("faultInst")
-
-    # 심각도별 카운터 초기화
-    severity_count = {"critical": 0, "major": 0, "minor": 0, "warning": 0}
+    # 변경된 Fault만 집계 큐브에 반영 (전체 재집계 없음, 조회 실패 시 직전 스냅샷 유지)
+    faults_ok = _refresh_fault_index(aci)
 
-    # Fault 순회하며 심각도별 집계
-    for fault in faults:
-        sev = fault["faultInst"]["attributes"].get("severity", "")
-        if sev in severity_count:
-            severity_count[sev] += 1
+    counts = _fault_index.severity_counts()
+    severity_count = {
+        sev: counts.get(sev, 0) for sev in ("critical", "major", "minor", "warning")
+    }
 
     # ============================================
-    # 2. Critical/Major Fault 상세 정보 추출
+    # 2. Critical/Major Fault 상위 10건 (심각도 → 최근 전환 순)
     # ============================================
-    critical_major = []
-    for fault in faults:
-        attr = fault["faultInst"]["attributes"]
-        # Critical 또는 Major인 경우만 추가
-        if attr.get("severity") in ["critical", "major"]:
-            critical_major.append(
-                {
-                    "severity": attr.get("severity", "").upper(),
-                    "description": attr.get("descr", "")[:80],  # 80자로 제한
-                }
-            )
+    critical_major = [
+        {
+            "severity": record.severity.upper(),
+            "code": record.code,
+            "node": record.node,
+            "dn": record.dn,
+            "description": record.descr,
+        }
+        for record in _fault_index.top_faults(10, ("critical", "major"))
+    ]
+
+    changes = _fault_index.changes(limit=0)
 
     # ============================================
     # 3. 노드 상태 조회
     # ============================================
     # fabricNode: 모든 Fabric 노드 (Spine, Leaf, Controller)
-    nodes = aci.get("fabricNode")
+    nodes = _fetch(aci, "fabricNode")
 
     # infraWiNode: Controller 상태 (별도 API)
-    controllers = aci.get("infraWiNode")
+    controllers = _fetch(aci, "infraWiNode")
+
+    # 둘 중 하나라도 실패하면 Up/Down 수치는 부정확 → 시계열 기록 생략
+    nodes_ok = nodes is not None and controllers is not None
+    nodes, controllers = nodes or [], controllers or []
 
     # Controller 상태를 딕셔너리로 저장 (이름 -> 상태)
     ctrl_status = {}
@@ -91,11 +160,152 @@ def get_health_data(aci):
             down_count += 1
 
     # ============================================
-    # 4. 결과 반환
+    # 4. 시계열 기록
+    # ============================================
+    _record_trend(
+        severity_count if faults_ok else None,
+        (up_count, down_count) if nodes_ok else None,
+    )
+
+    # ============================================
+    # 5. 결과 반환
     # ============================================
     return {
-        "total_faults": len(faults),
+        "total_faults": _fault_index.cube.total,
         "severity": severity_count,
-        "critical_major": critical_major[:10],  # 최대 10개
+        "critical_major": critical_major,
+        "by_code": _fault_index.slice("code", top=10)["items"],
+        "changes": {
+            "new": changes["new_count"],
+            "cleared": changes["cleared_count"],
+        },
         "nodes": {"up": up_count, "down": down_count},
     }
+
+
+def _record_trend(
+    severity_count: Optional[dict], node_counts: Optional[tuple[int, int]]
+) -> None:
+    """
+    현재 수집 결과를 시계열 저장소에 기록
+
+    조회에 실패한 항목(None)은 기록하지 않음 — 0이 실제 값으로 기록되어
+    상위 계층 평균까지 끌어내리는 것을 방지.
+
+    시리즈:
+    - fault.total, fault.severity.<심각도>
+    - node.up, node.down
+    - fault.code.<코드> — 상위 TREND_TOP_CODES개 + 기존 시리즈(사라진 코드는 0)
+
+    Args:
+        severity_count: 심각도별 Fault 수 (faultInst 조회 실패 시 None)
+        node_counts:    (Up 노드 수, Down 노드 수) (노드 조회 실패 시 None)
+    """
+    values: dict[str, float] = {}
+    if node_counts is not None:
+        values["node.up"], values["node.down"] = node_counts
+
+    if severity_count is not None:
+        values["fault.total"] = _fault_index.cube.total
+        for sev, count in severity_count.items():
+            values[f"fault.severity.{sev}"] = count
+        for name in _trend_store.names("fault.code."):
+            values[name] = 0
+        for item in _fault_index.slice("code", top=TREND_TOP_CODES)["items"]:
+            values[f"fault.code.{item['value']}"] = item["count"]
+
+    if values:
+        _trend_store.record(values)
+
+
+def get_health_trend(
+    series: Optional[list[str]] = None, seconds: int = 3600, tier: Optional[str] = None
+) -> dict:
+    """
+    Fault / 노드 수치 추세 조회 (메모리 시계열, APIC 호출 없음)
+
+    Args:
+        series:  시리즈 이름 목록 (미지정 시 기록된 시리즈 이름만 반환)
+        seconds: 조회 구간(초), 최대 TREND_MAX_RANGE
+        tier:    1m / 1h / 1d (미지정 시 구간에 맞춰 자동 선택)
+    Returns:
+        dict: {available, series: [{series, tier, step, points}]}
+    Raises:
+        HTTPException 400: 알 수 없는 계층 지정 시
+    """
+    seconds = max(60, min(seconds, TREND_MAX_RANGE))
+    try:
+        results = [
+            _trend_store.range_query(name, seconds, tier) for name in series or []
+        ]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"available": _trend_store.names(), "series": results}
+
+
+def get_health_scores(aci) -> dict:
+    """
+    Fabric / Pod / Node / Tenant Health Score
+
+    노드 수와 무관하게 클래스 쿼리 4회(fabricHealthTotal, topSystem+healthInst,
+    fabricNode, fvOverallHealth15min)로 수집하며 SNAPSHOT_MAX_AGE 동안 캐시.
+
+    Args:
+        aci: ACIClient 인스턴스
+    Returns:
+        dict: {fabric, pods, nodes, tenants} — nodes / tenants는 점수 낮은 순
+    """
+    return _score_cache.get_or_load("scores", lambda: collect_health_scores(aci))
+
+
+def get_fault_analytics(
+    aci,
+    group_by: str = "code",
+    filters: Optional[dict] = None,
+    subtree: str = "",
+    top: int = 10,
+) -> dict:
+    """
+    Fault group-by 분석 + top-N
+
+    예: group_by=code                         → Fault 코드별 상위 N
+        group_by=node, filters={severity}     → 특정 심각도의 노드별 상위 N
+        group_by=code, subtree=topology/pod-1/node-101 → 노드 101 하위만
+
+    Args:
+        aci:      ACIClient 인스턴스
+        group_by: 집계 차원 (code, severity, node, tenant, lifecycle)
+        filters:  {차원: 값} 고정 조건
+        subtree:  DN 서브트리 접두어 (선택)
+        top:      반환할 상위 항목 수
+    Returns:
+        dict: {group_by, filters, subtree, total, distinct, items, version}
+    Raises:
+        HTTPException 400: 알 수 없는 차원 지정 시
+    """
+    filters = filters or {}
+    for dim in [group_by, *filters]:
+        if dim not in FAULT_DIMENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown dimension '{dim}' — allowed: {', '.join(FAULT_DIMENSIONS)}",
+            )
+
+    index = _ensure_fault_index(aci)
+    result = index.slice(group_by, filters, top, subtree)
+    result["subtree"] = subtree
+    result["version"] = index.version
+    return result
+
+
+def get_fault_changes(aci, limit: int = 50) -> dict:
+    """
+    직전 스냅샷 대비 신규 / 해제 Fault 목록
+
+    Args:
+        aci:   ACIClient 인스턴스
+        limit: 신규 / 해제 각각 반환할 최대 건수
+    Returns:
+        dict: {version, new_count, cleared_count, new, cleared}
+    """
+    return _ensure_fault_index(aci).changes(limit)
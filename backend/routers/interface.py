@@ -1,12 +1,59 @@
 # ============================================
 # Interface Monitor Router
 # 목적: ACI 인터페이스 상태 모니터링 데이터 제공
+# 버전: v1.11.0 - 포트 사용률 / 에러율 상위 N 수집, 포트 flap 추적,
+#                노드 / 모듈별 집계 및 노드 × 포트 heatmap 추가
 # ============================================
 
+from typing import Optional
+
 from fastapi import APIRouter
 
+from services.dn_utils import parse_phys_port, split_eth_port
+from services.interface_counters import InterfaceCounterCollector
+from services.interface_flap import InterfaceFlapTracker
+from services.ttl_cache import TTLCache
+
 router = APIRouter()
 
+# 카운터 재수집 최소 간격(초) — 프론트엔드 자동 새로고침 주기(30초)와 동일
+COUNTER_MAX_AGE = 30
+
+# 수집기가 보관하는 상위 N 최대값 (요청 top은 이 범위 내에서 잘라 반환)
+COUNTER_MAX_TOP = 50
+
+# 프로세스 공용 카운터 수집기 (에러 delta 계산용 직전 누적값 보관)
+_counter_collector = InterfaceCounterCollector(top=COUNTER_MAX_TOP)
+
+# 프로세스 공용 포트 상태 전환 추적기 (get_interface_data 호출 시 갱신)
+_flap_tracker = InterfaceFlapTracker()
+
+# 노드 × 포트 heatmap 캐시 (get_interface_data 집계 시 함께 갱신)
+_heatmap_cache = TTLCache(ttl=COUNTER_MAX_AGE)
+
+# heatmap 셀 값
+HEATMAP_UP, HEATMAP_DOWN, HEATMAP_ABSENT = 1, 0, -1
+
+
+def _port_sort_key(label: str) -> tuple:
+    """포트 라벨("모듈/포트") 숫자 순 정렬 키"""
+    return tuple(int(p) if p.isdigit() else 0 for p in label.split("/"))
+
+
+def _build_heatmap(states: dict[str, dict[str, int]]) -> dict:
+    """
+    노드별 포트 상태 → heatmap payload
+
+    Args:
+        states: 노드 ID → {포트 라벨: HEATMAP_UP / HEATMAP_DOWN}
+    Returns:
+        dict: {nodes, ports, cells} — cells[i][j] = nodes[i]의 ports[j] 상태
+    """
+    nodes = sorted(states, key=lambda n: int(n) if n.isdigit() else 0)
+    ports = sorted({p for node in states.values() for p in node}, key=_port_sort_key)
+    cells = [[states[n].get(p, HEATMAP_ABSENT) for p in ports] for n in nodes]
+    return {"nodes": nodes, "ports": ports, "cells": cells}
+
 
 def get_interface_data(aci):
     """
@@ -16,6 +63,7 @@ def get_interface_data(aci):
     - 전체 인터페이스 수
     - Up/Down 개수
     - Down 원인별 분류
+    - 노드 / 모듈별 Up/Down (ethpmPhysIf 1회 일괄 조회, 노드별 조회 없음)
 
     Args:
         aci: ACIClient 인스턴스
@@ -28,17 +76,24 @@ def get_interface_data(aci):
     # ethpmPhysIf: 물리 인터페이스 상태 클래스
     interfaces = aci.get("ethpmPhysIf")
 
+    # 직전 스냅샷 대비 상태 전환 기록 (flap 추적)
+    _flap_tracker.update(interfaces)
+
     # ============================================
-    # 2. Up/Down 분류 및 Down 원인 집계
+    # 2. Up/Down 분류, Down 원인, 노드 / 모듈별 집계 (1회 순회)
     # ============================================
     up_count = 0
     down_count = 0
     down_reasons = {}  # 원인별 카운터
+    by_node: dict[str, list[int]] = {}  # 노드 → [up, down]
+    by_module: dict[tuple[str, str], list[int]] = {}  # (노드, 모듈) → [up, down]
+    port_states: dict[str, dict[str, int]] = {}  # heatmap용 노드 → 포트 → 상태
 
     for iface in interfaces:
         attr = iface["ethpmPhysIf"]["attributes"]
+        is_up = attr.get("operSt") == "up"
 
-        if attr.get("operSt") == "up":
+        if is_up:
             up_count += 1
         else:
             down_count += 1
@@ -46,6 +101,20 @@ def get_interface_data(aci):
             reason = attr.get("operStQual", "unknown")
             down_reasons[reason] = down_reasons.get(reason, 0) + 1
 
+        # DN에서 노드 / 포트 추출 (사전 컴파일 정규식)
+        node, port_name = parse_phys_port(attr.get("dn", ""))
+        if not node:
+            continue
+        module, port = split_eth_port(port_name)
+        slot = 0 if is_up else 1
+        by_node.setdefault(node, [0, 0])[slot] += 1
+        by_module.setdefault((node, module), [0, 0])[slot] += 1
+        port_states.setdefault(node, {})[f"{module}/{port}"] = (
+            HEATMAP_UP if is_up else HEATMAP_DOWN
+        )
+
+    _heatmap_cache.set("heatmap", _build_heatmap(port_states))
+
     # ============================================
     # 3. Down 원인을 리스트로 변환 (정렬)
     # ============================================
@@ -63,4 +132,91 @@ def get_interface_data(aci):
         "up": up_count,
         "down": down_count,
         "down_reasons": down_reasons_list,
+        "flapping": len(_flap_tracker.flapping()),
+        "by_node": [
+            {"node": node, "up": up, "down": down, "total": up + down}
+            for node, (up, down) in sorted(
+                by_node.items(), key=lambda x: _port_sort_key(x[0])
+            )
+        ],
+        "by_module": [
+            {"node": node, "module": module, "up": up, "down": down}
+            for (node, module), (up, down) in sorted(
+                by_module.items(),
+                key=lambda x: (_port_sort_key(x[0][0]), _port_sort_key(x[0][1])),
+            )
+        ],
+    }
+
+
+def get_interface_heatmap(aci) -> dict:
+    """
+    노드 × 포트 상태 heatmap (1=up, 0=down, -1=포트 없음)
+
+    get_interface_data 집계 시 함께 계산된 결과를 재사용하며,
+    캐시가 만료된 경우에만 get_interface_data를 다시 실행 (ethpmPhysIf 1회 조회).
+
+    Args:
+        aci: ACIClient 인스턴스
+    Returns:
+        dict: {nodes, ports, cells}
+    """
+    heatmap = _heatmap_cache.get("heatmap")
+    if heatmap is None:
+        get_interface_data(aci)
+        heatmap = _heatmap_cache.get("heatmap")
+    return heatmap
+
+
+def get_interface_counters(aci, top: int = 10) -> dict:
+    """
+    포트 사용률 / 에러율 상위 N
+
+    - eqptIngrTotal5min / eqptEgrTotal5min: 5분 평균 사용률, 초당 비트
+    - rmonEtherStats / rmonDot3Stats: 직전 수집 대비 에러 증가분, 초당 에러
+    - COUNTER_MAX_AGE 이내 재요청은 직전 결과 재사용
+
+    Args:
+        aci: ACIClient 인스턴스
+        top: 반환할 상위 포트 수 (최대 COUNTER_MAX_TOP)
+    Returns:
+        dict: {ports, interval, top_utilization, top_errors}
+    """
+    if _counter_collector.age() > COUNTER_MAX_AGE:
+        _counter_collector.refresh(
+            ingress=aci.get("eqptIngrTotal5min"),
+            egress=aci.get("eqptEgrTotal5min"),
+            ether=aci.get("rmonEtherStats"),
+            dot3=aci.get("rmonDot3Stats"),
+        )
+    top = max(1, min(top, COUNTER_MAX_TOP))
+    result = _counter_collector.result
+    return {
+        "ports": result["ports"],
+        "interval": result["interval"],
+        "top_utilization": result["top_utilization"][:top],
+        "top_errors": result["top_errors"][:top],
+    }
+
+
+def get_interface_flaps(aci, threshold: Optional[int] = None) -> dict:
+    """
+    Flapping 포트 목록
+
+    슬라이딩 윈도우(_flap_tracker.window초) 내 상태 전환 수가 임계값 이상인 포트.
+    COUNTER_MAX_AGE보다 오래된 경우에만 ethpmPhysIf 재조회.
+
+    Args:
+        aci:       ACIClient 인스턴스
+        threshold: 판정 임계값 (미지정 시 기본값)
+    Returns:
+        dict: {window, threshold, ports: [{node, interface, transitions, state, history}]}
+    """
+    if _flap_tracker.age() > COUNTER_MAX_AGE:
+        _flap_tracker.update(aci.get("ethpmPhysIf"))
+    threshold = _flap_tracker.threshold if threshold is None else max(1, threshold)
+    return {
+        "window": _flap_tracker.window,
+        "threshold": threshold,
+        "ports": _flap_tracker.flapping(threshold),
     }
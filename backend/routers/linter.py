@@ -1,26 +1,32 @@
 # ============================================
 # ACI Config Linter Router
 # 목적: Config Linter API 엔드포인트 제공
-# 버전: v1.3.0
+# 버전: v1.11.0 - 증분 lint 모드 (incremental=true — 직전 실행 대비 변경 오브젝트만 재평가),
+#                업로드 스트리밍 파싱 (대용량 export — 청크 단위, 규칙이 쓰는 데이터만 보관)
 #
 # 엔드포인트:
-#   GET  /api/lint            — APIC Live 조회 후 Linter 실행
+#   GET  /api/lint            — APIC Live 조회 후 Linter 실행 (?incremental=true)
 #   POST /api/lint/upload     — JSON 파일 업로드 후 Linter 실행
 # ============================================
 
-import json
 import logging
 
 from fastapi import APIRouter, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
+from services.json_stream import JSONStreamError
 from services.linter_engine import LinterService
+from services.linter_incremental import IncrementalLinter
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Live lint 증분 상태 (직전 수집 데이터 + 이슈)
+_live_linter = IncrementalLinter()
 
-def get_lint_data(aci) -> dict:
+
+def get_lint_data(aci, incremental: bool = False) -> dict:
     """
     APIC Live 조회 기반 Linter 실행
 
@@ -28,7 +34,9 @@ def get_lint_data(aci) -> dict:
     main.py의 ACIClient 인스턴스를 그대로 전달받아 사용.
 
     Args:
-        aci: ACIClient 인스턴스
+        aci:         ACIClient 인스턴스
+        incremental: True면 직전 Live lint 대비 변경 오브젝트만 재평가
+                     (첫 호출은 전체 평가, 응답에 incremental 통계 포함)
     Returns:
         dict: Linter 결과 (source, total_issues, summary, results)
     Raises:
@@ -36,7 +44,7 @@ def get_lint_data(aci) -> dict:
     """
     try:
         service = LinterService()
-        return service.run_live(aci)
+        return service.run_live(aci, _live_linter if incremental else None)
     except Exception as exc:
         logger.error("Live lint failed: %s", exc)
         raise HTTPException(
@@ -50,7 +58,9 @@ async def lint_upload(file: UploadFile) -> dict:
     업로드 파일 기반 Linter 실행
 
     POST /api/lint/upload 핸들러에서 호출.
-    파일을 메모리에서 직접 파싱 — 디스크 저장 없음.
+    multipart 파서가 임시 파일(SpooledTemporaryFile)에 저장한 업로드를
+    청크 단위로 스트리밍 파싱 — 파일 전체를 메모리에 올리지 않음.
+    수 GB export 파싱이 이벤트 루프를 막지 않도록 스레드 풀에서 실행.
 
     Args:
         file: FastAPI UploadFile (multipart/form-data)
@@ -71,30 +81,23 @@ async def lint_upload(file: UploadFile) -> dict:
         )
 
     # ============================================
-    # 2. 파일 내용 읽기 및 JSON 파싱
+    # 2. 스트리밍 파싱 + Linter 실행
     # ============================================
     try:
-        raw_bytes: bytes = await file.read()
-        file_content: dict = json.loads(raw_bytes.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        service = LinterService()
+        return await run_in_threadpool(service.run_from_stream, file.file)
+    except JSONStreamError as exc:
         logger.warning("JSON parse error for file '%s': %s", filename, exc)
         raise HTTPException(
             status_code=400,
             detail=f"Invalid JSON format: {exc}",
         )
-    except Exception as exc:
+    except (UnicodeDecodeError, OSError) as exc:
         logger.error("File read error: %s", exc)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to read file: {exc}",
         )
-
-    # ============================================
-    # 3. Linter 실행
-    # ============================================
-    try:
-        service = LinterService()
-        return service.run_from_file(file_content)
     except Exception as exc:
         logger.error("File-based lint failed: %s", exc)
         raise HTTPException(
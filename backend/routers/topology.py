@@ -1,12 +1,112 @@
 # ============================================
 # Topology Viewer Router
 # 목적: ACI Fabric 토폴로지 데이터 제공
+# 버전: v1.11.0 - fabricLink / lldpAdjEp 링크 그래프 + 인접 인덱스 캐시,
+#                이웃 / 차수 / 최소 홉 경로 조회,
+#                스냅샷 버전 / 노드·링크 diff + since 기반 delta 응답,
+#                구성 버전별 계층형 레이아웃 좌표 (교차 최소화) 캐시,
+#                Leaf 이중화 / 단일 장애점 / 노드 장애 영향 범위 (+ Endpoint 인덱스 조인),
+#                조회 실패 / 빈 fabricNode 시 스냅샷 미반영 + 직전 그래프 유지
 # ============================================
 
-from fastapi import APIRouter
+import logging
+import time
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from services.aci_client import APICRequestError, fetch_classes
+from services.topology_analysis import (
+    AnalysisCache,
+    TopologyAnalysis,
+    endpoint_counts,
+    impacted_endpoints,
+)
+from services.topology_diff import TopologySnapshotStore
+from services.topology_graph import TopologyGraph, build_topology_graph
+from services.topology_layout import LayoutCache
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 그래프 재수집 최소 간격(초) — 프론트엔드 자동 새로고침 주기(30초)와 동일
+SNAPSHOT_MAX_AGE = 30
+
+# 토폴로지 수집 클래스 (동시 조회)
+TOPOLOGY_CLASSES = ("fabricNode", "fabricLink", "lldpAdjEp")
+
+# 그래프 캐시 (SNAPSHOT_MAX_AGE 동안 이웃 / 경로 조회는 APIC 호출 없음)
+_graph_cache = TTLCache(ttl=SNAPSHOT_MAX_AGE)
+
+# 토폴로지 스냅샷 버전 / diff (그래프 재구성 시 갱신)
+_snapshots = TopologySnapshotStore()
+
+# 레이아웃 좌표 (구성 버전이 바뀔 때만 재계산)
+_layouts = LayoutCache()
+
+# 이중화 / 단일 장애점 분석 (스냅샷 버전이 바뀔 때만 재계산)
+_analyses = AnalysisCache()
+
+# 영향 범위 질의 최대 장애 가정 노드 수
+MAX_FAILED_NODES = 16
+
+# 변경 이벤트 최대 반환 개수
+MAX_CHANGE_LIMIT = 100
+
+
+def _get_graph(aci) -> TopologyGraph:
+    """
+    토폴로지 그래프 (캐시 만료 시에만 3개 클래스 동시 조회 후 재구성 + 스냅샷 diff)
+
+    조회 실패 또는 fabricNode가 빈 경우 스냅샷에 반영하지 않고(전 노드 제거로 기록되어
+    버전 / 구성 버전이 올라가는 문제 방지) 직전 그래프를 반환 — 캐시하지 않아 다음 요청에서 재수집.
+    """
+
+    def load() -> TopologyGraph:
+        fetched = fetch_classes(aci, list(TOPOLOGY_CLASSES), strict=True)
+        if not fetched["fabricNode"]:
+            raise APICRequestError("fabricNode 조회 결과 없음")
+        graph = build_topology_graph(
+            fetched["fabricNode"], fetched["fabricLink"], fetched["lldpAdjEp"]
+        )
+        _snapshots.apply(graph)
+        return graph
+
+    try:
+        return _graph_cache.get_or_load("graph", load)
+    except APICRequestError as exc:
+        logger.warning("토폴로지 수집 실패 (직전 그래프 유지): %s", exc)
+        previous = _graph_cache.get_stale("graph")
+        return previous if previous is not None else build_topology_graph([], [], [])
+
+
+def _get_analysis(aci) -> TopologyAnalysis:
+    """캐시된 그래프의 이중화 / 단일 장애점 분석"""
+    graph = _get_graph(aci)
+    return _analyses.get(_snapshots.version, graph)
+
+
+def _check_node(graph: TopologyGraph, node_id: str) -> None:
+    """노드 ID 검증 (없으면 400)"""
+    if node_id not in graph.nodes:
+        raise HTTPException(status_code=400, detail=f"Unknown node: {node_id}")
+
+
+def _parse_nodes(graph: TopologyGraph, value: str) -> list[str]:
+    """콤마 구분 노드 ID 목록 검증 (없거나 알 수 없는 노드 / 상한 초과 시 400)"""
+    nodes = list(dict.fromkeys(n.strip() for n in value.split(",") if n.strip()))
+    if not nodes:
+        raise HTTPException(status_code=400, detail="No node specified")
+    if len(nodes) > MAX_FAILED_NODES:
+        raise HTTPException(
+            status_code=400, detail=f"Too many nodes (max {MAX_FAILED_NODES})"
+        )
+    for node_id in nodes:
+        _check_node(graph, node_id)
+    return nodes
+
 
 def get_topology_data(aci):
     """
@@ -14,7 +114,8 @@ def get_topology_data(aci):
 
     조회 항목:
     - Fabric 노드 목록 (Controller, Spine, Leaf)
-    - 노드별 상세 정보 (ID, 이름, 모델, 상태)
+    - 노드별 상세 정보 (ID, 이름, 모델, 상태, 이웃 수)
+    - 링크 수 / Down 링크 수
 
     Args:
         aci: ACIClient 인스턴스
@@ -22,61 +123,280 @@ def get_topology_data(aci):
         dict: 토폴로지 데이터 딕셔너리
     """
     # ============================================
-    # 1. Fabric 노드 목록 조회
+    # 1. 토폴로지 그래프 (fabricNode / fabricLink / lldpAdjEp)
     # ============================================
-    # fabricNode: 모든 Fabric 노드 클래스
-    nodes = aci.get("fabricNode")
+    payload = _get_graph(aci).to_dict()
 
     # ============================================
-    # 2. 역할별 노드 분류
+    # 2. 역할별 노드 분류 (그래프 노드는 ID 순)
     # ============================================
-    spines = []
-    leafs = []
-    controllers = []
-
-    for node in nodes:
-        attr = node["fabricNode"]["attributes"]
-
-        # 노드 정보 추출
-        info = {
-            "id": attr.get("id", ""),
-            "name": attr.get("name", ""),
-            "model": attr.get("model", ""),
-            # 상태 판단: active면 UP, 아니면 DOWN
-            # Controller는 fabricSt가 없으므로 기본 UP 처리
-            "status": (
-                "UP"
-                if attr.get("fabricSt") == "active" or attr.get("role") == "controller"
-                else "DOWN"
-            ),
-        }
-
-        # 역할에 따라 분류
-        role = attr.get("role", "")
-        if role == "spine":
-            spines.append(info)
-        elif role == "leaf":
-            leafs.append(info)
-        elif role == "controller":
-            controllers.append(info)
+    by_role: dict[str, list[dict]] = {"spine": [], "leaf": [], "controller": []}
+    for node in payload["nodes"]:
+        if node["role"] in by_role:
+            by_role[node["role"]].append(
+                {
+                    "id": node["id"],
+                    "name": node["name"],
+                    "model": node["model"],
+                    "status": node["status"],
+                    "degree": node["degree"],
+                }
+            )
 
     # ============================================
-    # 3. ID 순으로 정렬
+    # 3. 결과 반환
     # ============================================
-    spines.sort(key=lambda x: int(x["id"]))
-    leafs.sort(key=lambda x: int(x["id"]))
-    controllers.sort(key=lambda x: int(x["id"]))
+    summary = payload["summary"]
+    return {
+        "version": _snapshots.version,
+        "summary": {
+            "controllers": len(by_role["controller"]),
+            "spines": len(by_role["spine"]),
+            "leafs": len(by_role["leaf"]),
+            "links": summary["links"],
+            "links_down": summary["links_down"],
+        },
+        "controllers": by_role["controller"],
+        "spines": by_role["spine"],
+        "leafs": by_role["leaf"],
+    }
 
-    # ============================================
-    # 4. 결과 반환
-    # ============================================
+
+def get_topology_graph(aci, since: Optional[int] = None) -> dict:
+    """
+    전체 노드 / 링크 그래프 또는 since 버전 이후 변경분
+
+    Args:
+        aci:   ACIClient 인스턴스
+        since: 클라이언트가 가진 버전 (지정 시 delta 응답)
+    Returns:
+        dict: since 미지정 — {version, summary, nodes: [{id, name, role, pod, model, status, degree}],
+                              links: [{a, a_port, b, b_port, state, kind}]}
+              since 지정   — {version, since, full: False, nodes: {added, removed, changed},
+                              links: {added, removed, changed}}
+                             (since가 보관 범위 밖이면 full: True + 전체 payload)
+    """
+    _get_graph(aci)
+    if since is None:
+        return _snapshots.snapshot()
+    return _snapshots.delta(since)
+
+
+def get_topology_changes(aci, limit: int = 20) -> dict:
+    """
+    최근 토폴로지 변경 이벤트 (노드 추가 / 제거 / 상태 변경, 링크 추가 / 제거 / 상태 변경)
+
+    Args:
+        aci:   ACIClient 인스턴스
+        limit: 최대 이벤트 수 (최대 MAX_CHANGE_LIMIT)
+    Returns:
+        dict: {version, changes: [{version, ts, nodes: {...}, links: {...}}]}
+    """
+    _get_graph(aci)
+    return {
+        "version": _snapshots.version,
+        "changes": _snapshots.changes(max(1, min(limit, MAX_CHANGE_LIMIT))),
+    }
+
+
+def get_topology_layout(aci) -> dict:
+    """
+    그리기용 레이아웃 (좌표는 구성 버전별 캐시, 상태는 현재 스냅샷)
+
+    Args:
+        aci: ACIClient 인스턴스
+    Returns:
+        dict: {version, layout_version, width, height, crossings,
+               layers: [{name, y}], pods: [{pod, x, width}],
+               nodes: [{id, name, role, pod, status, x, y}],
+               links: [{a, a_port, b, b_port, state, kind}]}
+    """
+    graph = _get_graph(aci)
+    layout_version = _snapshots.structure_version
+    layout = _layouts.get(layout_version, graph)
+    positions = layout["positions"]
+    return {
+        "version": _snapshots.version,
+        "layout_version": layout_version,
+        "width": layout["width"],
+        "height": layout["height"],
+        "crossings": layout["crossings"],
+        "layers": layout["layers"],
+        "pods": layout["pods"],
+        "nodes": [
+            {
+                "id": node_id,
+                "name": graph.nodes[node_id]["name"],
+                "role": graph.nodes[node_id]["role"],
+                "pod": graph.nodes[node_id]["pod"],
+                "status": graph.nodes[node_id]["status"],
+                "x": x,
+                "y": y,
+            }
+            for node_id, (x, y) in positions.items()
+        ],
+        # 포트 포함 (graph?since delta의 링크 키와 동일 — 클라이언트 증분 반영용)
+        "links": graph.links,
+    }
+
+
+def get_topology_neighbors(aci, node: str) -> dict:
+    """
+    노드 이웃 조회 (캐시된 인접 인덱스, APIC 재조회 없음)
+
+    Args:
+        aci:  ACIClient 인스턴스
+        node: 노드 ID (외부 이웃은 "ext:<sysName>")
+    Returns:
+        dict: {node, degree, neighbors: [{id, name, role, links}]}
+    Raises:
+        HTTPException 400: 알 수 없는 노드
+    """
+    graph = _get_graph(aci)
+    _check_node(graph, node)
     return {
+        "node": node,
+        "degree": graph.degree(node),
+        "neighbors": graph.neighbors(node),
+    }
+
+
+def get_topology_path(aci, src: str, dst: str, avoid: str = "") -> dict:
+    """
+    두 노드 간 최소 홉 경로 (up 링크만, 외부 / Controller 노드는 경유 제외)
+
+    Args:
+        aci:   ACIClient 인스턴스
+        src:   출발 노드 ID
+        dst:   도착 노드 ID
+        avoid: 장애 가정으로 경유 제외할 노드 ID (콤마 구분)
+    Returns:
+        dict: {src, dst, avoid, path: [{id, name, role}], hops} — 경로 없으면 path=[], hops=None
+    Raises:
+        HTTPException 400: 알 수 없는 노드
+    """
+    graph = _get_graph(aci)
+    _check_node(graph, src)
+    _check_node(graph, dst)
+    blocked = _parse_nodes(graph, avoid) if avoid.strip() else []
+    path = graph.shortest_path(src, dst, avoid=blocked) or []
+    return {
+        "src": src,
+        "dst": dst,
+        "avoid": blocked,
+        "path": [
+            {
+                "id": n,
+                "name": graph.nodes[n]["name"],
+                "role": graph.nodes[n]["role"],
+            }
+            for n in path
+        ],
+        "hops": len(path) - 1 if path else None,
+    }
+
+
+def get_topology_redundancy(aci, endpoints) -> dict:
+    """
+    Leaf 이중화 수준 + 단일 장애점 (노드별 Endpoint 수 조인)
+
+    Args:
+        aci:       ACIClient 인스턴스
+        endpoints: EndpointIndex (routers.endpoint.get_endpoint_index)
+    Returns:
+        dict: {version, computed_ms,
+               summary: {leaves, single_homed, isolated, spof},
+               leaves: [{id, name, pod, status, uplinks, endpoints}] (이중화 낮은 순),
+               spof: [{id, name, role, isolated, detached, endpoints}]}
+    """
+    analysis = _get_analysis(aci)
+    nodes = analysis.graph.nodes
+    counts = endpoint_counts(endpoints)
+    leaves = sorted(
+        (
+            {
+                "id": leaf,
+                "name": nodes[leaf]["name"],
+                "pod": nodes[leaf]["pod"],
+                "status": nodes[leaf]["status"],
+                "uplinks": analysis.redundancy[leaf],
+                "endpoints": counts.get(leaf, 0),
+            }
+            for leaf in analysis.leaves
+        ),
+        key=lambda item: (item["uplinks"], -item["endpoints"]),
+    )
+    spof = [
+        {
+            "id": item["id"],
+            "name": nodes[item["id"]]["name"],
+            "role": nodes[item["id"]]["role"],
+            "isolated": item["isolated"],
+            "detached": item["detached"],
+            # 장애 노드 자신 + 고립 Leaf에만 연결된 Endpoint
+            "endpoints": impacted_endpoints(
+                endpoints, [item["id"], *item["isolated"]], top=0
+            )["endpoints"],
+        }
+        for item in analysis.spof
+    ]
+    return {
+        "version": _snapshots.version,
+        "computed_ms": _analyses.computed_ms,
         "summary": {
-            "controllers": len(controllers),
-            "spines": len(spines),
-            "leafs": len(leafs),
+            "leaves": len(leaves),
+            "single_homed": sum(1 for leaf in leaves if leaf["uplinks"] == 1),
+            "isolated": sum(1 for leaf in leaves if leaf["uplinks"] == 0),
+            "spof": len(spof),
+        },
+        "leaves": leaves,
+        "spof": spof,
+    }
+
+
+def get_topology_impact(aci, node: str, endpoints) -> dict:
+    """
+    노드 장애 가정 시 영향 범위 (캐시된 그래프 / Endpoint 인덱스, APIC 재조회 없음)
+
+    Args:
+        aci:       ACIClient 인스턴스
+        node:      장애 가정 노드 ID (콤마 구분, 최대 MAX_FAILED_NODES)
+        endpoints: EndpointIndex (routers.endpoint.get_endpoint_index)
+    Returns:
+        dict: {version, failed, isolated: [{id, name}], degraded: [{id, name, before, after}],
+               detached: [{id, name, role}],
+               endpoints: {impacted, at_risk}, epgs: {total, items: [{tenant, epg, endpoints}]},
+               elapsed_ms}
+               impacted = 연결된 Leaf가 모두 장애 / 고립인 Endpoint
+                          (vPC Endpoint는 양쪽 Leaf 모두 해당될 때만),
+               at_risk  = 이중화가 1 이하로 떨어진 Leaf의 Endpoint
+    Raises:
+        HTTPException 400: 노드 미지정 / 알 수 없는 노드
+    """
+    analysis = _get_analysis(aci)
+    nodes = analysis.graph.nodes
+    failed = _parse_nodes(analysis.graph, node)
+
+    started = time.perf_counter()
+    radius = analysis.blast_radius(failed)
+    counts = endpoint_counts(endpoints)
+    impacted = impacted_endpoints(endpoints, [*radius["failed"], *radius["isolated"]])
+    at_risk = [d["id"] for d in radius["degraded"] if d["after"] <= 1]
+    return {
+        "version": _snapshots.version,
+        "failed": radius["failed"],
+        "isolated": [{"id": n, "name": nodes[n]["name"]} for n in radius["isolated"]],
+        "degraded": [
+            {**item, "name": nodes[item["id"]]["name"]} for item in radius["degraded"]
+        ],
+        "detached": [
+            {"id": n, "name": nodes[n]["name"], "role": nodes[n]["role"]}
+            for n in radius["detached"]
+        ],
+        "endpoints": {
+            "impacted": impacted["endpoints"],
+            "at_risk": sum(counts.get(n, 0) for n in at_risk),
         },
-        "controllers": controllers,
-        "spines": spines,
-        "leafs": leafs,
+        "epgs": impacted["epgs"],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
     }
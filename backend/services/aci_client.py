@@ -2,11 +2,15 @@
 # ACI API Client
 # 목적: ACI APIC 연결 및 API 호출 공통 모듈
 # 버전: v1.7.0 - login() Race Condition 수정 (threading.Lock)
+#       v1.11.0 - fetch_classes: 여러 클래스 쿼리 동시 실행 헬퍼,
+#                get(strict=True): 조회 실패를 빈 배열 대신 APICRequestError로 전달,
+#                fetch_classes(strict=True): 실패한 클래스가 있으면 APICRequestError
 # ============================================
 
 import logging
 import threading
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import requests
 import yaml
@@ -17,6 +21,10 @@ requests.packages.urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
 
 
+class APICRequestError(RuntimeError):
+    """APIC 조회 실패 (get(strict=True)에서만 발생 — 빈 결과와 실패 구분용)"""
+
+
 class ACIClient:
     """
     ACI APIC API 클라이언트 클래스
@@ -164,6 +172,7 @@ class ACIClient:
         Raises:
             requests.exceptions.Timeout: 타임아웃 발생 시
             requests.exceptions.ConnectionError: 연결 오류 발생 시
+            requests.exceptions.HTTPError: 401 외 오류 응답 시
         """
         url = f"{self.apic}/api/class/{class_name}.json"
 
@@ -178,10 +187,13 @@ class ACIClient:
             self.logged_in = False
             raise requests.exceptions.ConnectionError("session_expired")
 
+        # 그 외 오류 응답(400 / 5xx — imdata에 error 오브젝트)은 조회 실패로 처리
+        resp.raise_for_status()
+
         # imdata 반환, class_name 키 없는 항목(error 오브젝트 등) 필터링
         return [item for item in resp.json().get("imdata", []) if class_name in item]
 
-    def get(self, class_name: str, query: str = "") -> list:
+    def get(self, class_name: str, query: str = "", strict: bool = False) -> list:
         """
         ACI API GET 요청 공통 메서드
 
@@ -193,14 +205,17 @@ class ACIClient:
         Args:
             class_name: ACI 클래스명 (예: faultInst, fabricNode 등)
             query: 추가 쿼리 파라미터 (옵션)
+            strict: True면 실패 시 빈 배열 대신 APICRequestError 발생
         Returns:
             list: API 응답의 imdata 배열 (실패 시 빈 배열)
+        Raises:
+            APICRequestError: strict=True이고 조회에 실패한 경우
         """
         # 로그인 상태 확인 및 자동 로그인
         if not self.logged_in:
             if not self.login():
                 logger.error("로그인 실패로 API 조회 불가: %s", class_name)
-                return []
+                return self._failed(strict, f"login failed: {class_name}")
 
         # ============================================
         # retry 횟수만큼 재시도 (Failover + 세션 재로그인 포함)
@@ -220,7 +235,7 @@ class ACIClient:
                 # 다음 시도 전 Failover 로그인 시도
                 if not self.login():
                     logger.error("Failover 로그인 실패. 빈 배열 반환.")
-                    return []
+                    return self._failed(strict, f"failover login failed: {class_name}")
 
             except requests.exceptions.ConnectionError as exc:
                 if "session_expired" in str(exc):
@@ -232,7 +247,7 @@ class ACIClient:
                     )
                     if not self.login():
                         logger.error("재로그인 실패. 빈 배열 반환.")
-                        return []
+                        return self._failed(strict, f"re-login failed: {class_name}")
                 else:
                     logger.warning(
                         "연결 오류 (시도 %d/%d) class=%s host=%s",
@@ -243,15 +258,62 @@ class ACIClient:
                     )
                     if not self.login():
                         logger.error("Failover 로그인 실패. 빈 배열 반환.")
-                        return []
+                        return self._failed(
+                            strict, f"failover login failed: {class_name}"
+                        )
 
             except Exception as exc:
                 logger.error("예상치 못한 오류 class=%s: %s", class_name, exc)
-                return []
+                return self._failed(strict, f"{class_name}: {exc}")
 
         logger.error(
             "최대 재시도 횟수 초과 (%d회). 빈 배열 반환. class=%s",
             self.retry,
             class_name,
         )
+        return self._failed(strict, f"retries exhausted: {class_name}")
+
+    @staticmethod
+    def _failed(strict: bool, message: str) -> list:
+        """조회 실패 처리 — strict면 예외, 아니면 빈 배열 (기존 동작)"""
+        if strict:
+            raise APICRequestError(message)
         return []
+
+
+def fetch_classes(
+    aci, class_names: list[str], max_workers: Optional[int] = None, strict: bool = False
+) -> dict[str, list]:
+    """
+    여러 클래스 쿼리 동시 실행 (지연 = 가장 느린 쿼리 1개)
+
+    ACIClient 세션은 스레드 간 공유 (/api/all과 동일, login()은 _login_lock으로 직렬화).
+
+    Args:
+        aci:         ACIClient 인스턴스
+        class_names: 조회할 클래스명 목록
+        max_workers: 동시 실행 수 (기본 클래스 수)
+        strict:      True면 조회 실패 클래스가 있을 때 APICRequestError
+                     (결과를 캐시 / 스냅샷에 반영하기 전 실패 구분용)
+    Returns:
+        dict: 클래스명 → imdata (strict가 아니면 조회 실패 시 빈 배열)
+    Raises:
+        APICRequestError: strict=True이고 조회 실패 클래스가 있는 경우
+    """
+    options = {"strict": True} if strict else {}
+    results: dict[str, list] = {}
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers or len(class_names)) as executor:
+        futures = {
+            name: executor.submit(aci.get, name, **options) for name in class_names
+        }
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:
+                logger.error("클래스 조회 오류 [%s]: %s", name, exc)
+                results[name] = []
+                failed.append(name)
+    if strict and failed:
+        raise APICRequestError(f"클래스 조회 실패: {', '.join(failed)}")
+    return results
@@ -0,0 +1,141 @@
+# ============================================
+# Aggregation Cube
+# 목적: 스냅샷 인덱스 공용 다차원 집계 큐브
+# 버전: v1.11.0
+#
+# Endpoint 인덱스(v1.10.0)에서 분리하여 Fault 분석 등 다른 인덱스와 공유.
+# 항목 추가/삭제 시 셀·posting·marginal만 갱신하므로
+# 새로고침 diff와 결합하면 전체 재집계 없이 group-by 응답 가능.
+# ============================================
+
+import heapq
+from operator import itemgetter
+from typing import Iterable, Optional
+
+
+# ============================================
+# AggregationCube
+# ============================================
+
+
+class AggregationCube:
+    """
+    범용 다차원 집계 큐브
+
+    - _cells:     셀 키(차원 값 튜플) → 항목 수
+    - _postings:  차원 → 값 → 해당 값을 가진 셀 키 set
+    - _marginals: 차원 → 값 → 항목 수 (필터 없는 group-by 즉시 응답용)
+
+    add/remove는 O(차원 수), slice는 필터 교집합 크기에 비례.
+    """
+
+    def __init__(self, dimensions: tuple[str, ...]) -> None:
+        self.dimensions = dimensions
+        self._cells: dict[tuple[str, ...], int] = {}
+        self._postings: dict[str, dict[str, set[tuple[str, ...]]]] = {
+            dim: {} for dim in dimensions
+        }
+        self._marginals: dict[str, dict[str, int]] = {dim: {} for dim in dimensions}
+        self.total: int = 0
+
+    def add(self, key: tuple[str, ...]) -> None:
+        """항목 1건 추가 (key는 dimensions 순서의 값 튜플)"""
+        count = self._cells.get(key, 0)
+        self._cells[key] = count + 1
+        self.total += 1
+        for dim, value in zip(self.dimensions, key):
+            marginal = self._marginals[dim]
+            marginal[value] = marginal.get(value, 0) + 1
+            if count == 0:
+                self._postings[dim].setdefault(value, set()).add(key)
+
+    def remove(self, key: tuple[str, ...]) -> None:
+        """항목 1건 제거 (셀이 비면 posting에서도 제거)"""
+        count = self._cells.get(key, 0)
+        if count == 0:
+            return
+        self.total -= 1
+        if count == 1:
+            del self._cells[key]
+        else:
+            self._cells[key] = count - 1
+        for dim, value in zip(self.dimensions, key):
+            marginal = self._marginals[dim]
+            marginal[value] -= 1
+            if marginal[value] == 0:
+                del marginal[value]
+            if count == 1:
+                posting = self._postings[dim][value]
+                posting.discard(key)
+                if not posting:
+                    del self._postings[dim][value]
+
+    def marginal(self, dim: str) -> dict[str, int]:
+        """차원 값별 항목 수 (필터 없음) 복사본"""
+        if dim not in self.dimensions:
+            raise ValueError(f"Unknown dimension: {dim}")
+        return dict(self._marginals[dim])
+
+    def cells(self, dim: str, values: Iterable[str]) -> dict[tuple[str, ...], int]:
+        """dim 값이 values 중 하나인 셀 → 항목 수 복사본 (여러 차원 값을 함께 보는 조인용)"""
+        if dim not in self.dimensions:
+            raise ValueError(f"Unknown dimension: {dim}")
+        postings = self._postings[dim]
+        return {
+            key: self._cells[key]
+            for value in set(values)
+            for key in postings.get(value, ())
+        }
+
+    def slice(
+        self, group_by: str, filters: Optional[dict[str, str]] = None, top: int = 10
+    ) -> dict:
+        """
+        필터 조건으로 큐브를 자른 뒤 group_by 차원별 상위 N개 반환
+
+        Args:
+            group_by: 집계 차원 (dimensions 중 하나)
+            filters:  {차원: 값} 고정 조건 (drill-down 경로)
+            top:      반환할 상위 항목 수
+        Returns:
+            dict: {group_by, filters, total, distinct, items: [{value, count}]}
+        Raises:
+            ValueError: 알 수 없는 차원 지정 시
+        """
+        filters = filters or {}
+        for dim in [group_by, *filters]:
+            if dim not in self.dimensions:
+                raise ValueError(f"Unknown dimension: {dim}")
+
+        if not filters:
+            # 필터 없음 → marginal 카운터로 즉시 응답
+            counts = self._marginals[group_by]
+        else:
+            counts = {}
+            group_idx = self.dimensions.index(group_by)
+            for key in self._filtered_cells(filters):
+                value = key[group_idx]
+                counts[value] = counts.get(value, 0) + self._cells[key]
+
+        top_items = heapq.nlargest(max(top, 0), counts.items(), key=itemgetter(1))
+
+        return {
+            "group_by": group_by,
+            "filters": filters,
+            "total": sum(counts.values()),
+            "distinct": len(counts),
+            "items": [{"value": k, "count": v} for k, v in top_items],
+        }
+
+    def _filtered_cells(self, filters: dict[str, str]) -> set[tuple[str, ...]]:
+        """필터 조건별 posting 교집합 (작은 집합부터 교차)"""
+        postings = sorted(
+            (self._postings[dim].get(value, set()) for dim, value in filters.items()),
+            key=len,
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
@@ -0,0 +1,167 @@
+# ============================================
+# Audit Activity Histogram
+# 목적: 설정 변경 이력의 요일 × 시간대 버킷 집계 (변경 작업 시간대 준수 점검)
+# 버전: v1.11.0
+#
+# 구조:
+#   bucket_of        — created 문자열 → 버킷 번호 (요일 * 24 + 시)
+#   AuditHistogram   — 전체 / 사용자별 / Tenant별 168칸 카운터
+#
+# 설계 노트:
+#   - 요일 / 시각은 created 문자열의 오프셋(APIC 현지 시각) 기준
+#     · 서버 타임존과 무관하게 운영자가 보는 APIC 시각으로 집계
+#   - 카운터는 덧셈만 하므로 레코드 순서와 무관 → 동기화 신규 레코드를 그대로 누적
+#   - 최초 조회 시 저장소 전체로 1회 구성, 이후 증분 (O(신규 건수))
+#   - 응답은 7 × 24 배열 — 브라우저는 원본 레코드 없이 그리기만 함
+# ============================================
+
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from services.dn_utils import extract_tenant
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 요일 라벨 (datetime.weekday() 순서: 월=0)
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# 버킷 수 (7일 × 24시간)
+BUCKETS = 7 * 24
+
+# Tenant 하위가 아닌 DN(fabric / infra 정책 등)의 Tenant 키
+NO_TENANT = "-"
+
+
+def bucket_of(created: str) -> int:
+    """
+    created 문자열 → 버킷 번호 (weekday * 24 + hour)
+
+    예: 2026-03-17T09:00:00.000+09:00 (화) → 1 * 24 + 9 = 33
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    moment = datetime.fromisoformat(created)
+    return moment.weekday() * 24 + moment.hour
+
+
+def _to_grid(counts: list[int]) -> list[list[int]]:
+    """168칸 카운터 → 7 × 24 배열"""
+    rows = iter(counts)
+    return [[next(rows) for _ in range(24)] for _ in range(7)]
+
+
+# ============================================
+# AuditHistogram
+# ============================================
+
+
+class AuditHistogram:
+    """
+    요일 × 시간대 변경 횟수 집계
+
+    Args:
+        loader: 전체 레코드 반환 함수 — 최초 구성 시 사용 (AuditStore.iter_all)
+    """
+
+    def __init__(self, loader: Callable[[], list[dict]]) -> None:
+        self._loader = loader
+        self._overall = [0] * BUCKETS
+        self._by_user: dict[str, list[int]] = {}
+        self._by_tenant: dict[str, list[int]] = {}
+        self._built = False
+        self._lock = threading.Lock()
+
+    # ----------------------------------------
+    # 집계
+    # ----------------------------------------
+    def add(self, records: list[dict]) -> None:
+        """동기화로 새로 저장된 레코드 누적 (구성 전이면 무시 — 구성 시 포함됨)"""
+        if not records:
+            return
+        with self._lock:
+            if self._built:
+                for record in records:
+                    self._count(record)
+
+    def invalidate(self) -> None:
+        """집계 초기화 — 다음 조회 시 저장소 전체로 재구성 (저장소 초기화 후 호출)"""
+        with self._lock:
+            self._overall = [0] * BUCKETS
+            self._by_user = {}
+            self._by_tenant = {}
+            self._built = False
+
+    def _count(self, record: dict) -> None:
+        """레코드 1건 누적 (lock 보유 상태에서 호출)"""
+        try:
+            bucket = bucket_of(record["created"])
+        except ValueError:
+            return
+        self._overall[bucket] += 1
+        for table, key in (
+            (self._by_user, record["user"]),
+            (self._by_tenant, extract_tenant(record["affected"]) or NO_TENANT),
+        ):
+            counts = table.get(key)
+            if counts is None:
+                counts = table[key] = [0] * BUCKETS
+            counts[bucket] += 1
+
+    def _ensure_built(self) -> None:
+        """최초 조회 시 저장소 전체로 구성 (lock 보유 상태에서 호출)"""
+        if self._built:
+            return
+        for record in self._loader():
+            self._count(record)
+        self._built = True
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def snapshot(
+        self,
+        user: Optional[str] = None,
+        tenant: Optional[str] = None,
+        top: int = 10,
+    ) -> dict:
+        """
+        버킷 배열 조회
+
+        Args:
+            user:   지정 시 해당 사용자 버킷만 (by_user에는 해당 사용자 1건)
+            tenant: 지정 시 해당 Tenant 버킷만
+            top:    by_user / by_tenant 반환 개수 (변경 횟수 내림차순)
+        Returns:
+            dict: {weekdays, total, buckets[7][24],
+                   by_user: [{user, total, buckets}], by_tenant: [{tenant, total, buckets}]}
+        """
+        with self._lock:
+            self._ensure_built()
+            by_user = self._ranked(self._by_user, "user", user, top)
+            by_tenant = self._ranked(self._by_tenant, "tenant", tenant, top)
+            overall = list(self._overall)
+        return {
+            "weekdays": list(WEEKDAYS),
+            "total": sum(overall),
+            "buckets": _to_grid(overall),
+            "by_user": by_user,
+            "by_tenant": by_tenant,
+        }
+
+    @staticmethod
+    def _ranked(
+        table: dict[str, list[int]], label: str, key: Optional[str], top: int
+    ) -> list[dict]:
+        """키별 버킷 → 상위 top (key 지정 시 해당 키만)"""
+        if key is not None:
+            items = [(key, table[key])] if key in table else []
+        else:
+            items = sorted(table.items(), key=lambda kv: (-sum(kv[1]), kv[0]))[:top]
+        return [
+            {label: name, "total": sum(counts), "buckets": _to_grid(counts)}
+            for name, counts in items
+        ]
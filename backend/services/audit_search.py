@@ -0,0 +1,232 @@
+# ============================================
+# Audit Search Index
+# 목적: Audit 이력 메모리 역색인 (DN 서브트리 / 토큰 / 사용자 / 유형 / 시간)
+# 버전: v1.11.0
+#
+# 구조:
+#   tokenize          — descr / changeSet 검색 토큰 추출
+#   AuditSearchIndex  — docid(created 오름차순) 기반 posting list 역색인
+#
+# 설계 노트:
+#   - docid = created 오름차순 위치 → 시간 범위는 ts 배열 bisect로 docid 구간
+#   - posting list = array('I') (정렬된 docid, 항목당 4바이트)
+#     · "dn:<상위 DN>"  affected DN의 모든 상위 DN (서브트리 조회 = 정확 일치 1회)
+#     · "w:<토큰>"      descr / changeSet 토큰 (소문자)
+#     · "u:<사용자>", "a:<변경 유형>"
+#   - 조건 결합 = 가장 짧은 posting부터 나머지 posting에 bisect 탐색 (교집합)
+#   - 증분 동기화 레코드는 created 순서로 뒤에 추가 (O(신규 건수))
+#     순서가 어긋나는 경우(백필 진행 중)는 다음 조회 시 저장소에서 재구성
+# ============================================
+
+import bisect
+import re
+import threading
+from array import array
+from typing import Callable, Optional
+
+from services.dn_utils import dn_ancestors
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 검색 토큰 패턴 (영숫자 + DN/속성값에 흔한 구분자 일부)
+_TOKEN_PATTERN: re.Pattern = re.compile(r"[0-9a-z_][0-9a-z_.:\-]*")
+
+# 최소 토큰 길이 (1글자 토큰은 posting만 커지고 검색 가치 낮음)
+MIN_TOKEN_LEN = 2
+
+
+def tokenize(text: str) -> set[str]:
+    """검색 토큰 집합 (소문자, MIN_TOKEN_LEN 이상)"""
+    return {
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) >= MIN_TOKEN_LEN
+    }
+
+
+def _contains(posting: array, docid: int) -> bool:
+    """정렬된 posting에 docid 포함 여부 (bisect)"""
+    idx = bisect.bisect_left(posting, docid)
+    return idx < len(posting) and posting[idx] == docid
+
+
+# ============================================
+# AuditSearchIndex
+# ============================================
+
+
+class AuditSearchIndex:
+    """
+    Audit 역색인
+
+    Args:
+        loader: 전체 레코드(created 오름차순) 반환 함수 — 재구성 시 사용
+                (AuditStore.iter_all)
+    """
+
+    def __init__(self, loader: Callable[[], list[dict]]) -> None:
+        self._loader = loader
+        self._docs: list[tuple] = []
+        self._ts: array = array("d")
+        self._postings: dict[str, array] = {}
+        self._ids: set[str] = set()
+        self._dirty = True
+        self._lock = threading.Lock()
+
+    # ----------------------------------------
+    # 색인
+    # ----------------------------------------
+    def add(self, records: list[dict]) -> None:
+        """
+        동기화로 새로 저장된 레코드 색인
+
+        기존 마지막 created 이후 레코드면 뒤에 추가, 아니면 재구성 예약.
+        """
+        if not records:
+            return
+        records = sorted(records, key=lambda r: (r["ts"], r["id"]))
+        with self._lock:
+            if self._dirty:
+                return
+            if self._ts and records[0]["ts"] < self._ts[-1]:
+                self._dirty = True
+                return
+            for record in records:
+                self._append(record)
+
+    def invalidate(self) -> None:
+        """다음 검색 시 저장소 전체로 재구성 (저장소 초기화 후 호출)"""
+        with self._lock:
+            self._dirty = True
+
+    def _append(self, record: dict) -> None:
+        """레코드 1건 색인 (lock 보유 상태에서 호출)"""
+        if record["id"] in self._ids:
+            return
+        self._ids.add(record["id"])
+        docid = len(self._docs)
+        self._docs.append(
+            (
+                record["id"],
+                record["created"],
+                record["user"],
+                record["action"],
+                record["affected"],
+                record["descr"],
+            )
+        )
+        self._ts.append(record["ts"])
+
+        keys = {f"dn:{prefix}" for prefix in dn_ancestors(record["affected"])}
+        keys.update(
+            f"w:{token}"
+            for token in tokenize(f"{record['descr']} {record['change_set']}")
+        )
+        keys.add(f"u:{record['user']}")
+        keys.add(f"a:{record['action']}")
+        postings = self._postings
+        for key in keys:
+            posting = postings.get(key)
+            if posting is None:
+                posting = postings[key] = array("I")
+            posting.append(docid)
+
+    def _rebuild(self) -> None:
+        """저장소 전체로 재구성 (lock 보유 상태에서 호출)"""
+        self._docs = []
+        self._ts = array("d")
+        self._postings = {}
+        self._ids = set()
+        for record in self._loader():
+            self._append(record)
+        self._dirty = False
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def search(
+        self,
+        subtree: Optional[str] = None,
+        user: Optional[str] = None,
+        action: Optional[str] = None,
+        text: str = "",
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+    ) -> dict:
+        """
+        조건 결합 검색 (최신순)
+
+        Args:
+            subtree: affected DN 서브트리 (해당 DN 자신 포함)
+            user:    사용자 (정확 일치)
+            action:  creation / modification / deletion
+            text:    descr / changeSet 검색어 (공백 구분 토큰 모두 포함)
+            since:   시작 시각 epoch 초 (포함)
+            until:   종료 시각 epoch 초 (미포함)
+            limit:   최대 반환 건수
+        Returns:
+            dict: {items, total}
+        """
+        keys: list[str] = []
+        if subtree:
+            keys.append(f"dn:{subtree}")
+        if user:
+            keys.append(f"u:{user}")
+        if action:
+            keys.append(f"a:{action}")
+        keys.extend(f"w:{token}" for token in sorted(tokenize(text)))
+
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+
+            # ---- 시간 범위 → docid 구간 [lo, hi) ----
+            lo = 0 if since is None else bisect.bisect_left(self._ts, since)
+            hi = (
+                len(self._docs)
+                if until is None
+                else bisect.bisect_left(self._ts, until)
+            )
+            if lo >= hi:
+                return {"items": [], "total": 0}
+
+            if not keys:
+                matched = range(lo, hi)
+            else:
+                postings = []
+                for key in keys:
+                    posting = self._postings.get(key)
+                    if posting is None:
+                        return {"items": [], "total": 0}
+                    # posting 자체도 docid 정렬 → 시간 구간으로 먼저 자름
+                    start = bisect.bisect_left(posting, lo)
+                    end = bisect.bisect_left(posting, hi, start)
+                    postings.append(posting[start:end])
+                postings.sort(key=len)
+                matched = postings[0]
+                for other in postings[1:]:
+                    matched = array("I", (d for d in matched if _contains(other, d)))
+                    if not matched:
+                        break
+
+            total = len(matched)
+            docs = self._docs
+            items = []
+            for idx in range(total - 1, max(total - limit, 0) - 1, -1):
+                doc_id, created, doc_user, doc_action, affected, descr = docs[
+                    matched[idx]
+                ]
+                items.append(
+                    {
+                        "id": doc_id,
+                        "created": created,
+                        "user": doc_user,
+                        "action": doc_action,
+                        "affected": affected,
+                        "descr": descr,
+                    }
+                )
+        return {"items": items, "total": total}
@@ -0,0 +1,365 @@
+# ============================================
+# Audit Store Service
+# 목적: aaaModLR(설정 변경 이력) 로컬 SQLite 저장 및 동기화
+# 버전: v1.11.0
+#
+# 구조:
+#   parse_created — APIC created 문자열 → epoch 초
+#   AuditStore    — SQLite 테이블 (ts / user / action 인덱스) + 동기화 상태
+#   AuditSync     — 최초 1회 과거 방향 페이지 백필 → 이후 created 워터마크 증분
+#
+# 설계 노트:
+#   - 백필: order-by=created|desc 페이지를 끝까지 순회 (호출당 최대
+#     MAX_BACKFILL_PAGES 페이지, 진행 페이지를 저장하여 다음 호출에서 이어감)
+#     · 백필 중 신규 변경이 생기면 페이지가 밀려 중복만 발생 → INSERT OR IGNORE
+#     · aci.get(strict=True)로 조회 실패와 빈 페이지를 구분 — 실패한 페이지에서는
+#       완료 처리 없이 중단하고 다음 호출에서 같은 페이지부터 재시도
+#   - 증분: query-target-filter=ge(aaaModLR.created,"워터마크") 오름차순 페이지
+#     · 같은 created 값의 누락 방지를 위해 gt가 아닌 ge + 중복 무시
+#     · 워터마크 값은 URL 인코딩 (+09:00의 '+'가 공백으로 해석되는 문제 방지)
+#     · 저장소가 비어 워터마크가 없으면 백필부터 다시 시작
+#   - 저장소는 APIC hosts에 귀속 (sync_state.apic_hosts)
+#     · 기존 hosts와 겹치는 host가 하나도 없으면 다른 Fabric으로 보고 이력 / 백필 /
+#       워터마크 초기화 (클러스터 일부 host 변경은 같은 Fabric으로 유지)
+#   - APIC 부하는 신규 변경 건수에 비례, 조회는 로컬 SQLite에서만 처리
+# ============================================
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+from urllib.parse import quote
+
+from services.aci_client import APICRequestError
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# APIC 페이지 크기
+PAGE_SIZE = 1000
+
+# sync() 1회당 백필 최대 페이지 수 (대규모 이력에서 요청 지연 방지)
+MAX_BACKFILL_PAGES = 20
+
+# 증분 동기화 1회당 최대 페이지 수
+MAX_INCREMENTAL_PAGES = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit (
+    id         TEXT PRIMARY KEY,
+    created    TEXT NOT NULL,
+    ts         REAL NOT NULL,
+    user       TEXT NOT NULL,
+    action     TEXT NOT NULL,
+    affected   TEXT NOT NULL,
+    descr      TEXT NOT NULL,
+    change_set TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit(ts);
+CREATE INDEX IF NOT EXISTS idx_audit_user ON audit(user, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_action ON audit(action, ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 조회 결과 컬럼 순서
+_COLUMNS = ("id", "created", "ts", "user", "action", "affected", "descr", "change_set")
+
+
+def parse_created(created: str) -> float:
+    """
+    APIC created 문자열 → epoch 초
+
+    예: 2026-03-17T09:00:00.000+09:00 → 1773705600.0
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    return datetime.fromisoformat(created).timestamp()
+
+
+def _to_row(attr: dict) -> Optional[tuple]:
+    """aaaModLR attributes → INSERT 튜플 (created 파싱 실패 시 None)"""
+    created = attr.get("created", "")
+    try:
+        ts = parse_created(created)
+    except ValueError:
+        logger.warning("aaaModLR created 파싱 실패: %r", created)
+        return None
+    return (
+        attr.get("id") or attr.get("dn", ""),
+        created,
+        ts,
+        attr.get("user", "") or "unknown",
+        attr.get("ind", ""),
+        attr.get("affected", ""),
+        attr.get("descr", ""),
+        attr.get("changeSet", ""),
+    )
+
+
+# ============================================
+# AuditStore
+# ============================================
+
+
+class AuditStore:
+    """
+    aaaModLR 로컬 저장소 (SQLite)
+
+    Args:
+        path: DB 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    # ----------------------------------------
+    # 동기화 상태
+    # ----------------------------------------
+    def get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def bind_fabric(self, hosts: list[str]) -> bool:
+        """
+        저장소를 APIC hosts에 귀속 (다른 Fabric이면 이력 초기화)
+
+        Args:
+            hosts: APIC host 목록
+        Returns:
+            bool: 초기화 여부 (hosts 미기록 저장소는 초기화 없이 귀속만)
+        """
+        current = sorted({host.rstrip("/").lower() for host in hosts})
+        stored = self.get_state("apic_hosts")
+        reset = stored is not None and not set(stored.split(",")) & set(current)
+        with self._lock, self._conn:
+            if reset:
+                self._conn.execute("DELETE FROM audit")
+                self._conn.execute("DELETE FROM sync_state")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                ("apic_hosts", ",".join(current)),
+            )
+        if reset:
+            logger.warning(
+                "APIC hosts 변경 (%s → %s) — Audit 이력 초기화", stored, current
+            )
+        return reset
+
+    # ----------------------------------------
+    # 쓰기
+    # ----------------------------------------
+    def insert(self, items: list) -> list[dict]:
+        """
+        aaaModLR imdata 저장 (중복 id 무시)
+
+        Returns:
+            list: 실제로 새로 저장된 레코드 (dict)
+        """
+        rows = [
+            row
+            for row in (_to_row(item["aaaModLR"]["attributes"]) for item in items)
+            if row is not None
+        ]
+        inserted: list[dict] = []
+        with self._lock, self._conn:
+            for row in rows:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO audit VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row
+                )
+                if cursor.rowcount:
+                    inserted.append(dict(zip(_COLUMNS, row)))
+        return inserted
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def watermark(self) -> Optional[str]:
+        """저장된 가장 최근 created 문자열 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created FROM audit ORDER BY ts DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit").fetchone()[0]
+
+    def count_by(self, column: str) -> dict[str, int]:
+        """user / action 별 건수"""
+        if column not in ("user", "action"):
+            raise ValueError(f"Unknown column: {column}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM audit GROUP BY {column}"
+            ).fetchall()
+        return dict(rows)
+
+    def query(
+        self,
+        user: Optional[str] = None,
+        action: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict]:
+        """
+        조건 조회 (최신순)
+
+        Args:
+            user:   사용자 (정확 일치)
+            action: creation / modification / deletion
+            since:  시작 시각 (epoch 초, 포함)
+            until:  종료 시각 (epoch 초, 미포함)
+        """
+        clauses, params = [], []
+        for column, value in (("user", user), ("action", action)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT {', '.join(_COLUMNS)} FROM audit {where} "
+            "ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def iter_all(self) -> list[dict]:
+        """전체 레코드 (created 오름차순) — 메모리 인덱스 재구성용"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM audit ORDER BY ts, id"
+            ).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+
+# ============================================
+# AuditSync
+# ============================================
+
+
+class AuditSync:
+    """
+    APIC aaaModLR → AuditStore 동기화
+
+    Args:
+        store:     AuditStore 인스턴스
+        page_size: APIC 페이지 크기
+    """
+
+    def __init__(self, store: AuditStore, page_size: int = PAGE_SIZE) -> None:
+        self.store = store
+        self.page_size = page_size
+        self._lock = threading.Lock()
+
+    @property
+    def backfill_done(self) -> bool:
+        return self.store.get_state("backfill_done") == "1"
+
+    def bind_fabric(self, hosts: list[str]) -> bool:
+        """저장소를 APIC hosts에 귀속 (진행 중인 동기화와 직렬화)"""
+        with self._lock:
+            return self.store.bind_fabric(hosts)
+
+    def sync(self, aci) -> list[dict]:
+        """
+        백필 미완료 시 과거 방향으로 이어서 백필, 완료 후에는 워터마크 증분
+
+        동시 호출은 직렬화 (같은 페이지 중복 조회 방지).
+
+        Returns:
+            list: 이번 동기화에서 새로 저장된 레코드
+        """
+        with self._lock:
+            if not self.backfill_done:
+                return self._backfill(aci)
+            return self._incremental(aci)
+
+    def _page(self, aci, query: str, page: int) -> list:
+        """페이지 1개 조회 (조회 실패는 빈 배열이 아닌 APICRequestError)"""
+        return aci.get(
+            "aaaModLR",
+            f"{query}&page-size={self.page_size}&page={page}",
+            strict=True,
+        )
+
+    def _backfill(self, aci) -> list[dict]:
+        """
+        최신 → 과거 방향 페이지 순회 (진행 페이지 저장)
+
+        페이지 조회가 실패하면 완료 처리 없이 중단 → 다음 호출에서 같은 페이지부터 재시도.
+        """
+        query = "order-by=aaaModLR.created|desc"
+        page = int(self.store.get_state("backfill_page") or 0)
+        inserted: list[dict] = []
+        try:
+            for _ in range(MAX_BACKFILL_PAGES):
+                items = self._page(aci, query, page)
+                inserted.extend(self.store.insert(items))
+                page += 1
+                if len(items) < self.page_size:
+                    self._finish_backfill()
+                    break
+        except APICRequestError as exc:
+            logger.warning(
+                "Audit 백필 페이지 %d 조회 실패 (다음 동기화에서 재시도): %s", page, exc
+            )
+        self.store.set_state("backfill_page", str(page))
+        return inserted
+
+    def _finish_backfill(self) -> None:
+        self.store.set_state("backfill_done", "1")
+        logger.info("Audit 백필 완료: %d건", self.store.count())
+
+    def _incremental(self, aci) -> list[dict]:
+        """워터마크 이후 레코드만 오름차순 페이지 조회 (저장소가 비었으면 백필부터 다시)"""
+        watermark = self.store.watermark()
+        if watermark is None:
+            self.store.set_state("backfill_done", "0")
+            self.store.set_state("backfill_page", "0")
+            return self._backfill(aci)
+        # created의 '+09:00'은 쿼리 문자열에서 공백으로 해석될 수 있어 인코딩
+        query = (
+            f'query-target-filter=ge(aaaModLR.created,"{quote(watermark, safe=":.")}")'
+            "&order-by=aaaModLR.created|asc"
+        )
+        inserted: list[dict] = []
+        try:
+            for page in range(MAX_INCREMENTAL_PAGES):
+                items = self._page(aci, query, page)
+                inserted.extend(self.store.insert(items))
+                if len(items) < self.page_size:
+                    break
+        except APICRequestError as exc:
+            logger.warning("Audit 증분 동기화 실패 (다음 동기화에서 재시도): %s", exc)
+        return inserted
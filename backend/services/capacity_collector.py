@@ -0,0 +1,241 @@
+# ============================================
+# Capacity Collector
+# 목적: 노드별 하드웨어 자원(Policy CAM / EP 테이블 / VLAN / Mcast / LPM) 사용률 일괄 수집
+# 버전: v1.11.0
+#
+# 조회 클래스 (자원당 클래스 쿼리 1회 + fabricNode 1회, 노드 수와 무관):
+#   eqptcapacityPolUsage5min     polUsageCum / polUsageCapCum       Policy CAM (TCAM)
+#   eqptcapacityL2Usage5min      localEpCum / localEpCapCum         L2 로컬 Endpoint
+#   eqptcapacityL3Usage5min      localEpCum / localEpCapCum         L3 로컬 Endpoint
+#   eqptcapacityVlanUsage5min    totalCum / totalCapCum             VLAN
+#   eqptcapacityMcastUsage5min   localEpCum / localEpCapCum         Multicast
+#   eqptcapacityPrefixEntries5min extNormalizedCum (이미 %)          LPM / 호스트 라우트
+#
+# 설계 노트:
+#   - 클래스 쿼리는 ThreadPoolExecutor로 동시 실행 → 지연 = 가장 느린 1개 쿼리
+#   - fabricNode는 1회만 조회하여 노드 ID 맵 생성, 모든 자원이 같은 맵으로 조인
+#   - 같은 노드의 여러 레코드(슬롯별 등)는 used / capacity 합산
+#   - capacity가 0인 레코드는 해당 하드웨어 미지원으로 보고 제외
+#   - 클래스명 접미사(5min / 15min / 1h / 1d)만 바꿔 같은 자원 정의로 주기별 조회
+#   - strict=True면 조회 실패 시 APICRequestError (빈 결과가 캐시 / 이력에 남지 않도록)
+# ============================================
+
+from dataclasses import dataclass
+from typing import Optional
+
+from services.aci_client import fetch_classes
+from services.dn_utils import extract_node_id, extract_pod_id
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 통계 주기 (클래스명 접미사)
+DEFAULT_INTERVAL = "5min"
+
+# 지원 통계 주기 → 결과 캐시 TTL(초) = 주기 길이 (그보다 자주 조회해도 값이 같음)
+INTERVALS: dict[str, int] = {
+    "5min": 300,
+    "15min": 900,
+    "1h": 3600,
+    "1d": 86400,
+}
+
+# 고사용률 판정 기준(%)
+HIGH_USAGE_PCT = 80
+
+
+@dataclass(frozen=True)
+class CapacityResource:
+    """
+    용량 자원 정의
+
+    Attributes:
+        key:        응답 키 (예: policy_cam)
+        label:      표시 이름
+        class_base: 통계 클래스명 (주기 접미사 제외)
+        used_attr:  사용량 속성
+        cap_attr:   용량 속성 (None이면 used_attr가 이미 백분율)
+    """
+
+    key: str
+    label: str
+    class_base: str
+    used_attr: str
+    cap_attr: Optional[str]
+
+    def class_name(self, interval: str = DEFAULT_INTERVAL) -> str:
+        return f"{self.class_base}{interval}"
+
+
+RESOURCES: tuple[CapacityResource, ...] = (
+    CapacityResource(
+        "policy_cam",
+        "Policy CAM",
+        "eqptcapacityPolUsage",
+        "polUsageCum",
+        "polUsageCapCum",
+    ),
+    CapacityResource(
+        "l2_endpoint",
+        "L2 Endpoint",
+        "eqptcapacityL2Usage",
+        "localEpCum",
+        "localEpCapCum",
+    ),
+    CapacityResource(
+        "l3_endpoint",
+        "L3 Endpoint",
+        "eqptcapacityL3Usage",
+        "localEpCum",
+        "localEpCapCum",
+    ),
+    CapacityResource(
+        "vlan", "VLAN", "eqptcapacityVlanUsage", "totalCum", "totalCapCum"
+    ),
+    CapacityResource(
+        "multicast",
+        "Multicast",
+        "eqptcapacityMcastUsage",
+        "localEpCum",
+        "localEpCapCum",
+    ),
+    CapacityResource(
+        "lpm_prefix",
+        "LPM / Host Route",
+        "eqptcapacityPrefixEntries",
+        "extNormalizedCum",
+        None,
+    ),
+)
+
+
+def _number(value) -> float:
+    """속성 문자열 → 숫자 (형식 오류 시 0)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def build_node_map(nodes: list) -> dict[str, dict]:
+    """fabricNode → 노드 ID별 {name, role, pod}"""
+    node_map: dict[str, dict] = {}
+    for item in nodes:
+        attr = item["fabricNode"]["attributes"]
+        node_map[attr.get("id", "")] = {
+            "name": attr.get("name", ""),
+            "role": attr.get("role", ""),
+            "pod": extract_pod_id(attr.get("dn", "")),
+        }
+    return node_map
+
+
+def parse_usage(resource: CapacityResource, class_name: str, items: list) -> dict:
+    """
+    자원 통계 imdata → 노드 ID별 {used, capacity, percentage}
+
+    Returns:
+        dict: 노드 ID → 사용량 (capacity 0인 노드 제외)
+    """
+    totals: dict[str, list[float]] = {}
+    for item in items:
+        attr = item[class_name]["attributes"]
+        node_id = extract_node_id(attr.get("dn", ""))
+        if not node_id:
+            continue
+        used = _number(attr.get(resource.used_attr))
+        cap = (
+            100.0 if resource.cap_attr is None else _number(attr.get(resource.cap_attr))
+        )
+        total = totals.setdefault(node_id, [0.0, 0.0])
+        total[0] += used
+        total[1] += cap
+
+    usage: dict[str, dict] = {}
+    for node_id, (used, cap) in totals.items():
+        if cap <= 0:
+            continue
+        usage[node_id] = {
+            "used": int(used),
+            "capacity": int(cap),
+            "percentage": round(used / cap * 100, 1),
+        }
+    return usage
+
+
+# ============================================
+# 수집
+# ============================================
+
+
+def empty_capacity(interval: str = DEFAULT_INTERVAL) -> dict:
+    """수집 결과가 없을 때의 collect_capacity() 형식 응답"""
+    return {
+        "interval": interval,
+        "resources": [{"key": r.key, "label": r.label} for r in RESOURCES],
+        "nodes": [],
+        "top": {r.key: [] for r in RESOURCES},
+        "high_usage": [],
+    }
+
+
+def collect_capacity(
+    aci, interval: str = DEFAULT_INTERVAL, top: int = 10, strict: bool = False
+) -> dict:
+    """
+    노드 × 자원 사용률 매트릭스 수집
+
+    Args:
+        aci:      ACIClient 인스턴스
+        interval: 통계 주기 접미사 (5min 등)
+        top:      자원별 상위 노드 수
+        strict:   True면 클래스 조회 실패 시 APICRequestError
+    Returns:
+        dict: {interval, resources: [{key, label}], nodes: [{id, name, role, pod, usage}],
+               top: {자원 키: [{id, name, used, capacity, percentage}]}, high_usage}
+    Raises:
+        APICRequestError: strict=True이고 조회 실패 클래스가 있는 경우
+    """
+    class_names = {r.key: r.class_name(interval) for r in RESOURCES}
+    fetched = fetch_classes(aci, ["fabricNode", *class_names.values()], strict=strict)
+    node_map = build_node_map(fetched["fabricNode"])
+
+    matrix: dict[str, dict] = {}
+    top_by_resource: dict[str, list[dict]] = {}
+    high_usage: list[dict] = []
+    for resource in RESOURCES:
+        class_name = class_names[resource.key]
+        usage = parse_usage(resource, class_name, fetched[class_name])
+        rows = []
+        for node_id, values in usage.items():
+            info = node_map.get(node_id, {"name": node_id, "role": "", "pod": ""})
+            matrix.setdefault(node_id, {"id": node_id, **info, "usage": {}})["usage"][
+                resource.key
+            ] = values
+            rows.append({"id": node_id, "name": info["name"], **values})
+            if values["percentage"] >= HIGH_USAGE_PCT:
+                high_usage.append(
+                    {
+                        "id": node_id,
+                        "name": info["name"],
+                        "resource": resource.key,
+                        **values,
+                    }
+                )
+        rows.sort(key=lambda r: (-r["percentage"], r["name"]))
+        top_by_resource[resource.key] = rows[:top]
+
+    # 노드는 자원 중 최대 사용률 높은 순
+    nodes = sorted(
+        matrix.values(),
+        key=lambda n: (-max(u["percentage"] for u in n["usage"].values()), n["name"]),
+    )
+    high_usage.sort(key=lambda r: -r["percentage"])
+    return {
+        "interval": interval,
+        "resources": [{"key": r.key, "label": r.label} for r in RESOURCES],
+        "nodes": nodes,
+        "top": top_by_resource,
+        "high_usage": high_usage,
+    }
@@ -0,0 +1,211 @@
+# ============================================
+# Capacity Forecast
+# 목적: 노드 × 자원 사용률 이력 보관 및 선형 추세 기반 소진 예상일 계산
+# 버전: v1.11.0
+#
+# 구조:
+#   HISTORY_TIERS    — 용량 이력 다운샘플 계층 (1시간 / 1일, 1분 계층 생략)
+#   CapacityHistory  — TimeSeriesStore 래퍼 (시리즈 = capacity.<노드 ID>.<자원 키>)
+#   fit_series       — 시리즈 묶음 최소제곱 직선 적합 (1회 순회)
+#
+# 설계 노트:
+#   - 노드 400 × 자원 6 = 2,400 시리즈 → 1분 계층은 제외하여 메모리 절감
+#   - 적합은 시리즈별 Σt, Σv, Σt², Σtv 누적 후 닫힌 해로 계산
+#     (numpy 미사용 — 시리즈 수 × 포인트 수에 선형, 2,400 × 168 기준 약 0.3초)
+#   - t는 일 단위로 정규화 → 기울기 = 하루 증가 %p
+#   - 기울기가 MIN_SLOPE 미만이면 소진 예상 없음 (None)
+#   - 통계 주기(5min / 1d 등)가 다른 수집이 연달아 기록되어도 MIN_RECORD_GAP 이내의
+#     샘플은 생략 (같은 시각대 중복 기록 방지), 노드가 없는 수집(조회 실패)은 기록 생략
+# ============================================
+
+import threading
+import time
+from typing import Optional
+
+from services.timeseries import TimeSeriesStore
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# (계층 이름, 버킷 크기(초), 보존 버킷 수)
+HISTORY_TIERS: tuple[tuple[str, int, int], ...] = (
+    ("1h", 3600, 168),  # 7일
+    ("1d", 86400, 365),  # 1년
+)
+
+# 용량 시리즈 수 상한 (노드 수 × 자원 수)
+MAX_CAPACITY_SERIES = 4096
+
+# 이력 샘플 최소 간격(초) — 기본 통계 주기(5분)
+MIN_RECORD_GAP = 300
+
+# 추세 적합에 필요한 최소 포인트 수
+MIN_POINTS = 3
+
+# 소진 기준(%)
+EXHAUSTION_PCT = 100.0
+
+# 증가 추세로 보는 최소 기울기(%p / 일) — 부동소수점 오차로 인한 수만 년 예측 방지
+MIN_SLOPE = 0.001
+
+_SERIES_PREFIX = "capacity."
+_DAY = 86400.0
+
+
+def series_name(node_id: str, resource: str) -> str:
+    return f"{_SERIES_PREFIX}{node_id}.{resource}"
+
+
+def fit_series(
+    series: dict[str, list[tuple[float, float]]],
+    now: float,
+    limit: float = EXHAUSTION_PCT,
+    min_points: int = MIN_POINTS,
+) -> dict[str, dict]:
+    """
+    시리즈 묶음 직선 적합 및 소진 예상일 계산
+
+    Args:
+        series:     시리즈 이름 → [(epoch 초, 값)]
+        now:        기준 시각 (epoch 초)
+        limit:      소진 기준값
+        min_points: 적합 최소 포인트 수 (미만 시리즈는 결과에서 제외)
+    Returns:
+        dict: 시리즈 이름 → {current, slope_per_day, days_to_exhaustion}
+              current = 적합 직선의 now 시점 값
+    """
+    results: dict[str, dict] = {}
+    for name, points in series.items():
+        n = len(points)
+        if n < min_points:
+            continue
+        sum_t = sum_v = sum_tt = sum_tv = 0.0
+        for ts, value in points:
+            t = (ts - now) / _DAY  # now 기준 일 단위 (과거는 음수)
+            sum_t += t
+            sum_v += value
+            sum_tt += t * t
+            sum_tv += t * value
+        denom = n * sum_tt - sum_t * sum_t
+        if denom <= 0:
+            continue
+        slope = (n * sum_tv - sum_t * sum_v) / denom
+        current = (sum_v - slope * sum_t) / n  # t = 0 (now) 절편
+        days: Optional[float] = None
+        if current >= limit:
+            days = 0.0
+        elif slope >= MIN_SLOPE:
+            days = round((limit - current) / slope, 1)
+        results[name] = {
+            "current": round(current, 1),
+            "slope_per_day": round(slope, 3),
+            "days_to_exhaustion": days,
+        }
+    return results
+
+
+# ============================================
+# CapacityHistory
+# ============================================
+
+
+class CapacityHistory:
+    """
+    노드 × 자원 사용률 이력
+
+    Args:
+        max_series: 시리즈 수 상한
+    """
+
+    def __init__(self, max_series: int = MAX_CAPACITY_SERIES) -> None:
+        self.store = TimeSeriesStore(max_series=max_series, tiers=HISTORY_TIERS)
+        # 노드 ID → {name, role, pod} (마지막 수집 기준)
+        self.nodes: dict[str, dict] = {}
+        # 마지막 기록 시각 (MIN_RECORD_GAP 이내 중복 기록 생략)
+        self._last_ts: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, collected: dict, ts: Optional[float] = None) -> bool:
+        """
+        collect_capacity() 결과의 노드별 사용률 기록
+
+        Returns:
+            bool: 기록 여부 (노드 없음 / 직전 기록과 MIN_RECORD_GAP 이내면 False)
+        """
+        if not collected["nodes"]:
+            return False
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            if self._last_ts is not None and abs(ts - self._last_ts) < MIN_RECORD_GAP:
+                return False
+            self._last_ts = ts
+        values: dict[str, float] = {}
+        for node in collected["nodes"]:
+            self.nodes[node["id"]] = {
+                "name": node["name"],
+                "role": node["role"],
+                "pod": node["pod"],
+            }
+            for resource, usage in node["usage"].items():
+                values[series_name(node["id"], resource)] = usage["percentage"]
+        self.store.record(values, ts)
+        return True
+
+    def history(
+        self,
+        node_id: str,
+        resource: str,
+        seconds: float = 7 * 86400,
+        tier: Optional[str] = None,
+    ) -> dict:
+        """
+        노드 / 자원 사용률 이력
+
+        Raises:
+            ValueError: 알 수 없는 계층 지정 시
+        """
+        return self.store.range_query(series_name(node_id, resource), seconds, tier)
+
+    def forecast(
+        self,
+        resource: Optional[str] = None,
+        tier: str = "1h",
+        now: Optional[float] = None,
+    ) -> list[dict]:
+        """
+        전 노드 소진 예상일 (가까운 순, 예상 없음은 뒤)
+
+        Args:
+            resource: 지정 시 해당 자원만
+            tier:     적합에 사용할 계층 (1h: 최근 7일 / 1d: 최근 1년)
+            now:      기준 시각 (기본 현재)
+        Returns:
+            list: [{id, name, resource, current, slope_per_day, days_to_exhaustion}]
+        Raises:
+            ValueError: 알 수 없는 계층 지정 시
+        """
+        spans = {name: step * capacity for name, step, capacity in HISTORY_TIERS}
+        if tier not in spans:
+            raise ValueError(f"Unknown tier: {tier}")
+        now = time.time() if now is None else now
+
+        prefix = _SERIES_PREFIX
+        series = self.store.bulk_points(prefix, tier, now - spans[tier])
+        if resource is not None:
+            suffix = f".{resource}"
+            series = {k: v for k, v in series.items() if k.endswith(suffix)}
+
+        rows: list[dict] = []
+        for name, fit in fit_series(series, now).items():
+            node_id, _, res = name.removeprefix(prefix).partition(".")
+            info = self.nodes.get(node_id, {"name": node_id})
+            rows.append({"id": node_id, "name": info["name"], "resource": res, **fit})
+        rows.sort(
+            key=lambda r: (
+                r["days_to_exhaustion"] is None,
+                r["days_to_exhaustion"] or 0.0,
+                -r["current"],
+            )
+        )
+        return rows
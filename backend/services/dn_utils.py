@@ -0,0 +1,172 @@
+# ============================================
+# ACI DN Utilities
+# 목적: ACI DN(Distinguished Name) 파싱 공통 함수
+# 버전: v1.11.0 - 물리 포트 / LLDP 인접 DN 파싱 추가,
+#                경로 tDn 노드 목록(parse_path_nodes — vPC 양쪽 Leaf) 추가
+#
+# 라우터마다 개별 작성하던 DN 정규식을 사전 컴파일하여 공유.
+# 대량 오브젝트(10만 건 이상)를 1회 순회로 처리하기 위한 용도.
+#
+# DN 구조 예시:
+#   uni/tn-T1/ap-App/epg-Web/cep-00:50:56:AA:BB:CC
+#   uni/tn-T1/ap-App/epg-Web/cep-.../rscEpToPathEp-[topology/pod-1/paths-101/pathep-[eth1/1]]
+#   → 대괄호 안의 '/'는 RN 구분자가 아님
+# ============================================
+
+import re
+
+# ============================================
+# 사전 컴파일 정규식
+# ============================================
+_NODE_ID_PATTERN: re.Pattern = re.compile(r"node-(\d+)")
+_POD_ID_PATTERN: re.Pattern = re.compile(r"pod-(\d+)")
+_TENANT_PATTERN: re.Pattern = re.compile(r"tn-([^/\]]+)")
+_PATH_NODE_PATTERN: re.Pattern = re.compile(r"paths-(\d+)")
+_PATH_NODES_PATTERN: re.Pattern = re.compile(r"paths-(\d+(?:-\d+)*)/")
+_PATH_IFACE_PATTERN: re.Pattern = re.compile(r"\[(.+)\]")
+_PHYS_PORT_PATTERN: re.Pattern = re.compile(r"node-(\d+)/sys/phys-\[([^\]]+)\]")
+_LLDP_PORT_PATTERN: re.Pattern = re.compile(r"node-(\d+)/sys/lldp/inst/if-\[([^\]]+)\]")
+_ETH_PORT_PATTERN: re.Pattern = re.compile(r"eth((?:\d+/)*\d+)/(\d+)$")
+
+
+def parent_dn(dn: str) -> str:
+    """
+    부모 DN 반환 (대괄호 내부 '/' 무시)
+
+    예: uni/tn-T1/ap-App/epg-Web/cep-X/ip-[10.0.0.1] → uni/tn-T1/ap-App/epg-Web/cep-X
+
+    Args:
+        dn: ACI DN
+    Returns:
+        str: 부모 DN (최상위 RN이면 빈 문자열)
+    """
+    end = len(dn)
+    while True:
+        idx = dn.rfind("/", 0, end)
+        if idx < 0:
+            return ""
+        # 마지막 RN 구간의 대괄호가 짝이 맞으면 RN 구분자
+        tail = dn[idx:]
+        if tail.count("[") == tail.count("]"):
+            return dn[:idx]
+        end = idx
+
+
+def dn_ancestors(dn: str) -> list[str]:
+    """
+    DN 자신과 모든 상위 DN (루트 → 자신 순서, 대괄호 내부 '/' 무시)
+
+    예: uni/tn-T1/BD-bd1 → ["uni", "uni/tn-T1", "uni/tn-T1/BD-bd1"]
+    """
+    prefixes: list[str] = []
+    if "[" not in dn:
+        # 대괄호 없는 DN은 '/' 위치만 찾으면 됨 (대부분의 DN)
+        idx = dn.find("/")
+        while idx >= 0:
+            prefixes.append(dn[:idx])
+            idx = dn.find("/", idx + 1)
+        if dn:
+            prefixes.append(dn)
+        return prefixes
+
+    depth = 0
+    for idx, char in enumerate(dn):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "/" and depth == 0:
+            prefixes.append(dn[:idx])
+    if dn:
+        prefixes.append(dn)
+    return prefixes
+
+
+def extract_node_id(dn: str) -> str:
+    """DN에서 노드 ID 추출. 예: topology/pod-1/node-101/sys → 101 (없으면 빈 문자열)"""
+    match = _NODE_ID_PATTERN.search(dn)
+    return match.group(1) if match else ""
+
+
+def extract_pod_id(dn: str) -> str:
+    """DN에서 Pod ID 추출. 예: topology/pod-1/node-101 → 1 (없으면 빈 문자열)"""
+    match = _POD_ID_PATTERN.search(dn)
+    return match.group(1) if match else ""
+
+
+def extract_tenant(dn: str) -> str:
+    """DN에서 Tenant 이름 추출. 예: uni/tn-TenantA/... → TenantA (없으면 빈 문자열)"""
+    match = _TENANT_PATTERN.search(dn)
+    return match.group(1) if match else ""
+
+
+def parse_path_tdn(tdn: str) -> tuple[str, str]:
+    """
+    fvRsCEpToPathEp tDn에서 (노드 ID, 인터페이스) 추출
+
+    예: topology/pod-1/paths-101/pathep-[eth1/10] → ("101", "eth1/10")
+        topology/pod-1/protpaths-101-102/pathep-[vpc-pg] → ("101", "vpc-pg")
+
+    Returns:
+        tuple: (node, interface) — 추출 실패 시 "-"
+    """
+    node_match = _PATH_NODE_PATTERN.search(tdn)
+    iface_match = _PATH_IFACE_PATTERN.search(tdn)
+    return (
+        node_match.group(1) if node_match else "-",
+        iface_match.group(1) if iface_match else "-",
+    )
+
+
+def parse_path_nodes(tdn: str) -> tuple[str, ...]:
+    """
+    fvRsCEpToPathEp tDn의 노드 ID 전체 (vPC는 양쪽 Leaf)
+
+    예: topology/pod-1/paths-101/pathep-[eth1/10] → ("101",)
+        topology/pod-1/protpaths-101-102/pathep-[vpc-pg] → ("101", "102")
+
+    Returns:
+        tuple: 노드 ID 목록 — 추출 실패 시 빈 튜플
+    """
+    match = _PATH_NODES_PATTERN.search(tdn)
+    return tuple(match.group(1).split("-")) if match else ()
+
+
+def parse_phys_port(dn: str) -> tuple[str, str]:
+    """
+    물리 포트 하위 DN에서 (노드 ID, 인터페이스) 추출
+
+    예: topology/pod-1/node-101/sys/phys-[eth1/1]/phys → ("101", "eth1/1")
+        topology/pod-1/node-101/sys/phys-[eth1/1]/CDeqptIngrTotal5min → ("101", "eth1/1")
+
+    Returns:
+        tuple: (node, interface) — 물리 포트 DN이 아니면 ("", "")
+    """
+    match = _PHYS_PORT_PATTERN.search(dn)
+    return (match.group(1), match.group(2)) if match else ("", "")
+
+
+def parse_lldp_port(dn: str) -> tuple[str, str]:
+    """
+    lldpAdjEp DN에서 (노드 ID, 로컬 인터페이스) 추출
+
+    예: topology/pod-1/node-101/sys/lldp/inst/if-[eth1/48]/adj-1 → ("101", "eth1/48")
+
+    Returns:
+        tuple: (node, interface) — LLDP 인접 DN이 아니면 ("", "")
+    """
+    match = _LLDP_PORT_PATTERN.search(dn)
+    return (match.group(1), match.group(2)) if match else ("", "")
+
+
+def split_eth_port(iface: str) -> tuple[str, str]:
+    """
+    이더넷 인터페이스 이름 → (모듈, 포트)
+
+    예: eth1/33 → ("1", "33"), eth101/1/7 (FEX) → ("101/1", "7")
+
+    Returns:
+        tuple: (module, port) — 형식이 다르면 ("-", iface)
+    """
+    match = _ETH_PORT_PATTERN.match(iface)
+    return (match.group(1), match.group(2)) if match else ("-", iface)
@@ -0,0 +1,599 @@
+# ============================================
+# Endpoint Index Service
+# 목적: Endpoint 스냅샷 인덱스 및 다차원 집계 큐브
+# 버전: v1.10.0
+#       v1.11.0 - vPC 경로의 두 번째 Leaf를 peer 필드 / 큐브 차원으로 기록
+#
+# 구조:
+#   EndpointRecord — 정규화된 Endpoint 1건 (불변)
+#   build_enrichment — fvIp / fvRsToVm / fvRsHyper / compVm / compHv
+#                      일괄 조회 결과를 fvCEp DN 기준으로 해시 조인
+#   cube           — tenant × epg × node × interface × encap × peer 집계 큐브
+#                    (services/agg_cube.py AggregationCube)
+#   EndpointIndex  — fvCEp 스냅샷 보관 + 변경분만 큐브에 반영
+#                    + 정렬 / 커서 페이지네이션 / 스트리밍 순회
+#
+# 설계 노트:
+#   - 큐브 셀 = 5개 차원 값 튜플 → Endpoint 수
+#   - 차원 값별 셀 posting(set)을 유지하여 필터 조건은 교집합으로 처리
+#   - 새로고침 시 DN 기준 diff → 추가/삭제/변경된 Endpoint만 큐브 갱신
+#     (10만 건 스냅샷에서도 drill-down 시 전체 재스캔 없음)
+#   - 보조 IP / VM / Host 정보는 새로고침당 클래스별 1회 일괄 조회 후
+#     부모 DN 해시 조인 → 검색 시 추가 APIC 조회 없음
+#   - MAC / IP 정확 일치 검색은 해시 인덱스로 Endpoint당 O(1)
+#   - 정렬 결과는 스냅샷 버전별로 필드당 1회만 계산하여 캐시
+#   - 커서 = 마지막 행의 (정렬 값, DN) → bisect로 O(log N) 위치 탐색
+#     (오프셋 방식과 달리 새로고침으로 행이 추가/삭제되어도 중복·누락 없음)
+# ============================================
+
+import base64
+import bisect
+import ipaddress
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from services.agg_cube import AggregationCube
+from services.dn_utils import parent_dn, parse_path_nodes, parse_path_tdn
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 큐브 차원 (EndpointRecord 필드명과 동일)
+CUBE_DIMENSIONS: tuple[str, ...] = (
+    "tenant",
+    "epg",
+    "node",
+    "interface",
+    "encap",
+    "peer",
+)
+
+# fvRsCEpToPathEp RN 접두어 (부모 fvCEp DN 분리용)
+_PATH_RN_PREFIX = "/rscEpToPathEp-"
+
+# 보조 정보가 없는 Endpoint 기본값 (보조 IP, VM, Host)
+_NO_ENRICHMENT: tuple[tuple[str, ...], str, str] = ((), "-", "-")
+
+# 목록 정렬 가능 필드
+SORT_FIELDS: tuple[str, ...] = (
+    "mac",
+    "ip",
+    "tenant",
+    "app_profile",
+    "epg",
+    "encap",
+    "node",
+    "interface",
+)
+
+
+# ============================================
+# 데이터 구조 정의
+# ============================================
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointRecord:
+    """
+    정규화된 Endpoint 1건
+
+    Attributes:
+        dn:          fvCEp DN
+        mac:         MAC 주소
+        ip:          fvCEp.ip (없으면 첫 보조 IP, 둘 다 없으면 빈 문자열 — "-" 표시는 UI 담당)
+        tenant:      Tenant 이름
+        app_profile: Application Profile 이름
+        epg:         EPG 이름
+        encap:       Encap (예: vlan-100)
+        node:        학습된 노드 ID (경로 없으면 "-")
+        interface:   학습된 인터페이스 (경로 없으면 "-")
+        ips:         fvCEp.ip + fvIp 자식 주소 전체 (중복 제거, 순서 유지)
+        vm:          VMM 학습 시 VM 이름 (없으면 "-")
+        host:        VMM 학습 시 Hypervisor 이름 (없으면 "-")
+        peer:        vPC 경로의 두 번째 Leaf ID (vPC가 아니면 "-")
+    """
+
+    dn: str
+    mac: str
+    ip: str
+    tenant: str
+    app_profile: str
+    epg: str
+    encap: str
+    node: str
+    interface: str
+    ips: tuple[str, ...] = ()
+    vm: str = "-"
+    host: str = "-"
+    peer: str = "-"
+
+    def cube_key(self) -> tuple[str, ...]:
+        """큐브 셀 키 (CUBE_DIMENSIONS 순서)"""
+        return (
+            self.tenant,
+            self.epg,
+            self.node,
+            self.interface,
+            self.encap,
+            self.peer,
+        )
+
+    def to_dict(self) -> dict:
+        """API 응답용 dict 변환 (search_endpoint 응답 형식)"""
+        return {
+            "mac": self.mac,
+            "ip": self.ip,
+            "tenant": self.tenant,
+            "app_profile": self.app_profile,
+            "epg": self.epg,
+            "encap": self.encap,
+            "node": self.node,
+            "interface": self.interface,
+            "ips": list(self.ips),
+            "vm": self.vm,
+            "host": self.host,
+            "peer": self.peer,
+        }
+
+
+def _parse_epg_dn(epg_dn: str) -> tuple[str, str, str]:
+    """EPG DN에서 (Tenant, AP, EPG) 추출. 없는 항목은 "unknown" """
+    tenant = app = epg = "unknown"
+    for part in epg_dn.split("/"):
+        if part.startswith("tn-"):
+            tenant = part[3:]
+        elif part.startswith("ap-"):
+            app = part[3:]
+        elif part.startswith("epg-"):
+            epg = part[4:]
+    return tenant, app, epg
+
+
+def _sort_key(field_name: str, value: str) -> tuple:
+    """
+    정렬 키 생성
+
+    - ip:   주소 체계 → 정수 순 (10.0.0.9 < 10.0.0.10)
+    - node: 숫자 ID 순 ("-"는 뒤로)
+    - 그 외: 문자열 순
+    """
+    if field_name == "ip":
+        try:
+            addr = ipaddress.ip_address(value)
+            return (addr.version, int(addr), "")
+        except ValueError:
+            return (9, 0, value)
+    if field_name == "node":
+        return (0, int(value), "") if value.isdigit() else (9, 0, value)
+    return (0, 0, value)
+
+
+def encode_cursor(value: str, dn: str) -> str:
+    """페이지 커서 인코딩 (마지막 행의 정렬 값 + DN)"""
+    raw = json.dumps([value, dn], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    페이지 커서 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        value, dn = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+    if not isinstance(value, str) or not isinstance(dn, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return value, dn
+
+
+def _normalize_mac_query(query: str) -> str:
+    """
+    MAC 검색어 정규화 (소문자, 하이픈→콜론)
+
+    구분자만 있는 검색어("-", ":")는 모든 MAC과 부분 일치하므로 빈 문자열 반환.
+    """
+    normalized = query.lower().replace("-", ":")
+    return normalized if normalized.strip(":") else ""
+
+
+def _record_matches(
+    record: "EndpointRecord", filters: dict[str, str], query: str, mac_query: str
+) -> bool:
+    """차원 필터(정확 일치) + MAC/IP(보조 IP 포함) 부분 문자열 검색 조건 확인"""
+    for dim, value in filters.items():
+        if getattr(record, dim) != value:
+            return False
+    if query:
+        if mac_query and mac_query in record.mac.lower():
+            return True
+        return any(query in ip for ip in record.ips)
+    return True
+
+
+def build_enrichment(
+    ips: list, to_vm: list, hypers: list, vms: list, hosts: list
+) -> dict[str, tuple[tuple[str, ...], str, str]]:
+    """
+    Endpoint 보조 정보 해시 조인
+
+    - fvIp      (부모 = fvCEp)            → 보조 IP 목록
+    - fvRsToVm  (부모 = fvCEp, tDn=compVm) → VM 이름
+    - fvRsHyper (부모 = fvCEp, tDn=compHv) → Hypervisor 이름
+
+    Args:
+        ips:    fvIp imdata 배열
+        to_vm:  fvRsToVm imdata 배열
+        hypers: fvRsHyper imdata 배열
+        vms:    compVm imdata 배열
+        hosts:  compHv imdata 배열
+    Returns:
+        dict: fvCEp DN → (보조 IP 튜플, VM 이름, Host 이름)
+    """
+    vm_names = {
+        item["compVm"]["attributes"]
+        .get("dn", ""): item["compVm"]["attributes"]
+        .get("name", "")
+        for item in vms
+    }
+    host_names = {
+        item["compHv"]["attributes"]
+        .get("dn", ""): item["compHv"]["attributes"]
+        .get("name", "")
+        for item in hosts
+    }
+
+    ip_by_ep: dict[str, list[str]] = {}
+    for item in ips:
+        attr = item["fvIp"]["attributes"]
+        addr = attr.get("addr", "")
+        if addr:
+            ip_by_ep.setdefault(parent_dn(attr.get("dn", "")), []).append(addr)
+
+    vm_by_ep: dict[str, str] = {}
+    for item in to_vm:
+        attr = item["fvRsToVm"]["attributes"]
+        tdn = attr.get("tDn", "")
+        vm_by_ep[parent_dn(attr.get("dn", ""))] = vm_names.get(tdn) or tdn or "-"
+
+    host_by_ep: dict[str, str] = {}
+    for item in hypers:
+        attr = item["fvRsHyper"]["attributes"]
+        tdn = attr.get("tDn", "")
+        host_by_ep[parent_dn(attr.get("dn", ""))] = host_names.get(tdn) or tdn or "-"
+
+    result: dict[str, tuple[tuple[str, ...], str, str]] = {}
+    for ep_dn in ip_by_ep.keys() | vm_by_ep.keys() | host_by_ep.keys():
+        result[ep_dn] = (
+            tuple(ip_by_ep.get(ep_dn, ())),
+            vm_by_ep.get(ep_dn, "-"),
+            host_by_ep.get(ep_dn, "-"),
+        )
+    return result
+
+
+# ============================================
+# EndpointIndex
+# ============================================
+
+
+class EndpointIndex:
+    """
+    fvCEp 스냅샷 인덱스
+
+    refresh() 호출 시 fvCEp / fvRsCEpToPathEp를 부모 DN 해시 조인으로 결합하고,
+    이전 스냅샷과 비교하여 변경된 Endpoint만 큐브에 반영.
+
+    스냅샷 dict는 새로고침마다 새 객체로 교체(in-place 수정 없음)되므로
+    조회 측은 snapshot()으로 받은 dict를 락 없이 순회 가능.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, EndpointRecord] = {}
+        # 정확 일치 검색용 해시 인덱스 (스냅샷과 함께 교체)
+        self._by_mac: dict[str, list[str]] = {}
+        self._by_ip: dict[str, list[str]] = {}
+        self.cube = AggregationCube(CUBE_DIMENSIONS)
+        self.version: int = 0
+        self.refreshed_at: float = 0.0
+        self._lock = threading.Lock()
+
+        # 정렬 캐시: 필드명 → [(정렬 키, DN), ...] (오름차순, _sorted_version 기준)
+        self._sorted: dict[str, list[tuple[tuple, str]]] = {}
+        self._sorted_version: int = -1
+
+    def age(self) -> float:
+        """마지막 새로고침 이후 경과 시간(초). 한 번도 안 했으면 inf"""
+        if not self.refreshed_at:
+            return float("inf")
+        return time.time() - self.refreshed_at
+
+    def snapshot(self) -> dict[str, EndpointRecord]:
+        """현재 스냅샷 (DN → EndpointRecord). 반환 dict는 수정하지 말 것"""
+        return self._records
+
+    def refresh(
+        self,
+        endpoints: list,
+        paths: list,
+        enrichment: Optional[dict[str, tuple[tuple[str, ...], str, str]]] = None,
+    ) -> dict:
+        """
+        APIC imdata로 스냅샷 갱신
+
+        Args:
+            endpoints:  fvCEp imdata 배열
+            paths:      fvRsCEpToPathEp imdata 배열
+            enrichment: build_enrichment() 결과 (없으면 보조 정보 없이 구성)
+        Returns:
+            dict: {added, removed, changed} 변경 건수
+        """
+        new_records = self._build_records(endpoints, paths, enrichment or {})
+        by_mac, by_ip = self._build_lookup(new_records)
+
+        with self._lock:
+            old_records = self._records
+            added = removed = changed = 0
+
+            for dn, old in old_records.items():
+                new = new_records.get(dn)
+                if new is None:
+                    self.cube.remove(old.cube_key())
+                    removed += 1
+                elif new != old:
+                    self.cube.remove(old.cube_key())
+                    self.cube.add(new.cube_key())
+                    changed += 1
+
+            for dn, new in new_records.items():
+                if dn not in old_records:
+                    self.cube.add(new.cube_key())
+                    added += 1
+
+            self._records = new_records
+            self._by_mac = by_mac
+            self._by_ip = by_ip
+            self.refreshed_at = time.time()
+            if added or removed or changed:
+                self.version += 1
+
+        logger.debug(
+            "Endpoint index refreshed — total=%d, added=%d, removed=%d, changed=%d",
+            len(new_records),
+            added,
+            removed,
+            changed,
+        )
+        return {"added": added, "removed": removed, "changed": changed}
+
+    def slice(
+        self, group_by: str, filters: Optional[dict[str, str]] = None, top: int = 10
+    ) -> dict:
+        """큐브 slice (락 보호)"""
+        with self._lock:
+            return self.cube.slice(group_by, filters, top)
+
+    def marginals(self, *dims: str) -> dict[str, dict[str, int]]:
+        """차원별 marginal (같은 스냅샷 기준, 락 보호)"""
+        with self._lock:
+            return {dim: self.cube.marginal(dim) for dim in dims}
+
+    def cells(self, dim: str, values: Iterable[str]) -> dict[tuple[str, ...], int]:
+        """dim 값이 values 중 하나인 큐브 셀 → Endpoint 수 (락 보호)"""
+        with self._lock:
+            return self.cube.cells(dim, values)
+
+    def page(
+        self,
+        sort: str = "mac",
+        descending: bool = False,
+        filters: Optional[dict[str, str]] = None,
+        query: str = "",
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> dict:
+        """
+        정렬 + 필터 + 커서 기반 페이지 조회
+
+        Args:
+            sort:       정렬 필드 (SORT_FIELDS)
+            descending: 내림차순 여부
+            filters:    {차원: 값} 정확 일치 필터
+            query:      MAC/IP 부분 문자열 검색어
+            cursor:     이전 페이지 응답의 next_cursor (없으면 첫 페이지)
+            limit:      페이지 크기
+        Returns:
+            dict: {items, next_cursor, total, version}
+        Raises:
+            ValueError: 알 수 없는 정렬 필드 / 잘못된 커서
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        filters = filters or {}
+
+        records, entries = self._sorted_entries(sort)
+
+        # ---- 시작 위치 (커서 직후) ----
+        if cursor:
+            value, dn = decode_cursor(cursor)
+            pivot = (_sort_key(sort, value), dn)
+            if descending:
+                pos = bisect.bisect_left(entries, pivot) - 1
+            else:
+                pos = bisect.bisect_right(entries, pivot)
+        else:
+            pos = len(entries) - 1 if descending else 0
+        step = -1 if descending else 1
+
+        # ---- limit + 1건까지 수집 (다음 페이지 존재 여부 확인) ----
+        mac_query = _normalize_mac_query(query)
+        matched: list[EndpointRecord] = []
+        while 0 <= pos < len(entries) and len(matched) <= limit:
+            record = records.get(entries[pos][1])
+            if record is not None and _record_matches(
+                record, filters, query, mac_query
+            ):
+                matched.append(record)
+            pos += step
+
+        items = matched[:limit]
+        next_cursor = None
+        if len(matched) > limit and items:
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, sort), last.dn)
+
+        # 전체 건수: 큐브 차원 필터만 있으면 큐브에서 즉시 계산, 검색어 포함 시 생략
+        total: Optional[int] = None
+        if not query:
+            total = self.slice("tenant", filters)["total"] if filters else len(records)
+
+        return {
+            "items": [record.to_dict() for record in items],
+            "next_cursor": next_cursor,
+            "total": total,
+            "version": self.version,
+        }
+
+    def lookup(self, query: str) -> list[EndpointRecord]:
+        """
+        MAC 또는 IP(보조 IP 포함) 정확 일치 조회 — 해시 인덱스 O(1)
+
+        Returns:
+            list: 일치 Endpoint (없으면 빈 리스트)
+        """
+        records = self._records
+        dns = self._by_mac.get(_normalize_mac_query(query)) or self._by_ip.get(
+            query, []
+        )
+        return [records[dn] for dn in dns if dn in records]
+
+    def iter_records(
+        self, filters: Optional[dict[str, str]] = None, query: str = ""
+    ) -> Iterator[EndpointRecord]:
+        """
+        현재 스냅샷의 조건 일치 Endpoint를 순차 반환 (스트리밍 내보내기용)
+
+        호출 시점의 스냅샷 dict를 참조만 하므로 복사 비용 없음.
+        """
+        filters = filters or {}
+        mac_query = _normalize_mac_query(query)
+        for record in self._records.values():
+            if _record_matches(record, filters, query, mac_query):
+                yield record
+
+    def _sorted_entries(
+        self, sort: str
+    ) -> tuple[dict[str, EndpointRecord], list[tuple[tuple, str]]]:
+        """
+        (스냅샷, 필드별 정렬 목록) 반환
+
+        스냅샷 버전이 바뀌면 캐시 폐기 후 재계산. 두 값은 같은 버전 기준.
+        """
+        with self._lock:
+            if self._sorted_version != self.version:
+                self._sorted = {}
+                self._sorted_version = self.version
+            entries = self._sorted.get(sort)
+            if entries is None:
+                entries = sorted(
+                    (_sort_key(sort, getattr(record, sort)), dn)
+                    for dn, record in self._records.items()
+                )
+                self._sorted[sort] = entries
+            return self._records, entries
+
+    @staticmethod
+    def _build_lookup(
+        records: dict[str, EndpointRecord],
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+        """MAC(소문자) → DN 목록, IP → DN 목록 해시 인덱스 생성"""
+        by_mac: dict[str, list[str]] = {}
+        by_ip: dict[str, list[str]] = {}
+        for dn, record in records.items():
+            by_mac.setdefault(record.mac.lower(), []).append(dn)
+            for ip in record.ips:
+                by_ip.setdefault(ip, []).append(dn)
+        return by_mac, by_ip
+
+    @staticmethod
+    def _build_records(
+        endpoints: list,
+        paths: list,
+        enrichment: dict[str, tuple[tuple[str, ...], str, str]],
+    ) -> dict[str, EndpointRecord]:
+        """fvCEp + fvRsCEpToPathEp (+ 보조 정보) 해시 조인으로 EndpointRecord dict 생성"""
+        # 부모(fvCEp) DN → 첫 번째 경로 tDn
+        path_by_ep: dict[str, str] = {}
+        for item in paths:
+            attr = item["fvRsCEpToPathEp"]["attributes"]
+            dn = attr.get("dn", "")
+            # RN 접두어가 고정이므로 find로 부모 DN 분리 (tDn 내부 '/' 회피)
+            idx = dn.find(_PATH_RN_PREFIX)
+            ep_dn = dn[:idx] if idx >= 0 else parent_dn(dn)
+            if ep_dn not in path_by_ep:
+                path_by_ep[ep_dn] = attr.get("tDn", "")
+
+        # 동일 EPG / 동일 경로를 공유하는 Endpoint가 대부분 → 파싱 결과 캐시
+        epg_cache: dict[str, tuple[str, str, str]] = {}
+        tdn_cache: dict[str, tuple[str, str, str]] = {}
+
+        records: dict[str, EndpointRecord] = {}
+        for item in endpoints:
+            attr = item["fvCEp"]["attributes"]
+            dn = attr.get("dn", "")
+
+            # DN에서 Tenant, AP, EPG 추출 (cep-* RN에는 '/'가 없으므로 rpartition)
+            epg_dn = dn.rpartition("/")[0]
+            names = epg_cache.get(epg_dn)
+            if names is None:
+                names = epg_cache[epg_dn] = _parse_epg_dn(epg_dn)
+            tenant, app, epg = names
+
+            tdn = path_by_ep.get(dn)
+            if tdn is None:
+                node, interface, peer = "-", "-", "-"
+            else:
+                location = tdn_cache.get(tdn)
+                if location is None:
+                    path_nodes = parse_path_nodes(tdn)
+                    location = tdn_cache[tdn] = (
+                        *parse_path_tdn(tdn),
+                        path_nodes[1] if len(path_nodes) > 1 else "-",
+                    )
+                node, interface, peer = location
+
+            primary_ip = attr.get("ip", "")
+            extra_ips, vm, host = enrichment.get(dn, _NO_ENRICHMENT)
+            if extra_ips:
+                ips = tuple(
+                    dict.fromkeys((primary_ip, *extra_ips) if primary_ip else extra_ips)
+                )
+            else:
+                ips = (primary_ip,) if primary_ip else ()
+
+            records[dn] = EndpointRecord(
+                dn=dn,
+                mac=attr.get("mac", ""),
+                ip=primary_ip or (ips[0] if ips else ""),
+                tenant=tenant,
+                app_profile=app,
+                epg=epg,
+                encap=attr.get("encap", ""),
+                node=node,
+                interface=interface,
+                ips=ips,
+                vm=vm,
+                host=host,
+                peer=peer,
+            )
+        return records
@@ -0,0 +1,302 @@
+# ============================================
+# Fault Index Service
+# 목적: faultInst 스냅샷 인덱스 및 Fault 분석 (group-by / top-N / 변경분)
+# 버전: v1.11.0
+#
+# 구조:
+#   FaultRecord — 정규화된 faultInst 1건 (불변)
+#   FaultIndex  — DN 기준 Fault 테이블 + 집계 큐브
+#                 (code × severity × node × tenant × lifecycle)
+#
+# 설계 노트:
+#   - 새로고침 시 DN 기준 diff → 추가/삭제/변경된 Fault만 큐브에 반영
+#     (수천 건 Fault가 한꺼번에 발생해도 전체 재집계 없음)
+#   - 직전 스냅샷 대비 신규(new) / 해제(cleared) Fault를 변경분으로 보관
+#     · 신규: DN 최초 등장 또는 cleared → 활성 전환
+#     · 해제: DN 소멸 또는 활성 → severity=cleared 전환
+#   - top-N은 heapq.nlargest로 O(N log K)
+#   - DN 서브트리(예: topology/pod-1/node-101) 조건은 접두어 스캔
+# ============================================
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from services.agg_cube import AggregationCube
+from services.dn_utils import extract_node_id, extract_tenant
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 집계 차원 (FaultRecord 필드명과 동일)
+FAULT_DIMENSIONS: tuple[str, ...] = ("code", "severity", "node", "tenant", "lifecycle")
+
+# 심각도 순위 (top-N 정렬용, 높을수록 심각)
+SEVERITY_RANK: dict[str, int] = {
+    "critical": 5,
+    "major": 4,
+    "minor": 3,
+    "warning": 2,
+    "info": 1,
+    "cleared": 0,
+}
+
+# 변경분 보관 최대 건수 (신규 / 해제 각각)
+DELTA_KEEP = 500
+
+
+# ============================================
+# 데이터 구조 정의
+# ============================================
+
+
+@dataclass(frozen=True, slots=True)
+class FaultRecord:
+    """
+    정규화된 Fault 1건
+
+    Attributes:
+        dn:              faultInst DN
+        code:            Fault 코드 (예: F0532)
+        severity:        critical / major / minor / warning / info / cleared
+        lifecycle:       lc 속성 (raised / soaking / retaining / raised-clearing ...)
+        node:            DN에서 추출한 노드 ID (없으면 "-")
+        tenant:          DN에서 추출한 Tenant (없으면 "-")
+        descr:           설명
+        cause:           원인
+        created:         최초 발생 시각 (APIC 문자열)
+        last_transition: 마지막 상태 전환 시각
+    """
+
+    dn: str
+    code: str
+    severity: str
+    lifecycle: str
+    node: str
+    tenant: str
+    descr: str
+    cause: str
+    created: str
+    last_transition: str
+
+    @property
+    def active(self) -> bool:
+        """해제(cleared)되지 않은 Fault 여부"""
+        return self.severity != "cleared"
+
+    def cube_key(self) -> tuple[str, ...]:
+        """큐브 셀 키 (FAULT_DIMENSIONS 순서)"""
+        return (self.code, self.severity, self.node, self.tenant, self.lifecycle)
+
+    def to_dict(self) -> dict:
+        """API 응답용 dict"""
+        return {
+            "dn": self.dn,
+            "code": self.code,
+            "severity": self.severity,
+            "lifecycle": self.lifecycle,
+            "node": self.node,
+            "tenant": self.tenant,
+            "description": self.descr,
+            "cause": self.cause,
+            "created": self.created,
+            "last_transition": self.last_transition,
+        }
+
+    @classmethod
+    def from_attributes(cls, attr: dict) -> "FaultRecord":
+        """faultInst attributes → FaultRecord"""
+        dn = attr.get("dn", "")
+        return cls(
+            dn=dn,
+            code=attr.get("code", "") or "-",
+            severity=attr.get("severity", "") or "-",
+            lifecycle=attr.get("lc", "") or "-",
+            node=extract_node_id(dn) or "-",
+            tenant=extract_tenant(dn) or "-",
+            descr=attr.get("descr", ""),
+            cause=attr.get("cause", ""),
+            created=attr.get("created", ""),
+            last_transition=attr.get("lastTransition", ""),
+        )
+
+
+def _in_subtree(dn: str, subtree: str) -> bool:
+    """dn이 subtree DN 자신이거나 그 하위인지 확인"""
+    return dn == subtree or dn.startswith(subtree + "/")
+
+
+def _rank_key(record: FaultRecord) -> tuple[int, str]:
+    """top-N 정렬 키: (심각도 순위, 마지막 전환 시각)"""
+    return (
+        SEVERITY_RANK.get(record.severity, 0),
+        record.last_transition or record.created,
+    )
+
+
+# ============================================
+# FaultIndex
+# ============================================
+
+
+class FaultIndex:
+    """
+    faultInst 스냅샷 인덱스
+
+    refresh()는 새 스냅샷을 만든 뒤 lock 안에서 교체하므로
+    조회 측은 항상 일관된 스냅샷을 참조.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, FaultRecord] = {}
+        self.cube = AggregationCube(FAULT_DIMENSIONS)
+        self.version: int = 0
+        self.refreshed_at: float = 0.0
+        # 직전 새로고침의 변경분 (최신 DELTA_KEEP건)
+        self._new: list[FaultRecord] = []
+        self._cleared: list[FaultRecord] = []
+        self._new_count: int = 0
+        self._cleared_count: int = 0
+        self._lock = threading.Lock()
+
+    def age(self) -> float:
+        """마지막 갱신 후 경과 시간(초). 갱신 이력 없으면 무한대"""
+        if not self.refreshed_at:
+            return float("inf")
+        return time.monotonic() - self.refreshed_at
+
+    def refresh(self, faults: list) -> dict:
+        """
+        faultInst imdata로 스냅샷 갱신
+
+        Args:
+            faults: faultInst imdata 배열
+        Returns:
+            dict: {new, cleared, changed} 변경 건수
+        """
+        new_records: dict[str, FaultRecord] = {}
+        for item in faults:
+            record = FaultRecord.from_attributes(item["faultInst"]["attributes"])
+            new_records[record.dn] = record
+
+        raised: list[FaultRecord] = []
+        cleared: list[FaultRecord] = []
+        changed = 0
+
+        with self._lock:
+            old_records = self._records
+            first_load = not self.refreshed_at
+
+            for dn, old in old_records.items():
+                if dn not in new_records:
+                    self.cube.remove(old.cube_key())
+                    if old.active:
+                        cleared.append(old)
+
+            for dn, record in new_records.items():
+                old = old_records.get(dn)
+                if old is None:
+                    self.cube.add(record.cube_key())
+                    if record.active:
+                        raised.append(record)
+                    continue
+                if old == record:
+                    continue
+                changed += 1
+                if old.cube_key() != record.cube_key():
+                    self.cube.remove(old.cube_key())
+                    self.cube.add(record.cube_key())
+                if old.active and not record.active:
+                    cleared.append(record)
+                elif record.active and not old.active:
+                    raised.append(record)
+
+            self._records = new_records
+            self.refreshed_at = time.monotonic()
+            self.version += 1
+            # 최초 적재는 기준선 — 기존 Fault 전체를 "신규"로 보고하지 않음
+            if first_load:
+                raised = []
+            raised.sort(key=_rank_key, reverse=True)
+            cleared.sort(key=_rank_key, reverse=True)
+            self._new = raised[:DELTA_KEEP]
+            self._cleared = cleared[:DELTA_KEEP]
+            self._new_count = len(raised)
+            self._cleared_count = len(cleared)
+
+        return {"new": len(raised), "cleared": len(cleared), "changed": changed}
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def severity_counts(self) -> dict[str, int]:
+        """심각도별 Fault 수 (큐브 marginal 참조, O(1))"""
+        return self.cube.marginal("severity")
+
+    def slice(
+        self,
+        group_by: str,
+        filters: Optional[dict[str, str]] = None,
+        top: int = 10,
+        subtree: str = "",
+    ) -> dict:
+        """
+        group_by 차원별 Fault 수 상위 N개
+
+        subtree 미지정 시 큐브 posting으로 응답, 지정 시 해당 DN 하위만 스캔.
+
+        Raises:
+            ValueError: 알 수 없는 차원 지정 시
+        """
+        filters = filters or {}
+        if not subtree:
+            return self.cube.slice(group_by, filters, top)
+
+        for dim in [group_by, *filters]:
+            if dim not in FAULT_DIMENSIONS:
+                raise ValueError(f"Unknown dimension: {dim}")
+        counts: dict[str, int] = {}
+        for record in self._records.values():
+            if not _in_subtree(record.dn, subtree):
+                continue
+            if any(getattr(record, dim) != value for dim, value in filters.items()):
+                continue
+            value = getattr(record, group_by)
+            counts[value] = counts.get(value, 0) + 1
+
+        top_items = heapq.nlargest(max(top, 0), counts.items(), key=lambda kv: kv[1])
+        return {
+            "group_by": group_by,
+            "filters": filters,
+            "total": sum(counts.values()),
+            "distinct": len(counts),
+            "items": [{"value": k, "count": v} for k, v in top_items],
+        }
+
+    def top_faults(
+        self, top: int = 10, severities: Optional[tuple[str, ...]] = None
+    ) -> list[FaultRecord]:
+        """심각도 → 최근 전환 순 상위 N개 Fault (heapq.nlargest)"""
+        records = self._records.values()
+        if severities:
+            records = (r for r in records if r.severity in severities)
+        return heapq.nlargest(max(top, 0), records, key=_rank_key)
+
+    def changes(self, limit: int = 50) -> dict:
+        """
+        직전 스냅샷 대비 신규 / 해제 Fault
+
+        Returns:
+            dict: {version, new_count, cleared_count, new: [...], cleared: [...]}
+        """
+        limit = max(0, min(limit, DELTA_KEEP))
+        return {
+            "version": self.version,
+            "new_count": self._new_count,
+            "cleared_count": self._cleared_count,
+            "new": [r.to_dict() for r in self._new[:limit]],
+            "cleared": [r.to_dict() for r in self._cleared[:limit]],
+        }
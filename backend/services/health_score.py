@@ -0,0 +1,121 @@
+# ============================================
+# Health Score Collector
+# 목적: Fabric / Pod / Node / Tenant Health Score 일괄 수집
+# 버전: v1.11.0
+#
+# 조회 클래스 (클래스 쿼리 3회, 노드 수와 무관):
+#   fabricHealthTotal                           → Fabric 전체 / Pod별 점수
+#   topSystem?rsp-subtree-include=health        → 노드별 healthInst (자식)
+#   fvOverallHealth15min                        → Tenant별 최근 15분 점수
+# + fabricNode (노드 이름 / 역할 / 상태) — DN 해시 조인
+#
+# DN 예시:
+#   topology/health                              (Fabric 전체)
+#   topology/pod-1/health                        (Pod 1)
+#   topology/pod-1/node-101/sys                  (topSystem → 부모 = fabricNode DN)
+#   uni/tn-TenantA/CDfvOverallHealth15min        (Tenant)
+# ============================================
+
+from typing import Optional
+
+from services.dn_utils import extract_pod_id, extract_tenant, parent_dn
+
+# topSystem 하위 healthInst 포함 쿼리
+TOP_SYSTEM_HEALTH_QUERY = "rsp-subtree-include=health"
+
+
+def _score(value) -> Optional[int]:
+    """점수 문자열 → int (숫자가 아니면 None)"""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _sort_worst_first(rows: list[dict]) -> list[dict]:
+    """점수 오름차순 (점수 없음은 맨 앞 — 수집 불가 노드도 확인 대상)"""
+    return sorted(rows, key=lambda r: -1 if r["score"] is None else r["score"])
+
+
+def parse_fabric_health(items: list) -> tuple[Optional[int], list[dict]]:
+    """fabricHealthTotal → (Fabric 전체 점수, Pod별 점수 목록)"""
+    fabric_score: Optional[int] = None
+    pods: list[dict] = []
+    for item in items:
+        attr = item["fabricHealthTotal"]["attributes"]
+        dn = attr.get("dn", "")
+        score = _score(attr.get("cur"))
+        pod = extract_pod_id(dn)
+        if pod:
+            pods.append({"pod": pod, "score": score})
+        else:
+            fabric_score = score
+    return fabric_score, sorted(pods, key=lambda p: int(p["pod"]))
+
+
+def parse_node_health(systems: list, nodes: list) -> list[dict]:
+    """
+    topSystem(+healthInst 자식) ⋈ fabricNode (topSystem 부모 DN = fabricNode DN)
+
+    topSystem이 없는(응답 없는) 노드도 점수 None으로 포함.
+    """
+    score_by_node: dict[str, Optional[int]] = {}
+    for item in systems:
+        system = item["topSystem"]
+        score: Optional[int] = None
+        for child in system.get("children", []):
+            if "healthInst" in child:
+                score = _score(child["healthInst"]["attributes"].get("cur"))
+                break
+        score_by_node[parent_dn(system["attributes"].get("dn", ""))] = score
+
+    rows: list[dict] = []
+    for item in nodes:
+        attr = item["fabricNode"]["attributes"]
+        dn = attr.get("dn", "")
+        rows.append(
+            {
+                "id": attr.get("id", ""),
+                "name": attr.get("name", ""),
+                "role": attr.get("role", ""),
+                "pod": extract_pod_id(dn),
+                "status": attr.get("fabricSt", ""),
+                "score": score_by_node.get(dn),
+            }
+        )
+    return _sort_worst_first(rows)
+
+
+def parse_tenant_health(items: list) -> list[dict]:
+    """fvOverallHealth15min → Tenant별 {tenant, score(healthLast), avg(healthAvg)}"""
+    rows: list[dict] = []
+    for item in items:
+        attr = item["fvOverallHealth15min"]["attributes"]
+        tenant = extract_tenant(attr.get("dn", ""))
+        if not tenant:
+            continue
+        rows.append(
+            {
+                "tenant": tenant,
+                "score": _score(attr.get("healthLast")),
+                "avg": _score(attr.get("healthAvg")),
+            }
+        )
+    return _sort_worst_first(rows)
+
+
+def collect_health_scores(aci) -> dict:
+    """
+    Health Score 일괄 수집
+
+    Args:
+        aci: ACIClient 인스턴스
+    Returns:
+        dict: {fabric, pods, nodes, tenants} — nodes / tenants는 점수 낮은 순
+    """
+    fabric_score, pods = parse_fabric_health(aci.get("fabricHealthTotal"))
+    nodes = parse_node_health(
+        aci.get("topSystem", TOP_SYSTEM_HEALTH_QUERY), aci.get("fabricNode")
+    )
+    tenants = parse_tenant_health(aci.get("fvOverallHealth15min"))
+    return {"fabric": fabric_score, "pods": pods, "nodes": nodes, "tenants": tenants}
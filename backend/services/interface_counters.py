@@ -0,0 +1,225 @@
+# ============================================
+# Interface Counter Collector
+# 목적: 포트별 트래픽 사용률 / 에러율 계산 및 상위 N개 포트 보관
+# 버전: v1.11.0
+#
+# 조회 클래스 (클래스 쿼리 4회):
+#   eqptIngrTotal5min / eqptEgrTotal5min  → 5분 평균 사용률(utilAvg), bytesRate
+#   rmonEtherStats / rmonDot3Stats        → 누적 에러 카운터
+#
+# 설계 노트:
+#   - 포트 키 = "노드/인터페이스" (사전 컴파일 정규식으로 DN 1회 파싱)
+#   - 에러 카운터는 누적값 → 직전 새로고침 대비 delta / 경과 시간 = 초당 에러
+#     · 최초 관측 포트는 기준선만 저장 (delta 0)
+#     · 카운터 리셋(현재 < 이전) 시 현재값을 delta로 사용
+#     · 기준선은 (클래스, 포트)별 보관 — 조회 결과가 빈 클래스(aci.get 조회 실패)는
+#       직전 기준선을 그대로 유지 (다른 클래스만 delta 계산)
+#   - 결과는 heapq.nlargest로 상위 N개만 보관 → 포트 수와 무관하게 응답 크기 고정
+#   - 직전 누적값 dict만 포트 수에 비례 (포트당 튜플 1개)
+# ============================================
+
+import heapq
+import threading
+import time
+from typing import Optional
+
+from services.dn_utils import parse_phys_port
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 클래스별 에러 합산 대상 속성 (rmonDot3Stats.fCSErrors는 CRC와 중복이라 제외)
+ERROR_COUNTERS: dict[str, tuple[str, ...]] = {
+    "rmonEtherStats": ("cRCAlignErrors", "fragments", "jabbers"),
+    "rmonDot3Stats": ("symbolErrors", "lateCollisions"),
+}
+
+# 기본 상위 N
+DEFAULT_TOP = 10
+
+
+def _num(value) -> float:
+    """APIC 숫자 문자열 → float (비어 있거나 잘못된 값은 0)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _traffic_by_port(items: list, class_name: str) -> dict[str, tuple[float, float]]:
+    """eqpt*Total5min → 포트 키 → (utilAvg %, bytesRate B/s)"""
+    result: dict[str, tuple[float, float]] = {}
+    for item in items:
+        attr = item[class_name]["attributes"]
+        node, iface = parse_phys_port(attr.get("dn", ""))
+        if node:
+            result[f"{node}/{iface}"] = (
+                _num(attr.get("utilAvg")),
+                _num(attr.get("bytesRate")),
+            )
+    return result
+
+
+def _errors_by_port(ether: list, dot3: list) -> dict[str, dict[str, float]]:
+    """rmonEtherStats + rmonDot3Stats → 포트 키 → {속성: 누적값}"""
+    result: dict[str, dict[str, float]] = {}
+    for class_name, items in (("rmonEtherStats", ether), ("rmonDot3Stats", dot3)):
+        fields = ERROR_COUNTERS[class_name]
+        for item in items:
+            attr = item[class_name]["attributes"]
+            node, iface = parse_phys_port(attr.get("dn", ""))
+            if not node:
+                continue
+            counters = result.setdefault(f"{node}/{iface}", {})
+            for field in fields:
+                counters[field] = _num(attr.get(field))
+    return result
+
+
+class InterfaceCounterCollector:
+    """
+    포트 카운터 수집기
+
+    refresh()마다 상위 N개 사용률 / 에러 포트만 보관하며,
+    에러율 계산을 위해 클래스 / 포트별 직전 누적 에러 합계만 유지.
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP) -> None:
+        self.top = top
+        # (에러 클래스명, 포트 키) → (관측 시각, 누적 에러 합계)
+        self._prev_errors: dict[tuple[str, str], tuple[float, float]] = {}
+        self.refreshed_at: float = 0.0
+        self.result: dict = {
+            "ports": 0,
+            "interval": None,
+            "top_utilization": [],
+            "top_errors": [],
+        }
+        self._lock = threading.Lock()
+
+    def age(self) -> float:
+        """마지막 갱신 후 경과 시간(초). 갱신 이력 없으면 무한대"""
+        if not self.refreshed_at:
+            return float("inf")
+        return time.monotonic() - self.refreshed_at
+
+    def refresh(
+        self,
+        ingress: list,
+        egress: list,
+        ether: list,
+        dot3: list,
+        ts: Optional[float] = None,
+    ) -> dict:
+        """
+        카운터 imdata로 사용률 / 에러율 계산
+
+        Args:
+            ingress: eqptIngrTotal5min imdata 배열
+            egress:  eqptEgrTotal5min imdata 배열
+            ether:   rmonEtherStats imdata 배열
+            dot3:    rmonDot3Stats imdata 배열
+            ts:      관측 시각 (epoch 초, 기본 현재)
+        Returns:
+            dict: {ports, interval, top_utilization, top_errors}
+        """
+        ts = time.time() if ts is None else ts
+        ingr = _traffic_by_port(ingress, "eqptIngrTotal5min")
+        egr = _traffic_by_port(egress, "eqptEgrTotal5min")
+        errors = _errors_by_port(ether, dot3)
+
+        # ---- 사용률: 포트별 (최대 사용률, 키) 후보에서 상위 N ----
+        no_traffic = (0.0, 0.0)
+        util_rows = (
+            (max(ingr.get(key, no_traffic)[0], egr.get(key, no_traffic)[0]), key)
+            for key in ingr.keys() | egr.keys()
+        )
+        top_util = heapq.nlargest(self.top, util_rows)
+
+        # ---- 에러율: 클래스별 누적 합계 delta / 경과 시간 ----
+        with self._lock:
+            prev_errors = self._prev_errors
+            new_prev: dict[tuple[str, str], tuple[float, float]] = {}
+            # 조회 결과가 빈 클래스는 조회 실패로 보고 직전 기준선 유지
+            empty = {
+                name
+                for name, items in (("rmonEtherStats", ether), ("rmonDot3Stats", dot3))
+                if not items
+            }
+            if empty:
+                new_prev.update(
+                    (key, prev) for key, prev in prev_errors.items() if key[0] in empty
+                )
+            error_rows: list[tuple[float, float, str]] = []
+            intervals: list[float] = []
+            for key, counters in errors.items():
+                delta = rate = 0.0
+                for class_name, fields in ERROR_COUNTERS.items():
+                    if fields[0] not in counters:
+                        continue
+                    total = sum(counters[field] for field in fields)
+                    new_prev[(class_name, key)] = (ts, total)
+                    prev = prev_errors.get((class_name, key))
+                    if prev is None:
+                        continue
+                    class_delta = total - prev[1] if total >= prev[1] else total
+                    elapsed = ts - prev[0]
+                    if elapsed > 0:
+                        intervals.append(elapsed)
+                        rate += class_delta / elapsed
+                    delta += class_delta
+                if delta > 0:
+                    error_rows.append((delta, rate, key))
+            top_errors = heapq.nlargest(self.top, error_rows)
+
+            self.result = {
+                "ports": len(ingr.keys() | egr.keys() | errors.keys()),
+                "interval": round(max(intervals), 1) if intervals else None,
+                "top_utilization": [
+                    self._util_row(
+                        key, ingr.get(key, no_traffic), egr.get(key, no_traffic)
+                    )
+                    for _, key in top_util
+                ],
+                "top_errors": [
+                    self._error_row(key, delta, rate, errors[key])
+                    for delta, rate, key in top_errors
+                ],
+            }
+            self._prev_errors = new_prev
+            self.refreshed_at = time.monotonic()
+            return self.result
+
+    @staticmethod
+    def _split_key(key: str) -> tuple[str, str]:
+        node, _, iface = key.partition("/")
+        return node, iface
+
+    @classmethod
+    def _util_row(
+        cls, key: str, ingr: tuple[float, float], egr: tuple[float, float]
+    ) -> dict:
+        node, iface = cls._split_key(key)
+        return {
+            "node": node,
+            "interface": iface,
+            "util": max(ingr[0], egr[0]),
+            "ingress_util": ingr[0],
+            "egress_util": egr[0],
+            "ingress_bps": int(ingr[1] * 8),
+            "egress_bps": int(egr[1] * 8),
+        }
+
+    @classmethod
+    def _error_row(
+        cls, key: str, delta: float, rate: float, counters: dict[str, float]
+    ) -> dict:
+        node, iface = cls._split_key(key)
+        return {
+            "node": node,
+            "interface": iface,
+            "errors": int(delta),
+            "errors_per_sec": round(rate, 3),
+            "cumulative": {name: int(value) for name, value in counters.items()},
+        }
@@ -0,0 +1,175 @@
+# ============================================
+# Interface Flap Tracker
+# 목적: ethpmPhysIf 스냅샷 diff로 포트 상태 전환 기록 및 flapping 포트 탐지
+# 버전: v1.11.0
+#
+# 설계 노트:
+#   - 포트별 직전 상태 (operSt, lastLinkStChg) 보관 → 달라진 포트만 전환 기록
+#     · operSt 동일 + lastLinkStChg 변경 = 폴링 사이에 down→up 복귀한 경우
+#   - 포트별 전환 이력: deque(maxlen=HISTORY_PER_PORT)
+#   - 슬라이딩 윈도우: 전역 만료 deque[(시각, 포트)] + 포트별 카운터
+#     · 신규 전환은 append, 윈도우 밖 항목은 popleft 하며 카운터 감소
+#     → 업데이트 비용은 변경 포트 수 + 만료 항목 수에 비례
+#   - 스냅샷에서 사라진 포트는 상태 / 이력 삭제 → 메모리는 포트 수에 비례
+#   - 빈 스냅샷(조회 실패 시 aci.get은 빈 배열)은 무시 → 상태 / 이력 유지
+# ============================================
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from services.dn_utils import parse_phys_port
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 기본 슬라이딩 윈도우(초)와 flapping 판정 임계값(윈도우 내 전환 수)
+DEFAULT_WINDOW = 600
+DEFAULT_THRESHOLD = 3
+
+# 포트별 보관 전환 이력 수
+HISTORY_PER_PORT = 20
+
+# 윈도우 내 전역 전환 이벤트 상한 (대량 장애 시 메모리 보호)
+MAX_WINDOW_EVENTS = 100_000
+
+
+class InterfaceFlapTracker:
+    """
+    포트 상태 전환 추적기
+
+    Args:
+        window:    슬라이딩 윈도우 길이(초)
+        threshold: 윈도우 내 전환 수가 이 값 이상이면 flapping
+    """
+
+    def __init__(
+        self, window: int = DEFAULT_WINDOW, threshold: int = DEFAULT_THRESHOLD
+    ) -> None:
+        self.window = window
+        self.threshold = threshold
+        # 포트 키("노드/인터페이스") → (operSt, lastLinkStChg)
+        self._state: dict[str, tuple[str, str]] = {}
+        # 포트 키 → deque[(시각, 이전 상태, 현재 상태)]
+        self._history: dict[str, deque] = {}
+        # 윈도우 내 전환 이벤트 (시각 오름차순) + 포트별 개수
+        self._events: deque = deque(maxlen=MAX_WINDOW_EVENTS)
+        self._counts: dict[str, int] = {}
+        self.refreshed_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def age(self) -> float:
+        """마지막 갱신 후 경과 시간(초). 갱신 이력 없으면 무한대"""
+        if not self.refreshed_at:
+            return float("inf")
+        return time.monotonic() - self.refreshed_at
+
+    def update(self, interfaces: list, ts: Optional[float] = None) -> int:
+        """
+        ethpmPhysIf 스냅샷 반영
+
+        최초 스냅샷은 기준선으로만 저장 (전환 기록 없음).
+        빈 스냅샷은 조회 실패로 보고 무시 (기존 상태 / 이력 유지, 다음 호출에서 재시도).
+
+        Args:
+            interfaces: ethpmPhysIf imdata 배열
+            ts:         관측 시각 (epoch 초, 기본 현재)
+        Returns:
+            int: 이번 업데이트에서 기록한 전환 수
+        """
+        ts = time.time() if ts is None else ts
+        new_state: dict[str, tuple[str, str]] = {}
+        for item in interfaces:
+            attr = item["ethpmPhysIf"]["attributes"]
+            node, iface = parse_phys_port(attr.get("dn", ""))
+            if node:
+                new_state[f"{node}/{iface}"] = (
+                    attr.get("operSt", ""),
+                    attr.get("lastLinkStChg", ""),
+                )
+        if not new_state:
+            return 0
+
+        transitions = 0
+        with self._lock:
+            old_state = self._state
+            if old_state:
+                for key, state in new_state.items():
+                    old = old_state.get(key)
+                    if old is None or old == state:
+                        continue
+                    self._record(key, ts, old[0], state[0])
+                    transitions += 1
+                # 사라진 포트 정리
+                for key in old_state.keys() - new_state.keys():
+                    self._history.pop(key, None)
+            self._state = new_state
+            self._expire(ts)
+            self.refreshed_at = time.monotonic()
+        return transitions
+
+    def _record(self, key: str, ts: float, before: str, after: str) -> None:
+        """전환 1건 기록 (lock 보유 상태에서 호출)"""
+        history = self._history.get(key)
+        if history is None:
+            history = self._history[key] = deque(maxlen=HISTORY_PER_PORT)
+        history.append((ts, before, after))
+
+        if len(self._events) == self._events.maxlen:
+            # 상한 도달 — 가장 오래된 이벤트를 카운터에서 먼저 제거
+            self._forget(self._events[0][1])
+        self._events.append((ts, key))
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _forget(self, key: str) -> None:
+        count = self._counts.get(key, 0) - 1
+        if count > 0:
+            self._counts[key] = count
+        else:
+            self._counts.pop(key, None)
+
+    def _expire(self, now: float) -> None:
+        """윈도우 밖 이벤트 제거 (lock 보유 상태에서 호출)"""
+        cutoff = now - self.window
+        events = self._events
+        while events and events[0][0] < cutoff:
+            _, key = events.popleft()
+            self._forget(key)
+
+    def flapping(
+        self, threshold: Optional[int] = None, now: Optional[float] = None
+    ) -> list[dict]:
+        """
+        윈도우 내 전환 수가 임계값 이상인 포트 목록 (전환 수 내림차순)
+
+        Returns:
+            list: [{node, interface, transitions, state, history: [{ts, from, to}]}]
+        """
+        threshold = self.threshold if threshold is None else threshold
+        now = time.time() if now is None else now
+        with self._lock:
+            self._expire(now)
+            hits = [
+                (count, key)
+                for key, count in self._counts.items()
+                if count >= threshold
+            ]
+            hits.sort(key=lambda hit: (-hit[0], hit[1]))
+            result = []
+            for count, key in hits:
+                node, _, iface = key.partition("/")
+                result.append(
+                    {
+                        "node": node,
+                        "interface": iface,
+                        "transitions": count,
+                        "state": self._state.get(key, ("", ""))[0],
+                        "history": [
+                            {"ts": int(t), "from": before, "to": after}
+                            for t, before, after in self._history.get(key, ())
+                        ],
+                    }
+                )
+        return result
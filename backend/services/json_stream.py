@@ -0,0 +1,251 @@
+# ============================================
+# APIC Export JSON Stream Parser
+# 목적: 대용량 APIC export JSON을 청크 단위로 읽으며 Managed Object를 하나씩 전달
+#       (파일 전체를 메모리에 올리지 않음 — 피크 메모리 = 청크 + 가장 큰 단일 값)
+# 버전: v1.11.0
+#
+# 지원 구조:
+#   {"totalCount": "...", "imdata": [{클래스: {"attributes": {...}, "children": [...]}}, ...]}
+#   [{클래스: {...}}, ...]                      — imdata 배열만 있는 파일
+#   {"polUni": {"attributes": {...}, "children": [...]}}  — 설정 export (단일 트리)
+#   · children은 깊이 제한 없이 재귀 순회 (부모 → 자식 순으로 전달)
+#   · 자식 attributes에 dn이 없으면 부모 DN + "/" + rn으로 보완
+#     (children이 attributes보다 먼저 나오면 부모 DN 미확정 → rn만 사용)
+#
+# 파싱 방식:
+#   - 컨테이너 구조({ [ , : 키)는 Python에서 토큰 단위로 진행
+#   - attributes 객체 / 스칼라 / 알 수 없는 값은 json.JSONDecoder.raw_decode(C 구현)로 한 번에 디코딩
+#     · 값이 버퍼 끝에서 잘리면 청크를 더 읽어 재시도 (값 1개 최대 MAX_VALUE_SIZE)
+#   - 소비한 버퍼 앞부분은 청크를 읽을 때마다 버림
+# ============================================
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Callable
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 파일 읽기 단위 (bytes)
+CHUNK_SIZE = 1 << 20
+
+# 단일 값(attributes 객체 / 스칼라) 최대 크기 — 잘못된 JSON에서 버퍼 무한 증가 방지
+MAX_VALUE_SIZE = 16 << 20
+
+_WHITESPACE: re.Pattern = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Managed Object 전달 콜백 (클래스명, attributes)
+MoHandler = Callable[[str, dict[str, Any]], None]
+
+
+class JSONStreamError(ValueError):
+    """스트림 JSON 형식 오류 (offset = 파일 내 문자 위치)"""
+
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(f"{message} (char {offset})")
+        self.offset = offset
+
+
+class MoStreamParser:
+    """
+    APIC export JSON 스트림 파서
+
+    Args:
+        stream:     바이너리 파일 객체 (read(n) 지원 — UploadFile.file 등)
+        chunk_size: 읽기 단위 (bytes)
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        # 버림 처리한 앞부분 길이 (오류 위치 표시용)
+        self._offset = 0
+        self._eof = False
+        self._emit: MoHandler = lambda cls, attrs: None
+        self.objects = 0
+
+    # ----------------------------------------
+    # 진입점
+    # ----------------------------------------
+    def parse(self, emit: MoHandler) -> int:
+        """
+        스트림 전체 파싱, Managed Object마다 emit(클래스명, attributes) 호출
+
+        Returns:
+            전달한 오브젝트 수
+        Raises:
+            JSONStreamError: JSON 형식 오류 / 지원하지 않는 최상위 구조
+        """
+        self._emit = emit
+        char = self._peek()
+        if char == "[":
+            self._wrapper_array("")
+        elif char == "{":
+            self._top_object()
+        else:
+            self._error("Expected '{' or '[' at top level")
+        if self._peek() != "":
+            self._error("Extra data after top-level value")
+        return self.objects
+
+    # ----------------------------------------
+    # 버퍼 / 토큰
+    # ----------------------------------------
+    def _fill(self) -> bool:
+        """청크 1개 추가 (소비한 앞부분 버림), EOF면 False"""
+        if self._eof:
+            return False
+        raw = self._stream.read(self._chunk_size)
+        if not raw:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(raw)
+        consumed, self._pos = self._pos, 0
+        self._offset += consumed
+        self._buf = self._buf[consumed:] + text
+        return True
+
+    def _peek(self) -> str:
+        """다음 비공백 문자 (위치 이동), EOF면 빈 문자열"""
+        # 빠른 경로: 공백 없이 바로 토큰 (압축 export 대부분)
+        if self._pos < len(self._buf):
+            char = self._buf[self._pos]
+            if char not in " \t\n\r":
+                return char
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            self._error(f"Expected '{char}'")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """값 1개 디코딩 (잘린 값은 청크 추가 후 재시도)"""
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if len(self._buf) - self._pos > MAX_VALUE_SIZE or not self._fill():
+                    self._error(exc.msg, self._offset + exc.pos)
+                continue
+            # 숫자 / 리터럴이 버퍼 끝에서 끝나면 뒤가 잘렸을 수 있음 → 확인 후 재시도
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _key(self) -> str:
+        if self._peek() != '"':
+            self._error("Expected object key")
+        key = self._value()
+        self._expect(":")
+        return key
+
+    def _next(self, close: str) -> bool:
+        """구분자 처리 — ','면 True (다음 항목), close면 False (끝)"""
+        char = self._peek()
+        self._pos += 1
+        if char == ",":
+            return True
+        if char != close:
+            self._pos -= 1
+            self._error(f"Expected ',' or '{close}'")
+        return False
+
+    def _empty(self, close: str) -> bool:
+        """여는 괄호 직후 빈 컨테이너면 닫고 True"""
+        if self._peek() == close:
+            self._pos += 1
+            return True
+        return False
+
+    def _error(self, message: str, offset: int | None = None) -> None:
+        raise JSONStreamError(
+            message, self._offset + self._pos if offset is None else offset
+        )
+
+    # ----------------------------------------
+    # APIC 구조
+    # ----------------------------------------
+    def _top_object(self) -> None:
+        """최상위 객체 — imdata 배열 또는 {클래스: 본문}"""
+        self._expect("{")
+        if self._empty("}"):
+            return
+        while True:
+            key = self._key()
+            char = self._peek()
+            if key == "imdata" and char == "[":
+                self._wrapper_array("")
+            elif char == "{":
+                self._body(key, "")
+            else:
+                self._value()
+            if not self._next("}"):
+                return
+
+    def _wrapper_array(self, parent_dn: str) -> None:
+        """[{클래스: 본문}, ...] (객체가 아닌 항목은 건너뜀)"""
+        self._expect("[")
+        if self._empty("]"):
+            return
+        while True:
+            if self._peek() == "{":
+                self._wrapper(parent_dn)
+            else:
+                self._value()
+            if not self._next("]"):
+                return
+
+    def _wrapper(self, parent_dn: str) -> None:
+        """{클래스: 본문}"""
+        self._expect("{")
+        if self._empty("}"):
+            return
+        while True:
+            class_name = self._key()
+            if self._peek() == "{":
+                self._body(class_name, parent_dn)
+            else:
+                self._value()
+            if not self._next("}"):
+                return
+
+    def _body(self, class_name: str, parent_dn: str) -> None:
+        """{"attributes": {...}, "children": [...]} — attributes는 읽는 즉시 전달"""
+        self._expect("{")
+        if self._empty("}"):
+            return
+        dn = ""
+        while True:
+            key = self._key()
+            char = self._peek()
+            if key == "attributes" and char == "{":
+                attrs = self._value()
+                dn = attrs.get("dn", "")
+                if not dn:
+                    rn = attrs.get("rn", "")
+                    dn = f"{parent_dn}/{rn}" if parent_dn and rn else rn
+                    if dn:
+                        attrs["dn"] = dn
+                self.objects += 1
+                self._emit(class_name, attrs)
+            elif key == "children" and char == "[":
+                self._wrapper_array(dn)
+            else:
+                self._value()
+            if not self._next("}"):
+                return
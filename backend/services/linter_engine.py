@@ -1,21 +1,35 @@
 # ============================================
 # ACI Config Linter Engine
 # 목적: ACI 설정 데이터에 대한 규칙 평가 엔진
-# 버전: v1.3.0
+# 버전: v1.11.0 - CollectedData 부모 DN 인덱스 (포함 관계 규칙 O(N×M) → O(N)),
+#                규칙 메타데이터(RULE_SPECS) + 부분집합 평가 (증분 lint 지원),
+#                사용자 정의 선언형 규칙 (linter_rules.RulePlan) 통합,
+#                fork 프로세스 풀 병렬 규칙 실행 + 규칙별 wall / CPU 시간,
+#                업로드 스트리밍 수집 (규칙이 쓰는 클래스 / 속성만 보관)
 #
 # 구조:
-#   DataCollector  — imdata 원시 데이터를 클래스별 dict로 정리
-#   RuleEngine     — 규칙별 평가 함수 실행 및 결과 수집
+#   DataCollector  — imdata 원시 데이터를 클래스별 dict로 정리 (업로드는 json_stream 스트리밍)
+#   DnIndex        — 클래스별 "하위 오브젝트를 가진 DN" 집합 (포함 관계 O(1) 조회)
+#   RuleEngine     — 규칙별 평가 함수 실행 및 결과 수집 (내장 규칙 + 사용자 정의 규칙)
+#                    workers > 1이면 규칙 / 오브젝트 구간 단위로 fork 프로세스 풀 병렬 실행
 #   LintIssue      — 단일 위반 항목 데이터 구조
 # ============================================
 
 import logging
+import multiprocessing
+import os
 import re
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
 import yaml
 
+from services.dn_utils import dn_ancestors
+from services.json_stream import CHUNK_SIZE, MoStreamParser
+from services.linter_rules import RulePlan, load_rule_definitions
+
 logger = logging.getLogger(__name__)
 
 # ============================================
@@ -45,11 +59,56 @@ NAMING_TARGET_CLASSES: list[str] = [
 ]
 
 
+# NM-002: prefix 설정 키 → ACI 클래스
+PREFIX_CLASS_MAP: dict[str, str] = {
+    "tenant_prefix": "fvTenant",
+    "bd_prefix": "fvBD",
+    "epg_prefix": "fvAEPg",
+    "contract_prefix": "vzBrCP",
+    "ap_prefix": "fvAp",
+}
+
+
 # ============================================
 # 데이터 구조 정의
 # ============================================
 
 
+@dataclass(frozen=True)
+class RuleSpec:
+    """
+    규칙 메타데이터
+
+    Attributes:
+        method:   RuleEngine 평가 메서드 이름 (check_*)
+        targets:  평가 대상 클래스 (이슈 DN = 대상 오브젝트 DN)
+        children: 포함 관계로 참조하는 하위 클래스
+                  (하위 오브젝트 변경 시 상위 대상 오브젝트 재평가)
+        fields:   대상 클래스에서 읽는 속성 (하위 클래스는 dn만 사용)
+    """
+
+    method: str
+    targets: tuple[str, ...]
+    children: tuple[str, ...] = ()
+    fields: tuple[str, ...] = ("dn", "name")
+
+
+# 규칙 실행 순서 = 결과 순서
+RULE_SPECS: tuple[RuleSpec, ...] = (
+    RuleSpec("check_sec_001_risky_contract", ("vzBrCP",)),
+    RuleSpec("check_sec_002_empty_contract", ("vzBrCP",), ("vzSubj",)),
+    RuleSpec("check_sec_003_empty_subject", ("vzSubj",), ("vzRsSubjFiltAtt",)),
+    RuleSpec("check_bp_001_epg_no_bd", ("fvAEPg",), ("fvRsBd",)),
+    RuleSpec("check_bp_002_epg_no_contract", ("fvAEPg",), ("fvRsProv", "fvRsCons")),
+    RuleSpec("check_bp_003_bd_no_subnet", ("fvBD",), ("fvSubnet",)),
+    RuleSpec("check_nm_001_invalid_characters", tuple(NAMING_TARGET_CLASSES)),
+    RuleSpec("check_nm_002_prefix_convention", tuple(PREFIX_CLASS_MAP.values())),
+)
+
+# 규칙 평가 대상 부분집합 (클래스명 → attributes 목록), None이면 전체
+TargetObjects = Optional[dict[str, list[dict[str, Any]]]]
+
+
 @dataclass
 class LintIssue:
     """
@@ -70,6 +129,58 @@ class LintIssue:
     message: str
 
 
+class DnIndex:
+    """
+    부모 DN 인덱스 — "DN 하위에 클래스 X 오브젝트가 있는가"를 O(1)로 응답
+
+    클래스별로 처음 조회될 때 해당 클래스 오브젝트의 모든 상위 DN별
+    하위 오브젝트 수를 집계 (클래스당 1회, O(오브젝트 수 × DN 깊이)).
+    이후 조회는 dict 조회 1회, 오브젝트 추가 / 삭제는 add / remove로 O(DN 깊이) 반영.
+
+    직계 자식뿐 아니라 모든 하위 오브젝트 기준 (`dn + "/"` 접두 포함과 동일),
+    단 대괄호 내부 '/'는 RN 구분자로 보지 않음.
+    """
+
+    def __init__(self, objects: dict[str, list[dict[str, Any]]]) -> None:
+        self.objects = objects
+        # 클래스명 → 상위 DN → 하위 오브젝트 수
+        self._parents: dict[str, dict[str, int]] = {}
+
+    def parents_of(self, class_name: str) -> dict[str, int]:
+        """클래스 오브젝트를 하위에 가진 DN → 하위 오브젝트 수 (최초 조회 시 구성)"""
+        parents = self._parents.get(class_name)
+        if parents is None:
+            parents = {}
+            for attrs in self.objects.get(class_name, []):
+                # 마지막 항목(자기 자신) 제외
+                for ancestor in dn_ancestors(attrs.get("dn", ""))[:-1]:
+                    parents[ancestor] = parents.get(ancestor, 0) + 1
+            self._parents[class_name] = parents
+        return parents
+
+    def has_child(self, dn: str, class_name: str) -> bool:
+        """dn 하위에 class_name 오브젝트가 하나 이상 있으면 True"""
+        return bool(dn) and dn in self.parents_of(class_name)
+
+    def add(self, class_name: str, dn: str) -> None:
+        """오브젝트 추가 반영 (아직 구성 전인 클래스는 최초 조회 시 objects에서 구성)"""
+        parents = self._parents.get(class_name)
+        if parents is not None:
+            for ancestor in dn_ancestors(dn)[:-1]:
+                parents[ancestor] = parents.get(ancestor, 0) + 1
+
+    def remove(self, class_name: str, dn: str) -> None:
+        """오브젝트 삭제 반영"""
+        parents = self._parents.get(class_name)
+        if parents is not None:
+            for ancestor in dn_ancestors(dn)[:-1]:
+                count = parents.get(ancestor, 0) - 1
+                if count > 0:
+                    parents[ancestor] = count
+                else:
+                    parents.pop(ancestor, None)
+
+
 @dataclass
 class CollectedData:
     """
@@ -77,14 +188,29 @@ class CollectedData:
 
     key:   ACI 클래스명 (예: "fvTenant")
     value: 해당 클래스의 attributes 딕셔너리 목록
+
+    포함 관계 조회(has_child)는 lint 실행당 1회 구성되는 DnIndex 사용.
+    objects를 교체하면 인덱스도 다시 구성됨.
     """
 
     objects: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    _index: Optional[DnIndex] = field(default=None, repr=False, compare=False)
 
     def get(self, class_name: str) -> list[dict[str, Any]]:
         """클래스별 attributes 목록 반환 (없으면 빈 리스트)"""
         return self.objects.get(class_name, [])
 
+    @property
+    def index(self) -> DnIndex:
+        """부모 DN 인덱스 (objects 기준, 최초 접근 시 생성)"""
+        if self._index is None or self._index.objects is not self.objects:
+            self._index = DnIndex(self.objects)
+        return self._index
+
+    def has_child(self, dn: str, class_name: str) -> bool:
+        """dn 하위에 class_name 오브젝트가 있는지 (DnIndex O(1) 조회)"""
+        return self.index.has_child(dn, class_name)
+
 
 # ============================================
 # DataCollector
@@ -109,12 +235,13 @@ class DataCollector:
     """
 
     @staticmethod
-    def from_live(aci_client: Any) -> "CollectedData":
+    def from_live(aci_client: Any, extra_classes: tuple = ()) -> "CollectedData":
         """
         APIC Live 조회로 데이터 수집
 
         Args:
-            aci_client: ACIClient 인스턴스
+            aci_client:    ACIClient 인스턴스
+            extra_classes: 추가 수집 클래스 (사용자 정의 규칙 대상 / 하위 클래스)
         Returns:
             CollectedData
         """
@@ -132,6 +259,7 @@ class DataCollector:
             "fvRsProv",
             "fvRsCons",
         ]
+        target_classes += [c for c in extra_classes if c not in target_classes]
 
         raw: dict[str, list[dict]] = {}
 
@@ -194,6 +322,49 @@ class DataCollector:
         logger.info("Loaded %d classes from uploaded file", len(raw))
         return collected
 
+    @staticmethod
+    def from_stream(
+        stream: Any,
+        fields: Optional[dict[str, tuple[str, ...]]] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> "CollectedData":
+        """
+        업로드 파일 스트림에서 데이터 수집 (파일 전체를 메모리에 올리지 않음)
+
+        imdata 항목과 중첩 children 트리를 청크 단위로 파싱하면서
+        fields에 있는 클래스 / 속성만 보관 → 피크 메모리 = 청크 + 보관 데이터.
+
+        Args:
+            stream:     바이너리 파일 객체 (UploadFile.file 등)
+            fields:     클래스명 → 보관 속성 (None이면 전체 클래스 / 속성)
+            chunk_size: 읽기 단위 (bytes)
+        Returns:
+            CollectedData
+        Raises:
+            JSONStreamError: JSON 형식 오류
+        """
+        raw: dict[str, list[dict]] = {}
+
+        def keep(class_name: str, attrs: dict[str, Any]) -> None:
+            if fields is None:
+                raw.setdefault(class_name, []).append(attrs)
+                return
+            wanted = fields.get(class_name)
+            if wanted is None:
+                return
+            raw.setdefault(class_name, []).append(
+                {k: attrs[k] for k in wanted if k in attrs}
+            )
+
+        parsed = MoStreamParser(stream, chunk_size).parse(keep)
+        logger.info(
+            "Streamed %d objects, kept %d in %d classes",
+            parsed,
+            sum(len(items) for items in raw.values()),
+            len(raw),
+        )
+        return CollectedData(objects=raw)
+
     @staticmethod
     def _extract_attributes(class_name: str, imdata: list) -> list[dict[str, Any]]:
         """imdata 배열에서 attributes 딕셔너리만 추출"""
@@ -207,6 +378,65 @@ class DataCollector:
         return result
 
 
+# ============================================
+# 병렬 실행 (fork 프로세스 풀)
+# ============================================
+#
+# - 작업 단위 = (규칙 순번, 대상 클래스, 오브젝트 구간)
+#   · 대상 오브젝트가 SHARD_SIZE를 넘는 규칙은 클래스별 구간으로 분할
+# - 워커는 fork로 부모 메모리(engine, CollectedData, 선구성 DnIndex)를 copy-on-write 상속
+#   → 데이터 pickling 없음, 작업 인자(순번 / 구간)와 LintIssue 결과만 전달
+# - 결과는 작업 순서대로 병합 → 순차 실행과 같은 순서
+# - fork 미지원 플랫폼 / 소규모 데이터 / 풀 생성 실패 시 순차 실행
+
+# 병렬 실행 최소 오브젝트 수 (미만이면 fork 비용이 더 커서 순차 실행)
+PARALLEL_MIN_OBJECTS = 50000
+
+# 규칙 내 오브젝트 분할 단위
+SHARD_SIZE = 20000
+
+# 작업 단위 (규칙 순번, 대상 클래스 — None이면 규칙 전체, 구간 시작, 구간 끝)
+RuleTask = tuple[int, Optional[str], int, int]
+
+# fork 워커가 상속하는 실행 상태 (engine, data) — 풀 생성 직전 설정
+_FORK_STATE: Optional[tuple[Any, "CollectedData"]] = None
+_FORK_LOCK = threading.Lock()
+
+
+def _fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _timed_task(
+    engine: "RuleEngine", data: "CollectedData", task: RuleTask
+) -> tuple[int, list[LintIssue], float, float]:
+    """작업 1개 실행 → (규칙 순번, 이슈, wall ms, CPU ms)"""
+    idx, class_name, start, stop = task
+    objects = (
+        None if class_name is None else {class_name: data.get(class_name)[start:stop]}
+    )
+    wall, cpu = time.perf_counter(), time.thread_time()
+    found = engine.run_rule(engine.specs[idx], data, objects)
+    return (
+        idx,
+        found,
+        (time.perf_counter() - wall) * 1000,
+        (time.thread_time() - cpu) * 1000,
+    )
+
+
+def _run_forked_task(task: RuleTask) -> tuple[int, list[tuple], float, float]:
+    """워커 프로세스 진입점 (상속한 _FORK_STATE 사용, 이슈는 튜플로 반환 — pickling 비용 절감)"""
+    engine, data = _FORK_STATE
+    idx, found, wall_ms, cpu_ms = _timed_task(engine, data, task)
+    return (
+        idx,
+        [(i.rule_id, i.severity, i.category, i.dn, i.message) for i in found],
+        wall_ms,
+        cpu_ms,
+    )
+
+
 # ============================================
 # RuleEngine
 # ============================================
@@ -225,13 +455,45 @@ class RuleEngine:
         LintIssue    = ACL 매칭(히트) 결과
     """
 
-    def __init__(self, naming_config: dict | None = None) -> None:
+    def __init__(
+        self,
+        naming_config: dict | None = None,
+        custom_rules: RulePlan | None = None,
+        workers: int = 0,
+    ) -> None:
         """
         Args:
             naming_config: config.yaml의 linter.naming 섹션
                            None이면 기본 규칙(특수문자/공백)만 적용
+            custom_rules:  사용자 정의 규칙 쿼리 플랜 (내장 규칙 뒤에 실행)
+            workers:       병렬 실행 프로세스 수 (0 / 1이면 순차 실행)
         """
         self.naming_config: dict = naming_config or {}
+        self.workers = workers
+        # 직전 run_all 실행 시간 {mode, workers, wall_ms, rules: [...]}
+        self.last_timings: dict = {}
+        self.custom_rules: RulePlan = custom_rules or RulePlan()
+        # 실행 규칙 목록 — 사용자 정의 규칙은 플랜 전체가 규칙 1개 (클래스별 1회 순회)
+        self.specs: tuple[RuleSpec, ...] = RULE_SPECS
+        if self.custom_rules:
+            self.specs += (
+                RuleSpec(
+                    "check_custom_rules",
+                    self.custom_rules.classes,
+                    self.custom_rules.child_classes,
+                    self.custom_rules.attributes,
+                ),
+            )
+
+    def required_fields(self) -> dict[str, tuple[str, ...]]:
+        """규칙이 읽는 클래스 → 속성 (대상 클래스는 spec.fields, 하위 클래스는 dn)"""
+        fields: dict[str, set[str]] = {}
+        for spec in self.specs:
+            for cls in spec.targets:
+                fields.setdefault(cls, set()).update(spec.fields)
+            for cls in spec.children:
+                fields.setdefault(cls, set()).add("dn")
+        return {cls: tuple(sorted(names)) for cls, names in fields.items()}
 
     def run_all(self, data: CollectedData) -> list[LintIssue]:
         """
@@ -242,38 +504,119 @@ class RuleEngine:
         Returns:
             LintIssue 목록
         """
-        issues: list[LintIssue] = []
+        started = time.perf_counter()
+        total = sum(len(items) for items in data.objects.values())
+        results = None
+        if self.workers > 1 and total >= PARALLEL_MIN_OBJECTS and _fork_available():
+            results = self._run_parallel(data)
+        mode = "sequential" if results is None else "parallel"
+        if results is None:
+            tasks = [(idx, None, 0, 0) for idx in range(len(self.specs))]
+            results = [_timed_task(self, data, task) for task in tasks]
 
-        rule_methods = [
-            self.check_sec_001_risky_contract,
-            self.check_sec_002_empty_contract,
-            self.check_sec_003_empty_subject,
-            self.check_bp_001_epg_no_bd,
-            self.check_bp_002_epg_no_contract,
-            self.check_bp_003_bd_no_subnet,
-            self.check_nm_001_invalid_characters,
-            self.check_nm_002_prefix_convention,
+        issues: list[LintIssue] = []
+        rules = [
+            {
+                "rule": spec.method,
+                "wall_ms": 0.0,
+                "cpu_ms": 0.0,
+                "issues": 0,
+                "tasks": 0,
+            }
+            for spec in self.specs
         ]
+        for idx, found, wall_ms, cpu_ms in results:
+            issues.extend(found)
+            rules[idx]["wall_ms"] += wall_ms
+            rules[idx]["cpu_ms"] += cpu_ms
+            rules[idx]["issues"] += len(found)
+            rules[idx]["tasks"] += 1
+        for entry in rules:
+            entry["wall_ms"] = round(entry["wall_ms"], 2)
+            entry["cpu_ms"] = round(entry["cpu_ms"], 2)
+        self.last_timings = {
+            "mode": mode,
+            "workers": self.workers if mode == "parallel" else 1,
+            "wall_ms": round((time.perf_counter() - started) * 1000, 2),
+            "rules": rules,
+        }
+        return issues
 
-        for rule in rule_methods:
+    def _tasks(self, data: CollectedData) -> list[RuleTask]:
+        """규칙별 작업 목록 (대상 오브젝트가 SHARD_SIZE 초과면 클래스별 구간 분할)"""
+        tasks: list[RuleTask] = []
+        for idx, spec in enumerate(self.specs):
+            sizes = [(cls, len(data.get(cls))) for cls in spec.targets]
+            if sum(size for _, size in sizes) <= SHARD_SIZE:
+                tasks.append((idx, None, 0, 0))
+                continue
+            for cls, size in sizes:
+                for start in range(0, size, SHARD_SIZE):
+                    tasks.append((idx, cls, start, min(start + SHARD_SIZE, size)))
+        return tasks
+
+    def _run_parallel(self, data: CollectedData) -> Optional[list]:
+        """
+        fork 프로세스 풀 실행 (실패 시 None → 순차 실행)
+
+        포함 관계 인덱스를 fork 전에 구성해 워커가 재구성하지 않도록 함.
+        """
+        for spec in self.specs:
+            for child in spec.children:
+                data.index.parents_of(child)
+        tasks = self._tasks(data)
+        global _FORK_STATE
+        with _FORK_LOCK:
+            _FORK_STATE = (self, data)
             try:
-                found = rule(data)
-                issues.extend(found)
-                logger.debug(
-                    "Rule %s: %d issue(s) found",
-                    rule.__name__,
-                    len(found),
-                )
+                context = multiprocessing.get_context("fork")
+                with context.Pool(min(self.workers, len(tasks))) as pool:
+                    results = pool.map(_run_forked_task, tasks, chunksize=1)
             except Exception as exc:
-                logger.error("Rule %s failed: %s", rule.__name__, exc)
+                logger.error("Parallel lint failed, running sequentially: %s", exc)
+                return None
+            finally:
+                _FORK_STATE = None
+        return [
+            (idx, [LintIssue(*fields) for fields in found], wall_ms, cpu_ms)
+            for idx, found, wall_ms, cpu_ms in results
+        ]
 
-        return issues
+    def run_rule(
+        self, spec: RuleSpec, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
+        """
+        규칙 1개 실행 (실패 시 로그 후 빈 목록)
+
+        Args:
+            spec:    specs 항목
+            data:    DataCollector로 정리된 ACI 데이터
+            objects: 평가 대상 부분집합 (None이면 data 전체)
+        """
+        try:
+            found = getattr(self, spec.method)(data, objects)
+        except Exception as exc:
+            logger.error("Rule %s failed: %s", spec.method, exc)
+            return []
+        logger.debug("Rule %s: %d issue(s) found", spec.method, len(found))
+        return found
+
+    @staticmethod
+    def _targets(
+        data: CollectedData, class_name: str, objects: TargetObjects
+    ) -> list[dict[str, Any]]:
+        """평가 대상 오브젝트 (objects 지정 시 그 부분집합만 — 증분 lint)"""
+        if objects is None:
+            return data.get(class_name)
+        return objects.get(class_name, [])
 
     # ------------------------------------------
     # Security Rules
     # ------------------------------------------
 
-    def check_sec_001_risky_contract(self, data: CollectedData) -> list[LintIssue]:
+    def check_sec_001_risky_contract(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         SEC-001: permitAll 계열 위험 키워드를 포함한 Contract 탐지
 
@@ -282,7 +625,7 @@ class RuleEngine:
         """
         issues: list[LintIssue] = []
 
-        for attrs in data.get("vzBrCP"):
+        for attrs in self._targets(data, "vzBrCP", objects):
             name: str = attrs.get("name", "")
             dn: str = attrs.get("dn", "")
             name_lower = name.lower()
@@ -305,29 +648,27 @@ class RuleEngine:
 
         return issues
 
-    def check_sec_002_empty_contract(self, data: CollectedData) -> list[LintIssue]:
+    def check_sec_002_empty_contract(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         SEC-002: Subject가 없는 빈 Contract 탐지
 
         빈 Contract는 트래픽을 차단하거나 정책 의도가 불명확한 상태.
-        Subject DN은 Contract DN을 포함하므로 포함 여부로 판단.
+        Subject DN은 Contract DN의 하위이므로 부모 DN 인덱스로 판단.
 
         탐지 기준: Contract의 DN을 포함하는 Subject가 없음
         심각도: warning
         """
         issues: list[LintIssue] = []
 
-        subject_dns: set[str] = {attrs.get("dn", "") for attrs in data.get("vzSubj")}
-
-        for attrs in data.get("vzBrCP"):
+        for attrs in self._targets(data, "vzBrCP", objects):
             contract_dn: str = attrs.get("dn", "")
             name: str = attrs.get("name", "")
 
-            # Subject DN은 Contract DN을 prefix로 포함
+            # Subject DN은 Contract DN을 부모로 가짐
             # 예: uni/tn-T1/brc-CON-Web/subj-Subj1
-            has_subject = any(
-                subj_dn.startswith(contract_dn + "/") for subj_dn in subject_dns
-            )
+            has_subject = data.has_child(contract_dn, "vzSubj")
 
             if not has_subject:
                 issues.append(
@@ -345,7 +686,9 @@ class RuleEngine:
 
         return issues
 
-    def check_sec_003_empty_subject(self, data: CollectedData) -> list[LintIssue]:
+    def check_sec_003_empty_subject(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         SEC-003: Filter가 연결되지 않은 빈 Subject 탐지
 
@@ -357,17 +700,11 @@ class RuleEngine:
         """
         issues: list[LintIssue] = []
 
-        filter_att_dns: set[str] = {
-            attrs.get("dn", "") for attrs in data.get("vzRsSubjFiltAtt")
-        }
-
-        for attrs in data.get("vzSubj"):
+        for attrs in self._targets(data, "vzSubj", objects):
             subject_dn: str = attrs.get("dn", "")
             name: str = attrs.get("name", "")
 
-            has_filter = any(
-                att_dn.startswith(subject_dn + "/") for att_dn in filter_att_dns
-            )
+            has_filter = data.has_child(subject_dn, "vzRsSubjFiltAtt")
 
             if not has_filter:
                 issues.append(
@@ -389,7 +726,9 @@ class RuleEngine:
     # Best Practice Rules
     # ------------------------------------------
 
-    def check_bp_001_epg_no_bd(self, data: CollectedData) -> list[LintIssue]:
+    def check_bp_001_epg_no_bd(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         BP-001: BD가 연결되지 않은 EPG 탐지
 
@@ -401,13 +740,11 @@ class RuleEngine:
         """
         issues: list[LintIssue] = []
 
-        bd_rel_dns: set[str] = {attrs.get("dn", "") for attrs in data.get("fvRsBd")}
-
-        for attrs in data.get("fvAEPg"):
+        for attrs in self._targets(data, "fvAEPg", objects):
             epg_dn: str = attrs.get("dn", "")
             name: str = attrs.get("name", "")
 
-            has_bd = any(rel_dn.startswith(epg_dn + "/") for rel_dn in bd_rel_dns)
+            has_bd = data.has_child(epg_dn, "fvRsBd")
 
             if not has_bd:
                 issues.append(
@@ -425,7 +762,9 @@ class RuleEngine:
 
         return issues
 
-    def check_bp_002_epg_no_contract(self, data: CollectedData) -> list[LintIssue]:
+    def check_bp_002_epg_no_contract(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         BP-002: Contract(Provided/Consumed)이 없는 고립 EPG 탐지
 
@@ -436,15 +775,12 @@ class RuleEngine:
         """
         issues: list[LintIssue] = []
 
-        prov_dns: set[str] = {attrs.get("dn", "") for attrs in data.get("fvRsProv")}
-        cons_dns: set[str] = {attrs.get("dn", "") for attrs in data.get("fvRsCons")}
-
-        for attrs in data.get("fvAEPg"):
+        for attrs in self._targets(data, "fvAEPg", objects):
             epg_dn: str = attrs.get("dn", "")
             name: str = attrs.get("name", "")
 
-            has_prov = any(dn.startswith(epg_dn + "/") for dn in prov_dns)
-            has_cons = any(dn.startswith(epg_dn + "/") for dn in cons_dns)
+            has_prov = data.has_child(epg_dn, "fvRsProv")
+            has_cons = data.has_child(epg_dn, "fvRsCons")
 
             if not has_prov and not has_cons:
                 issues.append(
@@ -462,7 +798,9 @@ class RuleEngine:
 
         return issues
 
-    def check_bp_003_bd_no_subnet(self, data: CollectedData) -> list[LintIssue]:
+    def check_bp_003_bd_no_subnet(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         BP-003: Subnet이 없는 BD 탐지
 
@@ -474,13 +812,11 @@ class RuleEngine:
         """
         issues: list[LintIssue] = []
 
-        subnet_dns: set[str] = {attrs.get("dn", "") for attrs in data.get("fvSubnet")}
-
-        for attrs in data.get("fvBD"):
+        for attrs in self._targets(data, "fvBD", objects):
             bd_dn: str = attrs.get("dn", "")
             name: str = attrs.get("name", "")
 
-            has_subnet = any(sn_dn.startswith(bd_dn + "/") for sn_dn in subnet_dns)
+            has_subnet = data.has_child(bd_dn, "fvSubnet")
 
             if not has_subnet:
                 issues.append(
@@ -502,7 +838,9 @@ class RuleEngine:
     # Naming Convention Rules
     # ------------------------------------------
 
-    def check_nm_001_invalid_characters(self, data: CollectedData) -> list[LintIssue]:
+    def check_nm_001_invalid_characters(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         NM-001: 이름에 공백 또는 허용되지 않는 특수문자 포함 탐지
 
@@ -513,7 +851,7 @@ class RuleEngine:
         issues: list[LintIssue] = []
 
         for class_name in NAMING_TARGET_CLASSES:
-            for attrs in data.get(class_name):
+            for attrs in self._targets(data, class_name, objects):
                 name: str = attrs.get("name", "")
                 dn: str = attrs.get("dn", "")
 
@@ -533,7 +871,9 @@ class RuleEngine:
 
         return issues
 
-    def check_nm_002_prefix_convention(self, data: CollectedData) -> list[LintIssue]:
+    def check_nm_002_prefix_convention(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
         """
         NM-002: config.yaml에 정의된 prefix 규칙 위반 탐지
 
@@ -551,23 +891,14 @@ class RuleEngine:
         if not self.naming_config:
             return issues
 
-        # prefix 설정 키 → ACI 클래스 매핑
-        prefix_class_map: dict[str, str] = {
-            "tenant_prefix": "fvTenant",
-            "bd_prefix": "fvBD",
-            "epg_prefix": "fvAEPg",
-            "contract_prefix": "vzBrCP",
-            "ap_prefix": "fvAp",
-        }
-
-        for config_key, class_name in prefix_class_map.items():
+        for config_key, class_name in PREFIX_CLASS_MAP.items():
             required_prefix: str = self.naming_config.get(config_key, "")
 
             # prefix 미설정 시 해당 클래스 스킵
             if not required_prefix:
                 continue
 
-            for attrs in data.get(class_name):
+            for attrs in self._targets(data, class_name, objects):
                 name: str = attrs.get("name", "")
                 dn: str = attrs.get("dn", "")
 
@@ -587,6 +918,29 @@ class RuleEngine:
 
         return issues
 
+    # ------------------------------------------
+    # Custom Rules
+    # ------------------------------------------
+
+    def check_custom_rules(
+        self, data: CollectedData, objects: TargetObjects = None
+    ) -> list[LintIssue]:
+        """
+        사용자 정의 선언형 규칙 (config.yaml linter.rules / rules_file)
+
+        규칙별 스캔이 아닌 RulePlan 클래스별 1회 순회로 전체 규칙 평가.
+        """
+        return [
+            LintIssue(
+                rule_id=rule.rule_id,
+                severity=rule.severity,
+                category=rule.category,
+                dn=dn,
+                message=message,
+            )
+            for rule, dn, message in self.custom_rules.evaluate(data, objects)
+        ]
+
 
 # ============================================
 # LinterService — 외부 인터페이스
@@ -605,36 +959,66 @@ class LinterService:
     """
 
     def __init__(self, config_path: str = "config.yaml") -> None:
-        self.naming_config: dict = self._load_naming_config(config_path)
-        self.engine = RuleEngine(naming_config=self.naming_config)
+        linter_config = self._load_linter_config(config_path)
+        self.naming_config: dict = linter_config.get("naming") or {}
+        logger.info("Naming config loaded: %s", self.naming_config)
+        self.custom_rules = RulePlan(
+            load_rule_definitions(
+                linter_config, os.path.dirname(os.path.abspath(config_path))
+            )
+        )
+        self.engine = RuleEngine(
+            naming_config=self.naming_config,
+            custom_rules=self.custom_rules,
+            workers=self._workers(linter_config.get("parallel_workers")),
+        )
 
-    def _load_naming_config(self, config_path: str) -> dict:
-        """config.yaml에서 linter.naming 섹션 로드"""
+    @staticmethod
+    def _workers(value: Any) -> int:
+        """linter.parallel_workers (auto = CPU 수, 잘못된 값은 0 = 순차 실행)"""
+        if value == "auto":
+            return os.cpu_count() or 1
+        try:
+            return max(int(value or 0), 0)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Invalid linter.parallel_workers %r — running sequentially", value
+            )
+            return 0
+
+    def _load_linter_config(self, config_path: str) -> dict:
+        """config.yaml에서 linter 섹션 로드 (naming / rules / rules_file)"""
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 config = yaml.safe_load(f)
-            naming = config.get("linter", {}).get("naming", {})
-            logger.info("Naming config loaded: %s", naming)
-            return naming
+            return config.get("linter", {}) or {}
         except FileNotFoundError:
             logger.warning("config.yaml not found — naming rules will use defaults")
             return {}
         except Exception as exc:
-            logger.error("Failed to load naming config: %s", exc)
+            logger.error("Failed to load linter config: %s", exc)
             return {}
 
-    def run_live(self, aci_client: Any) -> dict:
+    def run_live(self, aci_client: Any, incremental: Any = None) -> dict:
         """
         APIC Live 조회 후 전체 규칙 실행
 
         Args:
-            aci_client: ACIClient 인스턴스
+            aci_client:  ACIClient 인스턴스
+            incremental: IncrementalLinter — 지정 시 직전 실행 대비 변경분만 재평가
+                         (응답에 incremental 통계 추가)
         Returns:
             결과 dict (API 응답 형식)
         """
         logger.info("Starting live lint scan")
-        data = DataCollector.from_live(aci_client)
-        return self._build_result(data, source="live")
+        extra = self.custom_rules.classes + self.custom_rules.child_classes
+        data = DataCollector.from_live(aci_client, extra)
+        if incremental is None:
+            return self._build_result(data, source="live")
+        issues = incremental.run(self.engine, data)
+        result = self._format_result(issues, source="live")
+        result["incremental"] = incremental.last_run
+        return result
 
     def run_from_file(self, file_content: dict) -> dict:
         """
@@ -649,10 +1033,29 @@ class LinterService:
         data = DataCollector.from_file(file_content)
         return self._build_result(data, source="upload")
 
+    def run_from_stream(self, stream: Any) -> dict:
+        """
+        업로드 파일 스트림 기반 전체 규칙 실행 (대용량 export — 규칙이 쓰는 데이터만 보관)
+
+        Args:
+            stream: 바이너리 파일 객체
+        Returns:
+            결과 dict (API 응답 형식)
+        Raises:
+            JSONStreamError: JSON 형식 오류
+        """
+        logger.info("Starting streamed file-based lint scan")
+        data = DataCollector.from_stream(stream, self.engine.required_fields())
+        return self._build_result(data, source="upload")
+
     def _build_result(self, data: CollectedData, source: str) -> dict:
-        """규칙 실행 결과를 API 응답 형식으로 변환"""
-        issues = self.engine.run_all(data)
+        """전체 규칙 실행 후 API 응답 형식으로 변환 (규칙별 실행 시간 포함)"""
+        result = self._format_result(self.engine.run_all(data), source)
+        result["timings"] = self.engine.last_timings
+        return result
 
+    def _format_result(self, issues: list[LintIssue], source: str) -> dict:
+        """LintIssue 목록을 API 응답 형식으로 변환"""
         severity_summary = {"critical": 0, "warning": 0}
         for issue in issues:
             if issue.severity in severity_summary:
@@ -666,7 +1069,7 @@ class LinterService:
             severity_summary["warning"],
         )
 
-        return {
+        result = {
             "source": source,
             "total_issues": len(issues),
             "summary": severity_summary,
@@ -681,3 +1084,7 @@ class LinterService:
                 for issue in issues
             ],
         }
+        if self.custom_rules.errors:
+            # 건너뛴 사용자 정의 규칙 (설정 오류)
+            result["rule_errors"] = self.custom_rules.errors
+        return result
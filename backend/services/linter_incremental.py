@@ -0,0 +1,210 @@
+# ============================================
+# Incremental Linter
+# 목적: 직전 lint 상태를 보관하고 변경된 오브젝트에 영향받는 규칙 대상만 재평가
+# 버전: v1.11.0
+#
+# 동작:
+#   - 최초 실행 / naming 설정·사용자 정의 규칙 변경 시 전체 평가 (RuleEngine.run_all과 같은 결과)
+#   - 이후 실행: 새 수집 데이터와 직전 상태를 클래스별 DN 기준 비교 → 오브젝트 단위 변경
+#     · apply()로 변경 목록을 직접 전달할 수도 있음 (비교 생략)
+#   - 영향 범위 (RuleEngine.specs 기준 — 사용자 정의 규칙 플랜 포함):
+#     · 변경 오브젝트가 규칙 대상 클래스 → 해당 오브젝트 재평가 (삭제면 이슈 제거)
+#     · 변경 오브젝트가 규칙 하위 클래스 → 상위 DN 중 규칙 대상 오브젝트 재평가
+#   - 이슈 저장소: (규칙 순번, 대상 DN) → 이슈 목록, 재평가한 키만 교체
+#   - DnIndex는 add / remove로 갱신 (전체 재구성 없음)
+#
+# 비용: 클래스별 DN 비교 O(N) (dict 비교) + 재평가 O(변경 수 × DN 깊이)
+# ============================================
+
+import json
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from services.dn_utils import dn_ancestors
+from services.linter_engine import CollectedData, LintIssue, RuleEngine, RuleSpec
+
+# 오브젝트 변경 (클래스명, DN, 새 attributes — 삭제면 None)
+ObjectChange = tuple[str, str, Optional[dict[str, Any]]]
+
+
+class IncrementalLinter:
+    """
+    증분 lint 상태 (수집 대상 1개 기준, 스레드 안전)
+
+    last_run: 직전 실행 통계 {mode, changed_objects, evaluated, elapsed_ms}
+    """
+
+    def __init__(self) -> None:
+        self._data: Optional[CollectedData] = None
+        # 클래스명 → DN → attributes
+        self._by_dn: dict[str, dict[str, dict[str, Any]]] = {}
+        # (규칙 순번, 대상 DN) → 이슈
+        self._issues: dict[tuple[int, str], list[LintIssue]] = {}
+        self._config_key: Optional[tuple] = None
+        self._specs: tuple[RuleSpec, ...] = ()
+        # 클래스 → 해당 클래스를 평가 대상 / 하위 클래스로 참조하는 규칙 순번
+        self._target_rules: dict[str, list[int]] = {}
+        self._child_rules: dict[str, list[int]] = {}
+        self.last_run: dict = {}
+        self._lock = threading.Lock()
+
+    # ----------------------------------------
+    # 실행
+    # ----------------------------------------
+    def run(self, engine: RuleEngine, data: CollectedData) -> list[LintIssue]:
+        """
+        새 수집 데이터 기준 lint (직전 상태와 비교해 변경분만 재평가)
+
+        Args:
+            engine: RuleEngine (naming 설정이 바뀌면 전체 재평가)
+            data:   DataCollector로 정리된 전체 데이터
+        """
+        with self._lock:
+            started = time.perf_counter()
+            if self._data is None or self._key(engine) != self._config_key:
+                evaluated = self._full(engine, data)
+                changed, mode = sum(len(v) for v in self._by_dn.values()), "full"
+            else:
+                changes = self._diff(data)
+                evaluated = self._apply(engine, changes)
+                changed, mode = len(changes), "incremental"
+            return self._finish(mode, changed, evaluated, started)
+
+    def apply(
+        self, engine: RuleEngine, changes: Iterable[ObjectChange]
+    ) -> list[LintIssue]:
+        """
+        오브젝트 변경 목록 반영 후 lint (전체 데이터 비교 없음)
+
+        최초 호출 전에는 빈 데이터를 기준선으로 사용.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            if self._data is None or self._key(engine) != self._config_key:
+                self._full(engine, self._data or CollectedData())
+            changes = list(changes)
+            evaluated = self._apply(engine, changes)
+            return self._finish("incremental", len(changes), evaluated, started)
+
+    def issues(self) -> list[LintIssue]:
+        """현재 이슈 (규칙 순서, 규칙 내 순서는 전체 실행과 다를 수 있음)"""
+        with self._lock:
+            return self._ordered()
+
+    # ----------------------------------------
+    # 내부
+    # ----------------------------------------
+    @staticmethod
+    def _key(engine: RuleEngine) -> tuple:
+        """전체 재평가가 필요한 설정 (naming / 규칙 목록 / 사용자 정의 규칙 원문)"""
+        return (
+            json.dumps(engine.naming_config, sort_keys=True, default=str),
+            engine.specs,
+            engine.custom_rules.signature,
+        )
+
+    def _ordered(self) -> list[LintIssue]:
+        by_rule: list[list[LintIssue]] = [[] for _ in self._specs]
+        for (idx, _), found in self._issues.items():
+            by_rule[idx].extend(found)
+        return [issue for found in by_rule for issue in found]
+
+    def _finish(
+        self, mode: str, changed: int, evaluated: int, started: float
+    ) -> list[LintIssue]:
+        self.last_run = {
+            "mode": mode,
+            "changed_objects": changed,
+            "evaluated": evaluated,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        return self._ordered()
+
+    def _full(self, engine: RuleEngine, data: CollectedData) -> int:
+        """전체 평가 후 상태 초기화 (objects는 복사해서 보관 — 이후 제자리 갱신)"""
+        self._by_dn = {
+            cls: {attrs.get("dn", ""): attrs for attrs in items}
+            for cls, items in data.objects.items()
+        }
+        self._data = CollectedData(
+            objects={cls: list(by_dn.values()) for cls, by_dn in self._by_dn.items()}
+        )
+        self._config_key = self._key(engine)
+        self._specs = engine.specs
+        self._target_rules, self._child_rules = {}, {}
+        for idx, spec in enumerate(self._specs):
+            for cls in spec.targets:
+                self._target_rules.setdefault(cls, []).append(idx)
+            for cls in spec.children:
+                self._child_rules.setdefault(cls, []).append(idx)
+        self._issues = {}
+        for idx, spec in enumerate(self._specs):
+            for issue in engine.run_rule(spec, self._data):
+                self._issues.setdefault((idx, issue.dn), []).append(issue)
+        return sum(len(v) for v in self._by_dn.values())
+
+    def _diff(self, data: CollectedData) -> list[ObjectChange]:
+        """직전 상태 대비 클래스별 추가 / 삭제 / 변경 오브젝트"""
+        changes: list[ObjectChange] = []
+        for cls in self._by_dn.keys() | data.objects.keys():
+            old = self._by_dn.get(cls, {})
+            new = {attrs.get("dn", ""): attrs for attrs in data.objects.get(cls, [])}
+            for dn, attrs in new.items():
+                if old.get(dn) != attrs:
+                    changes.append((cls, dn, attrs))
+            for dn in old.keys() - new.keys():
+                changes.append((cls, dn, None))
+        return changes
+
+    def _apply(self, engine: RuleEngine, changes: list[ObjectChange]) -> int:
+        """변경 반영 (objects / DnIndex 갱신) 후 영향받는 규칙 대상만 재평가"""
+        data = self._data
+        index = data.index
+        # 규칙 순번 → 대상 클래스 → 재평가 DN
+        affected: dict[int, dict[str, set[str]]] = {}
+        touched: set[str] = set()
+
+        for cls, dn, attrs in changes:
+            by_dn = self._by_dn.setdefault(cls, {})
+            existed = dn in by_dn
+            if attrs is None:
+                if not existed:
+                    continue
+                del by_dn[dn]
+                index.remove(cls, dn)
+            else:
+                if not existed:
+                    index.add(cls, dn)
+                by_dn[dn] = attrs
+            touched.add(cls)
+            for idx in self._target_rules.get(cls, ()):
+                affected.setdefault(idx, {}).setdefault(cls, set()).add(dn)
+            child_rules = self._child_rules.get(cls, ())
+            if child_rules:
+                ancestors = dn_ancestors(dn)[:-1]
+                for idx in child_rules:
+                    for target in self._specs[idx].targets:
+                        targets = self._by_dn.get(target, {})
+                        for ancestor in ancestors:
+                            if ancestor in targets:
+                                affected.setdefault(idx, {}).setdefault(
+                                    target, set()
+                                ).add(ancestor)
+
+        # 변경 클래스 objects 목록 교체 (같은 dict 객체 → DnIndex 유지)
+        for cls in touched:
+            data.objects[cls] = list(self._by_dn[cls].values())
+
+        evaluated = 0
+        for idx, targets in affected.items():
+            subset: dict[str, list[dict[str, Any]]] = {}
+            for cls, dns in targets.items():
+                by_dn = self._by_dn.get(cls, {})
+                for dn in dns:
+                    self._issues.pop((idx, dn), None)
+                subset[cls] = [by_dn[dn] for dn in dns if dn in by_dn]
+                evaluated += len(subset[cls])
+            for issue in engine.run_rule(self._specs[idx], data, subset):
+                self._issues.setdefault((idx, issue.dn), []).append(issue)
+        return evaluated
@@ -0,0 +1,400 @@
+# ============================================
+# Declarative Linter Rules
+# 목적: YAML / JSON 사용자 정의 lint 규칙을 공유 쿼리 플랜으로 컴파일 후 클래스별 1회 순회 평가
+# 버전: v1.11.0
+#
+# 규칙 정의 (config.yaml linter.rules 또는 linter.rules_file):
+#   id / class / severity / category / message
+#   where:       대상 선택 속성 조건 (모두 만족하는 오브젝트만 검사)
+#   require:     필수 속성 조건 (하나라도 불만족 → 위반)
+#   children:    하위에 있어야 하는 클래스 (fvRs* 관계 오브젝트 포함)
+#   no_children: 하위에 없어야 하는 클래스
+#
+# 쿼리 플랜:
+#   - 규칙을 대상 클래스별로 묶고, 같은 (속성, 연산자, 값) 조건은 클래스 내 슬롯 1개로 공유
+#   - 클래스별 오브젝트 목록 1회 순회 → 오브젝트마다 슬롯을 1회씩 평가해 모든 규칙이 공유
+#   - where 조합이 같은 규칙은 묶어서 대상 선택 판정 1회
+#   - 하위 클래스 존재 조건은 CollectedData DnIndex(parents_of) 조회 (O(1))
+#   → 비용 = 클래스별 오브젝트 순회 1회 × 고유 조건 수 (규칙 수에 비례하는 전체 스캔 없음)
+#
+# 잘못된 정의는 건너뛰고 plan.errors에 기록 (lint 전체를 중단하지 않음)
+# ============================================
+
+import json
+import logging
+import os
+import re
+import string
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 허용 심각도 (결과 summary 집계 기준과 동일)
+SEVERITIES = ("critical", "warning")
+
+# 기본 분류
+DEFAULT_CATEGORY = "Custom"
+
+
+def _text(value: Any) -> str:
+    """조건 값 정규화 — APIC 속성은 문자열 (YAML bool은 yes / no)"""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return "" if value is None else str(value)
+
+
+def _text_list(value: Any) -> tuple[str, ...]:
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"expected a list, got {value!r}")
+    return tuple(_text(v) for v in value)
+
+
+def _flag(value: Any) -> bool:
+    return _text(value).lower() in ("yes", "true", "1")
+
+
+def _regex(value: Any) -> Callable[[str], bool]:
+    try:
+        pattern = re.compile(_text(value))
+    except re.error as exc:
+        raise ValueError(f"invalid regex {value!r}: {exc}") from exc
+    return lambda actual: pattern.search(actual) is not None
+
+
+# 연산자 → (값 정규화, 검사 함수 생성)
+OPERATORS: dict[str, tuple[Callable, Callable]] = {
+    "eq": (_text, lambda e: lambda a: a == e),
+    "ne": (_text, lambda e: lambda a: a != e),
+    "in": (_text_list, lambda e: lambda a, s=frozenset(e): a in s),
+    "not_in": (_text_list, lambda e: lambda a, s=frozenset(e): a not in s),
+    "prefix": (_text, lambda e: lambda a: a.startswith(e)),
+    "suffix": (_text, lambda e: lambda a: a.endswith(e)),
+    "contains": (_text, lambda e: lambda a: e in a),
+    "regex": (_text, lambda e: _regex(e)),
+    "empty": (_flag, lambda e: lambda a: (a == "") is e),
+}
+
+
+class _Fields(dict):
+    """message 템플릿 치환용 (없는 키는 빈 문자열)"""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+# ============================================
+# 컴파일 결과
+# ============================================
+
+
+@dataclass
+class CompiledRule:
+    """
+    대상 클래스 1개 기준으로 컴파일된 규칙 (슬롯 번호는 클래스 플랜 기준)
+    """
+
+    rule_id: str
+    severity: str
+    category: str
+    message: str
+    where: tuple[int, ...]
+    require: tuple[int, ...]
+    children: tuple[str, ...]
+    no_children: tuple[str, ...]
+
+    def format(self, class_name: str, attrs: dict, failures: list[str]) -> str:
+        if self.message:
+            fields = _Fields(attrs)
+            fields.update(
+                {"class": class_name, "rule_id": self.rule_id},
+                failures="; ".join(failures),
+            )
+            return self.message.format_map(fields)
+        name = attrs.get("name", "") or attrs.get("dn", "")
+        return f"{class_name} '{name}' violates {self.rule_id}: " + "; ".join(failures)
+
+
+@dataclass
+class _ClassPlan:
+    """클래스별 공유 조건 슬롯 + 규칙 목록"""
+
+    slots: list[tuple[str, Callable[[str], bool]]] = field(default_factory=list)
+    labels: list[str] = field(default_factory=list)
+    keys: dict[tuple, int] = field(default_factory=dict)
+    rules: list[CompiledRule] = field(default_factory=list)
+    # where 슬롯 조합 → 규칙 (대상 선택 조건이 같은 규칙은 선택 판정 1회)
+    groups: dict[tuple[int, ...], list[CompiledRule]] = field(default_factory=dict)
+    child_classes: set[str] = field(default_factory=set)
+
+    def slot(self, attr: str, op: str, value: Any) -> int:
+        """(속성, 연산자, 값) 조건 슬롯 번호 (같은 조건은 재사용)"""
+        normalize, build = OPERATORS[op]
+        expected = normalize(value)
+        key = (attr, op, expected)
+        idx = self.keys.get(key)
+        if idx is None:
+            idx = self.keys[key] = len(self.slots)
+            self.slots.append((attr, build(expected)))
+            shown = list(expected) if isinstance(expected, tuple) else expected
+            self.labels.append(f"{attr} {op} {shown!r}")
+        return idx
+
+
+# 위반 (규칙, 대상 DN, 메시지)
+Violation = tuple[CompiledRule, str, str]
+
+
+class RulePlan:
+    """
+    사용자 정의 규칙 쿼리 플랜
+
+    Attributes:
+        rule_ids:      컴파일된 규칙 ID (정의 순서)
+        classes:       대상 클래스 (평가 순서)
+        child_classes: 하위 존재 조건에 쓰이는 클래스
+        attributes:    조건 / 메시지 템플릿이 참조하는 속성
+        errors:        건너뛴 정의의 오류 메시지
+        signature:     정의 원문 직렬화 (설정 변경 감지용)
+    """
+
+    def __init__(self, definitions: Iterable[Any] = ()) -> None:
+        self._classes: dict[str, _ClassPlan] = {}
+        self.rule_ids: list[str] = []
+        self.errors: list[str] = []
+        # 조건 / 메시지 템플릿이 참조하는 속성 (스트리밍 수집 시 보관 대상)
+        self._attributes: set[str] = set()
+        definitions = list(definitions)
+        self.signature = json.dumps(definitions, sort_keys=True, default=str)
+        for position, definition in enumerate(definitions):
+            try:
+                self._compile(definition)
+            except ValueError as exc:
+                label = (
+                    definition.get("id") if isinstance(definition, dict) else None
+                ) or f"#{position + 1}"
+                self.errors.append(f"{label}: {exc}")
+                logger.warning("Custom lint rule %s skipped: %s", label, exc)
+
+    @property
+    def classes(self) -> tuple[str, ...]:
+        return tuple(cls for cls, plan in self._classes.items() if plan.rules)
+
+    @property
+    def child_classes(self) -> tuple[str, ...]:
+        result: dict[str, None] = {}
+        for plan in self._classes.values():
+            result.update(dict.fromkeys(sorted(plan.child_classes)))
+        return tuple(result)
+
+    @property
+    def attributes(self) -> tuple[str, ...]:
+        """대상 클래스에서 보관해야 하는 속성 (dn / name + 조건 / 템플릿 참조 속성)"""
+        return tuple(sorted(self._attributes | {"dn", "name"}))
+
+    @property
+    def slot_count(self) -> int:
+        """고유 조건 슬롯 수 (클래스별 합)"""
+        return sum(len(plan.slots) for plan in self._classes.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.rule_ids)
+
+    # ----------------------------------------
+    # 컴파일
+    # ----------------------------------------
+    def _compile(self, definition: Any) -> None:
+        if not isinstance(definition, dict):
+            raise ValueError("rule definition must be a mapping")
+        unknown = set(definition) - {
+            "id",
+            "class",
+            "severity",
+            "category",
+            "message",
+            "where",
+            "require",
+            "children",
+            "no_children",
+        }
+        if unknown:
+            raise ValueError(f"unknown field(s): {', '.join(sorted(unknown))}")
+
+        rule_id = _text(definition.get("id")).strip()
+        if not rule_id:
+            raise ValueError("'id' is required")
+        if rule_id in self.rule_ids:
+            raise ValueError(f"duplicate rule id '{rule_id}'")
+        classes = definition.get("class")
+        classes = [classes] if isinstance(classes, str) else classes
+        if not classes or not all(isinstance(c, str) and c for c in classes):
+            raise ValueError("'class' must be a class name or a list of class names")
+        severity = _text(definition.get("severity", "warning"))
+        if severity not in SEVERITIES:
+            raise ValueError(f"'severity' must be one of {', '.join(SEVERITIES)}")
+        message = _text(definition.get("message", ""))
+        try:
+            message.format_map(_Fields())
+        except (ValueError, AttributeError, IndexError, KeyError) as exc:
+            raise ValueError(f"invalid message template: {exc}") from exc
+
+        where = self._conditions(definition.get("where"), "where")
+        require = self._conditions(definition.get("require"), "require")
+        children = self._class_list(definition.get("children"), "children")
+        no_children = self._class_list(definition.get("no_children"), "no_children")
+        if not (require or children or no_children):
+            raise ValueError("at least one of require / children / no_children needed")
+
+        compiled = []
+        for cls in classes:
+            plan = self._classes.setdefault(cls, _ClassPlan())
+            compiled.append(
+                (
+                    plan,
+                    CompiledRule(
+                        rule_id=rule_id,
+                        severity=severity,
+                        category=_text(definition.get("category", DEFAULT_CATEGORY)),
+                        message=message,
+                        where=tuple(plan.slot(*c) for c in where),
+                        require=tuple(plan.slot(*c) for c in require),
+                        children=children,
+                        no_children=no_children,
+                    ),
+                )
+            )
+        # 전체 컴파일 성공 후에만 등록
+        self._attributes.update(attr for attr, _, _ in where + require)
+        self._attributes.update(
+            re.split(r"[.\[]", name)[0]
+            for _, name, _, _ in string.Formatter().parse(message)
+            if name
+        )
+        for plan, rule in compiled:
+            plan.rules.append(rule)
+            plan.groups.setdefault(rule.where, []).append(rule)
+            plan.child_classes.update(children, no_children)
+        self.rule_ids.append(rule_id)
+
+    @staticmethod
+    def _conditions(spec: Any, name: str) -> list[tuple[str, str, Any]]:
+        """{속성: 값 | {연산자: 값}} → [(속성, 연산자, 값)] (연산자 검증)"""
+        if spec is None:
+            return []
+        if not isinstance(spec, dict):
+            raise ValueError(f"'{name}' must be a mapping of attribute conditions")
+        result = []
+        for attr, cond in spec.items():
+            ops = cond if isinstance(cond, dict) else {"eq": cond}
+            if not ops:
+                raise ValueError(f"'{name}.{attr}' has no operator")
+            for op, value in ops.items():
+                if op not in OPERATORS:
+                    raise ValueError(
+                        f"unknown operator '{op}' in '{name}.{attr}' "
+                        f"(allowed: {', '.join(OPERATORS)})"
+                    )
+                # 값 형식 검증 (regex 컴파일 포함)
+                normalize, build = OPERATORS[op]
+                build(normalize(value))
+                result.append((str(attr), op, value))
+        return result
+
+    @staticmethod
+    def _class_list(spec: Any, name: str) -> tuple[str, ...]:
+        if spec is None:
+            return ()
+        items = [spec] if isinstance(spec, str) else spec
+        if not isinstance(items, list) or not all(
+            isinstance(c, str) and c for c in items
+        ):
+            raise ValueError(f"'{name}' must be a class name or a list of class names")
+        return tuple(items)
+
+    # ----------------------------------------
+    # 평가
+    # ----------------------------------------
+    def evaluate(
+        self, data: Any, objects: Optional[dict[str, list[dict]]] = None
+    ) -> list[Violation]:
+        """
+        클래스별 1회 순회 평가
+
+        Args:
+            data:    CollectedData (클래스 목록 + DnIndex)
+            objects: 평가 대상 부분집합 (None이면 data 전체 — 증분 lint)
+        Returns:
+            [(규칙, DN, 메시지)] — 클래스 순, 오브젝트 순 (같은 where 규칙끼리 묶어 평가)
+        """
+        result: list[Violation] = []
+        for cls, plan in self._classes.items():
+            items = data.get(cls) if objects is None else objects.get(cls, [])
+            if not items or not plan.rules:
+                continue
+            parents = {c: data.index.parents_of(c) for c in plan.child_classes}
+            slots, labels = plan.slots, plan.labels
+            for attrs in items:
+                # 고유 조건은 오브젝트당 1회만 평가 → 모든 규칙이 결과 공유
+                values = [test(_text(attrs.get(attr, ""))) for attr, test in slots]
+                dn = attrs.get("dn", "")
+                for where, rules in plan.groups.items():
+                    if not all(values[idx] for idx in where):
+                        continue
+                    for rule in rules:
+                        failures = [
+                            labels[idx] for idx in rule.require if not values[idx]
+                        ]
+                        failures += [
+                            f"no {c} child"
+                            for c in rule.children
+                            if dn not in parents[c]
+                        ]
+                        failures += [
+                            f"has {c} child"
+                            for c in rule.no_children
+                            if dn in parents[c]
+                        ]
+                        if failures:
+                            result.append((rule, dn, rule.format(cls, attrs, failures)))
+        return result
+
+
+# ============================================
+# 정의 로드
+# ============================================
+
+
+def load_rule_definitions(linter_config: dict, base_dir: str = ".") -> list[Any]:
+    """
+    config.yaml linter 섹션에서 규칙 정의 목록 로드
+
+    linter.rules (인라인 목록) + linter.rules_file (YAML / JSON, 상대 경로는 base_dir 기준).
+    파일은 규칙 목록 또는 {"rules": [...]} 형식.
+    """
+    definitions = list(linter_config.get("rules") or [])
+    rules_file = linter_config.get("rules_file")
+    if rules_file:
+        path = (
+            rules_file
+            if os.path.isabs(rules_file)
+            else os.path.join(base_dir, rules_file)
+        )
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                loaded = json.load(f) if path.endswith(".json") else yaml.safe_load(f)
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            logger.error("Failed to load lint rules file %s: %s", path, exc)
+            loaded = None
+        if isinstance(loaded, dict):
+            loaded = loaded.get("rules")
+        if isinstance(loaded, list):
+            definitions.extend(loaded)
+        elif loaded is not None:
+            logger.error("Lint rules file %s must contain a list of rules", path)
+    return definitions
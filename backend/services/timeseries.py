@@ -0,0 +1,215 @@
+# ============================================
+# Time Series Store
+# 목적: 수집 주기별 수치를 메모리 내 링 버퍼에 보관 (추세 / sparkline 용)
+# 버전: v1.11.0
+#
+# 구조:
+#   TIERS           — 다운샘플 계층 (1분 / 1시간 / 1일)
+#   TimeSeriesStore — 시리즈 이름 → 계층별 고정 크기 링 버퍼
+#
+# 설계 노트:
+#   - 각 계층은 deque(maxlen=보존 버킷 수) → 실행 기간과 무관하게 메모리 고정
+#   - 버킷 = [시작 시각, 합계, 샘플 수, 최대값]
+#     같은 버킷에 들어온 샘플은 합산하여 평균 / 최대값 제공
+#   - 시리즈 수 상한(MAX_SERIES) 초과 시 가장 오래 비활성(0이 아닌 값 미기록)인 시리즈를
+#     제거하고 신규 시리즈 기록 (사라진 Fault 코드 등 0만 기록되는 시리즈부터 정리)
+#     · 같은 record() 호출의 시리즈만 남아 제거할 대상이 없으면 신규 시리즈 기록 생략
+#   - 계층 구성은 인스턴스별 지정 가능 (시리즈가 많은 용도는 세밀한 계층 생략)
+#   - 조회는 메모리에서만 수행 (APIC 호출 없음)
+# ============================================
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# (계층 이름, 버킷 크기(초), 보존 버킷 수)
+TIERS: tuple[tuple[str, int, int], ...] = (
+    ("1m", 60, 360),  # 6시간
+    ("1h", 3600, 168),  # 7일
+    ("1d", 86400, 365),  # 1년
+)
+
+# 시리즈 수 상한 (시리즈당 최대 TIERS 버킷 합계 = 893개)
+MAX_SERIES = 256
+
+# 버킷 필드 인덱스
+_START, _SUM, _COUNT, _MAX = 0, 1, 2, 3
+
+
+class TimeSeriesStore:
+    """
+    계층형 링 버퍼 시계열 저장소
+
+    record()는 모든 계층에 동시에 반영하며,
+    range_query()는 요청 구간을 보존하는 가장 세밀한 계층을 자동 선택.
+
+    Args:
+        max_series: 시리즈 수 상한
+        tiers:      (계층 이름, 버킷 크기(초), 보존 버킷 수) 목록 — 세밀한 순
+    """
+
+    def __init__(
+        self,
+        max_series: int = MAX_SERIES,
+        tiers: tuple[tuple[str, int, int], ...] = TIERS,
+    ) -> None:
+        self.max_series = max_series
+        self.tiers = tiers
+        # 시리즈 이름 → 계층 이름 → deque[버킷]
+        self._series: dict[str, dict[str, deque]] = {}
+        # 시리즈 이름 → 마지막으로 0이 아닌 값을 기록한 시각 (상한 초과 시 제거 순서)
+        self._active: dict[str, float] = {}
+        self.evicted: int = 0
+        self.dropped: int = 0
+        self._lock = threading.Lock()
+
+    def names(self, prefix: str = "") -> list[str]:
+        """저장된 시리즈 이름 (접두어 필터)"""
+        with self._lock:
+            return sorted(name for name in self._series if name.startswith(prefix))
+
+    def record(self, values: dict[str, float], ts: Optional[float] = None) -> None:
+        """
+        한 수집 시점의 값 기록
+
+        Args:
+            values: {시리즈 이름: 값}
+            ts:     수집 시각 (epoch 초, 기본 현재)
+        """
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            for name, value in values.items():
+                tiers = self._series.get(name)
+                if tiers is None:
+                    if len(self._series) >= self.max_series and not self._evict(values):
+                        self.dropped += 1
+                        logger.warning(
+                            "시계열 시리즈 상한(%d) 초과 — 신규 시리즈 '%s' 기록 생략",
+                            self.max_series,
+                            name,
+                        )
+                        continue
+                    tiers = {
+                        tier: deque(maxlen=capacity) for tier, _, capacity in self.tiers
+                    }
+                    self._series[name] = tiers
+                    self._active[name] = ts
+                elif value:
+                    self._active[name] = ts
+                for tier, step, _ in self.tiers:
+                    self._add(tiers[tier], ts - ts % step, value)
+
+    def _evict(self, keep: dict[str, float]) -> bool:
+        """가장 오래 비활성인 시리즈 1개 제거 (keep 제외, lock 보유 상태에서 호출)"""
+        victim = min(
+            (name for name in self._active if name not in keep),
+            key=self._active.__getitem__,
+            default=None,
+        )
+        if victim is None:
+            return False
+        del self._series[victim], self._active[victim]
+        self.evicted += 1
+        logger.info(
+            "시계열 시리즈 상한(%d) 초과 — 비활성 시리즈 '%s' 제거",
+            self.max_series,
+            victim,
+        )
+        return True
+
+    @staticmethod
+    def _add(buckets: deque, start: float, value: float) -> None:
+        """버킷 갱신 (같은 버킷이면 합산, 아니면 새 버킷 추가)"""
+        if buckets and buckets[-1][_START] == start:
+            bucket = buckets[-1]
+            bucket[_SUM] += value
+            bucket[_COUNT] += 1
+            if value > bucket[_MAX]:
+                bucket[_MAX] = value
+        elif not buckets or start > buckets[-1][_START]:
+            buckets.append([start, value, 1, value])
+        # 과거 버킷보다 이전 시각의 샘플은 무시 (시계 역행)
+
+    @staticmethod
+    def pick_tier(
+        seconds: float, tiers: tuple[tuple[str, int, int], ...] = TIERS
+    ) -> str:
+        """구간 길이를 보존하는 가장 세밀한 계층 이름"""
+        for tier, step, capacity in tiers:
+            if seconds <= step * capacity:
+                return tier
+        return tiers[-1][0]
+
+    def range_query(
+        self,
+        name: str,
+        seconds: float = 3600,
+        tier: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> dict:
+        """
+        최근 seconds 구간의 포인트 조회
+
+        Args:
+            name:    시리즈 이름
+            seconds: 조회 구간 길이(초)
+            tier:    계층 이름 (미지정 시 자동 선택)
+            now:     기준 시각 (기본 현재)
+        Returns:
+            dict: {series, tier, step, points: [{t, avg, max}]}
+        Raises:
+            ValueError: 알 수 없는 계층 지정 시
+        """
+        steps = {t: step for t, step, _ in self.tiers}
+        tier = tier or self.pick_tier(seconds, self.tiers)
+        if tier not in steps:
+            raise ValueError(f"Unknown tier: {tier}")
+        now = time.time() if now is None else now
+        since = now - seconds
+
+        with self._lock:
+            buckets = self._series.get(name, {}).get(tier, ())
+            points = [
+                {
+                    "t": int(b[_START]),
+                    "avg": round(b[_SUM] / b[_COUNT], 2),
+                    "max": b[_MAX],
+                }
+                for b in buckets
+                if b[_START] + steps[tier] > since
+            ]
+        return {"series": name, "tier": tier, "step": steps[tier], "points": points}
+
+    def bulk_points(
+        self, prefix: str, tier: str, since: float
+    ) -> dict[str, list[tuple[float, float]]]:
+        """
+        접두어가 일치하는 시리즈 전체의 (버킷 시작, 평균) 목록 (lock 1회)
+
+        시리즈 수가 많은 일괄 분석(추세 적합 등)용 — range_query의 dict 생성 생략.
+
+        Raises:
+            ValueError: 알 수 없는 계층 지정 시
+        """
+        steps = {t: step for t, step, _ in self.tiers}
+        if tier not in steps:
+            raise ValueError(f"Unknown tier: {tier}")
+        since -= steps[tier]
+        with self._lock:
+            return {
+                name: [
+                    (b[_START], b[_SUM] / b[_COUNT])
+                    for b in tiers[tier]
+                    if b[_START] > since
+                ]
+                for name, tiers in self._series.items()
+                if name.startswith(prefix)
+            }
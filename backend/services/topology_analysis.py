@@ -0,0 +1,324 @@
+# ============================================
+# Topology Analysis
+# 목적: 토폴로지 인접 인덱스 기반 장애 영향 분석
+#       (Leaf 이중화 수준, 단일 장애점, 노드 Down 시 영향 범위 + 영향 Endpoint / EPG)
+# 버전: v1.11.0
+#
+# 분석 그래프 (Fabric 전송 그래프):
+#   - Spine / Leaf 노드 중 UP 상태, up 링크만 (병렬 링크는 이웃 1개로 취급)
+#   - 외부 이웃 / Controller는 경유하지 않는 끝점 → 연결된 Fabric 노드 집합(attachment)만 보관
+#
+# 지표:
+#   - Leaf 이중화 수준 k = 서로 다른 up 상위 노드 수
+#     · 상위 = Spine 기준 BFS 깊이가 더 얕은 이웃 (tier-2 Leaf는 tier-1 Leaf가 상위)
+#     · Clos 구조에서 Leaf → Spine 계층의 정점 분리 경로 수와 같음 (k=1 = 이중화 없음)
+#   - 단일 장애점(SPOF)
+#     · Fabric 전송 그래프의 단절점 (반복형 Tarjan, O(V + E))
+#     · 외부 이웃 / Controller가 1개 Fabric 노드에만 연결된 경우 그 노드
+#     · 후보별 영향 범위를 계산해 실제로 고립 / 분리가 생기는 노드만 보고
+#   - 영향 범위 (failed 노드 집합 가정)
+#     · isolated: Spine에 도달할 수 없게 되는 Leaf (BFS, Spine 전체에서 시작)
+#     · degraded: 이중화 수준이 낮아지는 Leaf (before → after)
+#     · detached: 연결된 Fabric 노드가 모두 장애 / 고립되는 외부 이웃 / Controller
+#
+# Endpoint 조인:
+#   - EndpointIndex 큐브의 node / peer 차원 marginal로 노드별 Endpoint 수,
+#     장애 노드의 큐브 셀 조회로 영향 Endpoint / EPG 집계 (Endpoint 전체 순회 없음)
+#   - vPC Endpoint(peer 차원)는 양쪽 Leaf 모두에 연결된 것으로 집계하고,
+#     두 Leaf가 모두 장애 / 고립일 때만 영향 Endpoint로 판단
+#
+# 분석 결과(이중화 / SPOF)는 스냅샷 버전별 1회 계산, 영향 범위 질의는 O(V + E)
+# ============================================
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+from services.endpoint_index import CUBE_DIMENSIONS
+from services.topology_graph import TopologyGraph, node_sort_key
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# Fabric 전송 그래프에 포함하는 역할
+TRANSIT_ROLES = frozenset({"spine", "leaf"})
+
+# 영향 EPG 최대 반환 개수
+MAX_IMPACT_EPGS = 50
+
+
+# ============================================
+# 그래프 알고리즘
+# ============================================
+
+
+def articulation_points(adjacency: dict[str, set[str]]) -> set[str]:
+    """
+    무방향 그래프 단절점 (반복형 Tarjan — 깊은 그래프에서도 재귀 한도 없음)
+
+    Args:
+        adjacency: 노드 → 이웃 집합
+    """
+    disc: dict[str, int] = {}
+    low: dict[str, int] = {}
+    result: set[str] = set()
+    timer = 0
+    for root in adjacency:
+        if root in disc:
+            continue
+        disc[root] = low[root] = timer
+        timer += 1
+        root_children = 0
+        stack = [(root, "", iter(adjacency[root]))]
+        while stack:
+            node, parent, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor == parent:
+                    continue
+                if neighbor in disc:
+                    low[node] = min(low[node], disc[neighbor])
+                    continue
+                disc[neighbor] = low[neighbor] = timer
+                timer += 1
+                stack.append((neighbor, node, iter(adjacency[neighbor])))
+                break
+            else:
+                stack.pop()
+                if not parent:
+                    continue
+                low[parent] = min(low[parent], low[node])
+                if parent == root:
+                    root_children += 1
+                elif low[node] >= disc[parent]:
+                    result.add(parent)
+        if root_children > 1:
+            result.add(root)
+    return result
+
+
+# ============================================
+# TopologyAnalysis
+# ============================================
+
+
+class TopologyAnalysis:
+    """
+    TopologyGraph 장애 영향 분석 (생성 시 이중화 / SPOF 사전 계산)
+
+    Args:
+        graph: TopologyGraph (생성 후 변경하지 않음)
+    """
+
+    def __init__(self, graph: TopologyGraph) -> None:
+        self.graph = graph
+        nodes = graph.nodes
+
+        # ---- Fabric 전송 그래프 (UP Spine / Leaf, up 링크) ----
+        self.adjacency: dict[str, set[str]] = {
+            n: set()
+            for n, info in nodes.items()
+            if info["role"] in TRANSIT_ROLES and info["status"] == "UP"
+        }
+        # 외부 이웃 / Controller → 연결된 UP Fabric 노드
+        self.attachment: dict[str, set[str]] = {
+            n: set() for n, info in nodes.items() if info["role"] not in TRANSIT_ROLES
+        }
+        for node_id, neighbors in graph.adjacency.items():
+            for neighbor, idxs in neighbors.items():
+                if not graph.link_up(idxs):
+                    continue
+                if node_id in self.adjacency and neighbor in self.adjacency:
+                    self.adjacency[node_id].add(neighbor)
+                elif node_id in self.attachment and neighbor in self.adjacency:
+                    self.attachment[node_id].add(neighbor)
+
+        self.spines = [n for n in self.adjacency if nodes[n]["role"] == "spine"]
+        # Spine 기준 BFS 깊이 (Spine = 0)
+        self.depth = self._depths()
+        self.leaves = sorted(
+            (n for n in nodes if nodes[n]["role"] == "leaf"), key=node_sort_key
+        )
+        self.redundancy = {leaf: self._uplinks(leaf, ()) for leaf in self.leaves}
+        self.spof = self._find_spof()
+
+    # ----------------------------------------
+    # 이중화 수준
+    # ----------------------------------------
+    def _depths(self) -> dict[str, int]:
+        depth = {s: 0 for s in self.spines}
+        queue = deque(self.spines)
+        while queue:
+            current = queue.popleft()
+            for neighbor in self.adjacency[current]:
+                if neighbor not in depth:
+                    depth[neighbor] = depth[current] + 1
+                    queue.append(neighbor)
+        return depth
+
+    def _uplinks(self, leaf: str, failed: Iterable[str]) -> int:
+        """Leaf의 서로 다른 up 상위 노드 수 (장애 가정 노드 제외)"""
+        if leaf not in self.depth:
+            return 0
+        blocked = set(failed)
+        level = self.depth[leaf]
+        return sum(
+            1
+            for n in self.adjacency[leaf]
+            if n not in blocked and self.depth.get(n, level) < level
+        )
+
+    # ----------------------------------------
+    # 영향 범위
+    # ----------------------------------------
+    def _reachable_from_spines(self, failed: set[str]) -> set[str]:
+        """장애 노드 제외 후 Spine에서 도달 가능한 노드 (BFS)"""
+        seen = {s for s in self.spines if s not in failed}
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            for neighbor in self.adjacency[current]:
+                if neighbor not in seen and neighbor not in failed:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        return seen
+
+    def blast_radius(self, failed: Iterable[str]) -> dict:
+        """
+        노드 장애 가정 시 영향 범위
+
+        Args:
+            failed: 장애 가정 노드 ID
+        Returns:
+            dict: {failed, isolated: [Leaf ID], degraded: [{id, before, after}],
+                   detached: [외부 / Controller ID]}
+        """
+        failed_set = set(failed)
+        reachable = self._reachable_from_spines(failed_set)
+        isolated = [
+            leaf
+            for leaf in self.leaves
+            if leaf not in failed_set
+            and leaf in self.adjacency
+            and leaf not in reachable
+        ]
+        down = failed_set | set(isolated)
+        degraded = []
+        for leaf in self.leaves:
+            if leaf in down:
+                continue
+            after = self._uplinks(leaf, failed_set)
+            if after < self.redundancy[leaf]:
+                degraded.append(
+                    {"id": leaf, "before": self.redundancy[leaf], "after": after}
+                )
+        detached = [
+            n
+            for n in sorted(self.attachment, key=node_sort_key)
+            if n not in failed_set and self.attachment[n] and self.attachment[n] <= down
+        ]
+        return {
+            "failed": sorted(failed_set, key=node_sort_key),
+            "isolated": isolated,
+            "degraded": degraded,
+            "detached": detached,
+        }
+
+    # ----------------------------------------
+    # 단일 장애점
+    # ----------------------------------------
+    def _find_spof(self) -> list[dict]:
+        """단일 노드 장애로 Leaf 고립 / 외부·Controller 분리가 생기는 노드"""
+        candidates = articulation_points(self.adjacency)
+        for attached in self.attachment.values():
+            if len(attached) == 1:
+                candidates |= attached
+        result = []
+        for node_id in sorted(candidates, key=node_sort_key):
+            radius = self.blast_radius([node_id])
+            if radius["isolated"] or radius["detached"]:
+                result.append(
+                    {
+                        "id": node_id,
+                        "isolated": radius["isolated"],
+                        "detached": radius["detached"],
+                    }
+                )
+        return result
+
+
+# ============================================
+# Endpoint 조인
+# ============================================
+
+
+def endpoint_counts(endpoints) -> dict[str, int]:
+    """
+    노드 ID → 연결된 Endpoint 수 (EndpointIndex node / peer 차원 marginal)
+
+    vPC Endpoint는 양쪽 Leaf 모두에 집계.
+    """
+    marginals = endpoints.marginals("node", "peer")
+    counts = marginals["node"]
+    for node_id, count in marginals["peer"].items():
+        if node_id != "-":
+            counts[node_id] = counts.get(node_id, 0) + count
+    return counts
+
+
+def impacted_endpoints(
+    endpoints, nodes: Iterable[str], top: int = MAX_IMPACT_EPGS
+) -> dict:
+    """
+    노드 집합이 모두 장애일 때 연결이 끊기는 Endpoint 수 + (Tenant, EPG)별 수
+
+    연결된 Leaf가 모두 집합에 포함된 Endpoint만 영향으로 집계
+    (vPC Endpoint는 peer Leaf가 살아 있으면 제외).
+
+    Returns:
+        dict: {endpoints: 영향 Endpoint 수,
+               epgs: {total: EPG 수, items: [{tenant, epg, endpoints}]} (Endpoint 많은 순)}
+    """
+    down = set(nodes)
+    counts: dict[tuple[str, str], int] = {}
+    for key, count in endpoints.cells("node", down).items():
+        cell = dict(zip(CUBE_DIMENSIONS, key))
+        if cell["peer"] != "-" and cell["peer"] not in down:
+            continue
+        group = (cell["tenant"], cell["epg"])
+        counts[group] = counts.get(group, 0) + count
+    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    return {
+        "endpoints": sum(counts.values()),
+        "epgs": {
+            "total": len(counts),
+            "items": [
+                {"tenant": tenant, "epg": epg, "endpoints": count}
+                for (tenant, epg), count in ranked[:top]
+            ],
+        },
+    }
+
+
+class AnalysisCache:
+    """
+    스냅샷 버전별 TopologyAnalysis 캐시 (최신 1개만 보관)
+
+    노드 / 링크 상태 변경도 분석 결과를 바꾸므로 구성 버전이 아닌 스냅샷 버전 기준.
+    """
+
+    def __init__(self) -> None:
+        self._version: Optional[int] = None
+        self._analysis: Optional[TopologyAnalysis] = None
+        self.computed_ms: float = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, version: int, graph: TopologyGraph) -> TopologyAnalysis:
+        with self._lock:
+            if self._analysis is None or self._version != version:
+                started = time.perf_counter()
+                self._analysis = TopologyAnalysis(graph)
+                self.computed_ms = round((time.perf_counter() - started) * 1000, 2)
+                self._version = version
+            return self._analysis
@@ -0,0 +1,203 @@
+# ============================================
+# Topology Snapshot Store
+# 목적: 토폴로지 수집 간 노드 / 링크 diff, 스냅샷 버전 관리, since 기반 delta 응답
+# 버전: v1.11.0
+#
+# 설계 노트:
+#   - 노드 키 = 노드 ID, 링크 키 = (a, a_port, b, b_port)
+#     · 노드 비교에서 degree는 제외 (링크 diff에서 파생 — 링크 1개 변동이 노드 변경으로 번지지 않음)
+#   - 수집마다 직전 스냅샷과 키 집합 / 값 비교 → 변경이 있을 때만 버전 +1
+#     · 구성 버전(structure_version)은 노드 / 링크 추가·제거 시에만 갱신
+#       (상태 변경만 있으면 유지 → 레이아웃 등 구성 기반 캐시 무효화 기준)
+#   - 버전별 diff를 deque(maxlen=MAX_HISTORY)에 보관
+#     · since 이후 diff를 순서대로 병합하여 순(net) 변경만 응답
+#       (추가 후 삭제 = 없음, 삭제 후 추가 = 변경, 추가 후 변경 = 추가)
+#     · since가 보관 범위 밖이면 full=True + 전체 payload (클라이언트 재동기화)
+#   - delta 응답 크기 / 비용은 변경 수에 비례 (전체 노드 수와 무관)
+# ============================================
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from services.topology_graph import TopologyGraph
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 보관하는 버전별 diff 수
+MAX_HISTORY = 256
+
+# 변경 유형
+ADDED, REMOVED, CHANGED = "added", "removed", "changed"
+
+
+# 노드 비교에서 제외하는 파생 필드
+_DERIVED_NODE_FIELDS = ("degree",)
+
+
+def _link_key(link: dict) -> tuple:
+    return (link["a"], link["a_port"], link["b"], link["b_port"])
+
+
+def _diff_maps(old: dict, new: dict) -> dict[str, list]:
+    """키 → 값 맵 비교 → {added, removed, changed} (키 목록)"""
+    old_keys, new_keys = old.keys(), new.keys()
+    return {
+        ADDED: sorted(new_keys - old_keys),
+        REMOVED: sorted(old_keys - new_keys),
+        CHANGED: sorted(k for k in old_keys & new_keys if old[k] != new[k]),
+    }
+
+
+def _merge(net: dict, diff: dict[str, list]) -> None:
+    """
+    순 변경 병합 (키 → 유형)
+
+    added → removed = 없음, removed → added = changed, added → changed = added
+    """
+    for kind in (ADDED, REMOVED, CHANGED):
+        for key in diff[kind]:
+            prev = net.get(key)
+            if prev is None:
+                net[key] = kind
+            elif kind == REMOVED:
+                if prev == ADDED:
+                    del net[key]
+                else:
+                    net[key] = REMOVED
+            elif kind == ADDED:
+                net[key] = CHANGED if prev == REMOVED else ADDED
+            # CHANGED: prev가 ADDED / CHANGED면 그대로
+
+
+class TopologySnapshotStore:
+    """
+    토폴로지 스냅샷 버전 / diff 저장소
+
+    Args:
+        max_history: 보관하는 버전별 diff 수
+    """
+
+    def __init__(self, max_history: int = MAX_HISTORY) -> None:
+        self.version = 0
+        self.structure_version = 0
+        self._nodes: dict[str, dict] = {}
+        self._node_values: dict[str, dict] = {}
+        self._links: dict[tuple, dict] = {}
+        self._payload: Optional[dict] = None
+        # (버전, 시각, 노드 diff, 링크 diff)
+        self._history: deque = deque(maxlen=max_history)
+        self._lock = threading.Lock()
+
+    # ----------------------------------------
+    # 갱신
+    # ----------------------------------------
+    def apply(self, graph: TopologyGraph, ts: Optional[float] = None) -> Optional[dict]:
+        """
+        새 그래프 반영
+
+        최초 반영은 버전 1 (diff 기록 없음 — 기준선).
+
+        Returns:
+            dict: 변경 요약 {version, ts, nodes: {...}, links: {...}} — 변경 없으면 None
+        """
+        ts = time.time() if ts is None else ts
+        payload = graph.to_dict()
+        nodes = {n["id"]: n for n in payload["nodes"]}
+        node_values = {
+            node_id: {k: v for k, v in n.items() if k not in _DERIVED_NODE_FIELDS}
+            for node_id, n in nodes.items()
+        }
+        links = {_link_key(link): link for link in payload["links"]}
+
+        with self._lock:
+            first = self.version == 0
+            node_diff = _diff_maps(self._node_values, node_values)
+            link_diff = _diff_maps(self._links, links)
+            self._payload = payload
+            self._nodes, self._node_values, self._links = nodes, node_values, links
+            if first:
+                self.version = self.structure_version = 1
+                return None
+            if not any(node_diff.values()) and not any(link_diff.values()):
+                return None
+            self.version += 1
+            if any(diff[ADDED] or diff[REMOVED] for diff in (node_diff, link_diff)):
+                self.structure_version = self.version
+            self._history.append((self.version, ts, node_diff, link_diff))
+            return self._event(self.version, ts, node_diff, link_diff)
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def snapshot(self) -> dict:
+        """현재 전체 payload + 버전"""
+        with self._lock:
+            return {"version": self.version, **(self._payload or {})}
+
+    def delta(self, since: int) -> dict:
+        """
+        since 버전 이후 순 변경
+
+        Returns:
+            dict: {version, since, full: False, nodes: {added, removed, changed},
+                   links: {added, removed, changed}}
+                  since가 보관 범위 밖이면 {version, since, full: True, ...전체 payload}
+        """
+        with self._lock:
+            oldest = self._history[0][0] - 1 if self._history else self.version
+            if since > self.version or since < oldest:
+                return {
+                    "since": since,
+                    "full": True,
+                    "version": self.version,
+                    **(self._payload or {}),
+                }
+            node_net: dict = {}
+            link_net: dict = {}
+            for version, _, node_diff, link_diff in self._history:
+                if version > since:
+                    _merge(node_net, node_diff)
+                    _merge(link_net, link_diff)
+            return {
+                "version": self.version,
+                "since": since,
+                "full": False,
+                "nodes": self._expand(node_net, self._nodes, lambda k: k),
+                "links": self._expand(
+                    link_net,
+                    self._links,
+                    lambda k: {"a": k[0], "a_port": k[1], "b": k[2], "b_port": k[3]},
+                ),
+            }
+
+    @staticmethod
+    def _expand(net: dict, current: dict, key_view) -> dict[str, list]:
+        """순 변경 (키 → 유형) → 응답 형식 (추가 / 변경은 현재 값, 삭제는 키)"""
+        result: dict[str, list] = {ADDED: [], REMOVED: [], CHANGED: []}
+        for key, kind in sorted(net.items()):
+            result[kind].append(key_view(key) if kind == REMOVED else current[key])
+        return result
+
+    def changes(self, limit: int = 20) -> list[dict]:
+        """최근 변경 이벤트 (최신순)"""
+        with self._lock:
+            history = list(self._history)[-limit:]
+        return [self._event(*entry) for entry in reversed(history)]
+
+    @staticmethod
+    def _event(version: int, ts: float, node_diff: dict, link_diff: dict) -> dict:
+        return {
+            "version": version,
+            "ts": int(ts),
+            "nodes": {kind: list(keys) for kind, keys in node_diff.items()},
+            "links": {
+                kind: [
+                    {"a": k[0], "a_port": k[1], "b": k[2], "b_port": k[3]} for k in keys
+                ]
+                for kind, keys in link_diff.items()
+            },
+        }
@@ -0,0 +1,288 @@
+# ============================================
+# Topology Graph
+# 목적: Fabric 노드 / 링크 그래프 + 인접 인덱스 (이웃 / 차수 / 경로 조회)
+# 버전: v1.11.0
+#
+# 조회 클래스 (클래스 쿼리 3회, 노드 / 링크 수와 무관):
+#   fabricNode   노드 (id, name, role, model, fabricSt)
+#   fabricLink   Fabric 내부 링크 (n1/s1/p1 ↔ n2/s2/p2, linkState)
+#   lldpAdjEp    LLDP 인접 — Fabric 노드가 아닌 이웃(외부 스위치 / 라우터)과 APIC 연결
+#
+# DN 예시:
+#   topology/pod-1/lnkcnt-201/lnk-101-1-49-to-201-1-1          (fabricLink)
+#   topology/pod-1/node-101/sys/lldp/inst/if-[eth1/48]/adj-1   (lldpAdjEp)
+#
+# 설계 노트:
+#   - fabricLink는 양 끝 노드에서 각각 보고되므로 (노드, 포트) 쌍 집합으로 중복 제거
+#   - 인접 인덱스: 노드 ID → 이웃 ID → 링크 번호 목록 (병렬 링크 보존)
+#     · 이웃 / 차수 조회 O(차수), 경로 조회 BFS O(노드 + 링크)
+#   - 외부 이웃은 "ext:<sysName>" 노드로 추가 (role = external)
+#   - 경로 탐색은 up 링크만, 외부 / Controller 노드는 경유하지 않음 (끝점으로만)
+#   - 그래프는 생성 후 변경하지 않음 (갱신 = 새 그래프로 교체) → 조회 시 lock 불필요
+# ============================================
+
+from collections import deque
+from typing import Iterable, Optional
+
+from services.dn_utils import extract_pod_id, parse_lldp_port
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 외부 이웃 노드 ID 접두어
+EXTERNAL_PREFIX = "ext:"
+
+# 경로 탐색 시 경유하지 않는 역할
+NON_TRANSIT_ROLES = frozenset({"external", "controller"})
+
+# 링크 종류
+LINK_FABRIC, LINK_LLDP, LINK_EXTERNAL = "fabric", "lldp", "external"
+
+
+def _node_status(attr: dict) -> str:
+    """fabricNode 상태 (active → UP, Controller는 fabricSt가 없으므로 UP)"""
+    if attr.get("fabricSt") == "active" or attr.get("role") == "controller":
+        return "UP"
+    return "DOWN"
+
+
+def node_sort_key(node_id: str) -> tuple:
+    """노드 ID 정렬 키 (숫자 ID 먼저, 외부 노드는 이름순)"""
+    return (0, int(node_id), "") if node_id.isdigit() else (1, 0, node_id)
+
+
+# ============================================
+# TopologyGraph
+# ============================================
+
+
+class TopologyGraph:
+    """
+    Fabric 토폴로지 그래프
+
+    Args:
+        nodes: 노드 ID → {id, name, role, pod, model, status}
+        links: [{a, a_port, b, b_port, state, kind}]
+    """
+
+    def __init__(self, nodes: dict[str, dict], links: list[dict]) -> None:
+        self.nodes = nodes
+        self.links = links
+        # 노드 ID → 이웃 ID → 링크 번호 목록
+        self.adjacency: dict[str, dict[str, list[int]]] = {n: {} for n in nodes}
+        for idx, link in enumerate(links):
+            a, b = link["a"], link["b"]
+            self.adjacency.setdefault(a, {}).setdefault(b, []).append(idx)
+            self.adjacency.setdefault(b, {}).setdefault(a, []).append(idx)
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def degree(self, node_id: str) -> int:
+        """이웃 노드 수"""
+        return len(self.adjacency.get(node_id, ()))
+
+    def neighbors(self, node_id: str) -> list[dict]:
+        """
+        이웃 목록 (ID 순)
+
+        Returns:
+            list: [{id, name, role, links: [{local_port, remote_port, state, kind}]}]
+        """
+        result = []
+        for neighbor, idxs in sorted(
+            self.adjacency.get(node_id, {}).items(), key=lambda kv: node_sort_key(kv[0])
+        ):
+            info = self.nodes.get(neighbor, {})
+            ports = []
+            for idx in idxs:
+                link = self.links[idx]
+                local, remote = (
+                    (link["a_port"], link["b_port"])
+                    if link["a"] == node_id
+                    else (link["b_port"], link["a_port"])
+                )
+                ports.append(
+                    {
+                        "local_port": local,
+                        "remote_port": remote,
+                        "state": link["state"],
+                        "kind": link["kind"],
+                    }
+                )
+            result.append(
+                {
+                    "id": neighbor,
+                    "name": info.get("name", neighbor),
+                    "role": info.get("role", ""),
+                    "links": ports,
+                }
+            )
+        return result
+
+    def link_up(self, idxs: Iterable[int]) -> bool:
+        return any(self.links[idx]["state"] == "up" for idx in idxs)
+
+    def shortest_path(
+        self, src: str, dst: str, avoid: Iterable[str] = ()
+    ) -> Optional[list[str]]:
+        """
+        최소 홉 경로 (BFS, up 링크만)
+
+        Args:
+            src / dst: 노드 ID
+            avoid:     경유 제외 노드 ID (장애 가정 등)
+        Returns:
+            list: 노드 ID 경로 (src, ..., dst) — 경로 없으면 None
+        """
+        if src not in self.adjacency or dst not in self.adjacency:
+            return None
+        if src == dst:
+            return [src]
+        blocked = set(avoid)
+        parents: dict[str, Optional[str]] = {src: None}
+        queue = deque([src])
+        while queue:
+            current = queue.popleft()
+            if current != src and (
+                self.nodes.get(current, {}).get("role") in NON_TRANSIT_ROLES
+            ):
+                continue
+            for neighbor, idxs in self.adjacency[current].items():
+                if neighbor in parents or neighbor in blocked:
+                    continue
+                if not self.link_up(idxs):
+                    continue
+                parents[neighbor] = current
+                if neighbor == dst:
+                    path = [dst]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                queue.append(neighbor)
+        return None
+
+    def to_dict(self) -> dict:
+        """전체 노드 / 링크 payload"""
+        external = sum(1 for n in self.nodes.values() if n["role"] == "external")
+        return {
+            "summary": {
+                "nodes": len(self.nodes) - external,
+                "external": external,
+                "links": len(self.links),
+                "links_down": sum(1 for link in self.links if link["state"] != "up"),
+            },
+            "nodes": [
+                {**self.nodes[n], "degree": self.degree(n)}
+                for n in sorted(self.nodes, key=node_sort_key)
+            ],
+            "links": self.links,
+        }
+
+
+# ============================================
+# 생성
+# ============================================
+
+
+def build_topology_graph(nodes: list, links: list, lldp: list) -> TopologyGraph:
+    """
+    fabricNode / fabricLink / lldpAdjEp imdata → TopologyGraph
+
+    Args:
+        nodes: fabricNode imdata
+        links: fabricLink imdata
+        lldp:  lldpAdjEp imdata
+    """
+    graph_nodes: dict[str, dict] = {}
+    name_to_id: dict[str, str] = {}
+    for item in nodes:
+        attr = item["fabricNode"]["attributes"]
+        node_id = attr.get("id", "")
+        graph_nodes[node_id] = {
+            "id": node_id,
+            "name": attr.get("name", ""),
+            "role": attr.get("role", ""),
+            "pod": extract_pod_id(attr.get("dn", "")),
+            "model": attr.get("model", ""),
+            "status": _node_status(attr),
+        }
+        name_to_id[attr.get("name", "")] = node_id
+
+    graph_links: list[dict] = []
+    seen: set[frozenset] = set()
+    connected: set[frozenset] = set()
+
+    # ---- Fabric 링크 (양방향 보고 중복 제거) ----
+    for item in links:
+        attr = item["fabricLink"]["attributes"]
+        a, b = attr.get("n1", ""), attr.get("n2", "")
+        if not a or not b:
+            continue
+        a_port = f"eth{attr.get('s1', '')}/{attr.get('p1', '')}"
+        b_port = f"eth{attr.get('s2', '')}/{attr.get('p2', '')}"
+        key = frozenset({(a, a_port), (b, b_port)})
+        if key in seen:
+            continue
+        seen.add(key)
+        connected.add(frozenset({a, b}))
+        if node_sort_key(b) < node_sort_key(a):
+            a, b, a_port, b_port = b, a, b_port, a_port
+        graph_links.append(
+            {
+                "a": a,
+                "a_port": a_port,
+                "b": b,
+                "b_port": b_port,
+                "state": "up" if attr.get("linkState", "ok") == "ok" else "down",
+                "kind": LINK_FABRIC,
+            }
+        )
+
+    # ---- LLDP 인접 (외부 이웃 / fabricLink에 없는 Fabric 노드 연결) ----
+    for item in lldp:
+        attr = item["lldpAdjEp"]["attributes"]
+        node_id, local_port = parse_lldp_port(attr.get("dn", ""))
+        if node_id not in graph_nodes:
+            continue
+        sys_name = attr.get("sysName", "") or attr.get("chassisIdV", "")
+        if not sys_name:
+            continue
+        remote_port = attr.get("portIdV", "") or attr.get("portDesc", "")
+        neighbor = name_to_id.get(sys_name)
+        if neighbor is not None:
+            if frozenset({node_id, neighbor}) in connected:
+                continue
+            kind = LINK_LLDP
+        else:
+            neighbor = f"{EXTERNAL_PREFIX}{sys_name}"
+            graph_nodes.setdefault(
+                neighbor,
+                {
+                    "id": neighbor,
+                    "name": sys_name,
+                    "role": "external",
+                    "pod": graph_nodes[node_id]["pod"],
+                    "model": attr.get("sysDesc", "")[:60],
+                    "status": "UP",
+                    "mgmt_ip": attr.get("mgmtIp", ""),
+                },
+            )
+            kind = LINK_EXTERNAL
+        key = frozenset({(node_id, local_port), (neighbor, remote_port)})
+        if key in seen:
+            continue
+        seen.add(key)
+        graph_links.append(
+            {
+                "a": node_id,
+                "a_port": local_port,
+                "b": neighbor,
+                "b_port": remote_port,
+                "state": "up",
+                "kind": kind,
+            }
+        )
+
+    return TopologyGraph(graph_nodes, graph_links)
@@ -0,0 +1,234 @@
+# ============================================
+# Topology Layout
+# 목적: Fabric 토폴로지 계층형 레이아웃 좌표 계산 (브라우저는 좌표대로 그리기만)
+# 버전: v1.11.0
+#
+# 레이아웃:
+#   - 계층 (위 → 아래): Controller / Spine / Leaf / 외부 이웃
+#   - 가로: Pod별 구역 (Pod ID 순), 구역 폭 = Pod 내 최대 계층 노드 수 × NODE_GAP
+#     · 각 계층 노드는 Pod 구역 안에서 가운데 정렬
+#
+# 교차 최소화 (barycenter 휴리스틱):
+#   - 하향 sweep: 계층마다 윗 계층 이웃 x 평균 순으로 정렬
+#   - 상향 sweep: 계층마다 아랫 계층 이웃 x 평균 순으로 정렬
+#     · 정렬 키 = (Pod, barycenter, 현재 위치) → Pod 구역을 벗어나지 않음
+#     · 이웃이 없는 노드는 현재 위치 유지
+#   - sweep마다 링크 교차 수를 세어 가장 적은 배치를 채택, 개선 없으면 중단
+#     · 교차 수 = 계층 쌍별 링크를 (위 x, 아래 x) 정렬 후 아래 x 역순 쌍 수
+#       (Fenwick 트리 O(E log E), 2,880 링크 기준 수 ms)
+#
+# 캐시:
+#   - 좌표는 노드 / 링크 구성에만 의존 → 구성 버전(추가 / 제거 diff 발생 시 증가)별 1회 계산
+#   - 상태 변경(Up/Down, 링크 state)은 좌표를 바꾸지 않으므로 재계산 없음
+# ============================================
+
+import threading
+from bisect import bisect_left
+from typing import Optional
+
+from services.topology_graph import TopologyGraph, node_sort_key
+
+# ============================================
+# 상수 정의
+# ============================================
+
+# 계층 순서 (위 → 아래)
+LAYERS = ("controller", "spine", "leaf", "external")
+
+# 노드 간 가로 간격 / 계층 간 세로 간격 / 여백
+NODE_GAP = 60
+LAYER_GAP = 120
+MARGIN = 40
+
+# 교차 최소화 최대 sweep 수 (하향 + 상향 = 1회)
+MAX_SWEEPS = 8
+
+
+def _pod_key(pod: str) -> tuple:
+    return (0, int(pod), "") if str(pod).isdigit() else (1, 0, str(pod))
+
+
+def _count_inversions(values: list[int], size: int) -> int:
+    """values 내 역순 쌍 수 (Fenwick 트리, values는 0 ~ size-1)"""
+    tree = [0] * (size + 1)
+    inversions = 0
+    for seen, value in enumerate(values):
+        # value보다 큰 값을 가진 앞 원소 수 = seen - (value 이하 개수)
+        i, not_greater = value + 1, 0
+        while i > 0:
+            not_greater += tree[i]
+            i -= i & -i
+        inversions += seen - not_greater
+        i = value + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return inversions
+
+
+class _Layout:
+    """레이아웃 계산 상태 (계층별 순서 → 좌표)"""
+
+    def __init__(self, graph: TopologyGraph) -> None:
+        self.graph = graph
+        self.layer_of: dict[str, int] = {}
+        self.order: list[list[str]] = [[] for _ in LAYERS]
+        for node_id in sorted(graph.nodes, key=node_sort_key):
+            role = graph.nodes[node_id]["role"]
+            layer = LAYERS.index(role) if role in LAYERS else LAYERS.index("leaf")
+            self.layer_of[node_id] = layer
+            self.order[layer].append(node_id)
+
+        # Pod 구역 (Pod 순, 폭 = Pod 내 최대 계층 노드 수)
+        counts: dict[str, list[int]] = {}
+        for node_id, layer in self.layer_of.items():
+            counts.setdefault(self.pod(node_id), [0] * len(LAYERS))[layer] += 1
+        self.pods: list[dict] = []
+        x = MARGIN
+        for pod in sorted(counts, key=_pod_key):
+            width = max(counts[pod]) * NODE_GAP
+            self.pods.append({"pod": pod, "x": x, "width": width})
+            x += width + NODE_GAP
+        self.band = {p["pod"]: p for p in self.pods}
+        self.width = x - NODE_GAP + MARGIN if self.pods else 2 * MARGIN
+
+        # 계층 간 링크 (같은 계층 링크는 교차 계산 / barycenter에서 제외)
+        self.edges: list[tuple[str, str]] = []
+        for link in graph.links:
+            a, b = link["a"], link["b"]
+            if a in self.layer_of and b in self.layer_of:
+                if self.layer_of[a] > self.layer_of[b]:
+                    a, b = b, a
+                if self.layer_of[a] != self.layer_of[b]:
+                    self.edges.append((a, b))
+
+        self.x: dict[str, float] = {}
+        self._place_all()
+
+    def pod(self, node_id: str) -> str:
+        return str(self.graph.nodes[node_id].get("pod", "") or "")
+
+    # ----------------------------------------
+    # 좌표
+    # ----------------------------------------
+    def _place(self, layer: int) -> None:
+        """계층 순서 → x 좌표 (Pod 구역 안 가운데 정렬)"""
+        by_pod: dict[str, list[str]] = {}
+        for node_id in self.order[layer]:
+            by_pod.setdefault(self.pod(node_id), []).append(node_id)
+        for pod, members in by_pod.items():
+            band = self.band[pod]
+            start = band["x"] + (band["width"] - len(members) * NODE_GAP) / 2
+            for idx, node_id in enumerate(members):
+                self.x[node_id] = start + idx * NODE_GAP + NODE_GAP / 2
+
+    def _place_all(self) -> None:
+        for layer in range(len(LAYERS)):
+            self._place(layer)
+
+    # ----------------------------------------
+    # 교차 최소화
+    # ----------------------------------------
+    def _reorder(self, layer: int, upward: bool) -> None:
+        """barycenter 정렬 (upward=True면 아랫 계층 이웃 기준)"""
+        current = {node_id: idx for idx, node_id in enumerate(self.order[layer])}
+
+        def key(node_id: str) -> tuple:
+            xs = [
+                self.x[n]
+                for n in self.graph.adjacency.get(node_id, ())
+                if n in self.layer_of
+                and (self.layer_of[n] > layer if upward else self.layer_of[n] < layer)
+            ]
+            center = sum(xs) / len(xs) if xs else self.x[node_id]
+            return (_pod_key(self.pod(node_id)), center, current[node_id])
+
+        self.order[layer].sort(key=key)
+        self._place(layer)
+
+    def sweep(self) -> None:
+        """하향 + 상향 sweep 1회"""
+        for layer in range(1, len(LAYERS)):
+            self._reorder(layer, upward=False)
+        for layer in range(len(LAYERS) - 2, -1, -1):
+            self._reorder(layer, upward=True)
+
+    def crossings(self) -> int:
+        """계층 쌍별 링크 교차 수 합"""
+        by_pair: dict[tuple[int, int], list[tuple[float, float]]] = {}
+        for a, b in self.edges:
+            pair = (self.layer_of[a], self.layer_of[b])
+            by_pair.setdefault(pair, []).append((self.x[a], self.x[b]))
+        total = 0
+        for segments in by_pair.values():
+            segments.sort()
+            ranks = sorted({bx for _, bx in segments})
+            total += _count_inversions(
+                [bisect_left(ranks, bx) for _, bx in segments], len(ranks)
+            )
+        return total
+
+    def snapshot(self) -> tuple[list[list[str]], dict[str, float]]:
+        return [list(layer) for layer in self.order], dict(self.x)
+
+
+def compute_layout(graph: TopologyGraph, max_sweeps: int = MAX_SWEEPS) -> dict:
+    """
+    계층형 레이아웃 계산
+
+    Args:
+        graph:      TopologyGraph
+        max_sweeps: 교차 최소화 최대 sweep 수
+    Returns:
+        dict: {width, height, crossings, sweeps,
+               layers: [{name, y}], pods: [{pod, x, width}],
+               positions: {노드 ID: [x, y]}}
+    """
+    layout = _Layout(graph)
+    best_crossings = layout.crossings()
+    best = layout.snapshot()
+    sweeps = 0
+    while sweeps < max_sweeps and best_crossings > 0:
+        layout.sweep()
+        sweeps += 1
+        crossings = layout.crossings()
+        if crossings >= best_crossings:
+            break
+        best_crossings, best = crossings, layout.snapshot()
+
+    order, xs = best
+    used = [layer for layer in range(len(LAYERS)) if order[layer]]
+    ys = {layer: MARGIN + row * LAYER_GAP for row, layer in enumerate(used)}
+    return {
+        "width": layout.width,
+        "height": (ys[used[-1]] + MARGIN) if used else 2 * MARGIN,
+        "crossings": best_crossings,
+        "sweeps": sweeps,
+        "layers": [{"name": LAYERS[layer], "y": ys[layer]} for layer in used],
+        "pods": layout.pods,
+        "positions": {
+            node_id: [round(xs[node_id], 1), ys[layer]]
+            for layer in used
+            for node_id in order[layer]
+        },
+    }
+
+
+class LayoutCache:
+    """
+    구성 버전별 레이아웃 캐시 (최신 1개만 보관)
+
+    구성 버전이 바뀐 경우(노드 / 링크 추가·제거 diff)에만 재계산.
+    """
+
+    def __init__(self) -> None:
+        self._version: Optional[int] = None
+        self._layout: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def get(self, version: int, graph: TopologyGraph) -> dict:
+        with self._lock:
+            if self._layout is None or self._version != version:
+                self._layout = compute_layout(graph)
+                self._version = version
+            return self._layout
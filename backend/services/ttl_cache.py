@@ -0,0 +1,107 @@
+# ============================================
+# TTL Cache
+# 목적: 키별 만료 시간이 있는 조회 결과 캐시
+# 버전: v1.11.0
+#
+# 여러 APIC 클래스를 묶어 조회하는 수집기(Health Score 등)의 결과를
+# 일정 시간 재사용하여 대시보드 새로고침마다 APIC를 다시 조회하지 않도록 함.
+#
+# 설계 노트:
+#   - 동일 키 동시 요청 시 로더는 1회만 실행 (키별 로드 lock)
+#     · 로더는 캐시 전체 lock 밖에서 실행 → 느린 키가 다른 키 조회를 막지 않음
+#   - 로더 예외(조회 실패)는 저장하지 않고 그대로 전달 → 다음 요청에서 재시도
+#   - 빈 결과(cache_if 불만족)도 저장하지 않음 → 긴 TTL(1d 등) 동안 빈 값 고정 방지
+#   - 만료된 값도 다음 저장 전까지 보관 → 조회 실패 시 get_stale()로 직전 값 사용 가능
+# ============================================
+
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+# 조회 결과 없음 표시 (None도 캐시 값이 될 수 있으므로 별도 객체)
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    키별 TTL 캐시
+
+    Args:
+        ttl: 기본 유효 시간(초)
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        # 키 → (만료 시각(monotonic), 값)
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # 키 → 로드 lock (같은 키 로더 중복 실행 방지)
+        self._load_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Hashable) -> Any:
+        """유효한 값 반환 (없거나 만료 시 _MISSING)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return _MISSING
+            return entry[1]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """유효한 값 반환 (없거나 만료 시 None)"""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """만료 여부와 무관하게 마지막 저장 값 반환 (없으면 None, 조회 실패 시 대체용)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (이미 계산된 결과를 캐시에 넣을 때)"""
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + (self.ttl if ttl is None else ttl),
+                value,
+            )
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        cache_if: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        유효한 값이 있으면 반환, 없으면 loader() 실행 후 저장
+
+        Args:
+            key:      캐시 키
+            loader:   값 생성 함수 (인자 없음, 조회 실패 시 예외)
+            ttl:      이 키의 유효 시간(초), 미지정 시 기본값
+            cache_if: 저장 여부 판정 (기본: 빈 값이면 저장하지 않음)
+        Raises:
+            loader()의 예외 (저장하지 않고 전달)
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # 대기 중 다른 요청이 로드를 끝냈으면 그 결과 사용
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+            value = loader()
+            if cache_if(value):
+                self.set(key, value, ttl)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """키 1개 또는 전체 무효화"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -1,12 +1,48 @@
 // ============================================================
 // audit.js — Audit Log 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — Audit 검색 (DN 서브트리 / 키워드 / 사용자 / 기간),
+//                 요일 × 시간대 변경 heatmap (서버 집계 버킷)
 // 의존: common.js (apiFetch, setEl, escHtml, actionBadge,
 //                  showLoading)
 // ============================================================
 
 function _buildAuditScaffold() {
     return [
+        // ---- 검색 ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-search me-2"></i>AUDIT SEARCH</div>',
+        '  <div class="card-body">',
+        '    <div class="d-flex gap-2 mb-3 flex-wrap">',
+        '      <input type="text" class="form-control" id="audit-search-subtree" style="max-width:320px"',
+        '             placeholder="DN 서브트리 (uni/tn-TenantA)" onkeypress="if(event.key===\'Enter\')searchAudit()">',
+        '      <input type="text" class="form-control" id="audit-search-q" style="max-width:220px"',
+        '             placeholder="키워드 (descr / changeSet)" onkeypress="if(event.key===\'Enter\')searchAudit()">',
+        '      <input type="text" class="form-control" id="audit-search-user" style="max-width:160px"',
+        '             placeholder="사용자" onkeypress="if(event.key===\'Enter\')searchAudit()">',
+        '      <select class="form-select" id="audit-search-days" style="max-width:140px">',
+        '        <option value="">전체 기간</option><option value="1">최근 1일</option>',
+        '        <option value="7">최근 7일</option><option value="30" selected>최근 30일</option>',
+        '      </select>',
+        '      <button class="btn btn-cisco btn-sm" onclick="searchAudit()" style="white-space:nowrap">',
+        '        <i class="bi bi-search me-1"></i>Search',
+        '      </button>',
+        '    </div>',
+        '    <div id="audit-search-results"></div>',
+        '  </div>',
+        '</div>',
+
+        // ---- 요일 × 시간대 변경 heatmap ----
+        '<div class="card mb-4">',
+        '  <div class="card-header d-flex align-items-center">',
+        '    <span><i class="bi bi-calendar-week me-2"></i>CHANGE ACTIVITY (WEEKDAY × HOUR)</span>',
+        '    <select class="form-select form-select-sm ms-auto" id="audit-activity-scope" style="max-width:220px"',
+        '            onchange="renderAuditActivity()"><option value="">All changes</option></select>',
+        '  </div>',
+        '  <div class="card-body" id="audit-activity" style="overflow-x:auto">',
+        '    <div class="text-muted text-center py-3">Loading...</div>',
+        '  </div>',
+        '</div>',
+
         // ---- 사용자별 변경 횟수 ----
         '<div class="card mb-4">',
         '  <div class="card-header"><i class="bi bi-person me-2"></i>CHANGES BY USER</div>',
@@ -47,6 +83,7 @@ async function loadAudit() {
     try {
         var data = await apiFetch('/api/audit');
         renderAudit(data);
+        loadAuditActivity(await apiFetch('/api/audit/activity?top=10'));
     } catch (e) {
         console.error('Audit load error:', e);
     }
@@ -78,4 +115,105 @@ function renderAudit(data) {
                 '</tr>';
           }).join('');
     setEl('audit-recent-tbody', recentHtml, true);
-}
\ No newline at end of file
+}
+
+// ============================================================
+// CHANGE ACTIVITY — /api/audit/activity (7 × 24 버킷, 서버 집계)
+// ============================================================
+var _auditActivity = null;
+
+function loadAuditActivity(data) {
+    _auditActivity = data;
+    var options = ['<option value="">All changes</option>'];
+    data.by_user.forEach(function (u, i) {
+        options.push('<option value="user:' + i + '">User: ' + escHtml(u.user) + ' (' + u.total + ')</option>');
+    });
+    data.by_tenant.forEach(function (t, i) {
+        options.push('<option value="tenant:' + i + '">Tenant: ' + escHtml(t.tenant) + ' (' + t.total + ')</option>');
+    });
+    setEl('audit-activity-scope', options.join(''), true);
+    renderAuditActivity();
+}
+
+function renderAuditActivity() {
+    var data = _auditActivity;
+    if (!data) return;
+    var scope = document.getElementById('audit-activity-scope').value;
+    var buckets = data.buckets;
+    if (scope) {
+        var parts = scope.split(':');
+        buckets = data[parts[0] === 'user' ? 'by_user' : 'by_tenant'][Number(parts[1])].buckets;
+    }
+    var max = Math.max.apply(null, buckets.map(function (row) { return Math.max.apply(null, row); }));
+    if (max === 0) {
+        setEl('audit-activity', '<div class="text-muted text-center py-3">No changes recorded</div>', true);
+        return;
+    }
+
+    var cell = 'display:inline-block;width:22px;height:18px;margin:0 1px 1px 0;text-align:center;' +
+        'font-size:10px;line-height:18px;font-family:monospace';
+    var header = '<div style="white-space:nowrap"><span style="display:inline-block;width:40px"></span>' +
+        buckets[0].map(function (_, hour) {
+            return '<span style="' + cell + ';color:var(--text-muted)">' + hour + '</span>';
+        }).join('') + '</div>';
+    var rows = buckets.map(function (row, day) {
+        return '<div style="white-space:nowrap">' +
+            '<span style="display:inline-block;width:40px;font-size:12px;font-family:monospace">' +
+            data.weekdays[day] + '</span>' +
+            row.map(function (count, hour) {
+                var alpha = count ? (0.15 + 0.85 * count / max).toFixed(2) : 0;
+                return '<span title="' + data.weekdays[day] + ' ' + hour + ':00 — ' + count + ' change(s)" ' +
+                    'style="' + cell + ';background:rgba(4,159,212,' + alpha + ')">' + (count || '') + '</span>';
+            }).join('') + '</div>';
+    }).join('');
+    setEl('audit-activity', header + rows, true);
+}
+
+// ============================================================
+// AUDIT SEARCH — /api/audit/search (서버 역색인)
+// ============================================================
+async function searchAudit() {
+    var params = [];
+    [['subtree', 'audit-search-subtree'], ['q', 'audit-search-q'], ['user', 'audit-search-user']]
+        .forEach(function (pair) {
+            var value = document.getElementById(pair[1]).value.trim();
+            if (value) params.push(pair[0] + '=' + encodeURIComponent(value));
+        });
+    var days = document.getElementById('audit-search-days').value;
+    if (days) {
+        var since = new Date(Date.now() - Number(days) * 86400000).toISOString();
+        params.push('since=' + encodeURIComponent(since));
+    }
+
+    var resultEl = document.getElementById('audit-search-results');
+    resultEl.innerHTML = '<div class="info-box">Searching...</div>';
+    try {
+        var data = await apiFetch('/api/audit/search?limit=200&' + params.join('&'));
+        renderAuditSearch(data, resultEl);
+    } catch (e) {
+        resultEl.innerHTML = '<div class="critical-box">Search error: ' + escHtml(e.message) + '</div>';
+    }
+}
+
+function renderAuditSearch(data, el) {
+    if (data.total === 0) {
+        el.innerHTML = '<div class="warn-box">No audit records found.</div>';
+        return;
+    }
+    var rows = data.items.map(function (r) {
+        return '<tr>' +
+            '<td><code>' + escHtml(r.created.slice(0, 19)) + '</code></td>' +
+            '<td>' + escHtml(r.user) + '</td>' +
+            '<td>' + actionBadge(r.action) + '</td>' +
+            '<td style="max-width:300px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap"' +
+            ' title="' + escHtml(r.affected) + '">' + escHtml(r.affected) + '</td>' +
+            '<td>' + escHtml(r.descr) + '</td>' +
+            '</tr>';
+    }).join('');
+    el.innerHTML =
+        '<div class="info-box mb-2">' + data.total + ' record(s) found' +
+        (data.total > data.items.length ? ' (latest ' + data.items.length + ' shown)' : '') + '</div>' +
+        '<div class="table-responsive"><table class="table table-sm">' +
+        '<thead><tr><th>TIMESTAMP</th><th>USER</th><th>ACTION</th><th>AFFECTED</th><th>DESCRIPTION</th></tr></thead>' +
+        '<tbody>' + rows + '</tbody></table></div>';
+}
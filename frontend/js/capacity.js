@@ -1,14 +1,46 @@
 // ============================================================
 // capacity.js — Capacity Report 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — 노드 × 자원(Policy CAM / EP / VLAN / Mcast / LPM) 사용률 매트릭스,
+//                 자원 소진 예상일 (서버 추세 적합), 통계 주기 선택 (5min / 15min / 1h / 1d)
 // 의존: common.js (apiFetch, setEl, escHtml, showLoading)
 // ============================================================
 
+// 선택한 통계 주기 (섹션 재진입 / 자동 새로고침 시 유지)
+var _capacityInterval = '5min';
+
 function _buildCapacityScaffold() {
+    var intervals = [['5min', '5 min'], ['15min', '15 min'], ['1h', '1 hour'], ['1d', '1 day']];
     return [
+        // ---- 통계 주기 선택 ----
+        '<div class="d-flex justify-content-end mb-3">',
+        '  <select class="form-select form-select-sm" id="capacity-interval" style="max-width:160px"',
+        '          onchange="changeCapacityInterval(this.value)">',
+        intervals.map(function (i) {
+            return '<option value="' + i[0] + '"' + (i[0] === _capacityInterval ? ' selected' : '') +
+                '>Interval: ' + i[1] + '</option>';
+        }).join(''),
+        '  </select>',
+        '</div>',
+
         // ---- Alert 박스 ----
         '<div id="capacity-alert-box" class="mb-4"></div>',
 
+        // ---- 노드 × 자원 매트릭스 ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-grid-3x3-gap me-2"></i>RESOURCE USAGE BY NODE</div>',
+        '  <div class="card-body p-0" id="capacity-matrix" style="overflow-x:auto">',
+        '    <div class="text-muted text-center py-3">Loading...</div>',
+        '  </div>',
+        '</div>',
+
+        // ---- 소진 예상 ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-hourglass-split me-2"></i>EXHAUSTION FORECAST</div>',
+        '  <div class="card-body p-0" id="capacity-forecast">',
+        '    <div class="text-muted text-center py-3">Loading...</div>',
+        '  </div>',
+        '</div>',
+
         // ---- TCAM 테이블 ----
         '<div class="card">',
         '  <div class="card-header"><i class="bi bi-speedometer2 me-2"></i>TCAM USAGE BY NODE</div>',
@@ -39,14 +71,23 @@ async function loadCapacity() {
 
     showLoading(true);
     try {
-        var data = await apiFetch('/api/capacity');
+        var query = 'interval=' + encodeURIComponent(_capacityInterval);
+        var data = await apiFetch('/api/capacity?' + query);
         renderCapacity(data);
+        var matrix = await apiFetch('/api/capacity/resources?top=10&' + query);
+        renderCapacityMatrix(matrix);
+        renderCapacityForecast(await apiFetch('/api/capacity/forecast?top=15'), matrix.resources);
     } catch (e) {
         console.error('Capacity load error:', e);
     }
     showLoading(false);
 }
 
+function changeCapacityInterval(interval) {
+    _capacityInterval = interval;
+    loadCapacity();
+}
+
 function renderCapacity(data) {
     // ---- Alert 박스 ----
     var alertHtml = data.high_usage_count > 0
@@ -79,4 +120,58 @@ function renderCapacity(data) {
                 '</tr>';
           }).join('');
     setEl('capacity-tbody', tableHtml, true);
-}
\ No newline at end of file
+}
+// ============================================================
+// RESOURCE USAGE BY NODE — /api/capacity/resources
+// ============================================================
+function _usageBadge(u) {
+    if (!u) return '<span class="text-muted">-</span>';
+    var sevClass = u.percentage >= 80 ? 'sev-critical' :
+                   u.percentage >= 50 ? 'sev-major'    : 'sev-minor';
+    return '<span class="sev ' + sevClass + '" title="' + u.used.toLocaleString() + ' / ' +
+        u.capacity.toLocaleString() + '">' + u.percentage + '%</span>';
+}
+
+function renderCapacityMatrix(data) {
+    if (data.nodes.length === 0) {
+        setEl('capacity-matrix', '<div class="text-muted text-center py-3">No capacity data</div>', true);
+        return;
+    }
+    var header = '<th>NODE</th>' + data.resources.map(function (r) {
+        return '<th class="text-end">' + escHtml(r.label.toUpperCase()) + '</th>';
+    }).join('');
+    var rows = data.nodes.map(function (n) {
+        return '<tr><td><code>' + escHtml(n.name) + '</code></td>' +
+            data.resources.map(function (r) {
+                return '<td class="text-end">' + _usageBadge(n.usage[r.key]) + '</td>';
+            }).join('') + '</tr>';
+    }).join('');
+    setEl('capacity-matrix',
+        '<table class="table table-sm mb-0"><thead><tr>' + header + '</tr></thead>' +
+        '<tbody>' + rows + '</tbody></table>', true);
+}
+
+// ============================================================
+// EXHAUSTION FORECAST — /api/capacity/forecast
+// ============================================================
+function renderCapacityForecast(data, resources) {
+    var labels = {};
+    resources.forEach(function (r) { labels[r.key] = r.label; });
+    var rows = data.items.map(function (f) {
+        var days = f.days_to_exhaustion;
+        var daysHtml = days === null ? '<span class="text-muted">-</span>' :
+            '<span class="sev ' + (days <= 30 ? 'sev-critical' : days <= 90 ? 'sev-major' : 'sev-minor') + '">' +
+            days + ' d</span>';
+        return '<tr><td><code>' + escHtml(f.name) + '</code></td>' +
+            '<td>' + escHtml(labels[f.resource] || f.resource) + '</td>' +
+            '<td class="text-end">' + f.current + '%</td>' +
+            '<td class="text-end" style="font-family:monospace">' +
+            (f.slope_per_day > 0 ? '+' : '') + f.slope_per_day + '%/d</td>' +
+            '<td class="text-end">' + daysHtml + '</td></tr>';
+    }).join('');
+    setEl('capacity-forecast', rows
+        ? '<table class="table table-sm mb-0"><thead><tr><th>NODE</th><th>RESOURCE</th>' +
+          '<th class="text-end">CURRENT</th><th class="text-end">TREND</th>' +
+          '<th class="text-end">DAYS TO 100%</th></tr></thead><tbody>' + rows + '</tbody></table>'
+        : '<div class="text-muted text-center py-3">Collecting history...</div>', true);
+}
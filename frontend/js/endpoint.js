@@ -1,9 +1,15 @@
 // ============================================================
 // endpoint.js — Endpoint Tracker 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — 검색 결과에 보조 IP / VM / Host 표시
 // 의존: common.js (apiFetch, setEl, escHtml, showLoading)
 // ============================================================
 
+// ============================================================
+// 목록 상태 — 커서 스택으로 이전 페이지 이동 지원
+// ============================================================
+var EP_LIST_PAGE_SIZE = 50;
+var epListState = { sort: 'mac', order: 'asc', cursors: [null], page: 0 };
+
 function _buildEndpointScaffold() {
     return [
         // ---- 검색 ----
@@ -23,7 +29,7 @@ function _buildEndpointScaffold() {
         '</div>',
 
         // ---- Tenant별 통계 ----
-        '<div class="card">',
+        '<div class="card mb-4">',
         '  <div class="card-header"><i class="bi bi-hdd-network-fill me-2"></i>ENDPOINTS BY TENANT</div>',
         '  <div class="card-body p-0">',
         '    <div class="table-responsive">',
@@ -35,6 +41,51 @@ function _buildEndpointScaffold() {
         '      </table>',
         '    </div>',
         '  </div>',
+        '</div>',
+
+        // ---- 노드별 통계 (v1.10.0) ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-server me-2"></i>ENDPOINTS BY NODE</div>',
+        '  <div class="card-body p-0">',
+        '    <div class="table-responsive">',
+        '      <table class="table table-sm mb-0">',
+        '        <thead><tr><th>NODE</th><th class="text-end">COUNT</th></tr></thead>',
+        '        <tbody id="ep-node-tbody">',
+        '          <tr><td colspan="2" class="text-center text-muted py-3">Loading...</td></tr>',
+        '        </tbody>',
+        '      </table>',
+        '    </div>',
+        '  </div>',
+        '</div>',
+
+        // ---- 전체 목록 (v1.10.0: 서버 측 정렬 / 커서 페이지네이션) ----
+        '<div class="card">',
+        '  <div class="card-header d-flex align-items-center">',
+        '    <span><i class="bi bi-list-ul me-2"></i>ENDPOINT LIST</span>',
+        '    <span class="ms-2" style="font-size:0.78rem;font-weight:400;color:var(--text-muted)" id="ep-list-info"></span>',
+        '    <div class="ms-auto d-flex gap-2">',
+        '      <a class="btn btn-outline-secondary btn-sm" href="/api/endpoint/export?format=csv">',
+        '        <i class="bi bi-download me-1"></i>CSV</a>',
+        '      <a class="btn btn-outline-secondary btn-sm" href="/api/endpoint/export?format=ndjson">',
+        '        <i class="bi bi-download me-1"></i>NDJSON</a>',
+        '    </div>',
+        '  </div>',
+        '  <div class="card-body p-0">',
+        '    <div class="table-responsive">',
+        '      <table class="table table-sm mb-0">',
+        '        <thead><tr id="ep-list-head"></tr></thead>',
+        '        <tbody id="ep-list-tbody">',
+        '          <tr><td colspan="6" class="text-center text-muted py-3">Loading...</td></tr>',
+        '        </tbody>',
+        '      </table>',
+        '    </div>',
+        '    <div class="d-flex justify-content-end gap-2 p-2">',
+        '      <button class="btn btn-outline-secondary btn-sm" id="ep-list-prev" onclick="endpointListPage(-1)">',
+        '        <i class="bi bi-chevron-left"></i></button>',
+        '      <button class="btn btn-outline-secondary btn-sm" id="ep-list-next" onclick="endpointListPage(1)">',
+        '        <i class="bi bi-chevron-right"></i></button>',
+        '    </div>',
+        '  </div>',
         '</div>'
     ].join('\n');
 }
@@ -47,6 +98,9 @@ async function loadEndpoint() {
     try {
         var data = await apiFetch('/api/endpoint');
         renderEndpoint(data);
+        epListState.cursors = [null];
+        epListState.page    = 0;
+        await loadEndpointList();
     } catch (e) {
         console.error('Endpoint load error:', e);
     }
@@ -63,6 +117,18 @@ function renderEndpoint(data) {
                 '</tr>';
           }).join('');
     setEl('ep-tenant-tbody', tenantHtml, true);
+
+    // ---- 노드별 통계 ----
+    var byNode   = data.by_node || [];
+    var nodeHtml = byNode.length === 0
+        ? '<tr><td colspan="2" class="text-center text-muted py-3">No endpoints</td></tr>'
+        : byNode.map(function (n) {
+            return '<tr>' +
+                '<td><span class="sev sev-info">Node ' + escHtml(n.node) + '</span></td>' +
+                '<td class="text-end"><span class="sev sev-info">' + n.count + '</span></td>' +
+                '</tr>';
+          }).join('');
+    setEl('ep-node-tbody', nodeHtml, true);
 }
 
 async function searchEndpoint() {
@@ -91,11 +157,13 @@ function renderEndpointSearch(results, el) {
     var rows = results.map(function (ep) {
         return '<tr>' +
             '<td><code>' + escHtml(ep.mac)       + '</code></td>' +
-            '<td><code>' + escHtml(ep.ip)         + '</code></td>' +
+            '<td><code>' + escHtml(ep.ips && ep.ips.length ? ep.ips.join(', ') : (ep.ip || '-')) + '</code></td>' +
             '<td>'       + escHtml(ep.tenant)     + '</td>'        +
             '<td>'       + escHtml(ep.epg)        + '</td>'        +
             '<td><span class="sev sev-info">Node ' + escHtml(ep.node) + '</span></td>' +
             '<td><code>' + escHtml(ep.interface)  + '</code></td>' +
+            '<td>'       + escHtml(ep.vm || '-')   + '</td>'        +
+            '<td>'       + escHtml(ep.host || '-') + '</td>'        +
             '</tr>';
     }).join('');
 
@@ -103,7 +171,81 @@ function renderEndpointSearch(results, el) {
         '<div class="info-box mb-2">' + results.length + ' endpoint(s) found</div>' +
         '<div class="table-responsive">' +
         '<table class="table table-sm">' +
-        '<thead><tr><th>MAC</th><th>IP</th><th>TENANT</th><th>EPG</th><th>NODE</th><th>INTERFACE</th></tr></thead>' +
+        '<thead><tr><th>MAC</th><th>IP</th><th>TENANT</th><th>EPG</th><th>NODE</th><th>INTERFACE</th><th>VM</th><th>HOST</th></tr></thead>' +
         '<tbody>' + rows + '</tbody>' +
         '</table></div>';
-}
\ No newline at end of file
+}
+
+// ============================================================
+// ENDPOINT LIST — /api/endpoint/list
+// ============================================================
+var EP_LIST_COLUMNS = [
+    ['mac', 'MAC'], ['ip', 'IP'], ['tenant', 'TENANT'],
+    ['epg', 'EPG'], ['node', 'NODE'], ['interface', 'INTERFACE']
+];
+
+async function loadEndpointList() {
+    var cursor = epListState.cursors[epListState.page];
+    var url = '/api/endpoint/list?limit=' + EP_LIST_PAGE_SIZE +
+        '&sort=' + epListState.sort + '&order=' + epListState.order +
+        (cursor ? '&cursor=' + encodeURIComponent(cursor) : '');
+    try {
+        var data = await apiFetch(url);
+        renderEndpointList(data);
+    } catch (e) {
+        setEl('ep-list-tbody',
+            '<tr><td colspan="6" class="text-center text-muted py-3">' + escHtml(e.message) + '</td></tr>', true);
+    }
+}
+
+function renderEndpointList(data) {
+    // ---- 정렬 가능한 헤더 ----
+    var headHtml = EP_LIST_COLUMNS.map(function (col) {
+        var arrow = epListState.sort !== col[0] ? '' :
+            (epListState.order === 'asc' ? ' <i class="bi bi-caret-up-fill"></i>' : ' <i class="bi bi-caret-down-fill"></i>');
+        return '<th style="cursor:pointer" onclick="sortEndpointList(\'' + col[0] + '\')">' + col[1] + arrow + '</th>';
+    }).join('');
+    setEl('ep-list-head', headHtml, true);
+
+    var rows = data.items.length === 0
+        ? '<tr><td colspan="6" class="text-center text-muted py-3">No endpoints</td></tr>'
+        : data.items.map(function (ep) {
+            return '<tr>' +
+                '<td><code>' + escHtml(ep.mac)       + '</code></td>' +
+                '<td><code>' + escHtml(ep.ip || '-') + '</code></td>' +
+                '<td>'       + escHtml(ep.tenant)    + '</td>'        +
+                '<td>'       + escHtml(ep.epg)       + '</td>'        +
+                '<td>'       + escHtml(ep.node)      + '</td>'        +
+                '<td><code>' + escHtml(ep.interface) + '</code></td>' +
+                '</tr>';
+          }).join('');
+    setEl('ep-list-tbody', rows, true);
+
+    // ---- 페이지 정보 + 버튼 상태 ----
+    epListState.cursors[epListState.page + 1] = data.next_cursor;
+    var start = epListState.page * EP_LIST_PAGE_SIZE;
+    setEl('ep-list-info',
+        (start + 1) + '–' + (start + data.items.length) +
+        (data.total !== null ? ' of ' + data.total : ''));
+    document.getElementById('ep-list-prev').disabled = epListState.page === 0;
+    document.getElementById('ep-list-next').disabled = !data.next_cursor;
+}
+
+function endpointListPage(delta) {
+    var next = epListState.page + delta;
+    if (next < 0 || (delta > 0 && !epListState.cursors[next])) return;
+    epListState.page = next;
+    loadEndpointList();
+}
+
+function sortEndpointList(field) {
+    if (epListState.sort === field) {
+        epListState.order = epListState.order === 'asc' ? 'desc' : 'asc';
+    } else {
+        epListState.sort  = field;
+        epListState.order = 'asc';
+    }
+    epListState.cursors = [null];
+    epListState.page    = 0;
+    loadEndpointList();
+}
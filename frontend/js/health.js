@@ -1,6 +1,7 @@
 // ============================================================
 // health.js — Health Check 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — Fault 코드별 상위 집계, 신규/해제 변경분, 추세 sparkline,
+//                  Health Score 하위 노드/Tenant 정렬 목록
 // 의존: common.js (apiFetch, setEl, escHtml, showLoading,
 //                  cachedFaults)
 // ============================================================
@@ -10,11 +11,31 @@ function _buildHealthScaffold() {
         // ---- Severity 요약 ----
         '<div class="card mb-4">',
         '  <div class="card-header"><i class="bi bi-activity me-2"></i>FAULT SUMMARY</div>',
-        '  <div class="card-body" id="health-severity-content">',
+        '  <div class="card-body">',
+        '    <div id="health-severity-content"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '    <div id="health-trend-content" class="mt-3"></div>',
+        '  </div>',
+        '</div>',
+
+        // ---- Fault 코드별 상위 10 ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-bar-chart me-2"></i>TOP FAULT CODES</div>',
+        '  <div class="card-body" id="health-codes-content">',
         '    <div class="text-muted text-center py-3">Loading...</div>',
         '  </div>',
         '</div>',
 
+        // ---- Health Score (하위 노드 / Tenant) ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-heart-pulse me-2"></i>HEALTH SCORES <span id="health-fabric-score" class="ms-2"></span></div>',
+        '  <div class="card-body">',
+        '    <div class="row g-3">',
+        '      <div class="col-md-6" id="health-score-nodes"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '      <div class="col-md-6" id="health-score-tenants"></div>',
+        '    </div>',
+        '  </div>',
+        '</div>',
+
         // ---- 노드 상태 ----
         '<div class="card mb-4">',
         '  <div class="card-header"><i class="bi bi-server me-2"></i>NODE STATUS</div>',
@@ -48,6 +69,8 @@ async function loadHealth() {
     try {
         var data = await apiFetch('/api/health');
         renderHealth(data);
+        loadHealthTrend();
+        loadHealthScores();
     } catch (e) {
         console.error('Health load error:', e);
     }
@@ -65,8 +88,27 @@ function renderHealth(data) {
         sevCard('Minor',    data.severity.minor,    'color-minor')    +
         sevCard('Warning',  data.severity.warning,  'text-muted')     +
         '</div>';
+    if (data.changes) {
+        sevHtml +=
+            '<div class="d-flex gap-2">' +
+            '<span class="sev sev-critical">NEW ' + data.changes.new + '</span>' +
+            '<span class="sev sev-minor">CLEARED ' + data.changes.cleared + '</span>' +
+            '</div>';
+    }
     setEl('health-severity-content', sevHtml, true);
 
+    // ---- Fault 코드별 상위 10 ----
+    var codes = data.by_code || [];
+    var codeHtml = codes.length === 0
+        ? '<div class="text-muted">No faults</div>'
+        : '<table class="table table-sm mb-0"><thead><tr><th>CODE</th><th class="text-end">COUNT</th></tr></thead><tbody>' +
+          codes.map(function (c) {
+              return '<tr><td><code>' + escHtml(c.value) + '</code></td>' +
+                     '<td class="text-end">' + c.count + '</td></tr>';
+          }).join('') +
+          '</tbody></table>';
+    setEl('health-codes-content', codeHtml, true);
+
     // ---- 노드 상태 ----
     var nodeHtml = '';
     if (!data.nodes) {
@@ -98,6 +140,121 @@ function renderHealth(data) {
     setEl('health-faults-tbody', faultHtml, true);
 }
 
+// ============================================================
+// FAULT TREND — /api/health/trend (최근 6시간, 1분 버킷)
+// ============================================================
+var HEALTH_TREND_SERIES = [
+    ['fault.severity.critical', 'Critical', 'color-critical'],
+    ['fault.severity.major',    'Major',    'color-major'],
+    ['node.down',               'Nodes Down', 'text-muted']
+];
+
+async function loadHealthTrend() {
+    try {
+        var names = HEALTH_TREND_SERIES.map(function (s) { return s[0]; }).join(',');
+        var data = await apiFetch('/api/health/trend?range=21600&series=' + encodeURIComponent(names));
+        renderHealthTrend(data);
+    } catch (e) {
+        console.error('Health trend load error:', e);
+    }
+}
+
+function renderHealthTrend(data) {
+    var html = data.series.map(function (series, idx) {
+        var meta = HEALTH_TREND_SERIES[idx];
+        var last = series.points.length ? series.points[series.points.length - 1].max : 0;
+        return '<div class="d-flex align-items-center gap-2 mb-1">' +
+            '<div style="width:110px;font-size:13px;color:var(--text-muted);text-transform:uppercase">' + meta[1] + '</div>' +
+            sparklineSvg(series.points, 'var(--' + meta[2] + ')') +
+            '<div style="font-family:monospace">' + last + '</div>' +
+            '</div>';
+    }).join('');
+    setEl('health-trend-content', html, true);
+}
+
+function sparklineSvg(points, color) {
+    var width = 240, height = 28;
+    if (points.length < 2) {
+        return '<svg width="' + width + '" height="' + height + '"></svg>';
+    }
+    var max = Math.max.apply(null, points.map(function (p) { return p.max; })) || 1;
+    var t0 = points[0].t, span = (points[points.length - 1].t - t0) || 1;
+    var coords = points.map(function (p) {
+        var x = ((p.t - t0) / span) * (width - 2) + 1;
+        var y = height - 1 - (p.avg / max) * (height - 2);
+        return x.toFixed(1) + ',' + y.toFixed(1);
+    }).join(' ');
+    return '<svg width="' + width + '" height="' + height + '">' +
+        '<polyline fill="none" stroke="' + color + '" stroke-width="1.5" points="' + coords + '"/>' +
+        '</svg>';
+}
+
+// ============================================================
+// HEALTH SCORES — /api/health/scores (1회 조회 후 클라이언트 정렬)
+// ============================================================
+var HEALTH_SCORE_ROWS = 15;
+var healthScoreState = {
+    data: null,
+    nodes:   { key: 'score', asc: true },
+    tenants: { key: 'score', asc: true }
+};
+
+async function loadHealthScores() {
+    try {
+        healthScoreState.data = await apiFetch('/api/health/scores');
+        renderHealthScores();
+    } catch (e) {
+        console.error('Health score load error:', e);
+    }
+}
+
+function sortHealthScores(kind, key) {
+    var state = healthScoreState[kind];
+    state.asc = state.key === key ? !state.asc : true;
+    state.key = key;
+    renderHealthScores();
+}
+
+function _scoreBadge(score) {
+    if (score === null || score === undefined) return '<span class="sev sev-info">N/A</span>';
+    var cls = score < 70 ? 'sev-critical' : (score < 90 ? 'sev-major' : 'sev-minor');
+    return '<span class="sev ' + cls + '">' + score + '</span>';
+}
+
+function _sortedScoreRows(rows, state) {
+    return rows.slice().sort(function (a, b) {
+        var va = a[state.key], vb = b[state.key];
+        if (va === null || va === undefined) va = -1;
+        if (vb === null || vb === undefined) vb = -1;
+        var cmp = va < vb ? -1 : (va > vb ? 1 : 0);
+        return state.asc ? cmp : -cmp;
+    }).slice(0, HEALTH_SCORE_ROWS);
+}
+
+function _scoreTable(kind, columns, rows) {
+    var head = columns.map(function (c) {
+        return '<th style="cursor:pointer" onclick="sortHealthScores(\'' + kind + '\', \'' + c[0] + '\')">' + c[1] + '</th>';
+    }).join('');
+    var body = rows.map(function (r) {
+        return '<tr>' + columns.map(function (c) {
+            return '<td>' + (c[0] === 'score' ? _scoreBadge(r.score) : escHtml(String(r[c[0]]))) + '</td>';
+        }).join('') + '</tr>';
+    }).join('');
+    return '<table class="table table-sm mb-0"><thead><tr>' + head + '</tr></thead><tbody>' + body + '</tbody></table>';
+}
+
+function renderHealthScores() {
+    var data = healthScoreState.data;
+    if (!data) return;
+    setEl('health-fabric-score', 'Fabric ' + _scoreBadge(data.fabric), true);
+    setEl('health-score-nodes',
+        _scoreTable('nodes', [['name', 'NODE'], ['role', 'ROLE'], ['pod', 'POD'], ['score', 'SCORE']],
+                    _sortedScoreRows(data.nodes, healthScoreState.nodes)), true);
+    setEl('health-score-tenants',
+        _scoreTable('tenants', [['tenant', 'TENANT'], ['score', 'SCORE']],
+                    _sortedScoreRows(data.tenants, healthScoreState.tenants)), true);
+}
+
 function sevCard(label, count, colorVar) {
     return '<div class="col-6 col-md-3">' +
         '<div class="stat-card text-center p-2">' +
@@ -1,6 +1,6 @@
 // ============================================================
 // interface.js — Interface Monitor 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — 사용률 / 에러율 상위 포트, Flapping 포트, 노드별 집계 / 포트 heatmap 추가
 // 의존: common.js (apiFetch, setEl, escHtml, miniStatCard,
 //                  showLoading)
 // ============================================================
@@ -15,6 +15,36 @@ function _buildInterfaceScaffold() {
         '  </div>',
         '</div>',
 
+        // ---- 노드별 Up/Down + 노드 × 포트 heatmap ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-grid-3x3 me-2"></i>PORT HEATMAP</div>',
+        '  <div class="card-body" id="iface-heatmap" style="overflow-x:auto">',
+        '    <div class="text-muted text-center py-3">Loading...</div>',
+        '  </div>',
+        '</div>',
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-hdd-rack me-2"></i>INTERFACES BY NODE</div>',
+        '  <div class="card-body p-0" id="iface-by-node"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '</div>',
+
+        // ---- 사용률 / 에러율 상위 포트 ----
+        '<div class="row g-3 mb-4">',
+        '  <div class="col-md-6"><div class="card h-100">',
+        '    <div class="card-header"><i class="bi bi-speedometer2 me-2"></i>TOP UTILIZATION</div>',
+        '    <div class="card-body p-0" id="iface-top-util"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '  </div></div>',
+        '  <div class="col-md-6"><div class="card h-100">',
+        '    <div class="card-header"><i class="bi bi-bug me-2"></i>TOP ERROR PORTS</div>',
+        '    <div class="card-body p-0" id="iface-top-errors"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '  </div></div>',
+        '</div>',
+
+        // ---- Flapping 포트 ----
+        '<div class="card mb-4">',
+        '  <div class="card-header"><i class="bi bi-arrow-repeat me-2"></i>FLAPPING PORTS <span id="iface-flap-window" class="text-muted ms-2"></span></div>',
+        '  <div class="card-body p-0" id="iface-flaps"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '</div>',
+
         // ---- Down Reasons ----
         '<div class="card">',
         '  <div class="card-header"><i class="bi bi-x-circle me-2"></i>DOWN REASONS</div>',
@@ -40,6 +70,9 @@ async function loadInterface() {
     try {
         var data = await apiFetch('/api/interface');
         renderInterface(data);
+        renderInterfaceCounters(await apiFetch('/api/interface/counters?top=10'));
+        renderInterfaceFlaps(await apiFetch('/api/interface/flaps'));
+        renderInterfaceHeatmap(await apiFetch('/api/interface/heatmap'));
     } catch (e) {
         console.error('Interface load error:', e);
     }
@@ -75,4 +108,96 @@ function renderInterface(data) {
                 '</tr>';
           }).join('');
     setEl('iface-reasons-tbody', reasonsHtml, true);
-}
\ No newline at end of file
+
+    // ---- 노드별 Up/Down ----
+    var byNode = data.by_node || [];
+    var nodeRows = byNode.map(function (n) {
+        return '<tr><td>Node ' + escHtml(n.node) + '</td>' +
+            '<td class="text-end">' + n.total + '</td>' +
+            '<td class="text-end">' + n.up + '</td>' +
+            '<td class="text-end">' + (n.down > 0 ? '<span class="sev sev-major">' + n.down + '</span>' : 0) + '</td></tr>';
+    }).join('');
+    setEl('iface-by-node', nodeRows
+        ? _portTable(['NODE', 'TOTAL', 'UP', 'DOWN'], nodeRows)
+        : '<div class="text-muted text-center py-3">No node data</div>', true);
+}
+
+// ============================================================
+// TOP UTILIZATION / TOP ERROR PORTS — /api/interface/counters
+// ============================================================
+function _portTable(headers, rows) {
+    return '<table class="table table-sm mb-0"><thead><tr>' +
+        headers.map(function (h) { return '<th>' + h + '</th>'; }).join('') +
+        '</tr></thead><tbody>' + rows + '</tbody></table>';
+}
+
+function _formatBps(bps) {
+    if (bps >= 1e9) return (bps / 1e9).toFixed(2) + ' Gbps';
+    if (bps >= 1e6) return (bps / 1e6).toFixed(1) + ' Mbps';
+    if (bps >= 1e3) return (bps / 1e3).toFixed(1) + ' Kbps';
+    return bps + ' bps';
+}
+
+function renderInterfaceCounters(data) {
+    var utilRows = data.top_utilization.map(function (p) {
+        return '<tr><td>Node ' + escHtml(p.node) + '</td><td><code>' + escHtml(p.interface) + '</code></td>' +
+            '<td class="text-end">' + p.util.toFixed(1) + '%</td>' +
+            '<td class="text-end" style="font-family:monospace">' +
+            _formatBps(p.ingress_bps) + ' / ' + _formatBps(p.egress_bps) + '</td></tr>';
+    }).join('');
+    setEl('iface-top-util', utilRows
+        ? _portTable(['NODE', 'PORT', 'UTIL', 'IN / OUT'], utilRows)
+        : '<div class="text-muted text-center py-3">No counter data</div>', true);
+
+    var errRows = data.top_errors.map(function (p) {
+        return '<tr><td>Node ' + escHtml(p.node) + '</td><td><code>' + escHtml(p.interface) + '</code></td>' +
+            '<td class="text-end"><span class="sev sev-major">' + p.errors + '</span></td>' +
+            '<td class="text-end" style="font-family:monospace">' + p.errors_per_sec + '/s</td></tr>';
+    }).join('');
+    setEl('iface-top-errors', errRows
+        ? _portTable(['NODE', 'PORT', 'ERRORS', 'RATE'], errRows)
+        : '<div class="text-muted text-center py-3">' +
+          (data.interval === null ? 'Collecting baseline...' : 'No error increase') + '</div>', true);
+}
+
+// ============================================================
+// FLAPPING PORTS — /api/interface/flaps
+// ============================================================
+function renderInterfaceFlaps(data) {
+    setEl('iface-flap-window',
+        '(' + data.threshold + '+ transitions / ' + Math.round(data.window / 60) + ' min)', true);
+    var rows = data.ports.map(function (p) {
+        var last = p.history.length ? p.history[p.history.length - 1] : null;
+        return '<tr><td>Node ' + escHtml(p.node) + '</td><td><code>' + escHtml(p.interface) + '</code></td>' +
+            '<td class="text-end"><span class="sev sev-major">' + p.transitions + '</span></td>' +
+            '<td>' + escHtml(p.state) + '</td>' +
+            '<td style="font-family:monospace">' +
+            (last ? new Date(last.ts * 1000).toLocaleTimeString() : '-') + '</td></tr>';
+    }).join('');
+    setEl('iface-flaps', rows
+        ? _portTable(['NODE', 'PORT', 'TRANSITIONS', 'STATE', 'LAST CHANGE'], rows)
+        : '<div class="text-muted text-center py-3">No flapping ports</div>', true);
+}
+
+// ============================================================
+// PORT HEATMAP — /api/interface/heatmap (노드 × 포트, 서버 계산)
+// ============================================================
+var HEATMAP_COLORS = { '1': 'var(--bs-success)', '0': 'var(--bs-danger)', '-1': 'transparent' };
+
+function renderInterfaceHeatmap(data) {
+    if (!data.nodes.length) {
+        setEl('iface-heatmap', '<div class="text-muted text-center py-3">No port data</div>', true);
+        return;
+    }
+    var rows = data.nodes.map(function (node, i) {
+        var cells = data.cells[i].map(function (v, j) {
+            return '<span title="Node ' + escHtml(node) + ' eth' + escHtml(data.ports[j]) + '" ' +
+                'style="display:inline-block;width:8px;height:12px;margin-right:1px;background:' +
+                HEATMAP_COLORS[String(v)] + '"></span>';
+        }).join('');
+        return '<div style="white-space:nowrap;line-height:14px">' +
+            '<span style="display:inline-block;width:60px;font-size:12px;font-family:monospace">' +
+            escHtml(node) + '</span>' + cells + '</div>';
+    }).join('');
+    setEl('iface-heatmap', rows, true);
+}
@@ -1,6 +1,11 @@
 // ============================================================
 // topology.js — Topology Viewer 섹션
-// 버전: v1.8.0 — scaffold inject 방식으로 변경
+// 버전: v1.11.0 — 링크 수 / Down 링크 수, 노드별 이웃 수(서버 인접 인덱스) 표시,
+//                 최근 토폴로지 변경 이벤트 (스냅샷 버전별 diff),
+//                 다이어그램은 서버 계산 레이아웃 좌표(/api/topology/layout)로 그리기만 수행,
+//                 단일 장애점 / 노드 장애 영향 범위 (영향 Endpoint / EPG),
+//                 캔버스 LOD 렌더러 (축소 시 Pod 집계, 확대 시 노드 / 링크 / 레이블)
+//                 + 자동 새로고침은 since delta만 반영 (DOM / 캔버스 재구성 없음)
 // 의존: common.js (apiFetch, setEl, escHtml, showLoading)
 // ============================================================
 
@@ -27,19 +32,49 @@ function _buildTopologyScaffold() {
         '    <div class="table-responsive">',
         '      <table class="table table-sm mb-0">',
         '        <thead>',
-        '          <tr><th>ROLE</th><th>ID</th><th>NAME</th><th>MODEL</th><th>STATUS</th></tr>',
+        '          <tr><th>ROLE</th><th>ID</th><th>NAME</th><th>MODEL</th><th class="text-end">NEIGHBORS</th><th>STATUS</th></tr>',
         '        </thead>',
         '        <tbody id="topo-table-tbody">',
-        '          <tr><td colspan="5" class="text-center text-muted py-3">Loading...</td></tr>',
+        '          <tr><td colspan="6" class="text-center text-muted py-3">Loading...</td></tr>',
         '        </tbody>',
         '      </table>',
         '    </div>',
         '  </div>',
+        '</div>',
+
+        // ---- 장애 영향 ----
+        '<div class="card mt-4">',
+        '  <div class="card-header"><i class="bi bi-bullseye me-2"></i>FAILURE IMPACT',
+        '    <span class="ms-2" style="font-size:0.78rem;font-weight:400;color:var(--text-muted)"',
+        '          id="topo-redundancy-summary"></span>',
+        '  </div>',
+        '  <div class="card-body">',
+        '    <div id="topo-spof" class="mb-3"><div class="text-muted text-center py-3">Loading...</div></div>',
+        '    <div class="d-flex gap-2 mb-2">',
+        '      <input type="text" class="form-control form-control-sm" id="topo-impact-node"',
+        '             placeholder="Node ID(s), e.g. 201 or 201,202" style="max-width:260px"',
+        '             onkeydown="if (event.key === \'Enter\') simulateTopologyFailure()">',
+        '      <button class="btn btn-sm btn-outline-info" onclick="simulateTopologyFailure()">Simulate failure</button>',
+        '    </div>',
+        '    <div id="topo-impact"></div>',
+        '  </div>',
+        '</div>',
+
+        // ---- 변경 이벤트 ----
+        '<div class="card mt-4">',
+        '  <div class="card-header"><i class="bi bi-clock-history me-2"></i>TOPOLOGY CHANGES</div>',
+        '  <div class="card-body p-0" id="topo-changes">',
+        '    <div class="text-muted text-center py-3">Loading...</div>',
+        '  </div>',
         '</div>'
     ].join('\n');
 }
 
 async function loadTopology() {
+    // 자동 새로고침: 캔버스가 살아 있으면 변경분만 반영
+    if (_topo && document.getElementById('topo-canvas') === _topo.canvas) {
+        return refreshTopology();
+    }
     var body = document.getElementById('section-body');
     if (body) body.innerHTML = _buildTopologyScaffold();
 
@@ -47,6 +82,9 @@ async function loadTopology() {
     try {
         var data = await apiFetch('/api/topology');
         renderTopology(data);
+        initTopologyCanvas(await apiFetch('/api/topology/layout'));
+        renderTopologyRedundancy(await apiFetch('/api/topology/redundancy'));
+        renderTopologyChanges(await apiFetch('/api/topology/changes?limit=20'));
     } catch (e) {
         console.error('Topology load error:', e);
     }
@@ -58,53 +96,464 @@ function renderTopology(data) {
     setEl('topo-summary',
         data.summary.controllers + 'C / ' +
         data.summary.spines      + 'S / ' +
-        data.summary.leafs       + 'L');
-
-    // ---- 토폴로지 다이어그램 ----
-    var topoHtml =
-        _topoLayer('Controllers', data.controllers, false) +
-        '<div class="connector-line"></div>' +
-        _topoLayer('Spines',      data.spines,      false) +
-        '<div class="connector-line"></div>' +
-        _topoLayer('Leafs',       data.leafs,       true);
-    setEl('topo-content', topoHtml, true);
+        data.summary.leafs       + 'L · ' +
+        data.summary.links       + ' links' +
+        (data.summary.links_down ? ' (' + data.summary.links_down + ' down)' : ''));
 
     // ---- Node Details 테이블 ----
-    var allNodes = [].concat(
-        data.controllers.map(function (n) { return Object.assign({}, n, { role: 'Controller' }); }),
-        data.spines.map(function (n)      { return Object.assign({}, n, { role: 'Spine' }); }),
-        data.leafs.map(function (n)       { return Object.assign({}, n, { role: 'Leaf' }); })
+    var allNodes = [].concat(data.controllers, data.spines, data.leafs);
+    var roles = [].concat(
+        data.controllers.map(function () { return 'controller'; }),
+        data.spines.map(function () { return 'spine'; }),
+        data.leafs.map(function () { return 'leaf'; })
     );
-
-    var tableHtml = allNodes.map(function (n) {
-        var roleSev = n.role === 'Controller' ? 'sev-warning' :
-                      n.role === 'Spine'       ? 'sev-info'    : 'sev-minor';
-        var stSev   = n.status === 'UP' ? 'sev-minor' : 'sev-critical';
-        return '<tr>' +
-            '<td><span class="sev ' + roleSev + '">' + n.role + '</span></td>' +
-            '<td><code>' + n.id + '</code></td>' +
-            '<td>' + n.name + '</td>' +
-            '<td style="color:var(--text-muted);font-size:0.8rem">' + (n.model || '-') + '</td>' +
-            '<td><span class="sev ' + stSev + '">' + n.status + '</span></td>' +
-            '</tr>';
+    var tableHtml = allNodes.map(function (n, idx) {
+        return _topoRow(Object.assign({}, n, { role: roles[idx] }));
     }).join('');
 
     setEl('topo-table-tbody',
-        tableHtml || '<tr><td colspan="5" class="text-muted text-center py-3">No nodes</td></tr>',
+        tableHtml || '<tr><td colspan="6" class="text-muted text-center py-3">No nodes</td></tr>',
         true);
 }
 
-// ---- 내부 헬퍼: 레이어 한 줄 생성 ----
-function _topoLayer(label, nodes, isLeaf) {
-    var chips = nodes.map(function (n) {
-        var borderStyle = (isLeaf && n.status !== 'UP')
-            ? ' style="border-color:var(--color-critical)"' : '';
-        return '<div class="node-chip"' + borderStyle + '>' +
-            '<div class="status-dot ' + (n.status === 'UP' ? 'dot-up' : 'dot-down') + '"></div>' +
-            n.name +
-            '</div>';
+var _TOPO_ROLE_LABEL = { controller: 'Controller', spine: 'Spine', leaf: 'Leaf' };
+
+// ---- 내부 헬퍼: NODE DETAILS 한 행 (data-node로 증분 교체) ----
+function _topoRow(n) {
+    var role    = _TOPO_ROLE_LABEL[n.role] || n.role;
+    var roleSev = n.role === 'controller' ? 'sev-warning' :
+                  n.role === 'spine'      ? 'sev-info'    : 'sev-minor';
+    var stSev   = n.status === 'UP' ? 'sev-minor' : 'sev-critical';
+    return '<tr data-node="' + escHtml(n.id) + '">' +
+        '<td><span class="sev ' + roleSev + '">' + role + '</span></td>' +
+        '<td><code>' + escHtml(n.id) + '</code></td>' +
+        '<td>' + escHtml(n.name) + '</td>' +
+        '<td style="color:var(--text-muted);font-size:0.8rem">' + escHtml(n.model || '-') + '</td>' +
+        '<td class="text-end">' + n.degree + '</td>' +
+        '<td><span class="sev ' + stSev + '">' + n.status + '</span></td>' +
+        '</tr>';
+}
+
+// ============================================================
+// FABRIC TOPOLOGY 캔버스 — /api/topology/layout 좌표 + /api/topology/graph?since delta
+//   - 배율 < TOPO_POD_LOD_SCALE : Pod별 집계 glyph (노드 / Down 수)
+//   - 그 이상                   : 화면 안 노드 / 링크만 그림, TOPO_LABEL_SCALE 이상에서 레이블
+//   - 휠 = 확대 / 축소, 드래그 = 이동, 더블클릭 = 전체 보기
+// ============================================================
+var TOPO_POD_LOD_SCALE = 0.35;
+var TOPO_LABEL_SCALE   = 0.9;
+var TOPO_MAX_SCALE     = 4;
+var TOPO_NODE_RADIUS   = 9;
+var TOPO_CANVAS_HEIGHT = 460;
+
+// 캔버스 상태 (섹션 재진입 시 새로 생성)
+var _topo = null;
+var _topoWindowBound = false;
+
+var _TOPO_ROLE_VAR = {
+    controller: '--color-warning',
+    spine:      '--color-info',
+    leaf:       '--color-success',
+    external:   '--text-muted'
+};
+
+function _topoLinkKey(l) {
+    return l.a + '|' + l.a_port + '|' + l.b + '|' + l.b_port;
+}
+
+function _topoCssColor(name) {
+    return getComputedStyle(document.documentElement).getPropertyValue(name).trim() || '#888';
+}
+
+function initTopologyCanvas(layout) {
+    setEl('topo-content',
+        '<canvas id="topo-canvas" style="width:100%;height:' + TOPO_CANVAS_HEIGHT + 'px;' +
+        'display:block;cursor:grab"></canvas>' +
+        '<div style="font-size:0.72rem;color:var(--text-muted);margin-top:4px">' +
+        'Wheel: zoom · Drag: pan · Double-click: fit</div>', true);
+    var canvas = document.getElementById('topo-canvas');
+    if (!canvas) return;
+
+    var colors = {};
+    Object.keys(_TOPO_ROLE_VAR).forEach(function (role) { colors[role] = _topoCssColor(_TOPO_ROLE_VAR[role]); });
+    colors.down   = _topoCssColor('--color-critical');
+    colors.link   = _topoCssColor('--border-color');
+    colors.text   = _topoCssColor('--text-main');
+    colors.muted  = _topoCssColor('--text-muted');
+    colors.accent = _topoCssColor('--border-accent');
+
+    _topo = {
+        canvas: canvas,
+        ctx: canvas.getContext('2d'),
+        colors: colors,
+        view: { scale: 1, tx: 0, ty: 0 },
+        drag: null,
+        pending: false
+    };
+    _topoSetLayout(layout);
+    _topoFit();
+    _topoBindEvents(canvas);
+}
+
+function _topoSetLayout(layout) {
+    var t = _topo;
+    t.version       = layout.version;
+    t.layoutVersion = layout.layout_version;
+    t.width         = layout.width;
+    t.height        = layout.height;
+    t.pods          = layout.pods;
+    t.nodes = {};
+    layout.nodes.forEach(function (n) { t.nodes[n.id] = n; });
+    t.links = {};
+    layout.links.forEach(function (l) { t.links[_topoLinkKey(l)] = l; });
+    _topoPodStats();
+    _topoScheduleDraw();
+}
+
+// ---- Pod 집계 (상태 변경 반영 시 재계산, 노드 수 선형) ----
+function _topoPodStats() {
+    var stats = {};
+    _topo.pods.forEach(function (p) { stats[p.pod] = { spine: 0, leaf: 0, other: 0, down: 0 }; });
+    Object.keys(_topo.nodes).forEach(function (id) {
+        var n = _topo.nodes[id];
+        var st = stats[n.pod];
+        if (!st) return;
+        if (n.role === 'spine' || n.role === 'leaf') st[n.role] += 1; else st.other += 1;
+        if (n.status !== 'UP') st.down += 1;
+    });
+    var linksDown = {};
+    Object.keys(_topo.links).forEach(function (k) {
+        var l = _topo.links[k];
+        var a = _topo.nodes[l.a];
+        if (l.state !== 'up' && a) linksDown[a.pod] = (linksDown[a.pod] || 0) + 1;
+    });
+    Object.keys(stats).forEach(function (pod) { stats[pod].linksDown = linksDown[pod] || 0; });
+    _topo.podStats = stats;
+}
+
+// ---- 보기 변환 ----
+function _topoFit() {
+    var t = _topo;
+    var cw = t.canvas.clientWidth || 800;
+    var scale = Math.min(cw / t.width, TOPO_CANVAS_HEIGHT / t.height, TOPO_MAX_SCALE);
+    t.view.scale = scale;
+    t.view.tx = (cw - t.width * scale) / 2;
+    t.view.ty = (TOPO_CANVAS_HEIGHT - t.height * scale) / 2;
+    t.minScale = scale / 2;
+    _topoScheduleDraw();
+}
+
+function _topoScheduleDraw() {
+    if (!_topo || _topo.pending) return;
+    _topo.pending = true;
+    window.requestAnimationFrame(_topoDraw);
+}
+
+function _topoDraw() {
+    var t = _topo;
+    if (!t) return;
+    t.pending = false;
+    var canvas = t.canvas, ctx = t.ctx;
+    if (!document.body.contains(canvas)) return;
+
+    var dpr = window.devicePixelRatio || 1;
+    var cw = canvas.clientWidth, ch = canvas.clientHeight;
+    if (canvas.width !== Math.round(cw * dpr) || canvas.height !== Math.round(ch * dpr)) {
+        canvas.width  = Math.round(cw * dpr);
+        canvas.height = Math.round(ch * dpr);
+    }
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, cw, ch);
+
+    var v = t.view;
+    ctx.translate(v.tx, v.ty);
+    ctx.scale(v.scale, v.scale);
+    // 화면에 보이는 월드 좌표 범위 (노드 반경만큼 여유)
+    var pad = TOPO_NODE_RADIUS * 2;
+    var box = {
+        x0: -v.tx / v.scale - pad, y0: -v.ty / v.scale - pad,
+        x1: (cw - v.tx) / v.scale + pad, y1: (ch - v.ty) / v.scale + pad
+    };
+
+    if (v.scale < TOPO_POD_LOD_SCALE) _topoDrawPods(ctx, box);
+    else _topoDrawDetail(ctx, box);
+}
+
+function _topoDrawPods(ctx, box) {
+    var t = _topo, s = t.view.scale;
+    var fontPx = 12 / s;
+    t.pods.forEach(function (p) {
+        if (p.x > box.x1 || p.x + p.width < box.x0) return;
+        var st = t.podStats[p.pod] || { spine: 0, leaf: 0, other: 0, down: 0, linksDown: 0 };
+        var bad = st.down > 0 || st.linksDown > 0;
+        ctx.fillStyle = bad ? 'rgba(239,68,68,0.12)' : 'rgba(4,159,212,0.10)';
+        ctx.strokeStyle = bad ? t.colors.down : t.colors.accent;
+        ctx.lineWidth = 2 / s;
+        ctx.fillRect(p.x, 0, p.width, t.height);
+        ctx.strokeRect(p.x, 0, p.width, t.height);
+
+        ctx.fillStyle = t.colors.text;
+        ctx.textAlign = 'center';
+        ctx.font = 'bold ' + (fontPx * 1.4) + 'px sans-serif';
+        var cx = p.x + p.width / 2, cy = t.height / 2;
+        ctx.fillText('Pod ' + p.pod, cx, cy - fontPx * 1.6);
+        ctx.font = fontPx + 'px sans-serif';
+        ctx.fillText(st.spine + ' spines · ' + st.leaf + ' leaves', cx, cy);
+        if (bad) {
+            ctx.fillStyle = t.colors.down;
+            ctx.fillText(st.down + ' nodes / ' + st.linksDown + ' links down', cx, cy + fontPx * 1.6);
+        }
+    });
+}
+
+function _topoVisible(n, box) {
+    return n.x >= box.x0 && n.x <= box.x1 && n.y >= box.y0 && n.y <= box.y1;
+}
+
+function _topoDrawDetail(ctx, box) {
+    var t = _topo, s = t.view.scale;
+
+    // ---- 링크: 스타일별 경로 1개로 묶어 stroke (화면 밖 링크 제외) ----
+    var groups = { up: [], other: [], down: [] };
+    Object.keys(t.links).forEach(function (k) {
+        var l = t.links[k], a = t.nodes[l.a], b = t.nodes[l.b];
+        if (!a || !b) return;
+        if (Math.max(a.x, b.x) < box.x0 || Math.min(a.x, b.x) > box.x1) return;
+        var group = l.state !== 'up' ? 'down' : l.kind === 'fabric' ? 'up' : 'other';
+        groups[group].push(a, b);
+    });
+    [['up', t.colors.link, []], ['other', t.colors.link, [4, 3]], ['down', t.colors.down, []]]
+        .forEach(function (style) {
+            var pts = groups[style[0]];
+            if (!pts.length) return;
+            ctx.beginPath();
+            for (var i = 0; i < pts.length; i += 2) {
+                ctx.moveTo(pts[i].x, pts[i].y);
+                ctx.lineTo(pts[i + 1].x, pts[i + 1].y);
+            }
+            ctx.strokeStyle = style[1];
+            ctx.lineWidth = 1 / s;
+            ctx.setLineDash(style[2].map(function (d) { return d / s; }));
+            ctx.stroke();
+        });
+    ctx.setLineDash([]);
+
+    // ---- 노드: 색상별 경로 1개로 묶어 fill ----
+    var byColor = {}, visible = [];
+    Object.keys(t.nodes).forEach(function (id) {
+        var n = t.nodes[id];
+        if (!_topoVisible(n, box)) return;
+        var color = n.status === 'UP' ? (t.colors[n.role] || t.colors.muted) : t.colors.down;
+        (byColor[color] = byColor[color] || []).push(n);
+        visible.push(n);
+    });
+    Object.keys(byColor).forEach(function (color) {
+        ctx.beginPath();
+        byColor[color].forEach(function (n) {
+            ctx.moveTo(n.x + TOPO_NODE_RADIUS, n.y);
+            ctx.arc(n.x, n.y, TOPO_NODE_RADIUS, 0, Math.PI * 2);
+        });
+        ctx.fillStyle = color;
+        ctx.fill();
+    });
+
+    // ---- 레이블 (확대 시에만) ----
+    if (s >= TOPO_LABEL_SCALE) {
+        ctx.fillStyle = t.colors.text;
+        ctx.textAlign = 'center';
+        ctx.font = '9px sans-serif';
+        visible.forEach(function (n) { ctx.fillText(n.name, n.x, n.y + 22); });
+    }
+}
+
+// ---- 입력 이벤트 ----
+function _topoBindEvents(canvas) {
+    canvas.addEventListener('wheel', function (e) {
+        e.preventDefault();
+        var t = _topo, v = t.view;
+        var rect = canvas.getBoundingClientRect();
+        var mx = e.clientX - rect.left, my = e.clientY - rect.top;
+        var next = Math.min(TOPO_MAX_SCALE, Math.max(t.minScale, v.scale * Math.exp(-e.deltaY * 0.0015)));
+        var f = next / v.scale;
+        v.tx = mx - (mx - v.tx) * f;
+        v.ty = my - (my - v.ty) * f;
+        v.scale = next;
+        _topoScheduleDraw();
+    }, { passive: false });
+
+    canvas.addEventListener('mousedown', function (e) {
+        _topo.drag = { x: e.clientX, y: e.clientY, tx: _topo.view.tx, ty: _topo.view.ty };
+        canvas.style.cursor = 'grabbing';
+    });
+    canvas.addEventListener('mousemove', function (e) {
+        var t = _topo;
+        if (t.drag) {
+            t.view.tx = t.drag.tx + e.clientX - t.drag.x;
+            t.view.ty = t.drag.ty + e.clientY - t.drag.y;
+            _topoScheduleDraw();
+            return;
+        }
+        canvas.title = _topoHit(e) || '';
+    });
+    canvas.addEventListener('dblclick', _topoFit);
+
+    // window 리스너는 1회만 등록 (섹션 재진입 시 캔버스만 새로 생성)
+    if (_topoWindowBound) return;
+    _topoWindowBound = true;
+    window.addEventListener('mouseup', function () {
+        if (!_topo || !_topo.drag) return;
+        _topo.drag = null;
+        _topo.canvas.style.cursor = 'grab';
+    });
+    window.addEventListener('resize', _topoScheduleDraw);
+}
+
+// ---- 마우스 위치 노드 (확대 상태에서만, 툴팁용) ----
+function _topoHit(e) {
+    var t = _topo, v = t.view;
+    if (v.scale < TOPO_POD_LOD_SCALE) return '';
+    var rect = t.canvas.getBoundingClientRect();
+    var wx = (e.clientX - rect.left - v.tx) / v.scale;
+    var wy = (e.clientY - rect.top - v.ty) / v.scale;
+    var r2 = TOPO_NODE_RADIUS * TOPO_NODE_RADIUS;
+    for (var id in t.nodes) {
+        var n = t.nodes[id], dx = n.x - wx, dy = n.y - wy;
+        if (dx * dx + dy * dy <= r2) return n.name + ' (' + n.id + ') ' + n.status;
+    }
+    return '';
+}
+
+// ============================================================
+// 자동 새로고침 — /api/topology/graph?since=<버전>
+//   - 상태 변경만: 노드 / 링크 값 교체 + 해당 테이블 행만 교체 + 다시 그리기
+//   - 추가 / 제거 (구성 변경) 또는 full: 레이아웃 / 테이블 다시 조회
+// ============================================================
+async function refreshTopology() {
+    var t = _topo;
+    try {
+        var delta = await apiFetch('/api/topology/graph?since=' + t.version);
+        if (delta.version === t.version && !delta.full) return;
+        var structural = delta.full ||
+            delta.nodes.added.length || delta.nodes.removed.length ||
+            delta.links.added.length || delta.links.removed.length;
+        if (structural) {
+            renderTopology(await apiFetch('/api/topology'));
+            _topoSetLayout(await apiFetch('/api/topology/layout'));  // 보던 위치 / 배율은 유지
+        } else {
+            _topoApplyDelta(delta);
+            t.version = delta.version;
+        }
+        renderTopologyRedundancy(await apiFetch('/api/topology/redundancy'));
+        renderTopologyChanges(await apiFetch('/api/topology/changes?limit=20'));
+    } catch (e) {
+        console.error('Topology refresh error:', e);
+    }
+}
+
+function _topoApplyDelta(delta) {
+    var t = _topo;
+    delta.nodes.changed.forEach(function (n) {
+        var cur = t.nodes[n.id];
+        if (cur) { cur.status = n.status; cur.name = n.name; }
+        var row = document.querySelector('#topo-table-tbody tr[data-node="' + CSS.escape(n.id) + '"]');
+        if (row) row.outerHTML = _topoRow(n);
+    });
+    delta.links.changed.forEach(function (l) { t.links[_topoLinkKey(l)] = l; });
+    _topoPodStats();
+    _topoUpdateSummary();
+    _topoScheduleDraw();
+}
+
+// ---- 요약 레이블의 링크 수 / Down 수만 갱신 (노드 수는 구성 변경 시에만 바뀜) ----
+function _topoUpdateSummary() {
+    var el = document.getElementById('topo-summary');
+    if (!el) return;
+    var keys = Object.keys(_topo.links);
+    var down = keys.filter(function (k) { return _topo.links[k].state !== 'up'; }).length;
+    el.textContent = el.textContent.replace(/ · .*$/, '') + ' · ' + keys.length + ' links' +
+        (down ? ' (' + down + ' down)' : '');
+}
+
+// ============================================================
+// FAILURE IMPACT — /api/topology/redundancy, /api/topology/impact
+// ============================================================
+function renderTopologyRedundancy(data) {
+    setEl('topo-redundancy-summary',
+        data.summary.spof + ' SPOF · ' + data.summary.single_homed + ' single-homed leaf' +
+        (data.summary.isolated ? ' · ' + data.summary.isolated + ' isolated' : ''));
+    var rows = data.spof.map(function (s) {
+        var affected = s.isolated.concat(s.detached);
+        return '<tr><td><code>' + escHtml(s.id) + '</code></td><td>' + escHtml(s.name) + '</td>' +
+            '<td>' + escHtml(s.role) + '</td>' +
+            '<td>' + affected.map(function (n) { return '<code>' + escHtml(n) + '</code>'; }).join(' ') + '</td>' +
+            '<td class="text-end">' + s.endpoints.toLocaleString() + '</td></tr>';
+    }).join('');
+    setEl('topo-spof', rows
+        ? '<table class="table table-sm mb-0"><thead><tr><th>SPOF</th><th>NAME</th><th>ROLE</th>' +
+          '<th>ISOLATES / DETACHES</th><th class="text-end">ENDPOINTS</th></tr></thead><tbody>' +
+          rows + '</tbody></table>'
+        : '<div class="ok-box"><i class="bi bi-check-circle me-1"></i>No single point of failure.</div>', true);
+}
+
+async function simulateTopologyFailure() {
+    var input = document.getElementById('topo-impact-node');
+    var node = input ? input.value.trim() : '';
+    if (!node) return;
+    try {
+        renderTopologyImpact(await apiFetch('/api/topology/impact?node=' + encodeURIComponent(node)));
+    } catch (e) {
+        setEl('topo-impact', '<div class="text-muted">' + escHtml(String(e.message || e)) + '</div>', true);
+    }
+}
+
+function renderTopologyImpact(data) {
+    var ids = function (items) {
+        return items.length ? items.map(function (n) {
+            return '<code>' + escHtml(n.id) + '</code>' + (n.after !== undefined ? ' (' + n.before + '→' + n.after + ')' : '');
+        }).join(' ') : '<span class="text-muted">-</span>';
+    };
+    var epgs = data.epgs.items.map(function (e) {
+        return '<tr><td>' + escHtml(e.tenant) + '</td><td>' + escHtml(e.epg) + '</td>' +
+            '<td class="text-end">' + e.endpoints.toLocaleString() + '</td></tr>';
     }).join('');
+    setEl('topo-impact',
+        '<div class="mb-2"><span class="sev sev-critical me-1">' + data.endpoints.impacted.toLocaleString() +
+        ' endpoints impacted</span><span class="sev sev-major">' + data.endpoints.at_risk.toLocaleString() +
+        ' at risk</span> <span style="color:var(--text-muted);font-size:0.78rem">(' + data.elapsed_ms + ' ms)</span></div>' +
+        '<div>Isolated: ' + ids(data.isolated) + '</div>' +
+        '<div>Degraded: ' + ids(data.degraded) + '</div>' +
+        '<div class="mb-2">Detached: ' + ids(data.detached) + '</div>' +
+        (epgs ? '<table class="table table-sm mb-0"><thead><tr><th>TENANT</th><th>EPG</th>' +
+                '<th class="text-end">ENDPOINTS</th></tr></thead><tbody>' + epgs + '</tbody></table>' : ''),
+        true);
+}
 
-    return '<div class="layer-label">' + label + '</div>' +
-           '<div style="text-align:center;margin-bottom:4px">' + chips + '</div>';
-}
\ No newline at end of file
+// ============================================================
+// TOPOLOGY CHANGES — /api/topology/changes
+// ============================================================
+function _changeItems(kind, items, fmt) {
+    return items.map(function (i) {
+        var sevClass = kind === 'added' ? 'sev-minor' : kind === 'removed' ? 'sev-critical' : 'sev-major';
+        return '<span class="sev ' + sevClass + ' me-1">' + kind + '</span>' + escHtml(fmt(i));
+    });
+}
+
+function renderTopologyChanges(data) {
+    var nodeFmt = function (n) { return 'node ' + n; };
+    var linkFmt = function (l) { return l.a + ' ' + l.a_port + ' ↔ ' + l.b + ' ' + l.b_port; };
+    var rows = data.changes.map(function (c) {
+        var items = [];
+        ['added', 'removed', 'changed'].forEach(function (kind) {
+            items = items.concat(_changeItems(kind, c.nodes[kind], nodeFmt),
+                                 _changeItems(kind, c.links[kind], linkFmt));
+        });
+        return '<tr><td><code>v' + c.version + '</code></td>' +
+            '<td style="color:var(--text-muted);font-size:0.8rem">' +
+            new Date(c.ts * 1000).toLocaleString() + '</td>' +
+            '<td>' + items.join('<br>') + '</td></tr>';
+    }).join('');
+    setEl('topo-changes', rows
+        ? '<table class="table table-sm mb-0"><thead><tr><th>VERSION</th><th>TIME</th>' +
+          '<th>CHANGES</th></tr></thead><tbody>' + rows + '</tbody></table>'
+        : '<div class="text-muted text-center py-3">No changes since v' + data.version + '</div>', true);
+}
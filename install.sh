@@ -26,6 +26,9 @@ PORT=8001
 # 볼륨 마운트 대상 파일 (docker-compose.release.yml 기준 — 설치 디렉토리 루트)
 DATA_FILES=("config.yaml" "users.yaml" ".secret_key")
 
+# 볼륨 마운트 대상 디렉토리 (Audit 이력 DB — 업데이트 시에도 설치 디렉토리에 유지)
+DATA_DIRS=("data")
+
 # 터미널 색상
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -202,6 +205,9 @@ for f in "${DATA_FILES[@]}"; do
         info "유지: ${f} (이미 존재)"
     fi
 done
+for d in "${DATA_DIRS[@]}"; do
+    mkdir -p "${INSTALL_DIR}/${d}"
+done
 success "볼륨 마운트 파일 초기화 완료"
 
 # ============================================
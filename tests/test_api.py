@@ -171,6 +171,47 @@ MOCK_SIMULATE_DENY = SimulationResult(
 SRC_EPG_DN = "uni/tn-TenantA/ap-App/epg-Web"
 DST_EPG_DN = "uni/tn-TenantA/ap-App/epg-DB"
 
+# ------------------------------------------
+# 서비스 단위 테스트용 헬퍼 (v1.10.0)
+# ------------------------------------------
+
+
+def _mo(class_name: str, **attrs: Any) -> dict[str, Any]:
+    """APIC imdata 항목 1건 생성: {class_name: {"attributes": attrs}}"""
+    return {class_name: {"attributes": attrs}}
+
+
+class FakeACI:
+    """클래스명별 imdata를 반환하는 ACIClient 대역 (호출 이력 기록)"""
+
+    def __init__(self, data: dict[str, list] | None = None) -> None:
+        self.data: dict[str, list] = data or {}
+        self.calls: list[tuple[str, str]] = []
+        # 조회 실패로 처리할 클래스 (ACIClient와 같이 strict면 예외, 아니면 빈 배열)
+        self.failing: set[str] = set()
+
+    def get(self, class_name: str, query: str = "", strict: bool = False) -> list:
+        from services.aci_client import APICRequestError
+
+        self.calls.append((class_name, query))
+        if class_name in self.failing:
+            if strict:
+                raise APICRequestError(f"{class_name}: APIC unavailable")
+            return []
+        return self.data.get(class_name, [])
+
+
+def _endpoint_imdata(
+    tenant: str, epg: str, mac: str, node: str, iface: str
+) -> tuple[dict, dict]:
+    """fvCEp + fvRsCEpToPathEp imdata 한 쌍 생성"""
+    ep_dn = f"uni/tn-{tenant}/ap-App/epg-{epg}/cep-{mac}"
+    tdn = f"topology/pod-1/paths-{node}/pathep-[{iface}]"
+    return (
+        _mo("fvCEp", dn=ep_dn, mac=mac, ip="", encap="vlan-10"),
+        _mo("fvRsCEpToPathEp", dn=f"{ep_dn}/rscEpToPathEp-[{tdn}]", tDn=tdn),
+    )
+
 
 # ============================================
 # 픽스처: Mock ACIClient + TestClient
@@ -257,6 +298,282 @@ class TestHealthAPI:
         assert "up" in data["nodes"]
 
 
+# ============================================
+# TestFaultAnalytics — Fault 인덱스 / group-by / 변경분
+# ============================================
+
+
+def _fault(node: str, code: str, severity: str = "major", lc: str = "raised") -> dict:
+    """faultInst imdata 1건 생성 (노드 인터페이스 하위 DN)"""
+    dn = f"topology/pod-1/node-{node}/sys/phys-[eth1/1]/fault-{code}"
+    return _mo(
+        "faultInst",
+        dn=dn,
+        code=code,
+        severity=severity,
+        lc=lc,
+        descr=f"{code} on {node}",
+        lastTransition="2026-01-01T00:00:00",
+    )
+
+
+class TestFaultAnalytics:
+    """FaultIndex 증분 집계 및 /api/faults 테스트 (v1.11.0)"""
+
+    def test_group_by_code_and_node(self) -> None:
+        from services.fault_index import FaultIndex
+
+        index = FaultIndex()
+        index.refresh(
+            [_fault("101", "F0532"), _fault("102", "F0532"), _fault("101", "F1234")]
+        )
+        assert index.slice("code")["items"][0] == {"value": "F0532", "count": 2}
+        assert index.slice("node", {"code": "F1234"})["items"] == [
+            {"value": "101", "count": 1}
+        ]
+
+    def test_new_and_cleared_since_previous_snapshot(self) -> None:
+        from services.fault_index import FaultIndex
+
+        index = FaultIndex()
+        index.refresh([_fault("101", "F0532"), _fault("102", "F0532")])
+        delta = index.refresh(
+            [_fault("101", "F0532", severity="cleared"), _fault("103", "F0001")]
+        )
+        assert delta == {"new": 1, "cleared": 2, "changed": 1}
+        changes = index.changes()
+        assert [f["code"] for f in changes["new"]] == ["F0001"]
+        assert {f["node"] for f in changes["cleared"]} == {"101", "102"}
+
+    def test_first_load_is_baseline(self) -> None:
+        from services.fault_index import FaultIndex
+
+        index = FaultIndex()
+        assert index.refresh([_fault("101", "F0532")])["new"] == 0
+
+    def test_top_faults_ranked_by_severity(self) -> None:
+        from services.fault_index import FaultIndex
+
+        index = FaultIndex()
+        index.refresh(
+            [
+                _fault("101", "F0001", severity="minor"),
+                _fault("101", "F0002", severity="critical"),
+                _fault("101", "F0003", severity="major"),
+            ]
+        )
+        assert [r.code for r in index.top_faults(2)] == ["F0002", "F0003"]
+
+    def test_subtree_filter(self) -> None:
+        import routers.health as health_router
+        from services.fault_index import FaultIndex
+
+        aci = FakeACI({"faultInst": [_fault("101", "F0532"), _fault("102", "F0532")]})
+        with patch.object(health_router, "_fault_index", FaultIndex()):
+            result = health_router.get_fault_analytics(
+                aci, "code", subtree="topology/pod-1/node-101"
+            )
+        assert result["total"] == 1
+
+    def test_failed_fetch_keeps_fault_index(self) -> None:
+        import routers.health as health_router
+        from services.fault_index import FaultIndex
+
+        aci = FakeACI({"faultInst": [_fault("101", "F0532"), _fault("102", "F0532")]})
+        index = FaultIndex()
+        with patch.object(health_router, "_fault_index", index):
+            health_router.get_health_data(aci)
+            aci.failing.add("faultInst")
+            failed = health_router.get_health_data(aci)
+            aci.failing.clear()
+            health_router.get_health_data(aci)
+        assert failed["total_faults"] == 2
+        assert failed["changes"] == {"new": 0, "cleared": 0}
+        assert index.changes()["new_count"] == 0
+
+    def test_faults_api_unknown_dimension_returns_400(self, client) -> None:
+        response = client.get("/api/faults?group_by=bogus")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestHealthTrend — 링 버퍼 시계열 저장소 / 추세 API
+# ============================================
+
+
+class TestHealthTrend:
+    """TimeSeriesStore 계층 버킷 및 /api/health/trend 테스트 (v1.11.0)"""
+
+    def test_samples_in_same_bucket_are_averaged(self) -> None:
+        from services.timeseries import TimeSeriesStore
+
+        store = TimeSeriesStore()
+        store.record({"fault.total": 10}, ts=600)
+        store.record({"fault.total": 20}, ts=630)
+        store.record({"fault.total": 5}, ts=660)
+        result = store.range_query("fault.total", 3600, now=700)
+        assert result["tier"] == "1m"
+        assert result["points"] == [
+            {"t": 600, "avg": 15.0, "max": 20},
+            {"t": 660, "avg": 5.0, "max": 5},
+        ]
+
+    def test_ring_buffer_memory_is_bounded(self) -> None:
+        from services.timeseries import TIERS, TimeSeriesStore
+
+        store = TimeSeriesStore()
+        for minute in range(1000):
+            store.record({"node.up": minute}, ts=minute * 60)
+        buckets = store._series["node.up"]["1m"]
+        assert len(buckets) == TIERS[0][2]
+
+    def test_series_count_is_capped(self) -> None:
+        from services.timeseries import TimeSeriesStore
+
+        store = TimeSeriesStore(max_series=2)
+        store.record({"a": 1, "b": 1, "c": 1}, ts=0)
+        assert store.names() == ["a", "b"]
+        assert store.dropped == 1
+
+    def test_full_store_evicts_least_active_series(self) -> None:
+        from services.timeseries import TimeSeriesStore
+
+        store = TimeSeriesStore(max_series=2)
+        store.record({"fault.code.F1": 3, "fault.code.F2": 1}, ts=0)
+        # F1은 해제되어 0만 기록 → 가장 오래 비활성
+        store.record({"fault.code.F1": 0, "fault.code.F2": 2}, ts=60)
+        store.record({"fault.code.F3": 1}, ts=120)
+        assert store.names() == ["fault.code.F2", "fault.code.F3"]
+        assert (store.evicted, store.dropped) == (1, 0)
+
+    def test_long_range_uses_coarse_tier(self) -> None:
+        from services.timeseries import TimeSeriesStore
+
+        assert TimeSeriesStore.pick_tier(3 * 86400) == "1h"
+        assert TimeSeriesStore.pick_tier(60 * 86400) == "1d"
+
+    def test_health_collection_records_trend(self) -> None:
+        import routers.health as health_router
+        from services.fault_index import FaultIndex
+        from services.timeseries import TimeSeriesStore
+
+        aci = FakeACI({"faultInst": [_fault("101", "F0532", severity="critical")]})
+        store = TimeSeriesStore()
+        with (
+            patch.object(health_router, "_fault_index", FaultIndex()),
+            patch.object(health_router, "_trend_store", store),
+        ):
+            health_router.get_health_data(aci)
+            trend = health_router.get_health_trend(
+                ["fault.severity.critical", "fault.code.F0532"]
+            )
+        assert [s["points"][-1]["max"] for s in trend["series"]] == [1, 1]
+        assert "node.up" in trend["available"]
+
+    def test_failed_fetch_skips_trend_recording(self) -> None:
+        import routers.health as health_router
+        from services.fault_index import FaultIndex
+        from services.timeseries import TimeSeriesStore
+
+        aci = FakeACI(
+            {
+                "faultInst": [_fault("101", "F0532", severity="critical")],
+                "fabricNode": [_mo("fabricNode", role="leaf", fabricSt="active")],
+            }
+        )
+        store = TimeSeriesStore()
+        with (
+            patch.object(health_router, "_fault_index", FaultIndex()),
+            patch.object(health_router, "_trend_store", store),
+        ):
+            aci.failing = {"faultInst", "fabricNode"}
+            health_router.get_health_data(aci)
+            assert store.names() == []
+            # 노드 조회만 실패 → Fault 시리즈만 기록
+            aci.failing = {"fabricNode"}
+            health_router.get_health_data(aci)
+        assert "fault.total" in store.names()
+        assert "node.up" not in store.names()
+
+    def test_trend_api_unknown_tier_returns_400(self, client) -> None:
+        response = client.get("/api/health/trend?series=fault.total&tier=5s")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestHealthScores — Health Score 일괄 수집 / 캐시
+# ============================================
+
+
+class TestHealthScores:
+    """collect_health_scores DN 조인 및 TTL 캐시 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def aci(self) -> FakeACI:
+        def system(node: str, score: str) -> dict:
+            item = _mo("topSystem", dn=f"topology/pod-1/node-{node}/sys", id=node)
+            item["topSystem"]["children"] = [_mo("healthInst", cur=score)]
+            return item
+
+        def node(node_id: str, name: str) -> dict:
+            return _mo(
+                "fabricNode",
+                dn=f"topology/pod-1/node-{node_id}",
+                id=node_id,
+                name=name,
+                role="leaf",
+                fabricSt="active",
+            )
+
+        return FakeACI(
+            {
+                "fabricHealthTotal": [
+                    _mo("fabricHealthTotal", dn="topology/health", cur="88"),
+                    _mo("fabricHealthTotal", dn="topology/pod-1/health", cur="90"),
+                ],
+                "topSystem": [system("101", "95"), system("102", "40")],
+                "fabricNode": [node("101", "leaf-101"), node("102", "leaf-102")],
+                "fvOverallHealth15min": [
+                    _mo(
+                        "fvOverallHealth15min",
+                        dn=f"uni/tn-{name}/CDfvOverallHealth15min",
+                        healthLast=score,
+                        healthAvg=score,
+                    )
+                    for name, score in (("T1", "100"), ("T2", "63"))
+                ],
+            }
+        )
+
+    def test_nodes_joined_by_dn_worst_first(self, aci) -> None:
+        from services.health_score import collect_health_scores
+
+        result = collect_health_scores(aci)
+        assert result["fabric"] == 88
+        assert result["pods"] == [{"pod": "1", "score": 90}]
+        assert [(n["name"], n["score"]) for n in result["nodes"]] == [
+            ("leaf-102", 40),
+            ("leaf-101", 95),
+        ]
+        assert result["tenants"][0] == {"tenant": "T2", "score": 63, "avg": 63}
+
+    def test_bulk_class_queries_only(self, aci) -> None:
+        from services.health_score import collect_health_scores
+
+        collect_health_scores(aci)
+        assert ("topSystem", "rsp-subtree-include=health") in aci.calls
+        assert len(aci.calls) == 4
+
+    def test_scores_are_cached(self, aci) -> None:
+        import routers.health as health_router
+        from services.ttl_cache import TTLCache
+
+        with patch.object(health_router, "_score_cache", TTLCache(ttl=60)):
+            health_router.get_health_scores(aci)
+            health_router.get_health_scores(aci)
+        assert len(aci.calls) == 4
+
+
 # ============================================
 # 테스트: Policy Check API
 # ============================================
@@ -291,6 +608,234 @@ class TestInterfaceAPI:
         assert "down" in data
 
 
+# ============================================
+# TestInterfaceCounters — 포트 사용률 / 에러율 상위 N
+# ============================================
+
+
+def _port_dn(node: str, iface: str, rn: str) -> str:
+    return f"topology/pod-1/node-{node}/sys/phys-[{iface}]/{rn}"
+
+
+class TestInterfaceCounters:
+    """InterfaceCounterCollector 사용률 / 에러 delta 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _ether(node: str, iface: str, crc: int) -> dict:
+        return _mo(
+            "rmonEtherStats",
+            dn=_port_dn(node, iface, "dbgEtherStats"),
+            cRCAlignErrors=str(crc),
+            fragments="0",
+            jabbers="0",
+        )
+
+    def test_top_utilization_uses_max_direction(self) -> None:
+        from services.interface_counters import InterfaceCounterCollector
+
+        ingress = [
+            _mo(
+                "eqptIngrTotal5min",
+                dn=_port_dn("101", f"eth1/{i}", "CDeqptIngrTotal5min"),
+                utilAvg=str(i * 10),
+                bytesRate="125",
+            )
+            for i in range(1, 6)
+        ]
+        egress = [
+            _mo(
+                "eqptEgrTotal5min",
+                dn=_port_dn("102", "eth1/1", "CDeqptEgrTotal5min"),
+                utilAvg="95",
+                bytesRate="0",
+            )
+        ]
+        result = InterfaceCounterCollector(top=2).refresh(ingress, egress, [], [])
+        assert result["ports"] == 6
+        assert [(p["node"], p["util"]) for p in result["top_utilization"]] == [
+            ("102", 95.0),
+            ("101", 50.0),
+        ]
+        assert result["top_utilization"][1]["ingress_bps"] == 1000
+
+    def test_error_rate_from_cumulative_delta(self) -> None:
+        from services.interface_counters import InterfaceCounterCollector
+
+        collector = InterfaceCounterCollector()
+        first = collector.refresh([], [], [self._ether("101", "eth1/1", 100)], [], ts=0)
+        assert first["top_errors"] == []
+        result = collector.refresh(
+            [], [], [self._ether("101", "eth1/1", 160)], [], ts=60
+        )
+        assert result["interval"] == 60
+        assert result["top_errors"][0]["errors"] == 60
+        assert result["top_errors"][0]["errors_per_sec"] == 1.0
+
+    def test_counter_reset_uses_current_value(self) -> None:
+        from services.interface_counters import InterfaceCounterCollector
+
+        collector = InterfaceCounterCollector()
+        collector.refresh([], [], [self._ether("101", "eth1/1", 500)], [], ts=0)
+        result = collector.refresh([], [], [self._ether("101", "eth1/1", 7)], [], ts=30)
+        assert result["top_errors"][0]["errors"] == 7
+
+    def test_failed_fetch_keeps_error_baselines(self) -> None:
+        from services.interface_counters import InterfaceCounterCollector
+
+        dot3 = _mo(
+            "rmonDot3Stats",
+            dn=_port_dn("101", "eth1/1", "dbgDot3Stats"),
+            symbolErrors="40",
+            lateCollisions="0",
+        )
+        collector = InterfaceCounterCollector()
+        collector.refresh([], [], [self._ether("101", "eth1/1", 100)], [dot3], ts=0)
+        # rmonEtherStats / rmonDot3Stats 조회 실패 (빈 배열) → 기준선 유지
+        assert collector.refresh([], [], [], [], ts=30)["top_errors"] == []
+        # rmonDot3Stats만 실패 → 합계 감소를 카운터 리셋으로 오인하지 않음
+        partial = collector.refresh(
+            [], [], [self._ether("101", "eth1/1", 130)], [], ts=60
+        )
+        assert partial["top_errors"][0]["errors"] == 30
+        result = collector.refresh(
+            [], [], [self._ether("101", "eth1/1", 190)], [dot3], ts=120
+        )
+        assert result["top_errors"][0]["errors"] == 60
+        assert result["top_errors"][0]["errors_per_sec"] == 1.0
+
+    def test_counters_api_returns_top_lists(self) -> None:
+        import routers.interface as iface_router
+        from services.interface_counters import InterfaceCounterCollector
+
+        aci = FakeACI({"rmonEtherStats": [self._ether("101", "eth1/1", 1)]})
+        with patch.object(
+            iface_router, "_counter_collector", InterfaceCounterCollector()
+        ):
+            result = iface_router.get_interface_counters(aci, top=5)
+        assert result["ports"] == 1
+        assert {"top_utilization", "top_errors", "interval"} <= result.keys()
+
+
+# ============================================
+# TestInterfaceFlaps — 포트 상태 전환 / flapping 탐지
+# ============================================
+
+
+def _phys_if(node: str, iface: str, state: str, changed: str = "t0") -> dict:
+    return _mo(
+        "ethpmPhysIf",
+        dn=_port_dn(node, iface, "phys"),
+        operSt=state,
+        lastLinkStChg=changed,
+    )
+
+
+class TestInterfaceFlaps:
+    """InterfaceFlapTracker 스냅샷 diff / 슬라이딩 윈도우 테스트 (v1.11.0)"""
+
+    def _bounce(self, tracker, count: int, start: float = 0, step: float = 10):
+        for i in range(count + 1):
+            state = "up" if i % 2 == 0 else "down"
+            tracker.update(
+                [_phys_if("101", "eth1/1", state, f"t{i}")], ts=start + i * step
+            )
+
+    def test_port_flapping_above_threshold(self) -> None:
+        from services.interface_flap import InterfaceFlapTracker
+
+        tracker = InterfaceFlapTracker(window=600, threshold=3)
+        self._bounce(tracker, 4)
+        ports = tracker.flapping(now=40)
+        assert ports[0]["transitions"] == 4
+        assert ports[0]["history"][-1] == {"ts": 40, "from": "down", "to": "up"}
+
+    def test_old_transitions_expire_from_window(self) -> None:
+        from services.interface_flap import InterfaceFlapTracker
+
+        tracker = InterfaceFlapTracker(window=60, threshold=3)
+        self._bounce(tracker, 4)
+        assert tracker.flapping(now=200) == []
+
+    def test_bounce_between_polls_detected_by_last_change(self) -> None:
+        from services.interface_flap import InterfaceFlapTracker
+
+        tracker = InterfaceFlapTracker(threshold=1)
+        tracker.update([_phys_if("101", "eth1/1", "up", "t0")], ts=0)
+        assert tracker.update([_phys_if("101", "eth1/1", "up", "t1")], ts=30) == 1
+        assert tracker.update([_phys_if("101", "eth1/1", "up", "t1")], ts=60) == 0
+
+    def test_failed_fetch_keeps_state_and_history(self) -> None:
+        from services.interface_flap import InterfaceFlapTracker
+
+        tracker = InterfaceFlapTracker(window=600, threshold=3)
+        self._bounce(tracker, 2)
+        # APIC 조회 실패 → aci.get은 빈 배열
+        assert tracker.update([], ts=25) == 0
+        assert tracker.flapping(threshold=1, now=25)[0]["transitions"] == 2
+        # 다음 정상 스냅샷은 기준선이 아니라 전환으로 기록
+        assert tracker.update([_phys_if("101", "eth1/1", "down", "t3")], ts=30) == 1
+        assert tracker.flapping(now=30)[0]["transitions"] == 3
+
+    def test_history_is_bounded(self) -> None:
+        from services.interface_flap import HISTORY_PER_PORT, InterfaceFlapTracker
+
+        tracker = InterfaceFlapTracker(threshold=1)
+        self._bounce(tracker, HISTORY_PER_PORT * 2, step=1)
+        assert len(tracker.flapping(now=100)[0]["history"]) == HISTORY_PER_PORT
+
+
+# ============================================
+# TestInterfaceBreakdown — 노드 / 모듈별 집계 및 heatmap
+# ============================================
+
+
+class TestInterfaceBreakdown:
+    """get_interface_data 노드 / 모듈 집계 및 heatmap 캐시 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def aci(self) -> FakeACI:
+        return FakeACI(
+            {
+                "ethpmPhysIf": [
+                    _phys_if("101", "eth1/1", "up"),
+                    _phys_if("101", "eth1/2", "down"),
+                    _phys_if("101", "eth101/1/7", "up"),
+                    _phys_if("102", "eth1/1", "up"),
+                ]
+            }
+        )
+
+    @pytest.fixture(autouse=True)
+    def _fresh_state(self):
+        import routers.interface as iface_router
+        from services.interface_flap import InterfaceFlapTracker
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch.object(iface_router, "_flap_tracker", InterfaceFlapTracker()),
+            patch.object(iface_router, "_heatmap_cache", TTLCache(ttl=60)),
+        ):
+            yield iface_router
+
+    def test_by_node_and_module(self, aci, _fresh_state) -> None:
+        data = _fresh_state.get_interface_data(aci)
+        assert data["by_node"][0] == {"node": "101", "up": 2, "down": 1, "total": 3}
+        assert {"node": "101", "module": "101/1", "up": 1, "down": 0} in data[
+            "by_module"
+        ]
+
+    def test_heatmap_grid(self, aci, _fresh_state) -> None:
+        heatmap = _fresh_state.get_interface_heatmap(aci)
+        assert heatmap["nodes"] == ["101", "102"]
+        assert heatmap["ports"] == ["1/1", "1/2", "101/1/7"]
+        assert heatmap["cells"] == [[1, 0, 1], [1, -1, -1]]
+
+    def test_heatmap_reuses_cached_payload(self, aci, _fresh_state) -> None:
+        _fresh_state.get_interface_data(aci)
+        _fresh_state.get_interface_heatmap(aci)
+        assert [name for name, _ in aci.calls] == ["ethpmPhysIf"]
+
+
 # ============================================
 # 테스트: Endpoint Tracker API
 # ============================================
@@ -324,6 +869,261 @@ class TestEndpointAPI:
         assert response.status_code == 422
 
 
+# ============================================
+# TestEndpointCube — Endpoint 인덱스 / 집계 큐브
+# ============================================
+
+
+class TestEndpointCube:
+    """EndpointIndex 증분 갱신 및 큐브 drill-down 테스트 (v1.10.0)"""
+
+    def _build(self, rows):
+        from services.endpoint_index import EndpointIndex
+
+        eps, paths = (
+            zip(*[_endpoint_imdata(*row) for row in rows]) if rows else ((), ())
+        )
+        index = EndpointIndex()
+        index.refresh(list(eps), list(paths))
+        return index
+
+    def test_group_by_node(self):
+        index = self._build(
+            [
+                ("T1", "Web", "00:00:00:00:00:01", "101", "eth1/1"),
+                ("T1", "Web", "00:00:00:00:00:02", "101", "eth1/2"),
+                ("T2", "DB", "00:00:00:00:00:03", "102", "eth1/1"),
+            ]
+        )
+        result = index.slice("node")
+        assert result["total"] == 3
+        assert result["items"][0] == {"value": "101", "count": 2}
+
+    def test_drill_down_with_filters(self):
+        index = self._build(
+            [
+                ("T1", "Web", "00:00:00:00:00:01", "101", "eth1/1"),
+                ("T1", "Web", "00:00:00:00:00:02", "101", "eth1/1"),
+                ("T1", "App", "00:00:00:00:00:03", "101", "eth1/2"),
+                ("T2", "Web", "00:00:00:00:00:04", "102", "eth1/1"),
+            ]
+        )
+        result = index.slice("interface", {"tenant": "T1", "node": "101"})
+        assert result["total"] == 3
+        assert result["items"] == [
+            {"value": "eth1/1", "count": 2},
+            {"value": "eth1/2", "count": 1},
+        ]
+
+    def test_incremental_refresh_updates_cube(self):
+        row_a = _endpoint_imdata("T1", "Web", "00:00:00:00:00:01", "101", "eth1/1")
+        row_b = _endpoint_imdata("T1", "Web", "00:00:00:00:00:02", "101", "eth1/1")
+        moved = _endpoint_imdata("T1", "Web", "00:00:00:00:00:02", "102", "eth1/5")
+        index = self._build([])
+        index.refresh([row_a[0], row_b[0]], [row_a[1], row_b[1]])
+
+        delta = index.refresh([moved[0]], [moved[1]])
+
+        assert delta == {"added": 0, "removed": 1, "changed": 1}
+        assert index.slice("node")["items"] == [{"value": "102", "count": 1}]
+
+    def test_search_uses_path_join(self):
+        import routers.endpoint as ep_router
+        from services.endpoint_index import EndpointIndex
+
+        ep, path = _endpoint_imdata("T1", "Web", "00:50:56:AA:BB:CC", "101", "eth1/10")
+        aci = FakeACI({"fvCEp": [ep], "fvRsCEpToPathEp": [path]})
+        with patch.object(ep_router, "_index", EndpointIndex()):
+            results = ep_router.search_endpoint(aci, "00-50-56-aa")
+        assert results[0]["node"] == "101"
+        assert results[0]["interface"] == "eth1/10"
+
+    def test_search_lists_exact_match_then_substring_matches(self):
+        import routers.endpoint as ep_router
+        from services.endpoint_index import EndpointIndex
+
+        rows = []
+        for i, ip in enumerate(["10.0.0.12", "10.0.0.1", "10.0.0.100", "10.0.1.1"]):
+            ep, path = _endpoint_imdata(
+                "T1", "Web", f"00:50:56:AA:BB:{i:02X}", "101", "eth1/1"
+            )
+            ep["fvCEp"]["attributes"]["ip"] = ip
+            rows.append((ep, path))
+        aci = FakeACI(
+            {
+                "fvCEp": [ep for ep, _ in rows],
+                "fvRsCEpToPathEp": [path for _, path in rows],
+            }
+        )
+        with patch.object(ep_router, "_index", EndpointIndex()):
+            found = ep_router.search_endpoint(aci, "10.0.0.1")
+            exact = ep_router.search_endpoint(aci, "10.0.0.1", exact=True)
+            partial_mac = ep_router.search_endpoint(aci, "00:50:56:aa:bb")
+        assert [r["ip"] for r in found][0] == "10.0.0.1"
+        assert sorted(r["ip"] for r in found) == ["10.0.0.1", "10.0.0.100", "10.0.0.12"]
+        assert [r["ip"] for r in exact] == ["10.0.0.1"]
+        assert len(partial_mac) == 4
+
+    def test_endpoint_without_ip_not_matched_by_placeholder(self):
+        index = self._build(
+            [
+                ("T1", "Web", "00:00:00:00:00:01", "101", "eth1/1"),
+                ("T1", "Web", "00:00:00:00:00:02", "101", "eth1/2"),
+            ]
+        )
+        records = list(index.iter_records())
+        assert [r.ip for r in records] == ["", ""]
+        assert list(index.iter_records(query="-")) == []
+        assert len(list(index.iter_records(query="00-00-00"))) == 2
+
+    def test_cube_api_filters_by_peer(self, client: TestClient) -> None:
+        from services.endpoint_index import EndpointIndex
+
+        vpc_dn = "uni/tn-T1/ap-App/epg-Web/cep-00:00:00:00:00:10"
+        tdn = "topology/pod-1/protpaths-101-102/pathep-[vpc-pg]"
+        single = _endpoint_imdata("T1", "Web", "00:00:00:00:00:11", "101", "eth1/1")
+        index = EndpointIndex()
+        index.refresh(
+            [_mo("fvCEp", dn=vpc_dn, mac="00:00:00:00:00:10", ip=""), single[0]],
+            [
+                _mo("fvRsCEpToPathEp", dn=f"{vpc_dn}/rscEpToPathEp-[{tdn}]", tDn=tdn),
+                single[1],
+            ],
+        )
+        with patch("routers.endpoint._index", index):
+            data = client.get("/api/endpoint/cube?group_by=node&peer=102").json()
+        assert data["items"] == [{"value": "101", "count": 1}]
+
+    def test_cube_api_unknown_dimension_returns_400(self, client: TestClient) -> None:
+        response = client.get("/api/endpoint/cube?group_by=bogus")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestEndpointListAPI — 목록 페이지네이션 / 스트리밍 내보내기
+# ============================================
+
+
+class TestEndpointListAPI:
+    """GET /api/endpoint/list, /api/endpoint/export 테스트 (v1.10.0)"""
+
+    @pytest.fixture()
+    def index(self):
+        from services.endpoint_index import EndpointIndex
+
+        rows = [
+            _endpoint_imdata("T1", "Web", f"00:00:00:00:00:{i:02x}", "101", "eth1/1")
+            for i in range(1, 6)
+        ]
+        eps, paths = zip(*rows)
+        idx = EndpointIndex()
+        idx.refresh(list(eps), list(paths))
+        with patch("routers.endpoint._index", idx):
+            yield idx
+
+    def test_cursor_pagination_covers_all_rows(self, client, index) -> None:
+        seen, cursor = [], None
+        for _ in range(5):
+            url = "/api/endpoint/list?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            data = client.get(url).json()
+            seen.extend(item["mac"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        assert seen == sorted(seen)
+        assert len(seen) == 5
+        assert data["total"] == 5
+
+    def test_descending_sort(self, client, index) -> None:
+        data = client.get("/api/endpoint/list?sort=mac&order=desc&limit=1").json()
+        assert data["items"][0]["mac"] == "00:00:00:00:00:05"
+
+    def test_invalid_sort_field_returns_400(self, client, index) -> None:
+        response = client.get("/api/endpoint/list?sort=bogus")
+        assert response.status_code == 400
+
+    def test_invalid_cursor_returns_400(self, client, index) -> None:
+        response = client.get("/api/endpoint/list?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_export_csv_streams_all_rows(self, client, index) -> None:
+        response = client.get("/api/endpoint/export?format=csv")
+        assert response.status_code == 200
+        lines = response.text.strip().splitlines()
+        assert lines[0].startswith("mac,ip,tenant")
+        assert len(lines) == 6
+
+    def test_export_ndjson_with_filter(self, client, index) -> None:
+        import json
+
+        response = client.get("/api/endpoint/export?format=ndjson&q=00:00:00:00:00:03")
+        rows = [json.loads(line) for line in response.text.strip().splitlines()]
+        assert [row["mac"] for row in rows] == ["00:00:00:00:00:03"]
+
+
+# ============================================
+# TestEndpointEnrichment — 보조 IP / VM / Host 조인
+# ============================================
+
+
+class TestEndpointEnrichment:
+    """fvIp / fvRsToVm / fvRsHyper 일괄 조인 테스트 (v1.11.0)"""
+
+    MAC = "00:50:56:AA:BB:CC"
+
+    @pytest.fixture()
+    def aci(self) -> FakeACI:
+        ep, path = _endpoint_imdata("T1", "Web", self.MAC, "101", "eth1/10")
+        ep_dn = ep["fvCEp"]["attributes"]["dn"]
+        ep["fvCEp"]["attributes"]["ip"] = "10.0.0.1"
+        vm_dn = "comp/prov-VMware/ctrlr-[DC]-vc/vm-vm-42"
+        hv_dn = "comp/prov-VMware/ctrlr-[DC]-vc/hv-host-7"
+        return FakeACI(
+            {
+                "fvCEp": [ep],
+                "fvRsCEpToPathEp": [path],
+                "fvIp": [
+                    _mo("fvIp", dn=f"{ep_dn}/ip-[10.0.0.1]", addr="10.0.0.1"),
+                    _mo("fvIp", dn=f"{ep_dn}/ip-[10.0.0.99]", addr="10.0.0.99"),
+                ],
+                "fvRsToVm": [_mo("fvRsToVm", dn=f"{ep_dn}/rstoVm", tDn=vm_dn)],
+                "fvRsHyper": [_mo("fvRsHyper", dn=f"{ep_dn}/rshyper", tDn=hv_dn)],
+                "compVm": [_mo("compVm", dn=vm_dn, name="web-01")],
+                "compHv": [_mo("compHv", dn=hv_dn, name="esxi-07")],
+            }
+        )
+
+    def _search(self, aci, query):
+        import routers.endpoint as ep_router
+        from services.endpoint_index import EndpointIndex
+
+        with patch.object(ep_router, "_index", EndpointIndex()):
+            return ep_router.search_endpoint(aci, query)
+
+    def test_secondary_ip_exact_lookup(self, aci) -> None:
+        results = self._search(aci, "10.0.0.99")
+        assert len(results) == 1
+        assert results[0]["mac"] == self.MAC
+        assert results[0]["ips"] == ["10.0.0.1", "10.0.0.99"]
+
+    def test_vm_and_host_joined_by_parent_dn(self, aci) -> None:
+        result = self._search(aci, self.MAC.lower())[0]
+        assert result["vm"] == "web-01"
+        assert result["host"] == "esxi-07"
+
+    def test_enrichment_fetched_once_per_class(self, aci) -> None:
+        self._search(aci, "10.0.0")
+        fetched = [name for name, _ in aci.calls]
+        for class_name in ("fvIp", "fvRsToVm", "fvRsHyper", "compVm", "compHv"):
+            assert fetched.count(class_name) == 1
+
+    def test_endpoint_without_enrichment_defaults(self) -> None:
+        ep, path = _endpoint_imdata("T1", "Web", self.MAC, "101", "eth1/10")
+        result = self._search(FakeACI({"fvCEp": [ep], "fvRsCEpToPathEp": [path]}), "")
+        assert result[0]["ips"] == []
+        assert result[0]["vm"] == "-"
+
+
 # ============================================
 # 테스트: Audit Log API
 # ============================================
@@ -340,6 +1140,327 @@ class TestAuditAPI:
         assert "logs" in data
 
 
+# ============================================
+# TestAuditSync — aaaModLR 로컬 SQLite 동기화
+# ============================================
+
+
+def _audit_log(i: int, user: str = "admin", action: str = "modification", **extra):
+    """aaaModLR imdata 1건 (i분 단위 created)"""
+    return _mo(
+        "aaaModLR",
+        id=str(i),
+        created=f"2026-03-{1 + i // 1440:02d}T{(i // 60) % 24:02d}:{i % 60:02d}:00.000+00:00",
+        user=user,
+        ind=action,
+        affected=extra.pop("affected", f"uni/tn-T1/BD-bd{i}"),
+        descr=extra.pop("descr", f"BD bd{i} modified"),
+        changeSet=extra.pop("changeSet", ""),
+        **extra,
+    )
+
+
+class AuditFakeACI(FakeACI):
+    """page / page-size / ge(created) 필터를 해석하는 aaaModLR 대역"""
+
+    def __init__(self, logs: list) -> None:
+        super().__init__()
+        self.logs = logs
+        # 조회 실패로 처리할 page 번호 ("all"이면 모든 조회 실패)
+        self.fail_pages: set[int] | str = set()
+
+    def get(self, class_name: str, query: str = "", strict: bool = False) -> list:
+        import re
+        from urllib.parse import unquote
+
+        from services.aci_client import APICRequestError
+
+        self.calls.append((class_name, query))
+        params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+        rows = sorted(
+            self.logs,
+            key=lambda item: item["aaaModLR"]["attributes"]["created"],
+            reverse="desc" in params.get("order-by", ""),
+        )
+        if self.fail_pages == "all" or int(params.get("page", 0)) in self.fail_pages:
+            if strict:
+                raise APICRequestError("APIC unavailable")
+            return []
+        match = re.search(r'ge\(aaaModLR.created,"([^"]+)"\)', unquote(query))
+        if match:
+            rows = [
+                r for r in rows if r["aaaModLR"]["attributes"]["created"] >= match[1]
+            ]
+        size, page = int(params.get("page-size", 50)), int(params.get("page", 0))
+        start = page * size
+        return rows[start:][:size]
+
+
+class TestAuditSync:
+    """AuditStore / AuditSync 백필 + 증분 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _sync(page_size: int = 3):
+        from services.audit_store import AuditStore, AuditSync
+
+        return AuditSync(AuditStore(":memory:"), page_size=page_size)
+
+    def test_backfill_pages_through_full_history(self) -> None:
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(10)])
+        assert len(sync.sync(aci)) == 10
+        assert sync.backfill_done
+        assert sync.store.count() == 10
+
+    def test_incremental_fetches_only_new_records(self) -> None:
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(5)])
+        sync.sync(aci)
+        aci.logs.append(_audit_log(100))
+        aci.calls.clear()
+        inserted = sync.sync(aci)
+        assert [row["id"] for row in inserted] == ["100"]
+        assert "ge(aaaModLR.created" in aci.calls[0][1]
+
+    def test_failed_first_sync_retries_backfill(self) -> None:
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(10)])
+        aci.fail_pages = "all"
+        assert sync.sync(aci) == []
+        assert not sync.backfill_done
+        aci.fail_pages = set()
+        assert len(sync.sync(aci)) == 10
+        assert sync.backfill_done
+
+    def test_failed_page_mid_backfill_is_retried(self) -> None:
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(10)])
+        aci.fail_pages = {2}
+        assert len(sync.sync(aci)) == 6
+        assert not sync.backfill_done
+        aci.fail_pages = set()
+        assert len(sync.sync(aci)) == 4
+        assert sync.backfill_done
+
+    def test_backfill_ends_on_exact_page_multiple(self) -> None:
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(9)])
+        assert len(sync.sync(aci)) == 9
+        assert sync.backfill_done
+
+    def test_empty_store_after_backfill_restarts_backfill(self) -> None:
+        sync = self._sync()
+        sync.store.set_state("backfill_done", "1")
+        sync.store.set_state("backfill_page", "1")
+        aci = AuditFakeACI([_audit_log(i) for i in range(5)])
+        assert len(sync.sync(aci)) == 5
+        assert sync.backfill_done
+
+    def test_incremental_filter_encodes_timezone_offset(self) -> None:
+        sync = self._sync()
+        log = _audit_log(1)
+        log["aaaModLR"]["attributes"]["created"] = "2026-03-17T09:00:00.000+09:00"
+        aci = AuditFakeACI([log])
+        sync.sync(aci)
+        aci.calls.clear()
+        sync.sync(aci)
+        assert "%2B09:00" in aci.calls[0][1]
+        assert "+" not in aci.calls[0][1]
+
+    def test_other_fabric_resets_history(self) -> None:
+        sync = self._sync()
+        assert not sync.bind_fabric(["https://10.0.0.1", "https://10.0.0.2"])
+        sync.sync(AuditFakeACI([_audit_log(i) for i in range(5)]))
+        # 클러스터 일부 host 변경은 같은 Fabric
+        assert not sync.bind_fabric(["https://10.0.0.2/", "https://10.0.0.3"])
+        assert sync.store.count() == 5
+        assert sync.bind_fabric(["https://10.9.0.1"])
+        assert sync.store.count() == 0
+        assert not sync.backfill_done
+        assert len(sync.sync(AuditFakeACI([_audit_log(i) for i in range(2)]))) == 2
+
+    def test_router_drops_indexes_on_fabric_change(self) -> None:
+        import routers.audit as audit_router
+
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i) for i in range(4)])
+        aci.hosts = ["https://10.0.0.1"]
+        with (
+            patch.object(audit_router, "_sync", sync),
+            patch.object(audit_router, "_histogram", None),
+        ):
+            assert audit_router.get_audit_activity(aci)["total"] == 4
+            other = AuditFakeACI([_audit_log(i) for i in range(2)])
+            other.hosts = ["https://10.9.0.1"]
+            assert audit_router.get_audit_activity(other)["total"] == 2
+
+    def test_query_by_user_action_and_time(self) -> None:
+        sync = self._sync()
+        sync.sync(
+            AuditFakeACI(
+                [
+                    _audit_log(1, user="alice", action="creation"),
+                    _audit_log(2, user="alice", action="deletion"),
+                    _audit_log(3, user="bob", action="creation"),
+                ]
+            )
+        )
+        store = sync.store
+        assert [r["id"] for r in store.query(user="alice")] == ["2", "1"]
+        assert [r["id"] for r in store.query(action="creation")] == ["3", "1"]
+        since = store.query(user="alice")[0]["ts"]
+        assert [r["id"] for r in store.query(since=since)] == ["3", "2"]
+
+    def test_audit_data_aggregates_local_history(self) -> None:
+        import routers.audit as audit_router
+
+        sync = self._sync()
+        aci = AuditFakeACI([_audit_log(i, user=f"u{i % 2}") for i in range(60)])
+        with patch.object(audit_router, "_sync", sync):
+            data = audit_router.get_audit_data(aci)
+        assert data["total"] == 60
+        assert data["actions"]["modification"] == 60
+        assert len(data["recent"]) == 10
+
+    def test_query_api_invalid_time_returns_400(self, client) -> None:
+        response = client.get("/api/audit/query?since=yesterday")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestAuditSearch — Audit 역색인 검색
+# ============================================
+
+
+class TestAuditSearch:
+    """AuditSearchIndex posting 교집합 / 시간 범위 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def sync(self):
+        from services.audit_store import AuditStore, AuditSync
+
+        sync = AuditSync(AuditStore(":memory:"), page_size=100)
+        sync.sync(
+            AuditFakeACI(
+                [
+                    _audit_log(1, user="alice", affected="uni/tn-Y/BD-web"),
+                    _audit_log(2, user="bob", affected="uni/tn-Y/ap-A/epg-E"),
+                    _audit_log(
+                        3,
+                        user="alice",
+                        affected="uni/tn-Z/BD-web",
+                        descr="BD web deleted",
+                        action="deletion",
+                    ),
+                    _audit_log(
+                        4,
+                        user="alice",
+                        affected="uni/tn-Y/BD-db",
+                        changeSet="arpFlood (Old: no, New: yes)",
+                    ),
+                ]
+            )
+        )
+        return sync
+
+    def _index(self, sync):
+        from services.audit_search import AuditSearchIndex
+
+        return AuditSearchIndex(sync.store.iter_all)
+
+    def test_subtree_and_user_intersection(self, sync) -> None:
+        result = self._index(sync).search(subtree="uni/tn-Y", user="alice")
+        assert [item["id"] for item in result["items"]] == ["4", "1"]
+
+    def test_token_search_over_descr_and_change_set(self, sync) -> None:
+        index = self._index(sync)
+        assert index.search(text="arpflood")["total"] == 1
+        assert index.search(text="web deleted", action="deletion")["total"] == 1
+
+    def test_time_range_uses_created_order(self, sync) -> None:
+        index = self._index(sync)
+        ts = {row["id"]: row["ts"] for row in sync.store.iter_all()}
+        result = index.search(subtree="uni/tn-Y", since=ts["2"], until=ts["4"])
+        assert [item["id"] for item in result["items"]] == ["2"]
+
+    def test_incremental_append_without_rebuild(self, sync) -> None:
+        index = self._index(sync)
+        index.search()
+        aci = AuditFakeACI([])
+        aci.logs.append(_audit_log(10, affected="uni/tn-Y/BD-new"))
+        index.add(sync.sync(aci))
+        assert not index._dirty
+        assert index.search(subtree="uni/tn-Y/BD-new")["total"] == 1
+
+
+# ============================================
+# TestAuditActivity — 요일 × 시간대 히스토그램
+# ============================================
+
+
+class TestAuditActivity:
+    """AuditHistogram 버킷 집계 / 증분 누적 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def sync(self):
+        from services.audit_store import AuditStore, AuditSync
+
+        sync = AuditSync(AuditStore(":memory:"), page_size=100)
+        # 2026-03-01 (일) 00:01, 09:00 / 2026-03-02 (월) 09:00
+        sync.sync(
+            AuditFakeACI(
+                [
+                    _audit_log(1, user="alice", affected="uni/tn-A/BD-x"),
+                    _audit_log(540, user="bob", affected="uni/tn-B/BD-y"),
+                    _audit_log(1980, user="alice", affected="uni/fabric/hintp"),
+                ]
+            )
+        )
+        return sync
+
+    def test_bucket_uses_created_offset(self) -> None:
+        from services.audit_histogram import bucket_of
+
+        # 2026-03-17 (화) 09:00 +09:00 — UTC로는 00:00이지만 APIC 현지 시각 기준
+        assert bucket_of("2026-03-17T09:00:00.000+09:00") == 1 * 24 + 9
+
+    def test_overall_user_and_tenant_buckets(self, sync) -> None:
+        from services.audit_histogram import AuditHistogram, NO_TENANT
+
+        data = AuditHistogram(sync.store.iter_all).snapshot()
+        assert data["total"] == 3
+        assert data["buckets"][6][0] == 1 and data["buckets"][6][9] == 1
+        assert data["buckets"][0][9] == 1
+        assert data["by_user"][0]["user"] == "alice"
+        assert data["by_user"][0]["total"] == 2
+        tenants = {row["tenant"]: row["total"] for row in data["by_tenant"]}
+        assert tenants == {"A": 1, "B": 1, NO_TENANT: 1}
+
+    def test_incremental_add_after_build(self, sync) -> None:
+        from services.audit_histogram import AuditHistogram
+
+        histogram = AuditHistogram(sync.store.iter_all)
+        histogram.snapshot()
+        aci = AuditFakeACI([])
+        aci.logs.append(_audit_log(2000, user="carol"))
+        histogram.add(sync.sync(aci))
+        data = histogram.snapshot(user="carol")
+        assert data["total"] == 4
+        assert [row["user"] for row in data["by_user"]] == ["carol"]
+
+    def test_activity_api_counts_each_record_once(self, sync) -> None:
+        import routers.audit as audit_router
+
+        aci = AuditFakeACI([])
+        with (
+            patch.object(audit_router, "_sync", sync),
+            patch.object(audit_router, "_histogram", None),
+        ):
+            assert audit_router.get_audit_activity(aci)["total"] == 3
+            aci.logs.append(_audit_log(3000))
+            assert audit_router.get_audit_activity(aci)["total"] == 4
+
+
 # ============================================
 # 테스트: Capacity Report API
 # ============================================
@@ -356,6 +1477,334 @@ class TestCapacityAPI:
         assert "nodes" in data
 
 
+# ============================================
+# TestCapacityResources — 다중 자원 용량 수집
+# ============================================
+
+
+def _capacity_mo(class_name: str, node: str, **attrs):
+    """eqptcapacity* 통계 imdata 1건"""
+    dn = f"topology/pod-1/node-{node}/sys/eqptcapacity/CD{class_name}"
+    return _mo(class_name, dn=dn, **attrs)
+
+
+class TestCapacityResources:
+    """collect_capacity 노드 × 자원 매트릭스 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def aci(self) -> FakeACI:
+        return FakeACI(
+            {
+                "fabricNode": [
+                    _mo(
+                        "fabricNode",
+                        dn="topology/pod-1/node-101",
+                        id="101",
+                        name="leaf-101",
+                    ),
+                    _mo(
+                        "fabricNode",
+                        dn="topology/pod-1/node-102",
+                        id="102",
+                        name="leaf-102",
+                    ),
+                ],
+                "eqptcapacityPolUsage5min": [
+                    _capacity_mo(
+                        "eqptcapacityPolUsage5min",
+                        "101",
+                        polUsageCum="900",
+                        polUsageCapCum="1000",
+                    ),
+                    _capacity_mo(
+                        "eqptcapacityPolUsage5min",
+                        "102",
+                        polUsageCum="100",
+                        polUsageCapCum="1000",
+                    ),
+                ],
+                "eqptcapacityL2Usage5min": [
+                    _capacity_mo(
+                        "eqptcapacityL2Usage5min",
+                        "102",
+                        localEpCum="300",
+                        localEpCapCum="1000",
+                    ),
+                    _capacity_mo(
+                        "eqptcapacityL2Usage5min",
+                        "102",
+                        localEpCum="200",
+                        localEpCapCum="1000",
+                    ),
+                ],
+                "eqptcapacityVlanUsage5min": [
+                    _capacity_mo(
+                        "eqptcapacityVlanUsage5min",
+                        "101",
+                        totalCum="0",
+                        totalCapCum="0",
+                    ),
+                ],
+                "eqptcapacityPrefixEntries5min": [
+                    _capacity_mo(
+                        "eqptcapacityPrefixEntries5min", "101", extNormalizedCum="42"
+                    ),
+                ],
+            }
+        )
+
+    def test_each_class_fetched_once(self, aci) -> None:
+        from services.capacity_collector import RESOURCES, collect_capacity
+
+        collect_capacity(aci)
+        fetched = sorted(name for name, _ in aci.calls)
+        expected = sorted(["fabricNode", *(r.class_name("5min") for r in RESOURCES)])
+        assert fetched == expected
+
+    def test_matrix_joins_node_names_and_sums_records(self, aci) -> None:
+        from services.capacity_collector import collect_capacity
+
+        data = collect_capacity(aci)
+        nodes = {n["id"]: n for n in data["nodes"]}
+        assert nodes["101"]["name"] == "leaf-101"
+        assert nodes["102"]["usage"]["l2_endpoint"]["percentage"] == 25.0
+        assert nodes["101"]["usage"]["lpm_prefix"]["percentage"] == 42.0
+        # capacity 0 (미지원) 자원은 제외
+        assert "vlan" not in nodes["101"]["usage"]
+
+    def test_top_per_resource_and_high_usage(self, aci) -> None:
+        from services.capacity_collector import collect_capacity
+
+        data = collect_capacity(aci, top=1)
+        assert [r["id"] for r in data["top"]["policy_cam"]] == ["101"]
+        assert data["top"]["multicast"] == []
+        assert [(r["id"], r["resource"]) for r in data["high_usage"]] == [
+            ("101", "policy_cam")
+        ]
+
+    def test_resources_api_clamps_top(self, client: TestClient, aci) -> None:
+        import routers.capacity as capacity_router
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch("main.aci", aci),
+            patch.object(capacity_router, "_resource_cache", TTLCache(ttl=300)),
+        ):
+            data = client.get("/api/capacity/resources?top=0").json()
+        assert len(data["top"]["policy_cam"]) == 1
+
+
+# ============================================
+# TestCapacityForecast — 용량 이력 / 소진 예상
+# ============================================
+
+
+class TestCapacityForecast:
+    """CapacityHistory / fit_series 테스트 (v1.11.0)"""
+
+    NOW = 1_800_000_000.0
+
+    @staticmethod
+    def _collected(pct_by_node: dict[str, float]) -> dict:
+        return {
+            "nodes": [
+                {
+                    "id": node,
+                    "name": f"leaf-{node}",
+                    "role": "leaf",
+                    "pod": "1",
+                    "usage": {"policy_cam": {"percentage": pct}},
+                }
+                for node, pct in pct_by_node.items()
+            ]
+        }
+
+    def test_fit_series_exact_line(self) -> None:
+        from services.capacity_forecast import fit_series
+
+        # 하루 2%p 증가, 현재 60% → 20일 후 100%
+        points = [(self.NOW - d * 86400, 60 - 2 * d) for d in range(5)]
+        fit = fit_series({"s": points}, self.NOW)["s"]
+        assert fit["current"] == 60.0
+        assert fit["slope_per_day"] == 2.0
+        assert fit["days_to_exhaustion"] == 20.0
+
+    def test_flat_or_short_series(self) -> None:
+        from services.capacity_forecast import fit_series
+
+        flat = [(self.NOW - h * 3600, 40.0) for h in range(5)]
+        result = fit_series({"flat": flat, "short": flat[:2]}, self.NOW)
+        assert result["flat"]["days_to_exhaustion"] is None
+        assert "short" not in result
+
+    def test_forecast_sorts_soonest_exhaustion_first(self) -> None:
+        from services.capacity_forecast import CapacityHistory
+
+        history = CapacityHistory()
+        for h in range(6, 0, -1):
+            ts = self.NOW - h * 3600
+            history.record(
+                self._collected(
+                    {"101": 50 + (6 - h), "102": 80 + 2 * (6 - h), "103": 30}
+                ),
+                ts,
+            )
+        rows = history.forecast(now=self.NOW)
+        assert [r["id"] for r in rows] == ["102", "101", "103"]
+        assert rows[0]["name"] == "leaf-102"
+        assert rows[-1]["days_to_exhaustion"] is None
+
+    def test_forecast_api_unknown_resource_returns_400(self, client) -> None:
+        response = client.get("/api/capacity/forecast?resource=bogus")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestCapacityIntervals — 통계 주기 선택 / 주기별 캐시
+# ============================================
+
+
+class TestCapacityIntervals:
+    """get_capacity_data / get_capacity_resources interval 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def capacity(self):
+        import routers.capacity as capacity_router
+        from services.capacity_forecast import CapacityHistory
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch.object(capacity_router, "_resource_cache", TTLCache(ttl=300)),
+            patch.object(capacity_router, "_capacity_history", CapacityHistory()),
+        ):
+            yield capacity_router
+
+    @staticmethod
+    def _aci(interval: str) -> FakeACI:
+        class_name = f"eqptcapacityPolUsage{interval}"
+        return FakeACI(
+            {
+                "fabricNode": [_mo("fabricNode", id="101", name="leaf-101")],
+                class_name: [
+                    _capacity_mo(
+                        class_name, "101", polUsageCum="850", polUsageCapCum="1000"
+                    )
+                ],
+            }
+        )
+
+    def test_interval_selects_stats_class(self, capacity) -> None:
+        data = capacity.get_capacity_data(self._aci("1d"), "1d")
+        assert data["interval"] == "1d"
+        assert data["tcam"][0]["percentage"] == 85.0
+        assert data["high_usage_count"] == 1
+
+    def test_result_cached_per_interval(self, capacity) -> None:
+        aci = self._aci("1h")
+        capacity.get_capacity_data(aci, "1h")
+        fetched = len(aci.calls)
+        capacity.get_capacity_data(aci, "1h")
+        capacity.get_capacity_resources(aci, interval="1h")
+        assert len(aci.calls) == fetched
+        capacity.get_capacity_data(aci, "15min")
+        assert ("eqptcapacityPolUsage15min", "") in aci.calls
+
+    def test_report_path_feeds_history_for_any_interval(self, capacity) -> None:
+        capacity.get_capacity_data(self._aci("1d"), "1d")
+        assert capacity._capacity_history.store.names() == ["capacity.101.policy_cam"]
+        points = capacity._capacity_history.history("101", "policy_cam")["points"]
+        assert points[0]["avg"] == 85.0
+
+    def test_history_skips_duplicate_and_empty_samples(self) -> None:
+        from services.capacity_forecast import MIN_RECORD_GAP, CapacityHistory
+
+        collected = TestCapacityForecast._collected({"101": 50.0})
+        history = CapacityHistory()
+        assert not history.record({"nodes": []}, 1000.0)
+        assert history.record(collected, 1000.0)
+        assert not history.record(collected, 1000.0 + MIN_RECORD_GAP - 1)
+        assert history.record(collected, 1000.0 + MIN_RECORD_GAP)
+
+    def test_failed_or_empty_collection_is_not_cached(self, capacity) -> None:
+        aci = self._aci("1d")
+        aci.failing.add("eqptcapacityL2Usage1d")
+        data = capacity.get_capacity_data(aci, "1d")
+        assert data["tcam"] == [] and capacity._capacity_history.store.names() == []
+        aci.failing.clear()
+        assert capacity.get_capacity_data(aci, "1d")["tcam"][0]["percentage"] == 85.0
+
+        empty = FakeACI()
+        assert capacity.get_capacity_data(empty, "1h")["tcam"] == []
+        fetched = len(empty.calls)
+        capacity.get_capacity_data(empty, "1h")
+        assert len(empty.calls) == 2 * fetched
+
+    def test_unknown_interval_returns_400(self, client) -> None:
+        from fastapi import HTTPException
+
+        import routers.capacity as capacity_router
+
+        with pytest.raises(HTTPException) as exc:
+            capacity_router.get_capacity_data(FakeACI(), "10min")
+        assert exc.value.status_code == 400
+        response = client.get("/api/capacity/resources?interval=10min")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestTTLCache — 키별 로드 lock / 실패·빈 결과 미저장
+# ============================================
+
+
+class TestTTLCache:
+    """TTLCache get_or_load 테스트 (v1.11.0)"""
+
+    def test_failed_and_empty_loads_are_not_stored(self) -> None:
+        from services.aci_client import APICRequestError
+        from services.ttl_cache import TTLCache
+
+        cache = TTLCache(ttl=60)
+
+        def fail():
+            raise APICRequestError("APIC unavailable")
+
+        with pytest.raises(APICRequestError):
+            cache.get_or_load("k", fail)
+        assert cache.get_or_load("k", lambda: []) == []
+        assert cache.get_or_load("k", lambda: [1]) == [1]
+        assert cache.get_or_load("k", lambda: [2]) == [1]
+
+    def test_same_key_loads_once_other_keys_not_blocked(self) -> None:
+        import threading
+
+        from services.ttl_cache import TTLCache
+
+        cache = TTLCache(ttl=60)
+        started, release = threading.Event(), threading.Event()
+        calls: list[str] = []
+
+        def slow():
+            calls.append("slow")
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        threads = [
+            threading.Thread(target=cache.get_or_load, args=("slow", slow))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        # 다른 키는 느린 로드가 끝나기 전에 반환
+        assert cache.get_or_load("fast", lambda: "fast") == "fast"
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert calls == ["slow"]
+        assert cache.get("slow") == "slow"
+
+
 # ============================================
 # 테스트: Topology Viewer API
 # ============================================
@@ -373,6 +1822,505 @@ class TestTopologyAPI:
         assert "leaves" in data
 
 
+# ============================================
+# TestTopologyGraph — fabricLink / lldpAdjEp 그래프
+# ============================================
+
+
+def _fabric_node(node_id: str, role: str, pod: str = "1", **attrs):
+    return _mo(
+        "fabricNode",
+        dn=f"topology/pod-{pod}/node-{node_id}",
+        id=node_id,
+        name=attrs.pop("name", f"{role}-{node_id}"),
+        role=role,
+        fabricSt=attrs.pop("fabricSt", "active"),
+        **attrs,
+    )
+
+
+def _fabric_link(n1: str, p1: str, n2: str, p2: str, state: str = "ok"):
+    return _mo(
+        "fabricLink",
+        dn=f"topology/pod-1/lnkcnt-{n2}/lnk-{n1}-1-{p1}-to-{n2}-1-{p2}",
+        n1=n1,
+        s1="1",
+        p1=p1,
+        n2=n2,
+        s2="1",
+        p2=p2,
+        linkState=state,
+    )
+
+
+def _lldp_adj(node: str, iface: str, sys_name: str, port: str = "Gi0/1"):
+    return _mo(
+        "lldpAdjEp",
+        dn=f"topology/pod-1/node-{node}/sys/lldp/inst/if-[{iface}]/adj-1",
+        sysName=sys_name,
+        portIdV=port,
+        mgmtIp="192.0.2.1",
+    )
+
+
+def _topology_aci() -> FakeACI:
+    """spine 201/202 × leaf 101/102/103 (103–202 링크 down) + 외부 라우터 2개 leaf 연결"""
+    links = []
+    for leaf in ("101", "102", "103"):
+        for spine, port in (("201", leaf[-1]), ("202", leaf[-1])):
+            state = "fail" if (leaf, spine) == ("103", "202") else "ok"
+            # 양 끝에서 각각 보고
+            links.append(_fabric_link(leaf, f"4{spine[-1]}", spine, port, state))
+            links.append(_fabric_link(spine, port, leaf, f"4{spine[-1]}", state))
+    return FakeACI(
+        {
+            "fabricNode": [
+                _fabric_node("1", "controller", name="apic1", fabricSt=""),
+                *(_fabric_node(n, "spine") for n in ("201", "202")),
+                *(_fabric_node(n, "leaf") for n in ("101", "102", "103")),
+            ],
+            "fabricLink": links,
+            "lldpAdjEp": [
+                _lldp_adj("101", "eth1/48", "core-rtr"),
+                _lldp_adj("102", "eth1/48", "core-rtr", port="Gi0/2"),
+                _lldp_adj("101", "eth1/1", "apic1", port="eth2-1"),
+                _lldp_adj("101", "eth1/41", "spine-201", port="eth1/1"),
+            ],
+        }
+    )
+
+
+class TestTopologyGraph:
+    """build_topology_graph / TopologyGraph 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def graph(self):
+        from services.topology_graph import build_topology_graph
+
+        data = _topology_aci().data
+        return build_topology_graph(
+            data["fabricNode"], data["fabricLink"], data["lldpAdjEp"]
+        )
+
+    def test_links_deduplicated_and_external_added(self, graph) -> None:
+        summary = graph.to_dict()["summary"]
+        # fabric 6 + 외부 2 + APIC 1 (spine-201 LLDP는 fabricLink와 중복)
+        assert summary["links"] == 9
+        assert summary["links_down"] == 1
+        assert summary["external"] == 1
+        assert graph.degree("ext:core-rtr") == 2
+
+    def test_neighbors_report_local_and_remote_ports(self, graph) -> None:
+        neighbors = {n["id"]: n for n in graph.neighbors("101")}
+        assert set(neighbors) == {"1", "201", "202", "ext:core-rtr"}
+        link = neighbors["201"]["links"][0]
+        assert (link["local_port"], link["remote_port"]) == ("eth1/41", "eth1/1")
+        assert neighbors["ext:core-rtr"]["links"][0]["kind"] == "external"
+
+    def test_shortest_path_skips_down_links_and_external_transit(self, graph) -> None:
+        assert graph.shortest_path("101", "102") in (
+            ["101", "201", "102"],
+            ["101", "202", "102"],
+        )
+        assert graph.shortest_path("103", "202") == ["103", "201", "101", "202"]
+        # 외부 라우터 / APIC 경유 경로는 사용하지 않음
+        assert graph.shortest_path("101", "102", avoid={"201", "202"}) is None
+
+    def test_topology_data_built_from_cached_graph(self) -> None:
+        import routers.topology as topology_router
+        from services.ttl_cache import TTLCache
+
+        aci = _topology_aci()
+        with patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)):
+            data = topology_router.get_topology_data(aci)
+            topology_router.get_topology_neighbors(aci, "101")
+            topology_router.get_topology_path(aci, "101", "103")
+        assert data["summary"]["spines"] == 2 and data["summary"]["links"] == 9
+        assert [n["id"] for n in data["leafs"]] == ["101", "102", "103"]
+        assert sorted(name for name, _ in aci.calls) == sorted(
+            ["fabricNode", "fabricLink", "lldpAdjEp"]
+        )
+
+    def test_neighbors_api_unknown_node_returns_400(self, client) -> None:
+        import routers.topology as topology_router
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch("main.aci", _topology_aci()),
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+        ):
+            response = client.get("/api/topology/neighbors?node=999")
+        assert response.status_code == 400
+
+
+# ============================================
+# TestTopologyDiff — 스냅샷 버전 / delta
+# ============================================
+
+
+class TestTopologyDiff:
+    """TopologySnapshotStore diff / since delta 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _graph(drop_node: str = "", link_state: str = "ok", extra_leaf: str = ""):
+        from services.topology_graph import build_topology_graph
+
+        data = _topology_aci().data
+        nodes = [
+            n
+            for n in data["fabricNode"]
+            if n["fabricNode"]["attributes"]["id"] != drop_node
+        ]
+        if extra_leaf:
+            nodes.append(_fabric_node(extra_leaf, "leaf"))
+        links = [
+            link
+            for link in data["fabricLink"]
+            if drop_node
+            not in (
+                link["fabricLink"]["attributes"]["n1"],
+                link["fabricLink"]["attributes"]["n2"],
+            )
+        ]
+        links.append(_fabric_link("101", "45", "201", "9", link_state))
+        return build_topology_graph(nodes, links, [])
+
+    def test_baseline_and_unchanged_keep_version(self) -> None:
+        from services.topology_diff import TopologySnapshotStore
+
+        store = TopologySnapshotStore()
+        assert store.apply(self._graph()) is None
+        assert store.apply(self._graph()) is None
+        assert store.version == 1
+
+    def test_link_down_is_link_change_only(self) -> None:
+        from services.topology_diff import TopologySnapshotStore
+
+        store = TopologySnapshotStore()
+        store.apply(self._graph())
+        event = store.apply(self._graph(link_state="fail"))
+        assert store.version == 2
+        assert event["links"]["changed"] == [
+            {"a": "101", "a_port": "eth1/45", "b": "201", "b_port": "eth1/9"}
+        ]
+        assert event["nodes"] == {"added": [], "removed": [], "changed": []}
+
+    def test_delta_merges_net_changes(self) -> None:
+        from services.topology_diff import TopologySnapshotStore
+
+        store = TopologySnapshotStore()
+        store.apply(self._graph())
+        store.apply(self._graph(drop_node="103", extra_leaf="104"))  # v2
+        store.apply(self._graph(extra_leaf="104"))  # v3: 103 복귀
+        store.apply(self._graph())  # v4: 104 제거
+        delta = store.delta(1)
+        # 103 제거 후 복귀 = 변경, 104 추가 후 제거 = 없음
+        assert [n["id"] for n in delta["nodes"]["changed"]] == ["103"]
+        assert delta["nodes"]["added"] == [] and delta["nodes"]["removed"] == []
+        assert store.delta(3)["nodes"]["removed"] == ["104"]
+        assert store.delta(4)["links"] == {"added": [], "removed": [], "changed": []}
+
+    def test_since_out_of_range_returns_full_payload(self) -> None:
+        from services.topology_diff import TopologySnapshotStore
+
+        store = TopologySnapshotStore(max_history=1)
+        store.apply(self._graph())
+        store.apply(self._graph(link_state="fail"))
+        store.apply(self._graph())
+        assert store.delta(1)["full"] is True
+        assert len(store.delta(1)["nodes"]) == 6
+        assert store.delta(2)["full"] is False
+
+    def test_graph_api_since_returns_delta(self, client) -> None:
+        import routers.topology as topology_router
+        from services.topology_diff import TopologySnapshotStore
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch("main.aci", _topology_aci()),
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+            patch.object(topology_router, "_snapshots", TopologySnapshotStore()),
+        ):
+            full = client.get("/api/topology/graph").json()
+            delta = client.get(f"/api/topology/graph?since={full['version']}").json()
+        assert full["version"] == 1 and len(full["links"]) == 9
+        assert delta["full"] is False
+        assert delta["nodes"] == {"added": [], "removed": [], "changed": []}
+
+    def test_failed_or_empty_fetch_keeps_snapshot(self) -> None:
+        import routers.topology as topology_router
+        from services.topology_diff import TopologySnapshotStore
+        from services.ttl_cache import TTLCache
+
+        aci = _topology_aci()
+        snapshots = TopologySnapshotStore()
+        # ttl=0: 매 호출 재수집
+        with (
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=0)),
+            patch.object(topology_router, "_snapshots", snapshots),
+        ):
+            graph = topology_router._get_graph(aci)
+            aci.failing.add("fabricLink")
+            assert topology_router._get_graph(aci) is graph
+            aci.failing.clear()
+            aci.data["fabricNode"] = []
+            assert topology_router._get_graph(aci) is graph
+        assert snapshots.version == 1 and snapshots.structure_version == 1
+        assert len(snapshots.snapshot()["nodes"]) == len(graph.nodes)
+
+
+# ============================================
+# TestTopologyLayout — 계층형 레이아웃 / 구성 버전 캐시
+# ============================================
+
+
+class TestTopologyLayout:
+    """compute_layout / LayoutCache / /api/topology/layout 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def graph(self):
+        from services.topology_graph import build_topology_graph
+
+        data = _topology_aci().data
+        return build_topology_graph(
+            data["fabricNode"], data["fabricLink"], data["lldpAdjEp"]
+        )
+
+    def test_layers_top_to_bottom(self, graph) -> None:
+        from services.topology_layout import compute_layout
+
+        layout = compute_layout(graph)
+        pos = layout["positions"]
+        assert [layer["name"] for layer in layout["layers"]] == [
+            "controller",
+            "spine",
+            "leaf",
+            "external",
+        ]
+        assert pos["1"][1] < pos["201"][1] < pos["101"][1] < pos["ext:core-rtr"][1]
+        assert set(pos) == set(graph.nodes)
+        assert all(0 < x < layout["width"] for x, _ in pos.values())
+
+    def test_crossings_minimized(self) -> None:
+        from services.topology_graph import build_topology_graph
+        from services.topology_layout import compute_layout
+
+        nodes = [_fabric_node(n, "leaf") for n in ("101", "102")]
+        lldp = [
+            _lldp_adj("101", "eth1/48", "rtr-b"),
+            _lldp_adj("102", "eth1/48", "rtr-a"),
+        ]
+        graph = build_topology_graph(nodes, [], lldp)
+        # 초기 배치(ID / 이름순)는 rtr-a ↔ 102, rtr-b ↔ 101 교차 1개
+        assert compute_layout(graph, max_sweeps=0)["crossings"] == 1
+        layout = compute_layout(graph)
+        pos = layout["positions"]
+        assert layout["crossings"] == 0
+        assert pos["ext:rtr-b"][0] < pos["ext:rtr-a"][0]
+
+    def test_pods_get_separate_bands(self) -> None:
+        from services.topology_graph import build_topology_graph
+        from services.topology_layout import compute_layout
+
+        nodes = [
+            _fabric_node("101", "leaf", pod="1"),
+            _fabric_node("201", "leaf", pod="2"),
+            _fabric_node("202", "leaf", pod="2"),
+        ]
+        layout = compute_layout(build_topology_graph(nodes, [], []))
+        pods = {p["pod"]: p for p in layout["pods"]}
+        assert pods["1"]["x"] + pods["1"]["width"] < pods["2"]["x"]
+        assert layout["positions"]["101"][0] < layout["positions"]["201"][0]
+
+    def test_cache_recomputes_only_on_structure_change(self) -> None:
+        from services.topology_diff import TopologySnapshotStore
+        from services.topology_layout import LayoutCache
+
+        graphs = TestTopologyDiff  # 동일 토폴로지 변형 그래프 재사용
+        store, cache = TopologySnapshotStore(), LayoutCache()
+        store.apply(graphs._graph())
+        first = cache.get(store.structure_version, graphs._graph())
+        # 링크 상태 변경 → 버전 증가, 구성 버전 유지 → 캐시 재사용
+        store.apply(graphs._graph(link_state="fail"))
+        assert store.version == 2 and store.structure_version == 1
+        assert cache.get(store.structure_version, graphs._graph()) is first
+        # 노드 추가 → 재계산
+        graph = graphs._graph(extra_leaf="104")
+        store.apply(graph)
+        assert store.structure_version == 3
+        assert "104" in cache.get(store.structure_version, graph)["positions"]
+
+    def test_layout_api_returns_positions_with_status(self, client) -> None:
+        import routers.topology as topology_router
+        from services.topology_diff import TopologySnapshotStore
+        from services.topology_layout import LayoutCache
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch("main.aci", _topology_aci()),
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+            patch.object(topology_router, "_snapshots", TopologySnapshotStore()),
+            patch.object(topology_router, "_layouts", LayoutCache()),
+        ):
+            data = client.get("/api/topology/layout").json()
+        nodes = {n["id"]: n for n in data["nodes"]}
+        assert data["version"] == data["layout_version"] == 1
+        assert nodes["103"]["status"] == "UP" and "x" in nodes["103"]
+        assert len(data["links"]) == 9
+        # 링크는 graph?since delta와 같은 키(양 끝 포트)를 포함 — 클라이언트 증분 반영
+        assert {"a", "a_port", "b", "b_port", "state"} <= set(data["links"][0])
+
+
+# ============================================
+# TestTopologyAnalysis — 이중화 / 단일 장애점 / 영향 범위
+# ============================================
+
+
+class TestTopologyAnalysis:
+    """TopologyAnalysis / /api/topology/redundancy, impact 테스트 (v1.11.0)"""
+
+    @pytest.fixture()
+    def analysis(self):
+        from services.topology_analysis import TopologyAnalysis
+        from services.topology_graph import build_topology_graph
+
+        data = _topology_aci().data
+        return TopologyAnalysis(
+            build_topology_graph(
+                data["fabricNode"], data["fabricLink"], data["lldpAdjEp"]
+            )
+        )
+
+    @pytest.fixture()
+    def endpoints(self):
+        from services.endpoint_index import EndpointIndex
+
+        pairs = [
+            _endpoint_imdata("T1", "web", "00:00:00:00:00:01", "103", "eth1/1"),
+            _endpoint_imdata("T1", "web", "00:00:00:00:00:02", "103", "eth1/2"),
+            _endpoint_imdata("T2", "db", "00:00:00:00:00:03", "103", "eth1/3"),
+            _endpoint_imdata("T1", "web", "00:00:00:00:00:04", "101", "eth1/1"),
+        ]
+        index = EndpointIndex()
+        index.refresh([p[0] for p in pairs], [p[1] for p in pairs])
+        return index
+
+    def test_articulation_points(self) -> None:
+        from services.topology_analysis import articulation_points
+
+        chain = {"a": {"b"}, "b": {"a", "c"}, "c": {"b", "d"}, "d": {"c"}}
+        assert articulation_points(chain) == {"b", "c"}
+        ring = {"a": {"b", "c"}, "b": {"a", "c"}, "c": {"a", "b"}}
+        assert articulation_points(ring) == set()
+
+    def test_redundancy_and_spof(self, analysis) -> None:
+        # 103–202 링크 down → 103은 Spine 1개에만 연결
+        assert analysis.redundancy == {"101": 2, "102": 2, "103": 1}
+        spof = {item["id"]: item for item in analysis.spof}
+        assert spof["201"]["isolated"] == ["103"]
+        # APIC은 101에만 연결, 외부 라우터는 101 / 102 이중 연결
+        assert spof["101"]["detached"] == ["1"]
+        assert set(spof) == {"101", "201"}
+
+    def test_blast_radius_spine_and_multi_failure(self, analysis) -> None:
+        radius = analysis.blast_radius(["202"])
+        assert radius["isolated"] == [] and radius["detached"] == []
+        assert [(d["id"], d["before"], d["after"]) for d in radius["degraded"]] == [
+            ("101", 2, 1),
+            ("102", 2, 1),
+        ]
+        both = analysis.blast_radius(["201", "202"])
+        assert both["isolated"] == ["101", "102", "103"]
+        assert both["detached"] == ["1", "ext:core-rtr"]
+
+    def test_impact_joins_endpoint_index(self, endpoints) -> None:
+        import routers.topology as topology_router
+        from services.topology_analysis import AnalysisCache
+        from services.topology_diff import TopologySnapshotStore
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+            patch.object(topology_router, "_snapshots", TopologySnapshotStore()),
+            patch.object(topology_router, "_analyses", AnalysisCache()),
+        ):
+            aci = _topology_aci()
+            impact = topology_router.get_topology_impact(aci, "201", endpoints)
+            redundancy = topology_router.get_topology_redundancy(aci, endpoints)
+        assert [n["id"] for n in impact["isolated"]] == ["103"]
+        assert impact["endpoints"] == {"impacted": 3, "at_risk": 1}
+        assert impact["epgs"]["items"][0] == {
+            "tenant": "T1",
+            "epg": "web",
+            "endpoints": 2,
+        }
+        assert impact["epgs"]["total"] == 2
+        assert redundancy["leaves"][0]["id"] == "103"
+        assert redundancy["summary"]["single_homed"] == 1
+        spof = {item["id"]: item for item in redundancy["spof"]}
+        assert spof["201"]["endpoints"] == 3
+
+    def test_vpc_endpoint_impacted_only_when_both_leaves_fail(self) -> None:
+        import routers.topology as topology_router
+        from services.dn_utils import parse_path_nodes
+        from services.endpoint_index import EndpointIndex
+        from services.topology_analysis import AnalysisCache, endpoint_counts
+        from services.topology_diff import TopologySnapshotStore
+        from services.ttl_cache import TTLCache
+
+        assert parse_path_nodes("topology/pod-1/protpaths-101-102/pathep-[vpc-pg]") == (
+            "101",
+            "102",
+        )
+        vpc_dn = "uni/tn-T1/ap-App/epg-app/cep-00:00:00:00:00:10"
+        tdn = "topology/pod-1/protpaths-101-102/pathep-[vpc-pg]"
+        single = _endpoint_imdata("T1", "web", "00:00:00:00:00:11", "102", "eth1/1")
+        index = EndpointIndex()
+        index.refresh(
+            [_mo("fvCEp", dn=vpc_dn, mac="00:00:00:00:00:10", ip=""), single[0]],
+            [
+                _mo("fvRsCEpToPathEp", dn=f"{vpc_dn}/rscEpToPathEp-[{tdn}]", tDn=tdn),
+                single[1],
+            ],
+        )
+        assert endpoint_counts(index) == {"101": 1, "102": 2}
+
+        def impacted(nodes: str) -> int:
+            with (
+                patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+                patch.object(topology_router, "_snapshots", TopologySnapshotStore()),
+                patch.object(topology_router, "_analyses", AnalysisCache()),
+            ):
+                result = topology_router.get_topology_impact(
+                    _topology_aci(), nodes, index
+                )
+            return result["endpoints"]["impacted"]
+
+        # 한쪽 Leaf 장애 → vPC Endpoint는 peer Leaf로 계속 연결
+        assert impacted("101") == 0
+        assert impacted("102") == 1
+        assert impacted("101,102") == 2
+
+    def test_impact_api_and_path_avoid(self, client, endpoints) -> None:
+        import routers.topology as topology_router
+        from services.topology_analysis import AnalysisCache
+        from services.ttl_cache import TTLCache
+
+        with (
+            patch("main.aci", _topology_aci()),
+            patch("main.get_endpoint_index", return_value=endpoints),
+            patch.object(topology_router, "_graph_cache", TTLCache(ttl=30)),
+            patch.object(topology_router, "_analyses", AnalysisCache()),
+        ):
+            ok = client.get("/api/topology/impact?node=202")
+            bad = client.get("/api/topology/impact?node=999")
+            path = client.get("/api/topology/path?src=101&dst=102&avoid=201").json()
+        assert ok.status_code == 200
+        assert ok.json()["endpoints"] == {"impacted": 0, "at_risk": 1}
+        assert bad.status_code == 400
+        assert [n["id"] for n in path["path"]] == ["101", "202", "102"]
+
+
 # ============================================
 # 테스트: All-in-One API
 # ============================================
@@ -667,6 +2615,581 @@ class TestLinterUploadAPI:
             assert result["category"] in ("Security", "BestPractice", "Naming")
 
 
+# ============================================
+# TestLinterDnIndex — 부모 DN 인덱스 (포함 관계 규칙)
+# ============================================
+
+
+class TestLinterDnIndex:
+    """DnIndex / CollectedData.has_child 및 규칙 결과 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _data(**objects):
+        from services.linter_engine import CollectedData
+
+        return CollectedData(objects={k: list(v) for k, v in objects.items()})
+
+    def test_has_child_matches_descendants_only(self) -> None:
+        data = self._data(
+            vzSubj=[{"dn": "uni/tn-T1/brc-A/subj-s1"}],
+            vzRsSubjFiltAtt=[{"dn": "uni/tn-T1/brc-A/subj-s1/rssubjFiltAtt-f"}],
+        )
+        assert data.has_child("uni/tn-T1/brc-A", "vzSubj")
+        # 하위(자손) 전체 기준 — 손자도 포함
+        assert data.has_child("uni/tn-T1/brc-A", "vzRsSubjFiltAtt")
+        # 이름 접두가 같은 형제 / 자기 자신 / 빈 DN은 불일치
+        assert not data.has_child("uni/tn-T1/brc-AB", "vzSubj")
+        assert not data.has_child("uni/tn-T1/brc-A/subj-s1", "vzSubj")
+        assert not data.has_child("", "vzSubj")
+
+    def test_bracket_rn_is_not_split(self) -> None:
+        data = self._data(fvSubnet=[{"dn": "uni/tn-T1/BD-b1/subnet-[10.0.0.1/24]"}])
+        assert data.has_child("uni/tn-T1/BD-b1", "fvSubnet")
+        assert not data.has_child("uni/tn-T1/BD-b1/subnet-[10.0.0.1", "fvSubnet")
+
+    def test_index_built_once_and_rebuilt_on_replace(self) -> None:
+        data = self._data(fvRsBd=[{"dn": "uni/tn-T1/ap-A/epg-E1/rsbd"}])
+        first = data.index.parents_of("fvRsBd")
+        assert data.index.parents_of("fvRsBd") is first
+        data.objects = {"fvRsBd": []}
+        assert not data.has_child("uni/tn-T1/ap-A/epg-E1", "fvRsBd")
+
+    def test_containment_rules_use_index(self) -> None:
+        from services.linter_engine import RuleEngine
+
+        data = self._data(
+            fvAEPg=[
+                {"dn": "uni/tn-T1/ap-A/epg-E1", "name": "E1"},
+                {"dn": "uni/tn-T1/ap-A/epg-E10", "name": "E10"},
+            ],
+            fvRsBd=[{"dn": "uni/tn-T1/ap-A/epg-E10/rsbd"}],
+            fvRsCons=[{"dn": "uni/tn-T1/ap-A/epg-E1/rscons-c"}],
+            fvBD=[{"dn": "uni/tn-T1/BD-b1", "name": "b1"}],
+            fvSubnet=[{"dn": "uni/tn-T1/BD-b1/subnet-[10.0.0.1/24]"}],
+        )
+        found = {(i.rule_id, i.dn) for i in RuleEngine().run_all(data)}
+        assert found == {
+            ("BP-001", "uni/tn-T1/ap-A/epg-E1"),
+            ("BP-002", "uni/tn-T1/ap-A/epg-E10"),
+        }
+
+
+# ============================================
+# TestLinterIncremental — 증분 lint (변경 오브젝트만 재평가)
+# ============================================
+
+
+class TestLinterIncremental:
+    """IncrementalLinter 영향 범위 / 전체 실행 동일성 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _objects(epgs: int = 3) -> dict[str, list[dict]]:
+        return {
+            "fvAEPg": [
+                {"dn": f"uni/tn-T1/ap-A/epg-E{i}", "name": f"E{i}"} for i in range(epgs)
+            ],
+            "fvRsBd": [{"dn": f"uni/tn-T1/ap-A/epg-E{i}/rsbd"} for i in range(epgs)],
+            "fvRsCons": [
+                {"dn": f"uni/tn-T1/ap-A/epg-E{i}/rscons-c"} for i in range(epgs)
+            ],
+            "vzBrCP": [{"dn": "uni/tn-T1/brc-c", "name": "c"}],
+            "vzSubj": [{"dn": "uni/tn-T1/brc-c/subj-s"}],
+            "vzRsSubjFiltAtt": [{"dn": "uni/tn-T1/brc-c/subj-s/rssubjFiltAtt-f"}],
+        }
+
+    @staticmethod
+    def _data(objects: dict[str, list[dict]]):
+        from services.linter_engine import CollectedData
+
+        return CollectedData(objects={k: list(v) for k, v in objects.items()})
+
+    @staticmethod
+    def _keys(issues) -> set[tuple[str, str]]:
+        return {(i.rule_id, i.dn) for i in issues}
+
+    def _assert_same_as_full(self, issues, objects) -> None:
+        from services.linter_engine import RuleEngine
+
+        full = RuleEngine().run_all(self._data(objects))
+        assert self._keys(issues) == self._keys(full)
+
+    def test_first_run_is_full_and_unchanged_is_noop(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_incremental import IncrementalLinter
+
+        engine, linter = RuleEngine(), IncrementalLinter()
+        objects = self._objects()
+        linter.run(engine, self._data(objects))
+        assert linter.last_run["mode"] == "full"
+        issues = linter.run(engine, self._data(objects))
+        assert linter.last_run["mode"] == "incremental"
+        assert linter.last_run["changed_objects"] == 0
+        assert linter.last_run["evaluated"] == 0
+        self._assert_same_as_full(issues, objects)
+
+    def test_changed_object_only_reevaluated(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_incremental import IncrementalLinter
+
+        engine, linter = RuleEngine(), IncrementalLinter()
+        objects = self._objects(50)
+        linter.run(engine, self._data(objects))
+        objects["fvAEPg"][7] = {"dn": "uni/tn-T1/ap-A/epg-E7", "name": "bad name"}
+        issues = linter.run(engine, self._data(objects))
+        # 이름 변경 EPG 1개 × EPG 대상 규칙 (BP-001 / BP-002 / NM-001 / NM-002)
+        assert linter.last_run["changed_objects"] == 1
+        assert linter.last_run["evaluated"] == 4
+        assert ("NM-001", "uni/tn-T1/ap-A/epg-E7") in self._keys(issues)
+        self._assert_same_as_full(issues, objects)
+
+    def test_child_change_reevaluates_parent(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_incremental import IncrementalLinter
+
+        engine, linter = RuleEngine(), IncrementalLinter()
+        objects = self._objects()
+        linter.run(engine, self._data(objects))
+        objects["fvRsBd"] = objects["fvRsBd"][1:]
+        objects["vzRsSubjFiltAtt"] = []
+        issues = linter.run(engine, self._data(objects))
+        keys = self._keys(issues)
+        assert ("BP-001", "uni/tn-T1/ap-A/epg-E0") in keys
+        assert ("SEC-003", "uni/tn-T1/brc-c/subj-s") in keys
+        self._assert_same_as_full(issues, objects)
+
+        # 하위 오브젝트 복원 → 이슈 해제
+        issues = linter.run(engine, self._data(self._objects()))
+        self._assert_same_as_full(issues, self._objects())
+
+    def test_removed_object_drops_issues(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_incremental import IncrementalLinter
+
+        engine, linter = RuleEngine(), IncrementalLinter()
+        objects = self._objects()
+        objects["fvAEPg"].append({"dn": "uni/tn-T1/ap-A/epg-X", "name": "x y"})
+        issues = linter.run(engine, self._data(objects))
+        assert any(dn == "uni/tn-T1/ap-A/epg-X" for _, dn in self._keys(issues))
+        issues = linter.apply(engine, [("fvAEPg", "uni/tn-T1/ap-A/epg-X", None)])
+        assert all(dn != "uni/tn-T1/ap-A/epg-X" for _, dn in self._keys(issues))
+        self._assert_same_as_full(issues, self._objects())
+
+    def test_live_api_incremental_mode(self, client: TestClient) -> None:
+        from routers import linter as linter_router
+        from services.linter_incremental import IncrementalLinter
+
+        aci = FakeACI(
+            {
+                cls: [_mo(cls, **attrs) for attrs in items]
+                for cls, items in self._objects().items()
+            }
+        )
+        with (
+            patch("main.aci", aci),
+            patch.object(linter_router, "_live_linter", IncrementalLinter()),
+        ):
+            first = client.get("/api/lint?incremental=true").json()
+            second = client.get("/api/lint?incremental=true").json()
+            plain = client.get("/api/lint").json()
+        assert first["incremental"]["mode"] == "full"
+        assert second["incremental"]["mode"] == "incremental"
+        assert "incremental" not in plain
+        assert second["total_issues"] == plain["total_issues"]
+
+
+# ============================================
+# TestLinterCustomRules — 사용자 정의 선언형 규칙
+# ============================================
+
+
+class TestLinterCustomRules:
+    """RulePlan 컴파일 / 공유 조건 / 평가 / 설정 로드 테스트 (v1.11.0)"""
+
+    RULES_YAML = """
+- id: CUS-001
+  class: fvBD
+  severity: critical
+  where: {dn: {prefix: "uni/tn-T1/"}}
+  require: {unicastRoute: no}
+- id: CUS-002
+  class: fvBD
+  where: {dn: {prefix: "uni/tn-T1/"}}
+  children: [fvSubnet]
+- id: CUS-003
+  class: [fvAEPg, fvBD]
+  require: {descr: {empty: false}}
+  message: "{class} {name} needs a description"
+- id: CUS-004
+  class: fvAEPg
+  no_children: fvRsIntraEpg
+"""
+
+    @staticmethod
+    def _data(**objects):
+        from services.linter_engine import CollectedData
+
+        return CollectedData(objects={k: list(v) for k, v in objects.items()})
+
+    def _plan(self):
+        import yaml
+
+        from services.linter_rules import RulePlan
+
+        return RulePlan(yaml.safe_load(self.RULES_YAML))
+
+    def test_compile_shares_conditions(self) -> None:
+        plan = self._plan()
+        assert plan.errors == []
+        assert plan.rule_ids == ["CUS-001", "CUS-002", "CUS-003", "CUS-004"]
+        assert plan.classes == ("fvBD", "fvAEPg")
+        assert set(plan.child_classes) == {"fvSubnet", "fvRsIntraEpg"}
+        # fvBD: dn prefix (공유) + unicastRoute + descr / fvAEPg: descr
+        assert plan.slot_count == 4
+
+    def test_evaluate_single_pass(self) -> None:
+        from services.linter_engine import RuleEngine
+
+        data = self._data(
+            fvBD=[
+                {"dn": "uni/tn-T1/BD-a", "name": "a", "unicastRoute": "yes"},
+                {
+                    "dn": "uni/tn-T1/BD-b",
+                    "name": "b",
+                    "unicastRoute": "no",
+                    "descr": "x",
+                },
+                {
+                    "dn": "uni/tn-T2/BD-c",
+                    "name": "c",
+                    "unicastRoute": "yes",
+                    "descr": "y",
+                },
+            ],
+            fvSubnet=[{"dn": "uni/tn-T1/BD-b/subnet-[10.0.0.1/24]"}],
+            fvAEPg=[{"dn": "uni/tn-T1/ap-A/epg-E1", "name": "E1", "descr": "web"}],
+            fvRsIntraEpg=[{"dn": "uni/tn-T1/ap-A/epg-E1/rsintraEpg-c"}],
+        )
+        issues = RuleEngine(custom_rules=self._plan()).check_custom_rules(data)
+        found = {(i.rule_id, i.dn) for i in issues}
+        assert found == {
+            ("CUS-001", "uni/tn-T1/BD-a"),
+            ("CUS-002", "uni/tn-T1/BD-a"),
+            ("CUS-003", "uni/tn-T1/BD-a"),
+            ("CUS-004", "uni/tn-T1/ap-A/epg-E1"),
+        }
+        by_id = {i.rule_id: i for i in issues}
+        assert by_id["CUS-001"].severity == "critical"
+        assert by_id["CUS-003"].category == "Custom"
+        assert by_id["CUS-003"].message == "fvBD a needs a description"
+        assert "unicastRoute eq 'no'" in by_id["CUS-001"].message
+
+    def test_invalid_definitions_skipped(self) -> None:
+        from services.linter_rules import RulePlan
+
+        plan = RulePlan(
+            [
+                {"id": "OK-1", "class": "fvBD", "children": ["fvSubnet"]},
+                {"id": "OK-1", "class": "fvBD", "children": ["fvSubnet"]},
+                {"id": "BAD-1", "class": "fvBD", "require": {"name": {"like": "x"}}},
+                {"id": "BAD-2", "class": "fvBD", "require": {"name": {"regex": "("}}},
+                {"id": "BAD-3", "class": "fvBD", "severity": "info", "children": "x"},
+                {"id": "BAD-4", "class": "fvBD"},
+                "not-a-rule",
+            ]
+        )
+        assert plan.rule_ids == ["OK-1"]
+        assert [e.split(":")[0] for e in plan.errors] == [
+            "OK-1",
+            "BAD-1",
+            "BAD-2",
+            "BAD-3",
+            "BAD-4",
+            "#7",
+        ]
+
+    def test_service_loads_rules_file(self, tmp_path) -> None:
+        import json
+
+        from services.linter_engine import LinterService
+
+        (tmp_path / "rules.json").write_text(
+            json.dumps(
+                {
+                    "rules": [
+                        {
+                            "id": "CUS-010",
+                            "class": "fvTenant",
+                            "require": {"descr": {"ne": ""}},
+                        }
+                    ]
+                }
+            )
+        )
+        (tmp_path / "config.yaml").write_text(
+            "linter:\n"
+            "  rules_file: rules.json\n"
+            "  rules:\n"
+            "    - {id: CUS-011, class: fvTenant, severity: fatal, children: [fvAp]}\n"
+        )
+        service = LinterService(config_path=str(tmp_path / "config.yaml"))
+        result = service.run_from_file(
+            {"imdata": [_mo("fvTenant", dn="uni/tn-T1", name="T1", descr="")]}
+        )
+        assert [r["rule_id"] for r in result["results"]] == ["CUS-010"]
+        assert result["rule_errors"][0].startswith("CUS-011")
+
+    def test_incremental_reevaluates_custom_rules(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_incremental import IncrementalLinter
+
+        engine, linter = RuleEngine(custom_rules=self._plan()), IncrementalLinter()
+        bd = {"dn": "uni/tn-T1/BD-a", "name": "a", "unicastRoute": "no"}
+        linter.run(engine, self._data(fvBD=[bd]))
+        objects = {
+            "fvBD": [dict(bd, descr="core")],
+            "fvSubnet": [{"dn": "uni/tn-T1/BD-a/subnet-[10.0.0.1/24]"}],
+        }
+        issues = linter.run(engine, self._data(**objects))
+        assert linter.last_run["mode"] == "incremental"
+        full = engine.run_all(self._data(**objects))
+        assert {(i.rule_id, i.dn) for i in issues} == {(i.rule_id, i.dn) for i in full}
+        assert not any(i.rule_id.startswith("CUS-") for i in issues)
+
+
+# ============================================
+# TestLinterParallel — fork 프로세스 풀 병렬 실행 / 규칙별 실행 시간
+# ============================================
+
+
+class TestLinterParallel:
+    """RuleEngine 병렬 실행 결과 동일성 / 작업 분할 / 실행 시간 테스트 (v1.11.0)"""
+
+    @staticmethod
+    def _data():
+        from services.linter_engine import CollectedData
+
+        return CollectedData(
+            objects={
+                "fvAEPg": [
+                    {"dn": f"uni/tn-T1/ap-A/epg-E{i}", "name": f"E {i}"}
+                    for i in range(10)
+                ],
+                "fvRsBd": [
+                    {"dn": f"uni/tn-T1/ap-A/epg-E{i}/rsbd"} for i in range(0, 10, 2)
+                ],
+                "fvBD": [
+                    {"dn": f"uni/tn-T1/BD-b{i}", "name": f"b{i}"} for i in range(4)
+                ],
+                "vzBrCP": [{"dn": "uni/tn-T1/brc-any", "name": "any"}],
+            }
+        )
+
+    @staticmethod
+    def _issues(issues) -> list[tuple]:
+        return [(i.rule_id, i.dn, i.message) for i in issues]
+
+    def test_sequential_reports_rule_timings(self) -> None:
+        from services.linter_engine import RULE_SPECS, RuleEngine
+
+        engine = RuleEngine()
+        issues = engine.run_all(self._data())
+        timings = engine.last_timings
+        assert timings["mode"] == "sequential"
+        assert [r["rule"] for r in timings["rules"]] == [s.method for s in RULE_SPECS]
+        assert sum(r["issues"] for r in timings["rules"]) == len(issues)
+        assert all(r["wall_ms"] >= 0 and r["cpu_ms"] >= 0 for r in timings["rules"])
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fork start method unavailable")
+    def test_parallel_matches_sequential_order(self) -> None:
+        from services import linter_engine
+        from services.linter_engine import RuleEngine
+
+        expected = self._issues(RuleEngine().run_all(self._data()))
+        engine = RuleEngine(workers=2)
+        with (
+            patch.object(linter_engine, "PARALLEL_MIN_OBJECTS", 0),
+            patch.object(linter_engine, "SHARD_SIZE", 3),
+        ):
+            issues = engine.run_all(self._data())
+        assert engine.last_timings["mode"] == "parallel"
+        assert self._issues(issues) == expected
+        tasks = {r["rule"]: r["tasks"] for r in engine.last_timings["rules"]}
+        # EPG 10개 / 구간 3 → 4개 작업, Subject 대상 규칙은 분할 없음
+        assert tasks["check_bp_001_epg_no_bd"] == 4
+        assert tasks["check_sec_003_empty_subject"] == 1
+
+    def test_small_data_or_no_fork_runs_sequentially(self) -> None:
+        from services import linter_engine
+        from services.linter_engine import RuleEngine
+
+        engine = RuleEngine(workers=4)
+        engine.run_all(self._data())
+        assert engine.last_timings["mode"] == "sequential"
+        with (
+            patch.object(linter_engine, "PARALLEL_MIN_OBJECTS", 0),
+            patch.object(linter_engine, "_fork_available", return_value=False),
+        ):
+            engine.run_all(self._data())
+        assert engine.last_timings["mode"] == "sequential"
+
+    def test_workers_config_parsing(self) -> None:
+        from services.linter_engine import LinterService
+
+        assert LinterService._workers(None) == 0
+        assert LinterService._workers(3) == 3
+        assert LinterService._workers("bad") == 0
+        assert LinterService._workers("auto") >= 1
+
+    def test_lint_response_includes_timings(self, client: TestClient) -> None:
+        data = client.get("/api/lint").json()
+        assert data["timings"]["mode"] == "sequential"
+        assert len(data["timings"]["rules"]) >= 8
+
+
+# ============================================
+# TestLinterStreamUpload — 업로드 스트리밍 파싱
+# ============================================
+
+
+class TestLinterStreamUpload:
+    """MoStreamParser / DataCollector.from_stream / 업로드 API 테스트 (v1.11.0)"""
+
+    TREE = {
+        "totalCount": "1",
+        "imdata": [
+            {
+                "fvTenant": {
+                    "attributes": {"dn": "uni/tn-T1", "name": "T1", "descr": "é"},
+                    "children": [
+                        {
+                            "fvBD": {
+                                "attributes": {"rn": "BD-b1", "name": "b1"},
+                                "children": [
+                                    {"fvRsCtx": {"attributes": {"rn": "rsctx"}}}
+                                ],
+                            }
+                        },
+                        {
+                            "fvAp": {
+                                "attributes": {"rn": "ap-A", "name": "A"},
+                                "children": [
+                                    {
+                                        "fvAEPg": {
+                                            "attributes": {
+                                                "rn": "epg-E1",
+                                                "name": "E1",
+                                            },
+                                            "children": [
+                                                {
+                                                    "fvRsBd": {
+                                                        "attributes": {"rn": "rsbd"}
+                                                    }
+                                                }
+                                            ],
+                                        }
+                                    }
+                                ],
+                            }
+                        },
+                    ],
+                }
+            }
+        ],
+    }
+
+    @staticmethod
+    def _parse(payload, chunk_size: int) -> list[tuple[str, str]]:
+        import io
+        import json
+
+        from services.json_stream import MoStreamParser
+
+        found: list[tuple[str, str]] = []
+        raw = json.dumps(payload, indent=1, ensure_ascii=False).encode("utf-8")
+        MoStreamParser(io.BytesIO(raw), chunk_size).parse(
+            lambda cls, attrs: found.append((cls, attrs["dn"]))
+        )
+        return found
+
+    def test_nested_children_and_chunk_boundaries(self) -> None:
+        expected = [
+            ("fvTenant", "uni/tn-T1"),
+            ("fvBD", "uni/tn-T1/BD-b1"),
+            ("fvRsCtx", "uni/tn-T1/BD-b1/rsctx"),
+            ("fvAp", "uni/tn-T1/ap-A"),
+            ("fvAEPg", "uni/tn-T1/ap-A/epg-E1"),
+            ("fvRsBd", "uni/tn-T1/ap-A/epg-E1/rsbd"),
+        ]
+        for chunk_size in (1, 2, 7, 1 << 20):
+            assert self._parse(self.TREE, chunk_size) == expected
+        # imdata 배열만 있는 파일 / 설정 export 단일 트리
+        assert self._parse(self.TREE["imdata"], 5) == expected
+        assert self._parse(self.TREE["imdata"][0], 5) == expected
+
+    def test_malformed_json_reports_offset(self) -> None:
+        import io
+
+        from services.json_stream import JSONStreamError, MoStreamParser
+
+        for raw in (b'{"imdata": [{"fvTenant": {', b"[1, 2", b"[] []", b"", b"{bad}"):
+            with pytest.raises(JSONStreamError) as exc:
+                MoStreamParser(io.BytesIO(raw), 3).parse(lambda cls, attrs: None)
+            assert 0 <= exc.value.offset <= len(raw)
+
+    def test_keeps_only_rule_fields(self) -> None:
+        import io
+        import json
+
+        from services.linter_engine import DataCollector, RuleEngine
+
+        fields = RuleEngine().required_fields()
+        assert fields["fvRsBd"] == ("dn",)
+        assert fields["fvAEPg"] == ("dn", "name")
+        raw = json.dumps(self.TREE).encode("utf-8")
+        data = DataCollector.from_stream(io.BytesIO(raw), fields, chunk_size=16)
+        # fvRsCtx는 어떤 규칙도 사용하지 않음 → 보관 안 함
+        assert "fvRsCtx" not in data.objects
+        assert data.get("fvTenant") == [{"dn": "uni/tn-T1", "name": "T1"}]
+        assert data.has_child("uni/tn-T1/ap-A/epg-E1", "fvRsBd")
+
+    def test_custom_rule_attributes_are_kept(self) -> None:
+        from services.linter_engine import RuleEngine
+        from services.linter_rules import RulePlan
+
+        plan = RulePlan(
+            [
+                {
+                    "id": "CUS-1",
+                    "class": "fvBD",
+                    "require": {"unicastRoute": "no"},
+                    "message": "{name} arp={arpFlood}",
+                }
+            ]
+        )
+        fields = RuleEngine(custom_rules=plan).required_fields()
+        assert set(fields["fvBD"]) == {"arpFlood", "dn", "name", "unicastRoute"}
+
+    def test_upload_nested_export(self, client: TestClient) -> None:
+        import json
+
+        content = json.dumps(self.TREE).encode("utf-8")
+        response = client.post(
+            "/api/lint/upload",
+            files={"file": ("export.json", content, "application/json")},
+        )
+        found = {(r["rule_id"], r["dn"]) for r in response.json()["results"]}
+        assert ("BP-003", "uni/tn-T1/BD-b1") in found
+        assert ("BP-002", "uni/tn-T1/ap-A/epg-E1") in found
+        assert ("BP-001", "uni/tn-T1/ap-A/epg-E1") not in found
+
+        truncated = client.post(
+            "/api/lint/upload",
+            files={"file": ("export.json", content[:-10], "application/json")},
+        )
+        assert truncated.status_code == 400
+        assert "Invalid JSON format" in truncated.json()["detail"]
+
+
 # ============================================
 # TestSimulatorTenantsAPI — GET /api/simulate/tenants
 # ============================================